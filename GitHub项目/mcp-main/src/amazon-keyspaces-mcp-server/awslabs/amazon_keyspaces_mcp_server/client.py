@@ -18,23 +18,40 @@ Note that this client intentionally does not use the AWS SDK for Keyspaces, but
 through the Cassandra driver.
 """
 
+import asyncio
 import logging
 import os
 import ssl
+import threading
 from .consts import (
     CERT_DIRECTORY,
     CERT_FILENAME,
     CONNECTION_TIMEOUT,
     CONTROL_CONNECTION_TIMEOUT,
+    DEFAULT_FETCH_SIZE,
+    DEFAULT_SCAN_SPLITS,
     KEYSPACES_DEFAULT_PORT,
+    MAX_RESULT_BYTES,
+    MAX_RESULT_ROWS,
+    PREPARED_STATEMENT_CACHE_SIZE,
     PROTOCOL_VERSION,
 )
 from cassandra.auth import PlainTextAuthProvider
-from cassandra.cluster import Cluster, Session
+from cassandra.cluster import (
+    EXEC_PROFILE_DEFAULT,
+    Cluster,
+    ExecutionProfile,
+    ResponseFuture,
+    ResultSet,
+    Session,
+)
 
 # Use asyncore reactor for Python 3.11 compatibility
 from cassandra.io.asyncorereactor import AsyncoreConnection
-from typing import Any, Dict, List, Optional
+from cassandra.metadata import Metadata, protect_name
+from cassandra.query import PreparedStatement, tuple_factory
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # Older versions of the Cassandra Python driver may not include SSLOptions. Conditionally
@@ -61,6 +78,64 @@ from .models import KeyspaceInfo, TableInfo
 
 logger = logging.getLogger(__name__)
 
+# Execution profile of read queries, whose rows are returned as plain tuples
+QUERY_EXECUTION_PROFILE = 'read_only_query'
+
+# Token ring of each supported partitioner, as the exclusive start and inclusive end of the
+# range that holds every token. The Murmur3 minimum token is never assigned to a partition.
+# Amazon Keyspaces uses DefaultPartitioner, whose tokens span the range of RandomPartitioner.
+PARTITIONER_TOKEN_RANGES = {
+    'Murmur3Partitioner': (-(2**63), 2**63 - 1),
+    'RandomPartitioner': (-1, 2**127),
+    'DefaultPartitioner': (-1, 2**127),
+}
+
+
+def _execution_profiles() -> Dict[Any, ExecutionProfile]:
+    """Return the execution profiles of the cluster.
+
+    Schema queries keep the named tuple rows of the default profile, read queries use the
+    tuple row factory, so their rows are converted to dicts with the column names once.
+    """
+    return {
+        EXEC_PROFILE_DEFAULT: ExecutionProfile(),
+        QUERY_EXECUTION_PROFILE: ExecutionProfile(row_factory=tuple_factory),
+    }
+
+
+def _await_response(response_future: ResponseFuture) -> 'asyncio.Future[ResultSet]':
+    """Bridge a driver response future to an asyncio future of its result set.
+
+    The driver calls back from its event loop thread, so the result is handed over to the
+    running asyncio loop with call_soon_threadsafe.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def set_result(result):
+        if not future.done():
+            future.set_result(result)
+
+    def set_exception(exc):
+        if not future.done():
+            future.set_exception(exc)
+
+    def on_success(_):
+        try:
+            loop.call_soon_threadsafe(set_result, response_future.result())
+        except Exception as e:
+            loop.call_soon_threadsafe(set_exception, e)
+
+    response_future.add_callbacks(
+        on_success, lambda exc: loop.call_soon_threadsafe(set_exception, exc)
+    )
+    return future
+
+
+def _estimate_size(row: tuple) -> int:
+    """Return a rough estimate of the size of the values of a row in bytes."""
+    return sum(len(value) if isinstance(value, (str, bytes)) else 8 for value in row)
+
 
 class UnifiedCassandraClient:
     """A unified client for both Apache Cassandra and Amazon Keyspaces."""
@@ -69,6 +144,8 @@ class UnifiedCassandraClient:
         """Initialize the client with the given configuration."""
         self.database_config = database_config
         self.is_keyspaces = database_config.use_keyspaces
+        self._prepared: 'OrderedDict[str, PreparedStatement]' = OrderedDict()
+        self._prepared_lock = threading.Lock()
 
         # Initialize session for the configured database type (Keyspaces or Cassandra)
         try:
@@ -99,6 +176,7 @@ class UnifiedCassandraClient:
             protocol_version=4,  # Use protocol version 4 for better compatibility
             control_connection_timeout=CONTROL_CONNECTION_TIMEOUT,
             connect_timeout=int(CONNECTION_TIMEOUT),
+            execution_profiles=_execution_profiles(),
         )
 
         cluster.connection_class = AsyncoreConnection
@@ -130,6 +208,7 @@ class UnifiedCassandraClient:
                 protocol_version=PROTOCOL_VERSION,
                 control_connection_timeout=CONTROL_CONNECTION_TIMEOUT,
                 connect_timeout=int(CONNECTION_TIMEOUT),
+                execution_profiles=_execution_profiles(),
             )
         else:
             # Fallback if SSLOptions is not available
@@ -141,6 +220,7 @@ class UnifiedCassandraClient:
                 protocol_version=PROTOCOL_VERSION,
                 control_connection_timeout=CONTROL_CONNECTION_TIMEOUT,
                 connect_timeout=int(CONNECTION_TIMEOUT),
+                execution_profiles=_execution_profiles(),
             )
 
         cluster.connection_class = AsyncoreConnection
@@ -170,13 +250,69 @@ class UnifiedCassandraClient:
         """Check if the client is using Amazon Keyspaces."""
         return self.is_keyspaces
 
-    def list_keyspaces(self) -> List[KeyspaceInfo]:
+    async def _execute(self, query: Any, parameters: Any = None, **kwargs) -> ResultSet:
+        """Execute a statement with execute_async and await its first page."""
+        return await _await_response(self.session.execute_async(query, parameters, **kwargs))
+
+    def _cluster_metadata(self) -> Metadata:
+        """Return the metadata the driver keeps about the cluster of the session."""
+        cluster = self.session.cluster
+        if cluster is None or cluster.metadata is None:
+            raise RuntimeError('The session is not connected to a cluster')
+        return cluster.metadata
+
+    async def _fetch_next_page(self, rs: ResultSet) -> ResultSet:
+        """Request the next page of a result set and await it."""
+        response_future = rs.response_future
+        response_future.clear_callbacks()
+        response_future.start_fetching_next_page()
+        return await _await_response(response_future)
+
+    async def _token_range(self) -> Tuple[int, int]:
+        """Return the token range of the partitioner of the cluster.
+
+        The partitioner is taken from the driver metadata, or read from system.local when the
+        driver has not learned it yet.
+        """
+        partitioner = self._cluster_metadata().partitioner
+        if not partitioner:
+            rs = await self._execute('SELECT partitioner FROM system.local')
+            row: Any = rs.one()
+            if row is None or not row.partitioner:
+                raise RuntimeError('Could not read the partitioner of the cluster')
+            partitioner = row.partitioner
+        name = partitioner.rsplit('.', 1)[-1]
+        if name not in PARTITIONER_TOKEN_RANGES:
+            raise RuntimeError(f'Table scans are not supported with the {name} partitioner')
+        return PARTITIONER_TOKEN_RANGES[name]
+
+    def schema_version(self, keyspace_name: Optional[str] = None, table_name: str = '') -> Any:
+        """Return a value that changes when the driver sees a schema change.
+
+        The driver refreshes its schema metadata on schema change events, replacing the
+        metadata objects of changed keyspaces and tables, so the objects themselves are
+        compared. None is returned when the driver has no schema metadata.
+        """
+        try:
+            keyspaces = self._cluster_metadata().keyspaces
+            if keyspaces is None:
+                return None
+            if keyspace_name is None:
+                return tuple(keyspaces.items())
+            keyspace = keyspaces[keyspace_name]
+            if table_name:
+                return keyspace.tables[table_name]
+            return (keyspace, tuple(keyspace.tables.items()))
+        except Exception:
+            return None
+
+    async def list_keyspaces(self) -> List[KeyspaceInfo]:
         """List all keyspaces in the database."""
         keyspaces = []
 
         try:
             query = 'SELECT keyspace_name, replication FROM system_schema.keyspaces'
-            rows = self.session.execute(query)
+            rows = await self._execute(query)
 
             for row in rows:
                 name = row.keyspace_name
@@ -198,13 +334,13 @@ class UnifiedCassandraClient:
             logger.error(f'Error listing keyspaces: {str(e)}')
             raise RuntimeError(f'Failed to list keyspaces: {str(e)}')
 
-    def list_tables(self, keyspace_name: str) -> List[TableInfo]:
+    async def list_tables(self, keyspace_name: str) -> List[TableInfo]:
         """List all tables in a keyspace."""
         tables = []
 
         try:
             query = 'SELECT table_name FROM system_schema.tables WHERE keyspace_name = %s'
-            rows = self.session.execute(query, [keyspace_name])
+            rows = await self._execute(query, [keyspace_name])
 
             for row in rows:
                 name = row.table_name
@@ -215,14 +351,24 @@ class UnifiedCassandraClient:
             logger.error(f'Error listing tables for keyspace {keyspace_name}: {str(e)}')
             raise RuntimeError(f'Failed to list tables for keyspace {keyspace_name}: {str(e)}')
 
-    def describe_keyspace(self, keyspace_name: str) -> Dict[str, Any]:
+    async def describe_keyspace(self, keyspace_name: str) -> Dict[str, Any]:
         """Get detailed information about a keyspace."""
         try:
             query = 'SELECT * FROM system_schema.keyspaces WHERE keyspace_name = %s'
-            row = self.session.execute(query, [keyspace_name]).one()
+            # Read the keyspace and its tables concurrently
+            rs, tables = await asyncio.gather(
+                self._execute(query, [keyspace_name]),
+                self.list_tables(keyspace_name),
+                return_exceptions=True,
+            )
+            if isinstance(rs, BaseException):
+                raise rs
+            row: Any = rs.one()
 
             if not row:
                 raise RuntimeError(f'Keyspace not found: {keyspace_name}')
+            if isinstance(tables, BaseException):
+                raise tables
 
             keyspace_details = {
                 'name': row.keyspace_name,
@@ -231,7 +377,7 @@ class UnifiedCassandraClient:
             }
 
             # Add tables
-            keyspace_details['tables'] = self.list_tables(keyspace_name)
+            keyspace_details['tables'] = tables
 
             # Add Keyspaces-specific context if applicable
             if self.is_keyspaces:
@@ -242,13 +388,46 @@ class UnifiedCassandraClient:
             logger.error(f'Error describing keyspace {keyspace_name}: {str(e)}')
             raise RuntimeError(f'Failed to describe keyspace {keyspace_name}: {str(e)}')
 
-    def describe_table(self, keyspace_name: str, table_name: str) -> Dict[str, Any]:
-        """Get detailed information about a table."""
+    async def describe_table(self, keyspace_name: str, table_name: str) -> Dict[str, Any]:
+        """Get detailed information about a table.
+
+        The table, its columns, its indexes and, for Keyspaces, its capacity settings are
+        read concurrently.
+        """
         try:
-            query = (
-                'SELECT * FROM system_schema.tables WHERE keyspace_name = %s AND table_name = %s'
+            params = [keyspace_name, table_name]
+            queries = [
+                self._execute(
+                    'SELECT * FROM system_schema.tables WHERE keyspace_name = %s AND table_name = %s',
+                    params,
+                ),
+                self._execute(
+                    'SELECT * FROM system_schema.columns WHERE keyspace_name = %s AND table_name = %s',
+                    params,
+                ),
+                self._execute(
+                    'SELECT * FROM system_schema.indexes WHERE keyspace_name = %s AND table_name = %s',
+                    params,
+                ),
+            ]
+            if self.is_keyspaces:
+                queries.append(
+                    self._execute(
+                        'SELECT custom_properties FROM system_schema_mcs.tables WHERE keyspace_name = %s AND table_name = %s',
+                        params,
+                    )
+                )
+            table_rs, column_rows, index_rows, *capacity = await asyncio.gather(
+                *queries, return_exceptions=True
             )
-            table_row = self.session.execute(query, [keyspace_name, table_name]).one()
+            if isinstance(table_rs, BaseException):
+                raise table_rs
+            if isinstance(column_rows, BaseException):
+                raise column_rows
+            if isinstance(index_rows, BaseException):
+                raise index_rows
+
+            table_row: Any = table_rs.one()
 
             if not table_row:
                 raise RuntimeError(f'Table not found: {keyspace_name}.{table_name}')
@@ -259,11 +438,6 @@ class UnifiedCassandraClient:
             }
 
             # Get column metadata
-            query = (
-                'SELECT * FROM system_schema.columns WHERE keyspace_name = %s AND table_name = %s'
-            )
-            column_rows = self.session.execute(query, [keyspace_name, table_name])
-
             columns = []
             for column_row in column_rows:
                 column = {
@@ -277,11 +451,6 @@ class UnifiedCassandraClient:
             table_details['columns'] = columns
 
             # Get indexes
-            query = (
-                'SELECT * FROM system_schema.indexes WHERE keyspace_name = %s AND table_name = %s'
-            )
-            index_rows = self.session.execute(query, [keyspace_name, table_name])
-
             indexes = []
             for index_row in index_rows:
                 index = {
@@ -299,8 +468,9 @@ class UnifiedCassandraClient:
 
                 # Add capacity mode information for Keyspaces tables
                 try:
-                    query = 'SELECT custom_properties FROM system_schema_mcs.tables WHERE keyspace_name = %s AND table_name = %s'
-                    capacity_row = self.session.execute(query, [keyspace_name, table_name]).one()
+                    if isinstance(capacity[0], BaseException):
+                        raise capacity[0]
+                    capacity_row: Any = capacity[0].one()
 
                     if capacity_row and capacity_row.custom_properties:
                         props = capacity_row.custom_properties
@@ -325,10 +495,29 @@ class UnifiedCassandraClient:
             logger.error(f'Error describing table {keyspace_name}.{table_name}: {str(e)}')
             raise RuntimeError(f'Failed to describe table {keyspace_name}.{table_name}: {str(e)}')
 
-    def execute_read_only_query(
-        self, query: str, params: Optional[List[Any]] = None
-    ) -> Dict[str, Any]:
-        """Execute a read-only SELECT query against the database."""
+    async def _prepare(self, query: str) -> PreparedStatement:
+        """Return the prepared statement of a query, preparing it on first use.
+
+        Prepared statements are cached by query text, keeping the most recently used ones.
+        The driver only prepares synchronously, so it runs in a worker thread.
+        """
+        with self._prepared_lock:
+            prepared = self._prepared.get(query)
+            if prepared is not None:
+                self._prepared.move_to_end(query)
+                return prepared
+
+        prepared = await asyncio.to_thread(self.session.prepare, query)
+
+        with self._prepared_lock:
+            self._prepared[query] = prepared
+            if len(self._prepared) > PREPARED_STATEMENT_CACHE_SIZE:
+                self._prepared.popitem(last=False)
+        return prepared
+
+    @staticmethod
+    def _validate_read_only_query(query: str) -> None:
+        """Raise a ValueError if a query is not a read-only SELECT query."""
         # Validate that this is a read-only query
         trimmed_query = query.strip().lower()
         if not trimmed_query.startswith('select '):
@@ -341,42 +530,60 @@ class UnifiedCassandraClient:
         ):
             raise ValueError('Query contains potentially unsafe operations')
 
+    async def execute_read_only_query(
+        self,
+        query: str,
+        params: Optional[List[Any]] = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        paging_state: Optional[str] = None,
+        max_bytes: int = MAX_RESULT_BYTES,
+    ) -> Dict[str, Any]:
+        """Execute a read-only SELECT query against the database.
+
+        The query is run as a cached prepared statement, with ``?`` bind markers for the
+        params, and only one page of at most fetch_size rows (capped at MAX_RESULT_ROWS)
+        is read. If there are more rows, the result contains the paging_state to pass to
+        resume the query from the next page.
+
+        Rows are cut off once their estimated size exceeds max_bytes; the result is then
+        marked as truncated and its paging_state is the one the page was read from, so the
+        page can be read again with a smaller fetch_size.
+        """
+        self._validate_read_only_query(query)
+
         try:
             logger.info(f'Executing read-only query: {query}')
 
-            # Execute the query
-            if params:
-                rs = self.session.execute(query, params)
-            else:
-                rs = self.session.execute(query)
+            statement = (await self._prepare(query)).bind(params or [])
+            statement.fetch_size = max(1, min(fetch_size, MAX_RESULT_ROWS))
+
+            rs = await self._execute(
+                statement,
+                paging_state=bytes.fromhex(paging_state) if paging_state else None,
+                execution_profile=QUERY_EXECUTION_PROFILE,
+            )
 
-            # Process the results
+            column_names = list(rs.column_names) if rs.column_names else []
             rows = []
-            column_names = []
-
-            # Get column definitions from the first row
-            if rs.column_names:
-                column_names = list(rs.column_names)
-
-            # Process each row
-            for row in rs:
-                row_data = {}
-                for col_name in column_names:
-                    # Get the column value, handling null values
-                    value = None
-                    try:
-                        if hasattr(row, col_name) and getattr(row, col_name) is not None:
-                            value = getattr(row, col_name)
-                    except Exception as e:
-                        logger.warning(f'Error getting value for column {col_name}: {str(e)}')
-                    row_data[col_name] = value
-                rows.append(row_data)
+            size = 0
+            truncated = False
+            page: List[Any] = rs.current_rows
+            for row in page:
+                size += _estimate_size(row)
+                if size > max_bytes:
+                    truncated = True
+                    break
+                rows.append(dict(zip(column_names, row)))
 
             # Build the result
             result = {
                 'columns': column_names,
                 'rows': rows,
                 'row_count': len(rows),
+                'paging_state': paging_state
+                if truncated
+                else (rs.paging_state.hex() if rs.paging_state else None),
+                'truncated': truncated,
             }
 
             # Add execution info
@@ -392,6 +599,97 @@ class UnifiedCassandraClient:
             logger.error(f'Error executing query: {query}: {str(e)}')
             raise RuntimeError(f'Failed to execute query: {str(e)}')
 
+    async def scan_table(
+        self,
+        keyspace_name: str,
+        table_name: str,
+        columns: Optional[List[str]] = None,
+        splits: int = DEFAULT_SCAN_SPLITS,
+        max_rows: int = MAX_RESULT_ROWS,
+        max_bytes: int = MAX_RESULT_BYTES,
+    ) -> Dict[str, Any]:
+        """Read a table by splitting the token ring into ranges that are queried in parallel.
+
+        The token ring is that of the partitioner of the cluster. The first page of every
+        token range is requested at once with execute_async, with the row budget divided
+        between the ranges. Pages are consumed in rounds, the current page of every range
+        before the next page of any, so that a truncated result samples all ranges. Reading
+        stops when max_rows rows (capped at MAX_RESULT_ROWS) or max_bytes of estimated value
+        size are returned, in which case the result is marked as truncated.
+        """
+        try:
+            keyspaces = self._cluster_metadata().keyspaces or {}
+            table = keyspaces[keyspace_name].tables[table_name]
+        except KeyError:
+            raise RuntimeError(f'Table not found: {keyspace_name}.{table_name}')
+
+        try:
+            token = 'token({})'.format(
+                ', '.join(protect_name(c.name) for c in table.partition_key)
+            )
+            selected = ', '.join(protect_name(c) for c in columns) if columns else '*'
+            query = (
+                f'SELECT {selected} FROM {protect_name(keyspace_name)}.{protect_name(table_name)}'
+                f' WHERE {token} > ? AND {token} <= ?'
+            )
+            logger.info(f'Scanning {keyspace_name}.{table_name} in {splits} token ranges')
+            prepared = await self._prepare(query)
+
+            max_rows = max(1, min(max_rows, MAX_RESULT_ROWS))
+            splits = max(1, splits)
+            min_token, max_token = await self._token_range()
+            width = (max_token - min_token) // splits
+            bounds = [min_token + i * width for i in range(splits)] + [max_token]
+
+            pending = []
+            for start, end in zip(bounds, bounds[1:]):
+                statement = prepared.bind([start, end])
+                statement.fetch_size = min(DEFAULT_FETCH_SIZE, -(-max_rows // splits))
+                pending.append(
+                    asyncio.ensure_future(
+                        self._execute(statement, execution_profile=QUERY_EXECUTION_PROFILE)
+                    )
+                )
+
+            tasks = list(pending)
+            column_names: List[str] = []
+            rows = []
+            size = 0
+            truncated = False
+            try:
+                while pending and not truncated:
+                    next_pages = []
+                    for task in pending:
+                        rs = await task
+                        if rs.column_names:
+                            column_names = list(rs.column_names)
+                        for row in rs.current_rows:
+                            size += _estimate_size(row)
+                            if len(rows) >= max_rows or size > max_bytes:
+                                truncated = True
+                                break
+                            rows.append(dict(zip(column_names, row)))
+                        if truncated:
+                            break
+                        if rs.has_more_pages:
+                            next_pages.append(asyncio.ensure_future(self._fetch_next_page(rs)))
+                    tasks.extend(next_pages)
+                    pending = next_pages
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            return {
+                'columns': column_names,
+                'rows': rows,
+                'row_count': len(rows),
+                'truncated': truncated,
+                'execution_info': {'token_ranges': splits},
+            }
+        except Exception as e:
+            logger.error(f'Error scanning table {keyspace_name}.{table_name}: {str(e)}')
+            raise RuntimeError(f'Failed to scan table {keyspace_name}.{table_name}: {str(e)}')
+
     def _add_keyspaces_context(self, details: Dict[str, Any]) -> None:
         """Add Keyspaces-specific context to the details."""
         keyspaces_context = {'service_characteristics': self._build_service_characteristics()}
@@ -53,3 +53,18 @@ UNSAFE_OPERATIONS = [
 
 # Query display limits
 MAX_DISPLAY_ROWS = 20
+
+# Read query limits: rows fetched per page, and caps on the rows and the estimated size of
+# the values returned by a single call
+DEFAULT_FETCH_SIZE = 100
+MAX_RESULT_ROWS = 1000
+MAX_RESULT_BYTES = 1024 * 1024
+
+# Maximum number of prepared statements kept by the client
+PREPARED_STATEMENT_CACHE_SIZE = 256
+
+# Seconds for which schema metadata is cached, unless the driver sees a schema change first
+SCHEMA_CACHE_TTL = 300
+
+# Number of token ranges that are read in parallel by a table scan
+DEFAULT_SCAN_SPLITS = 8
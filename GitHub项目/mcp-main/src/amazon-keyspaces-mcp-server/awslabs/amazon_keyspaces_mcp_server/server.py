@@ -17,7 +17,9 @@ import sys
 from .client import UnifiedCassandraClient
 from .config import AppConfig
 from .consts import (
+    DEFAULT_FETCH_SIZE,
     MAX_DISPLAY_ROWS,
+    MAX_RESULT_ROWS,
     SERVER_NAME,
     UNSAFE_OPERATIONS,
 )
@@ -33,7 +35,7 @@ from .services import DataService, QueryAnalysisService, SchemaService
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 
 # Remove all default handlers then add our own
@@ -75,74 +77,100 @@ def get_proxy():
     name='listKeyspaces',
     description='Lists all keyspaces in the Cassandra/Keyspaces database - args: none',
 )
-def list_keyspaces(
+async def list_keyspaces(
     ctx: Optional[Context] = None,
 ) -> str:
     """Lists all keyspaces in the Cassandra/Keyspaces database."""
-    return get_proxy().handle_list_keyspaces(ctx)
+    return await get_proxy().handle_list_keyspaces(ctx)
 
 
 @mcp.tool(
     name='listTables',
     description='Lists all tables in a specified keyspace - args: keyspace',
 )
-def list_tables(
+async def list_tables(
     keyspace: str = Field(..., description='The keyspace to list tables from.'),
     ctx: Optional[Context] = None,
 ) -> str:
     """Lists all tables in a specified keyspace."""
-    return get_proxy()._handle_list_tables(keyspace, ctx)
+    return await get_proxy()._handle_list_tables(keyspace, ctx)
 
 
 @mcp.tool(
     name='describeKeyspace',
     description='Gets detailed information about a keyspace - args: keyspace',
 )
-def describe_keyspace(
+async def describe_keyspace(
     keyspace: str = Field(..., description='The keyspace to retrieve metadata for.'),
     ctx: Optional[Context] = None,
 ) -> str:
     """Gets detailed information about a keyspace."""
-    return get_proxy()._handle_describe_keyspace(keyspace, ctx)
+    return await get_proxy()._handle_describe_keyspace(keyspace, ctx)
 
 
 @mcp.tool(
     name='describeTable',
     description='Gets detailed information about a table - args: keyspace, table',
 )
-def describe_table(
+async def describe_table(
     keyspace: str = Field(..., description='The keyspace containing the table'),
     table: str = Field(..., description='The name of the table to describe'),
     ctx: Optional[Context] = None,
 ) -> str:
     """Gets detailed information about a table."""
-    return get_proxy()._handle_describe_table(keyspace, table, ctx)
+    return await get_proxy()._handle_describe_table(keyspace, table, ctx)
 
 
 @mcp.tool(
     name='executeQuery',
-    description='Executes a read-only SELECT query against the database - args: keyspace, query',
+    description='Executes a read-only SELECT query against the database, one page at a time - args: keyspace, query, fetch_size, paging_state',
 )
-def execute_query(
+async def execute_query(
     keyspace: str = Field(..., description='The keyspace to execute the query against'),
     query: str = Field(..., description='The CQL SELECT query to execute'),
+    fetch_size: int = Field(
+        DEFAULT_FETCH_SIZE,
+        description=f'The number of rows to return, at most {MAX_RESULT_ROWS}',
+    ),
+    paging_state: Optional[str] = Field(
+        None, description='The paging state returned by a previous call, to read the next page'
+    ),
     ctx: Optional[Context] = None,
 ) -> str:
     """Executes a read-only (SELECT) query against the database."""
-    return get_proxy()._handle_execute_query(keyspace, query, ctx)
+    return await get_proxy()._handle_execute_query(
+        keyspace, query, ctx, fetch_size=fetch_size, paging_state=paging_state
+    )
+
+
+@mcp.tool(
+    name='scanTable',
+    description='Reads the rows of a table with parallel token range queries - args: keyspace, table, max_rows',
+)
+async def scan_table(
+    keyspace: str = Field(..., description='The keyspace containing the table'),
+    table: str = Field(..., description='The name of the table to scan'),
+    max_rows: int = Field(
+        MAX_RESULT_ROWS,
+        description=f'The maximum number of rows to read, at most {MAX_RESULT_ROWS}',
+    ),
+    ctx: Optional[Context] = None,
+) -> str:
+    """Reads the rows of a table with parallel token range queries."""
+    return await get_proxy()._handle_scan_table(keyspace, table, max_rows, ctx)
 
 
 @mcp.tool(
     name='analyzeQueryPerformance',
     description='Analyzes the performance characteristics of a CQL query - args: keyspace, query',
 )
-def analyze_query_performance(
+async def analyze_query_performance(
     keyspace: str = Field(..., description='The keyspace to analyze the query against'),
     query: str = Field(..., description='The CQL query to analyze for performance'),
     ctx: Optional[Context] = None,
 ) -> str:
     """Analyzes the performance characteristics of a CQL query."""
-    return get_proxy()._handle_analyze_query_performance(keyspace, query, ctx)
+    return await get_proxy()._handle_analyze_query_performance(keyspace, query, ctx)
 
 
 class KeyspacesMcpStdioServer:
@@ -159,10 +187,10 @@ class KeyspacesMcpStdioServer:
         self.query_analysis_service = query_analysis_service
         self.schema_service = schema_service
 
-    def handle_list_keyspaces(self, ctx: Optional[Any] = None) -> str:
+    async def handle_list_keyspaces(self, ctx: Optional[Any] = None) -> str:
         """Handle the listKeyspaces tool."""
         try:
-            keyspaces = self.schema_service.list_keyspaces()
+            keyspaces = await self.schema_service.list_keyspaces()
 
             # Format keyspace names as a markdown list for better display
             keyspace_names = [k.name for k in keyspaces]
@@ -175,7 +203,7 @@ class KeyspacesMcpStdioServer:
 
             # Add contextual information about Cassandra/Keyspaces
             if ctx:
-                ctx.info('Adding contextual information about Cassandra/Keyspaces')  # type: ignore[unused-coroutine]
+                await ctx.info('Adding contextual information about Cassandra/Keyspaces')
                 formatted_text += build_list_keyspaces_context(keyspaces)
 
             return formatted_text
@@ -183,13 +211,13 @@ class KeyspacesMcpStdioServer:
             logger.error(f'Error listing keyspaces: {str(e)}')
             raise Exception(f'Error listing keyspaces: {str(e)}')
 
-    def _handle_list_tables(self, keyspace: str, ctx: Optional[Context] = None) -> str:
+    async def _handle_list_tables(self, keyspace: str, ctx: Optional[Context] = None) -> str:
         """Handle the listTables tool."""
         try:
             if not keyspace:
                 raise Exception('Keyspace name is required')
 
-            tables = self.schema_service.list_tables(keyspace)
+            tables = await self.schema_service.list_tables(keyspace)
 
             # Format table names as a markdown list for better display
             table_names = [t.name for t in tables]
@@ -202,7 +230,9 @@ class KeyspacesMcpStdioServer:
 
             # Add contextual information about tables in Cassandra
             if ctx:
-                ctx.info(f'Adding contextual information about tables in keyspace {keyspace}')  # type: ignore[unused-coroutine]
+                await ctx.info(
+                    f'Adding contextual information about tables in keyspace {keyspace}'
+                )
                 formatted_text += build_list_tables_context(keyspace, tables)
 
             return formatted_text
@@ -210,13 +240,13 @@ class KeyspacesMcpStdioServer:
             logger.error(f'Error listing tables: {str(e)}')
             raise Exception(f'Error listing tables: {str(e)}')
 
-    def _handle_describe_keyspace(self, keyspace: str, ctx: Optional[Context] = None) -> str:
+    async def _handle_describe_keyspace(self, keyspace: str, ctx: Optional[Context] = None) -> str:
         """Handle the describeKeyspace tool."""
         try:
             if not keyspace:
                 raise Exception('Keyspace name is required')
 
-            keyspace_details = self.schema_service.describe_keyspace(keyspace)
+            keyspace_details = await self.schema_service.describe_keyspace(keyspace)
 
             # Format keyspace details as markdown
             formatted_text = f'## Keyspace: `{keyspace}`\n\n'
@@ -241,7 +271,7 @@ class KeyspacesMcpStdioServer:
 
             # Add contextual information about replication strategies
             if ctx:
-                ctx.info('Adding contextual information about replication strategies')  # type: ignore[unused-coroutine]
+                await ctx.info('Adding contextual information about replication strategies')
                 formatted_text += build_keyspace_details_context(keyspace_details)
 
             return formatted_text
@@ -249,7 +279,7 @@ class KeyspacesMcpStdioServer:
             logger.error(f'Error describing keyspace: {str(e)}')
             raise Exception(f'Error describing keyspace: {str(e)}')
 
-    def _handle_describe_table(
+    async def _handle_describe_table(
         self, keyspace: str, table: str, ctx: Optional[Context] = None
     ) -> str:
         """Handle the describeTable tool."""
@@ -260,7 +290,7 @@ class KeyspacesMcpStdioServer:
             if not table:
                 raise Exception('Table name is required')
 
-            table_details = self.schema_service.describe_table(keyspace, table)
+            table_details = await self.schema_service.describe_table(keyspace, table)
 
             # Format table details as markdown
             formatted_text = f'## Table: `{keyspace}.{table}`\n\n'
@@ -307,9 +337,9 @@ class KeyspacesMcpStdioServer:
 
             # Add contextual information about Cassandra data types and primary keys
             if ctx:
-                ctx.info(
+                await ctx.info(
                     'Adding contextual information about Cassandra data types and primary keys'
-                )  # type: ignore[unused-coroutine]
+                )
                 formatted_text += build_table_details_context(table_details)
 
             return formatted_text
@@ -317,8 +347,13 @@ class KeyspacesMcpStdioServer:
             logger.error(f'Error describing table: {str(e)}')
             raise Exception(f'Error describing table: {str(e)}')
 
-    def _handle_execute_query(
-        self, keyspace: str, query: str, ctx: Optional[Context] = None
+    async def _handle_execute_query(
+        self,
+        keyspace: str,
+        query: str,
+        ctx: Optional[Context] = None,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        paging_state: Optional[str] = None,
     ) -> str:
         """Handle the executeQuery tool."""
         try:
@@ -338,45 +373,26 @@ class KeyspacesMcpStdioServer:
                 raise Exception('Query contains potentially unsafe operations')
 
             # Execute the query using the DataService
-            query_results = self.data_service.execute_read_only_query(keyspace, query)
+            query_results = await self.data_service.execute_read_only_query(
+                keyspace, query, fetch_size=fetch_size, paging_state=paging_state
+            )
 
             # Format the results for display
             formatted_text = '## Query Results\n\n'
             formatted_text += f'**Query:** `{query}`\n\n'
+            formatted_text += self._format_rows(query_results)
 
-            columns = query_results.get('columns', [])
-            rows = query_results.get('rows', [])
-            row_count = query_results.get('row_count', 0)
-
-            formatted_text += f'**Row Count:** {row_count}\n\n'
-
-            if row_count > 0:
-                # Create a markdown table for the results
-                # Header row
-                formatted_text += '| ' + ' | '.join(columns) + ' |\n'
-
-                # Separator row
-                formatted_text += '| ' + ' | '.join(['---'] * len(columns)) + ' |\n'
-
-                # Data rows (limit to first few rows for readability)
-                display_limit = min(len(rows), MAX_DISPLAY_ROWS)
-                for i in range(display_limit):
-                    row = rows[i]
-                    row_values = []
-                    for column in columns:
-                        value = row.get(column)
-                        row_values.append('null' if value is None else str(value))
-                    formatted_text += '| ' + ' | '.join(row_values) + ' |\n'
-
-                # Add note if results were truncated
-                if len(rows) > display_limit:
-                    formatted_text += f'\n_Note: Showing {display_limit} of {len(rows)} total rows. Use LIMIT in your query to restrict results._'
-            else:
-                formatted_text += 'No rows returned.'
+            if query_results.get('truncated'):
+                formatted_text += '\n\n_Note: The page was cut off at the result size limit. Repeat the query with a smaller fetch_size'
+                if query_results.get('paging_state'):
+                    formatted_text += f' and paging_state `{query_results["paging_state"]}`'
+                formatted_text += ' to read all of its rows._'
+            elif query_results.get('paging_state'):
+                formatted_text += f'\n\n**Next Page:** more rows are available, repeat the query with paging_state `{query_results["paging_state"]}`'
 
             # Add contextual information about CQL queries
             if ctx:
-                ctx.info('Adding contextual information about CQL queries')  # type: ignore[unused-coroutine]
+                await ctx.info('Adding contextual information about CQL queries')
                 formatted_text += build_query_result_context(query_results)
 
             return formatted_text
@@ -388,7 +404,70 @@ class KeyspacesMcpStdioServer:
             logger.error(f'Error executing query: {str(e)}')
             raise Exception(f'Error executing query: {str(e)}')
 
-    def _handle_analyze_query_performance(
+    async def _handle_scan_table(
+        self,
+        keyspace: str,
+        table: str,
+        max_rows: int = MAX_RESULT_ROWS,
+        ctx: Optional[Context] = None,
+    ) -> str:
+        """Handle the scanTable tool."""
+        try:
+            if not keyspace:
+                raise Exception('Keyspace name is required')
+
+            if not table:
+                raise Exception('Table name is required')
+
+            scan_results = await self.data_service.scan_table(keyspace, table, max_rows=max_rows)
+
+            formatted_text = f'## Scan Results: `{keyspace}.{table}`\n\n'
+            formatted_text += self._format_rows(scan_results)
+
+            if scan_results.get('truncated'):
+                formatted_text += '\n\n_Note: The scan stopped at the row or result size limit._'
+
+            return formatted_text
+        except Exception as e:
+            logger.error(f'Error scanning table: {str(e)}')
+            raise Exception(f'Error scanning table: {str(e)}')
+
+    @staticmethod
+    def _format_rows(results: Dict[str, Any]) -> str:
+        """Format the rows of a query result as a markdown table."""
+        columns = results.get('columns', [])
+        rows = results.get('rows', [])
+        row_count = results.get('row_count', 0)
+
+        formatted_text = f'**Row Count:** {row_count}\n\n'
+
+        if row_count > 0:
+            # Create a markdown table for the results
+            # Header row
+            formatted_text += '| ' + ' | '.join(columns) + ' |\n'
+
+            # Separator row
+            formatted_text += '| ' + ' | '.join(['---'] * len(columns)) + ' |\n'
+
+            # Data rows (limit to first few rows for readability)
+            display_limit = min(len(rows), MAX_DISPLAY_ROWS)
+            for i in range(display_limit):
+                row = rows[i]
+                row_values = []
+                for column in columns:
+                    value = row.get(column)
+                    row_values.append('null' if value is None else str(value))
+                formatted_text += '| ' + ' | '.join(row_values) + ' |\n'
+
+            # Add note if results were truncated
+            if len(rows) > display_limit:
+                formatted_text += f'\n_Note: Showing {display_limit} of {len(rows)} total rows. Use LIMIT in your query to restrict results._'
+        else:
+            formatted_text += 'No rows returned.'
+
+        return formatted_text
+
+    async def _handle_analyze_query_performance(
         self, keyspace: str, query: str, ctx: Optional[Context] = None
     ) -> str:
         """Handle the analyzeQueryPerformance tool."""
@@ -399,7 +478,7 @@ class KeyspacesMcpStdioServer:
             if not query:
                 raise Exception('Query is required')
 
-            analysis_result = self.query_analysis_service.analyze_query(keyspace, query)
+            analysis_result = await self.query_analysis_service.analyze_query(keyspace, query)
 
             # Build a user-friendly response
             formatted_text = '## Query Analysis Results\n\n'
@@ -415,7 +494,9 @@ class KeyspacesMcpStdioServer:
 
             # Add contextual information about query performance in Cassandra
             if ctx:
-                ctx.info('Adding contextual information about query performance in Cassandra')  # type: ignore[unused-coroutine]
+                await ctx.info(
+                    'Adding contextual information about query performance in Cassandra'
+                )
                 formatted_text += build_query_analysis_context(analysis_result)
 
             return formatted_text
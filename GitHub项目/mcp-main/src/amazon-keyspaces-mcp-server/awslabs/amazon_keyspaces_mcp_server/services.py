@@ -15,9 +15,11 @@
 
 import logging
 import re
+import time
 from .client import UnifiedCassandraClient
+from .consts import DEFAULT_FETCH_SIZE, MAX_RESULT_ROWS, SCHEMA_CACHE_TTL
 from .models import KeyspaceInfo, QueryAnalysisResult, TableInfo
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -33,8 +35,14 @@ class DataService:
             f'SchemaService initialized. Using Keyspaces: {cassandra_client.is_using_keyspaces()}'
         )
 
-    def execute_read_only_query(self, keyspace_name: str, query: str) -> Dict[str, Any]:
-        """Execute a read-only SELECT query against the database."""
+    async def execute_read_only_query(
+        self,
+        keyspace_name: str,
+        query: str,
+        fetch_size: int = DEFAULT_FETCH_SIZE,
+        paging_state: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Execute a read-only SELECT query against the database, one page at a time."""
         logger.info(f'Executing read-only query on keyspace {keyspace_name}: {query}')
 
         # If keyspace is specified, qualify the query with the keyspace
@@ -70,38 +78,98 @@ class DataService:
                                 + query[table_name_start:]
                             )
 
-        return self.cassandra_client.execute_read_only_query(full_query)
+        return await self.cassandra_client.execute_read_only_query(
+            full_query, fetch_size=fetch_size, paging_state=paging_state
+        )
+
+    async def scan_table(
+        self, keyspace_name: str, table_name: str, max_rows: int = MAX_RESULT_ROWS
+    ) -> Dict[str, Any]:
+        """Read up to max_rows rows of a table with parallel token range queries."""
+        logger.info(f'Scanning table {keyspace_name}.{table_name}')
+        return await self.cassandra_client.scan_table(keyspace_name, table_name, max_rows=max_rows)
+
+
+class SchemaCache:
+    """In-memory cache of schema metadata read from the database.
+
+    An entry is reused until its TTL expires or the schema version reported by the client
+    for it changes, which happens when the driver refreshes its metadata after a schema
+    change event.
+    """
+
+    def __init__(self, ttl: float = SCHEMA_CACHE_TTL):
+        """Initialize an empty cache whose entries expire after ttl seconds."""
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, ...], Tuple[float, Any, Any]] = {}
+
+    async def get(
+        self, key: Tuple[str, ...], version: Any, load: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value of a key, loading it if it is missing or stale."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, cached_version, value = entry
+            if expires_at > time.monotonic() and cached_version == version:
+                return value
+
+        value = await load()
+        self._entries[key] = (time.monotonic() + self.ttl, version, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
 
 
 class SchemaService:
-    """Service for schema-related operations."""
+    """Service for schema-related operations, with cached results."""
 
-    def __init__(self, cassandra_client: UnifiedCassandraClient):
+    def __init__(
+        self, cassandra_client: UnifiedCassandraClient, cache_ttl: float = SCHEMA_CACHE_TTL
+    ):
         """Initialize the service with the given client."""
         self.cassandra_client = cassandra_client
+        self.cache = SchemaCache(cache_ttl)
         logger.info(
             f'SchemaService initialized. Using Keyspaces: {cassandra_client.is_using_keyspaces()}'
         )
 
-    def list_keyspaces(self) -> List[KeyspaceInfo]:
+    async def list_keyspaces(self) -> List[KeyspaceInfo]:
         """List all keyspaces in the database."""
         logger.info('Listing keyspaces')
-        return self.cassandra_client.list_keyspaces()
+        return await self.cache.get(
+            ('keyspaces',),
+            self.cassandra_client.schema_version(),
+            self.cassandra_client.list_keyspaces,
+        )
 
-    def list_tables(self, keyspace_name: str) -> List[TableInfo]:
+    async def list_tables(self, keyspace_name: str) -> List[TableInfo]:
         """List all tables in a keyspace."""
         logger.info(f'Listing tables for keyspace: {keyspace_name}')
-        return self.cassandra_client.list_tables(keyspace_name)
+        return await self.cache.get(
+            ('tables', keyspace_name),
+            self.cassandra_client.schema_version(keyspace_name),
+            lambda: self.cassandra_client.list_tables(keyspace_name),
+        )
 
-    def describe_keyspace(self, keyspace_name: str) -> Dict[str, Any]:
+    async def describe_keyspace(self, keyspace_name: str) -> Dict[str, Any]:
         """Get detailed information about a keyspace."""
         logger.info(f'Describing keyspace: {keyspace_name}')
-        return self.cassandra_client.describe_keyspace(keyspace_name)
+        return await self.cache.get(
+            ('keyspace', keyspace_name),
+            self.cassandra_client.schema_version(keyspace_name),
+            lambda: self.cassandra_client.describe_keyspace(keyspace_name),
+        )
 
-    def describe_table(self, keyspace_name: str, table_name: str) -> Dict[str, Any]:
+    async def describe_table(self, keyspace_name: str, table_name: str) -> Dict[str, Any]:
         """Get detailed information about a table."""
         logger.info(f'Describing table: {keyspace_name}.{table_name}')
-        return self.cassandra_client.describe_table(keyspace_name, table_name)
+        return await self.cache.get(
+            ('table', keyspace_name, table_name),
+            self.cassandra_client.schema_version(keyspace_name, table_name),
+            lambda: self.cassandra_client.describe_table(keyspace_name, table_name),
+        )
 
 
 class QueryAnalysisService:
@@ -113,7 +181,7 @@ class QueryAnalysisService:
         self.schema_service = schema_service
         logger.info('QueryAnalysisService initialized')
 
-    def analyze_query(self, keyspace_name: str, query: str) -> QueryAnalysisResult:
+    async def analyze_query(self, keyspace_name: str, query: str) -> QueryAnalysisResult:
         """Analyze a CQL query for performance characteristics."""
         logger.info(f'Analyzing query for keyspace {keyspace_name}: {query}')
 
@@ -135,7 +203,7 @@ class QueryAnalysisService:
                 return result
 
             # Get table schema information
-            tables = self.schema_service.list_tables(keyspace_name)
+            tables = await self.schema_service.list_tables(keyspace_name)
             table_info = next((t for t in tables if t.name.lower() == table_name.lower()), None)
 
             if not table_info:
@@ -146,7 +214,7 @@ class QueryAnalysisService:
                 return result
 
             # Get table details
-            table_details = self.schema_service.describe_table(keyspace_name, table_name)
+            table_details = await self.schema_service.describe_table(keyspace_name, table_name)
 
             # Extract WHERE conditions
             where_conditions = self._extract_where_conditions(normalized_query)
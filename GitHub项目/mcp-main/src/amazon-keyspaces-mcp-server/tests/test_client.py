@@ -11,16 +11,21 @@
 """Unit tests for the UnifiedCassandraClient class."""
 
 import ssl
+import threading
 import unittest
-from awslabs.amazon_keyspaces_mcp_server.client import UnifiedCassandraClient
+from awslabs.amazon_keyspaces_mcp_server.client import (
+    QUERY_EXECUTION_PROFILE,
+    UnifiedCassandraClient,
+)
 from awslabs.amazon_keyspaces_mcp_server.config import DatabaseConfig
+from awslabs.amazon_keyspaces_mcp_server.consts import DEFAULT_FETCH_SIZE, MAX_RESULT_ROWS
 from awslabs.amazon_keyspaces_mcp_server.models import TableInfo
 from cassandra.auth import PlainTextAuthProvider
 from cassandra.cluster import Cluster, Session
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 
-class TestUnifiedCassandraClient(unittest.TestCase):
+class TestUnifiedCassandraClient(unittest.IsolatedAsyncioTestCase):
     """Tests for the UnifiedCassandraClient class."""
 
     def setUp(self):
@@ -54,6 +59,28 @@ class TestUnifiedCassandraClient(unittest.TestCase):
         self.mock_cluster = Mock(spec=Cluster)
         self.mock_cluster.connect.return_value = self.mock_session
 
+        # execute_async completes with the result of the execute mock, so tests configure
+        # and assert the statements executed on execute
+        self.mock_session.execute_async.side_effect = self._execute_async
+
+    def _execute_async(self, query, parameters=None, **kwargs):
+        """Run a statement on the execute mock and return a completed response future."""
+        args = [query] if parameters is None else [query, parameters]
+        try:
+            return self._response_future(self.mock_session.execute(*args, **kwargs))
+        except Exception as e:
+            return self._response_future(error=e)
+
+    @staticmethod
+    def _response_future(result=None, error=None):
+        """Create a mock driver response future that has completed with a result or error."""
+        response_future = Mock()
+        response_future.result.return_value = result
+        response_future.add_callbacks.side_effect = lambda callback, errback: (
+            errback(error) if error else callback(None)
+        )
+        return response_future
+
     @patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster')
     def test_create_cassandra_session(self, mock_cluster_class):
         """Test creating a session for Apache Cassandra."""
@@ -230,7 +257,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             self.assertFalse(cassandra_client.is_using_keyspaces())
             self.assertTrue(keyspaces_client.is_using_keyspaces())
 
-    def test_list_keyspaces(self):
+    async def test_list_keyspaces(self):
         """Test listing keyspaces."""
         mock_row1 = Mock()
         mock_row1.keyspace_name = 'system'
@@ -250,7 +277,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             client = UnifiedCassandraClient(self.cassandra_config)
 
             # Call the method
-            keyspaces = client.list_keyspaces()
+            keyspaces = await client.list_keyspaces()
 
             # Verify the session.execute was called with the correct query
             self.mock_session.execute.assert_called_once_with(
@@ -265,7 +292,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             self.assertEqual(keyspaces[1].name, 'mykeyspace')
             self.assertEqual(keyspaces[1].replication_strategy, 'NetworkTopologyStrategy')
 
-    def test_describe_keyspace(self):
+    async def test_describe_keyspace(self):
         """Test describing a keyspace."""
         # Set up the mock session
         mock_row = Mock()
@@ -287,7 +314,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             client = UnifiedCassandraClient(self.cassandra_config)
 
             # Mock the list_tables method
-            client.list_tables = Mock(
+            client.list_tables = AsyncMock(
                 return_value=[
                     TableInfo(name='users', keyspace='mykeyspace'),
                     TableInfo(name='products', keyspace='mykeyspace'),
@@ -295,7 +322,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             )
 
             # Call the method
-            keyspace_details = client.describe_keyspace('mykeyspace')
+            keyspace_details = await client.describe_keyspace('mykeyspace')
 
             # Check if execute was called at all
             self.assertTrue(self.mock_session.execute.called, 'session.execute was not called')
@@ -312,7 +339,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             self.assertTrue(keyspace_details['durable_writes'])
             self.assertEqual(len(keyspace_details['tables']), 2)
 
-    def test_list_tables(self):
+    async def test_list_tables(self):
         """Test listing tables in a keyspace."""
         # Set up the mock session
         mock_row1 = Mock()
@@ -332,7 +359,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             client = UnifiedCassandraClient(self.cassandra_config)
 
             # Call the method
-            tables = client.list_tables('mykeyspace')
+            tables = await client.list_tables('mykeyspace')
 
             # Verify the session.execute was called with the correct query
             self.mock_session.execute.assert_called_once_with(
@@ -347,7 +374,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             self.assertEqual(tables[1].name, 'products')
             self.assertEqual(tables[1].keyspace, 'mykeyspace')
 
-    def test_describe_keyspace_not_found(self):
+    async def test_describe_keyspace_not_found(self):
         """Test describing a keyspace that doesn't exist."""
         # Set up the mock session to return None
         self.mock_session.execute.return_value = Mock()
@@ -363,11 +390,11 @@ class TestUnifiedCassandraClient(unittest.TestCase):
 
             # Call the method and verify it raises an exception
             with self.assertRaises(RuntimeError) as context:
-                client.describe_keyspace('nonexistent')
+                await client.describe_keyspace('nonexistent')
 
             self.assertIn('Keyspace not found', str(context.exception))
 
-    def test_describe_table(self):
+    async def test_describe_table(self):
         """Test describing a table."""
         # Set up the mock session for table query
         mock_table_row = Mock()
@@ -416,7 +443,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             client = UnifiedCassandraClient(self.cassandra_config)
 
             # Call the method
-            table_details = client.describe_table('mykeyspace', 'users')
+            table_details = await client.describe_table('mykeyspace', 'users')
 
             # Verify the result
             self.assertEqual(table_details['name'], 'users')
@@ -432,7 +459,7 @@ class TestUnifiedCassandraClient(unittest.TestCase):
             self.assertEqual(table_details['indexes'][0]['name'], 'name_idx')
             self.assertEqual(table_details['indexes'][0]['options']['target'], 'name')
 
-    def test_describe_table_not_found(self):
+    async def test_describe_table_not_found(self):
         """Test describing a table that doesn't exist."""
         with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster') as mock_cluster_class:
             # Configure the mock cluster to return our mock session
@@ -445,101 +472,226 @@ class TestUnifiedCassandraClient(unittest.TestCase):
 
             # Call the method and verify it raises an exception
             with self.assertRaises(RuntimeError) as context:
-                client.describe_table('mykeyspace', 'nonexistent')
+                await client.describe_table('mykeyspace', 'nonexistent')
 
             self.assertIn('Table not found', str(context.exception))
 
-    def test_execute_read_only_query(self):
-        """Test executing a read-only query."""
-        # Set up the mock session
-        mock_column_names = ['id', 'name', 'value']
-
-        mock_row = Mock()
-        mock_row.id = 1
-        mock_row.name = 'test'
-        mock_row.value = 100
+    def _create_client(self):
+        """Create a Cassandra client connected to the mock session."""
+        with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster') as mock_cluster_class:
+            # Associate the mock_session with the mock_cluster the client will connect to.
+            mock_cluster_class.return_value.connect.return_value = self.mock_session
+            return UnifiedCassandraClient(self.cassandra_config)
 
+    @staticmethod
+    def _result_set(column_names, rows, paging_state=None, coordinator_host=None):
+        """Create a mock result set with one page of tuple rows."""
         mock_result_set = Mock()
-        mock_result_set.column_names = mock_column_names
-        mock_result_set.__iter__ = lambda self: iter([mock_row])
+        mock_result_set.column_names = column_names
+        mock_result_set.current_rows = rows
+        mock_result_set.paging_state = paging_state
+        mock_result_set.has_more_pages = paging_state is not None
+        mock_result_set.response_future = Mock()
+        mock_result_set.response_future.coordinator_host = coordinator_host
+        return mock_result_set
 
-        # Set up the response future
-        mock_response_future = Mock()
+    async def test_execute_read_only_query(self):
+        """Test executing a read-only query."""
         mock_coordinator_host = Mock()
-        # mock_coordinator_host.__str__ = lambda self: '127.0.0.1'
         mock_coordinator_host.__str__ = Mock(return_value='127.0.0.1')
-        mock_response_future.coordinator_host = mock_coordinator_host
+        self.mock_session.execute.return_value = self._result_set(
+            ['id', 'name', 'value'], [(1, 'test', 100)], coordinator_host=mock_coordinator_host
+        )
+        client = self._create_client()
 
-        mock_result_set.response_future = mock_response_future
+        # Call the method
+        result = await client.execute_read_only_query('SELECT * FROM users WHERE id = 1')
 
-        self.mock_session.execute.return_value = mock_result_set
+        # Verify the query was prepared and executed as one page with the tuple row profile
+        self.mock_session.prepare.assert_called_once_with('SELECT * FROM users WHERE id = 1')
+        statement = self.mock_session.prepare.return_value.bind.return_value
+        self.assertEqual(statement.fetch_size, DEFAULT_FETCH_SIZE)
+        self.mock_session.execute.assert_called_once_with(
+            statement, paging_state=None, execution_profile=QUERY_EXECUTION_PROFILE
+        )
 
-        with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster') as mock_cluster_class:
-            # Associate the mock_session with the mock_cluster the client will connect to.
-            mock_cluster_instance = mock_cluster_class.return_value
-            mock_cluster_instance.connect.return_value = self.mock_session
+        # Verify the result
+        self.assertEqual(result['columns'], ['id', 'name', 'value'])
+        self.assertEqual(result['rows'], [{'id': 1, 'name': 'test', 'value': 100}])
+        self.assertEqual(result['row_count'], 1)
+        self.assertIsNone(result['paging_state'])
+        self.assertFalse(result['truncated'])
+        self.assertEqual(result['execution_info']['queried_host'], '127.0.0.1')
 
-            client = UnifiedCassandraClient(self.cassandra_config)
+    async def test_execute_read_only_query_with_params(self):
+        """Test executing a read-only query with parameters."""
+        self.mock_session.execute.return_value = self._result_set(['id', 'name'], [(1, 'test')])
+        client = self._create_client()
 
-            # Call the method
-            result = client.execute_read_only_query('SELECT * FROM users WHERE id = 1')
+        # Call the method with parameters
+        params = [1]
+        result = await client.execute_read_only_query('SELECT * FROM users WHERE id = ?', params)
 
-            # Verify the session.execute was called with the correct query
-            self.mock_session.execute.assert_called_once_with(
-                'SELECT * FROM users WHERE id = 1',
-            )
+        # Verify the parameters were bound to the prepared statement
+        self.mock_session.prepare.return_value.bind.assert_called_once_with(params)
 
-            # Verify the result
-            self.assertEqual(result['columns'], ['id', 'name', 'value'])
-            self.assertEqual(len(result['rows']), 1)
-            self.assertEqual(result['rows'][0]['id'], 1)
-            self.assertEqual(result['rows'][0]['name'], 'test')
-            self.assertEqual(result['rows'][0]['value'], 100)
-            self.assertEqual(result['row_count'], 1)
-            self.assertEqual(result['execution_info']['queried_host'], '127.0.0.1')
-
-    def test_execute_read_only_query_with_params(self):
-        """Test executing a read-only query with parameters."""
-        # Set up the mock session
-        mock_column_names = ['id', 'name']
+        # Verify the result
+        self.assertEqual(result['columns'], ['id', 'name'])
+        self.assertEqual(result['rows'], [{'id': 1, 'name': 'test'}])
+        self.assertEqual(result['row_count'], 1)
 
-        mock_row = Mock()
-        mock_row.id = 1
-        mock_row.name = 'test'
+    async def test_execute_read_only_query_prepared_statement_cache(self):
+        """Test that prepared statements are cached by query text."""
+        self.mock_session.execute.return_value = self._result_set(['id'], [])
+        client = self._create_client()
 
-        mock_result_set = Mock()
-        mock_result_set.column_names = mock_column_names
-        mock_result_set.__iter__ = lambda self: iter([mock_row])
-        mock_result_set.response_future = Mock()
-        mock_result_set.response_future.coordinator_host = None
+        await client.execute_read_only_query('SELECT * FROM users')
+        await client.execute_read_only_query('SELECT * FROM users')
+        await client.execute_read_only_query('SELECT id FROM users')
 
-        self.mock_session.execute.return_value = mock_result_set
+        self.assertEqual(self.mock_session.prepare.call_count, 2)
 
-        # Create the client
-        with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster') as mock_cluster_class:
-            # Associate the mock_session with the mock_cluster the client will connect to.
-            mock_cluster_instance = mock_cluster_class.return_value
-            mock_cluster_instance.connect.return_value = self.mock_session
+    async def test_execute_read_only_query_paging(self):
+        """Test that a query is resumed from a paging state and returns the next one."""
+        self.mock_session.execute.return_value = self._result_set(
+            ['id'], [(2,), (3,)], paging_state=b'\x0c\x0d'
+        )
+        client = self._create_client()
 
-            client = UnifiedCassandraClient(self.cassandra_config)
+        result = await client.execute_read_only_query(
+            'SELECT * FROM users', fetch_size=2, paging_state='0a0b'
+        )
 
-            # Call the method with parameters
-            params = [1]
-            result = client.execute_read_only_query('SELECT * FROM users WHERE id = %s', params)
+        statement = self.mock_session.prepare.return_value.bind.return_value
+        self.assertEqual(statement.fetch_size, 2)
+        self.assertEqual(self.mock_session.execute.call_args[1]['paging_state'], b'\x0a\x0b')
+        self.assertEqual(result['rows'], [{'id': 2}, {'id': 3}])
+        self.assertEqual(result['paging_state'], '0c0d')
 
-            # Verify the session.execute was called with the correct query and parameters
-            self.mock_session.execute.assert_called_once_with(
-                'SELECT * FROM users WHERE id = %s', params
-            )
+    async def test_execute_read_only_query_row_and_byte_caps(self):
+        """Test that the page size is capped and rows are cut off at the byte cap."""
+        self.mock_session.execute.return_value = self._result_set(
+            ['name'], [('a' * 60,), ('b' * 60,)], paging_state=b'\x01'
+        )
+        client = self._create_client()
 
-            # Verify the result
-            self.assertEqual(result['columns'], ['id', 'name'])
-            self.assertEqual(len(result['rows']), 1)
-            self.assertEqual(result['rows'][0]['id'], 1)
-            self.assertEqual(result['rows'][0]['name'], 'test')
-            self.assertEqual(result['row_count'], 1)
+        result = await client.execute_read_only_query(
+            'SELECT * FROM users', fetch_size=MAX_RESULT_ROWS + 1, paging_state='ff', max_bytes=100
+        )
 
-    def test_execute_read_only_query_non_select(self):
+        statement = self.mock_session.prepare.return_value.bind.return_value
+        self.assertEqual(statement.fetch_size, MAX_RESULT_ROWS)
+        self.assertEqual(result['row_count'], 1)
+        self.assertTrue(result['truncated'])
+        # The page can be read again from where it started
+        self.assertEqual(result['paging_state'], 'ff')
+
+    def _scan_table_metadata(self, partitioner):
+        """Set up the driver metadata of table ks.users partitioned by id."""
+        table = Mock()
+        table.partition_key = [Mock()]
+        table.partition_key[0].name = 'id'
+        self.mock_session.cluster = Mock()
+        self.mock_session.cluster.metadata.keyspaces = {'ks': Mock(tables={'users': table})}
+        self.mock_session.cluster.metadata.partitioner = partitioner
+
+    async def test_scan_table(self):
+        """Test that a table is scanned with parallel token range queries, page by page."""
+        self._scan_table_metadata('org.apache.cassandra.dht.Murmur3Partitioner')
+
+        first = self._result_set(['id'], [(1,)], paging_state=b'\x01')
+
+        first.response_future = self._response_future(self._result_set(['id'], [(2,)]))
+        self.mock_session.execute.side_effect = [
+            first,
+            self._result_set(['id'], [(3,), (4,)]),
+        ]
+        client = self._create_client()
+
+        result = await client.scan_table('ks', 'users', splits=2, max_rows=3)
+
+        self.mock_session.prepare.assert_called_once_with(
+            'SELECT * FROM ks.users WHERE token(id) > ? AND token(id) <= ?'
+        )
+        bind = self.mock_session.prepare.return_value.bind
+        self.assertEqual(bind.call_args_list[0][0][0][0], -(2**63))
+        self.assertEqual(bind.call_args_list[-1][0][0][1], 2**63 - 1)
+        self.assertEqual(self.mock_session.execute_async.call_count, 2)
+        # The first pages of both ranges are read before the second page of the first range
+        self.assertEqual(result['rows'], [{'id': 1}, {'id': 3}, {'id': 4}])
+        self.assertTrue(result['truncated'])
+
+    async def test_scan_table_default_partitioner(self):
+        """Test that the token ring of the Amazon Keyspaces DefaultPartitioner is scanned."""
+        self._scan_table_metadata('com.amazonaws.cassandra.DefaultPartitioner')
+        self.mock_session.execute.side_effect = [
+            self._result_set(['id'], [(1,)]),
+            self._result_set(['id'], [(2,)]),
+        ]
+        client = self._create_client()
+
+        result = await client.scan_table('ks', 'users', splits=2)
+
+        bind = self.mock_session.prepare.return_value.bind
+        self.assertEqual(
+            [call[0][0] for call in bind.call_args_list], [[-1, 2**126 - 1], [2**126 - 1, 2**127]]
+        )
+        self.assertEqual(result['rows'], [{'id': 1}, {'id': 2}])
+        self.assertFalse(result['truncated'])
+
+    async def test_scan_table_random_partitioner_from_system_local(self):
+        """Test that the partitioner is read from system.local when the driver lacks it."""
+        self._scan_table_metadata(None)
+        local = Mock()
+        local.one.return_value = Mock(partitioner='org.apache.cassandra.dht.RandomPartitioner')
+        self.mock_session.execute.side_effect = [local, self._result_set(['id'], [(1,)])]
+        client = self._create_client()
+
+        result = await client.scan_table('ks', 'users', splits=1)
+
+        self.assertEqual(
+            self.mock_session.execute_async.call_args_list[0][0][0],
+            'SELECT partitioner FROM system.local',
+        )
+        bind = self.mock_session.prepare.return_value.bind
+        self.assertEqual(bind.call_args[0][0], [-1, 2**127])
+        self.assertEqual(result['rows'], [{'id': 1}])
+
+    async def test_scan_table_unsupported_partitioner(self):
+        """Test that scanning with an order preserving partitioner raises an error."""
+        self._scan_table_metadata('org.apache.cassandra.dht.ByteOrderedPartitioner')
+        client = self._create_client()
+
+        with self.assertRaises(RuntimeError) as context:
+            await client.scan_table('ks', 'users')
+
+        self.assertIn('ByteOrderedPartitioner', str(context.exception))
+
+    async def test_scan_table_unknown_partitioner(self):
+        """Test that scanning raises an error when the partitioner cannot be read."""
+        self._scan_table_metadata(None)
+        local = Mock()
+        local.one.return_value = None
+        self.mock_session.execute.side_effect = [local]
+        client = self._create_client()
+
+        with self.assertRaises(RuntimeError) as context:
+            await client.scan_table('ks', 'users')
+
+        self.assertIn('Could not read the partitioner', str(context.exception))
+
+    async def test_scan_table_not_found(self):
+        """Test that scanning an unknown table raises an error."""
+        self.mock_session.cluster = Mock()
+        self.mock_session.cluster.metadata.keyspaces = {}
+        client = self._create_client()
+
+        with self.assertRaises(RuntimeError) as context:
+            await client.scan_table('ks', 'users')
+
+        self.assertIn('Table not found', str(context.exception))
+
+    async def test_execute_read_only_query_non_select(self):
         """Test executing a non-SELECT query."""
         # Create the client
         with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster'):
@@ -547,11 +699,13 @@ class TestUnifiedCassandraClient(unittest.TestCase):
 
             # Call the method with a non-SELECT query and verify it raises an exception
             with self.assertRaises(ValueError) as context:
-                client.execute_read_only_query("INSERT INTO users (id, name) VALUES (1, 'test')")
+                await client.execute_read_only_query(
+                    "INSERT INTO users (id, name) VALUES (1, 'test')"
+                )
 
             self.assertIn('Only SELECT queries are allowed', str(context.exception))
 
-    def test_execute_read_only_query_unsafe_operations(self):
+    async def test_execute_read_only_query_unsafe_operations(self):
         """Test executing a query with unsafe operations."""
         # Create the client
         with patch('awslabs.amazon_keyspaces_mcp_server.client.Cluster'):
@@ -559,10 +713,51 @@ class TestUnifiedCassandraClient(unittest.TestCase):
 
             # Call the method with a query containing unsafe operations and verify it raises an exception
             with self.assertRaises(ValueError) as context:
-                client.execute_read_only_query('SELECT * FROM users; DROP TABLE users;')
+                await client.execute_read_only_query('SELECT * FROM users; DROP TABLE users;')
 
             self.assertIn('potentially unsafe operations', str(context.exception))
 
+    async def test_result_delivered_on_driver_thread(self):
+        """Test that a result delivered on a driver thread resolves the awaiting coroutine."""
+        response_future = Mock()
+        response_future.result.return_value = self._result_set(['id'], [(1,)])
+        response_future.add_callbacks.side_effect = lambda callback, errback: threading.Timer(
+            0.01, callback, [None]
+        ).start()
+        self.mock_session.execute_async.side_effect = None
+        self.mock_session.execute_async.return_value = response_future
+        client = self._create_client()
+
+        result = await client.execute_read_only_query('SELECT * FROM users')
+
+        self.assertEqual(result['rows'], [{'id': 1}])
+
+    async def test_execute_error_propagated(self):
+        """Test that an error of an asynchronous execution is raised to the caller."""
+        self.mock_session.execute.side_effect = Exception('Read timeout')
+        client = self._create_client()
+
+        with self.assertRaises(RuntimeError) as context:
+            await client.list_tables('mykeyspace')
+
+        self.assertIn('Read timeout', str(context.exception))
+
+    def test_schema_version(self):
+        """Test that the schema version follows the metadata objects of the driver."""
+        table = Mock()
+        keyspace = Mock(tables={'users': table})
+        self.mock_session.cluster = Mock()
+        self.mock_session.cluster.metadata.keyspaces = {'ks': keyspace}
+        client = self._create_client()
+
+        self.assertIs(client.schema_version('ks', 'users'), table)
+        version = client.schema_version('ks')
+
+        # The driver replaces the metadata of a table after a schema change
+        keyspace.tables = {'users': Mock()}
+        self.assertNotEqual(client.schema_version('ks'), version)
+        self.assertIsNone(client.schema_version('missing'))
+
     def test_close(self):
         """Test closing the client."""
         # Create the client
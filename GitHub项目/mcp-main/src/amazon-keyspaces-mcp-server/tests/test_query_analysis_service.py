@@ -16,7 +16,7 @@ from awslabs.amazon_keyspaces_mcp_server.services import QueryAnalysisService, S
 from unittest.mock import Mock, PropertyMock
 
 
-class TestQueryAnalysisService(unittest.TestCase):
+class TestQueryAnalysisService(unittest.IsolatedAsyncioTestCase):
     """Tests for the QueryAnalysisService class."""
 
     def setUp(self):
@@ -27,49 +27,49 @@ class TestQueryAnalysisService(unittest.TestCase):
             self.mock_client, self.mock_schema_service
         )
 
-    def test_normalize_query(self):
+    async def test_normalize_query(self):
         """Test normalizing a query."""
         query = '  SELECT * FROM users WHERE id = 1  '
         normalized = self.query_analysis_service._normalize_query(query)
         self.assertEqual(normalized, 'select * from users where id = 1')
 
-    def test_extract_table_name_simple(self):
+    async def test_extract_table_name_simple(self):
         """Test extracting table name from a simple query."""
         query = 'select * from users where id = 1'
         table_name = self.query_analysis_service._extract_table_name(query)
         self.assertEqual(table_name, 'users')
 
-    def test_extract_table_name_with_keyspace(self):
+    async def test_extract_table_name_with_keyspace(self):
         """Test extracting table name from a query with keyspace qualifier."""
         query = 'select * from myks.users where id = 1'
         table_name = self.query_analysis_service._extract_table_name(query)
         self.assertEqual(table_name, 'users')
 
-    def test_extract_where_conditions_simple(self):
+    async def test_extract_where_conditions_simple(self):
         """Test extracting WHERE conditions from a simple query."""
         query = 'select * from users where id = 1'
         conditions = self.query_analysis_service._extract_where_conditions(query)
         self.assertEqual(conditions, ['id'])
 
-    def test_extract_where_conditions_multiple(self):
+    async def test_extract_where_conditions_multiple(self):
         """Test extracting WHERE conditions from a query with multiple conditions."""
         query = "select * from users where id = 1 and name = 'test'"
         conditions = self.query_analysis_service._extract_where_conditions(query)
         self.assertEqual(conditions, ['id', 'name'])
 
-    def test_extract_where_conditions_with_order_by(self):
+    async def test_extract_where_conditions_with_order_by(self):
         """Test extracting WHERE conditions from a query with ORDER BY clause."""
         query = 'select * from users where id = 1 order by name'
         conditions = self.query_analysis_service._extract_where_conditions(query)
         self.assertEqual(conditions, ['id'])
 
-    def test_extract_where_conditions_with_limit(self):
+    async def test_extract_where_conditions_with_limit(self):
         """Test extracting WHERE conditions from a query with LIMIT clause."""
         query = 'select * from users where id = 1 limit 10'
         conditions = self.query_analysis_service._extract_where_conditions(query)
         self.assertEqual(conditions, ['id'])
 
-    def test_extract_partition_key_columns(self):
+    async def test_extract_partition_key_columns(self):
         """Test extracting partition key columns from table details."""
         table_details = {
             'columns': [
@@ -81,7 +81,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         partition_keys = self.query_analysis_service._extract_partition_key_columns(table_details)
         self.assertEqual(partition_keys, ['id', 'region'])
 
-    def test_extract_clustering_columns(self):
+    async def test_extract_clustering_columns(self):
         """Test extracting clustering columns from table details."""
         table_details = {
             'columns': [
@@ -93,7 +93,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         clustering_columns = self.query_analysis_service._extract_clustering_columns(table_details)
         self.assertEqual(clustering_columns, ['created_at', 'updated_at'])
 
-    def test_check_partition_key_usage_all_used(self):
+    async def test_check_partition_key_usage_all_used(self):
         """Test checking partition key usage when all keys are used."""
         partition_keys = ['id', 'region']
         where_conditions = ['id', 'region', 'name']
@@ -102,7 +102,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         )
         self.assertTrue(result)
 
-    def test_check_partition_key_usage_not_all_used(self):
+    async def test_check_partition_key_usage_not_all_used(self):
         """Test checking partition key usage when not all keys are used."""
         partition_keys = ['id', 'region']
         where_conditions = ['id', 'name']
@@ -111,7 +111,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         )
         self.assertFalse(result)
 
-    def test_check_clustering_column_usage_used(self):
+    async def test_check_clustering_column_usage_used(self):
         """Test checking clustering column usage when at least one is used."""
         clustering_columns = ['created_at', 'updated_at']
         where_conditions = ['id', 'created_at']
@@ -120,7 +120,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         )
         self.assertTrue(result)
 
-    def test_check_clustering_column_usage_not_used(self):
+    async def test_check_clustering_column_usage_not_used(self):
         """Test checking clustering column usage when none are used."""
         clustering_columns = ['created_at', 'updated_at']
         where_conditions = ['id', 'name']
@@ -129,7 +129,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         )
         self.assertFalse(result)
 
-    def test_check_secondary_index_usage_used(self):
+    async def test_check_secondary_index_usage_used(self):
         """Test checking secondary index usage when an index is used."""
         table_details = {'indexes': [{'options': {'target': 'name'}}]}
         where_conditions = ['id', 'name']
@@ -138,7 +138,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         )
         self.assertTrue(result)
 
-    def test_check_secondary_index_usage_not_used(self):
+    async def test_check_secondary_index_usage_not_used(self):
         """Test checking secondary index usage when no index is used."""
         table_details = {'indexes': [{'options': {'target': 'email'}}]}
         where_conditions = ['id', 'name']
@@ -147,7 +147,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         )
         self.assertFalse(result)
 
-    def test_check_secondary_index_usage_no_indexes(self):
+    async def test_check_secondary_index_usage_no_indexes(self):
         """Test checking secondary index usage when no indexes exist."""
         table_details = {'indexes': []}
         where_conditions = ['id', 'name']
@@ -156,7 +156,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         )
         self.assertFalse(result)
 
-    def test_check_secondary_index_usage_with_quotes(self):
+    async def test_check_secondary_index_usage_with_quotes(self):
         """Test checking secondary index usage with quoted column names."""
         table_details = {'indexes': [{'options': {'target': '"userName"'}}]}
         where_conditions = ['id', 'userName']
@@ -165,7 +165,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         )
         self.assertTrue(result)
 
-    def test_generate_performance_assessment_good_query(self):
+    async def test_generate_performance_assessment_good_query(self):
         """Test generating performance assessment for a good query."""
         result = QueryAnalysisResult(query='select * from users where id = 1')
         result.uses_partition_key = True
@@ -183,7 +183,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         self.assertNotIn('ALLOW FILTERING', result.performance_assessment)
         self.assertNotIn('FULL TABLE SCAN', result.performance_assessment)
 
-    def test_generate_performance_assessment_bad_query(self):
+    async def test_generate_performance_assessment_bad_query(self):
         """Test generating performance assessment for a bad query."""
         result = QueryAnalysisResult(query='select * from users')
         result.uses_partition_key = False
@@ -201,7 +201,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         self.assertIn('FULL TABLE SCAN', result.performance_assessment)
         self.assertIn('Include all partition key columns', result.recommendations[0])
 
-    def test_generate_performance_assessment_with_secondary_index(self):
+    async def test_generate_performance_assessment_with_secondary_index(self):
         """Test generating performance assessment for a query using secondary index."""
         result = QueryAnalysisResult(query="select * from users where email = 'test@example.com'")
         result.uses_partition_key = False
@@ -217,7 +217,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         self.assertIn('SECONDARY INDEX USAGE', result.performance_assessment)
         self.assertIn('Monitor the performance', ' '.join(result.recommendations))
 
-    def test_analyze_query_integration(self):
+    async def test_analyze_query_integration(self):
         """Test the analyze_query method with a complete integration test."""
         # Mock the schema service responses
         table_info_mock = Mock()
@@ -235,7 +235,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         }
 
         # Call the analyze_query method
-        result = self.query_analysis_service.analyze_query(
+        result = await self.query_analysis_service.analyze_query(
             'myks', "SELECT * FROM users WHERE id = 1 AND name = 'test'"
         )
 
@@ -248,13 +248,13 @@ class TestQueryAnalysisService(unittest.TestCase):
         self.assertFalse(result.is_full_table_scan)
         self.assertIn('EFFICIENT PARTITION KEY USAGE', result.performance_assessment)
 
-    def test_analyze_query_with_error(self):
+    async def test_analyze_query_with_error(self):
         """Test the analyze_query method when an error occurs."""
         # Mock the schema service to raise an exception
         self.mock_schema_service.list_tables.side_effect = Exception('Test error')
 
         # Call the analyze_query method
-        result = self.query_analysis_service.analyze_query(
+        result = await self.query_analysis_service.analyze_query(
             'myks', 'SELECT * FROM users WHERE id = 1'
         )
 
@@ -262,7 +262,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         self.assertIn('Error analyzing query', result.performance_assessment)
         self.assertEqual(result.table_name, 'users')
 
-    def test_analyze_query_with_allow_filtering(self):
+    async def test_analyze_query_with_allow_filtering(self):
         """Test analyzing a query with ALLOW FILTERING."""
         # Mock the schema service responses
         table_info_mock = Mock()
@@ -279,7 +279,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         }
 
         # Call the analyze_query method
-        result = self.query_analysis_service.analyze_query(
+        result = await self.query_analysis_service.analyze_query(
             'myks', "SELECT * FROM users WHERE name = 'test' ALLOW FILTERING"
         )
 
@@ -288,7 +288,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         self.assertIn('ALLOW FILTERING', result.performance_assessment)
         self.assertIn('Avoid using ALLOW FILTERING', ' '.join(result.recommendations))
 
-    def test_analyze_query_with_secondary_index(self):
+    async def test_analyze_query_with_secondary_index(self):
         """Test analyzing a query that uses a secondary index."""
         table_info_mock = Mock()
         type(table_info_mock).name = PropertyMock(return_value='users')
@@ -304,7 +304,7 @@ class TestQueryAnalysisService(unittest.TestCase):
         }
 
         # Call the analyze_query method
-        result = self.query_analysis_service.analyze_query(
+        result = await self.query_analysis_service.analyze_query(
             'myks', "SELECT * FROM users WHERE name = 'test'"
         )
 
@@ -313,13 +313,13 @@ class TestQueryAnalysisService(unittest.TestCase):
         self.assertIn('SECONDARY INDEX USAGE', result.performance_assessment)
         self.assertIn('Monitor the performance', ' '.join(result.recommendations))
 
-    def test_analyze_query_table_not_found(self):
+    async def test_analyze_query_table_not_found(self):
         """Test analyzing a query when the table is not found."""
         # Mock the schema service responses
         self.mock_schema_service.list_tables.return_value = []
 
         # Call the analyze_query method
-        result = self.query_analysis_service.analyze_query(
+        result = await self.query_analysis_service.analyze_query(
             'myks', 'SELECT * FROM users WHERE id = 1'
         )
 
@@ -328,10 +328,10 @@ class TestQueryAnalysisService(unittest.TestCase):
         self.assertIn("Table 'users' not found", result.performance_assessment)
         self.assertIn('Verify the table name', result.recommendations[0])
 
-    def test_analyze_query_unable_to_determine_table(self):
+    async def test_analyze_query_unable_to_determine_table(self):
         """Test analyzing a query when the table name cannot be determined."""
         # Call the analyze_query method with a malformed query
-        result = self.query_analysis_service.analyze_query(
+        result = await self.query_analysis_service.analyze_query(
             'myks',
             'SELECT * WHERE id = 1',  # Missing FROM clause
         )
@@ -11,7 +11,7 @@
 """Unit tests for the server module."""
 
 import unittest
-from awslabs.amazon_keyspaces_mcp_server.consts import MAX_DISPLAY_ROWS
+from awslabs.amazon_keyspaces_mcp_server.consts import DEFAULT_FETCH_SIZE, MAX_DISPLAY_ROWS
 from awslabs.amazon_keyspaces_mcp_server.models import KeyspaceInfo, QueryAnalysisResult, TableInfo
 from awslabs.amazon_keyspaces_mcp_server.server import (
     KeyspacesMcpStdioServer,
@@ -22,101 +22,117 @@ from awslabs.amazon_keyspaces_mcp_server.server import (
     get_proxy,
     list_keyspaces,
     list_tables,
+    scan_table,
 )
 from mcp.server.fastmcp import Context
 from unittest.mock import AsyncMock, Mock, patch
 
 
-class TestServerTools(unittest.TestCase):
+class TestServerTools(unittest.IsolatedAsyncioTestCase):
     """Tests for the server tool functions."""
 
     @patch('awslabs.amazon_keyspaces_mcp_server.server.get_proxy')
-    def test_list_keyspaces(self, mock_get_proxy):
+    async def test_list_keyspaces(self, mock_get_proxy):
         """Test the list_keyspaces tool."""
         # Set up the mock
-        mock_proxy = Mock()
+        mock_proxy = AsyncMock()
         mock_proxy.handle_list_keyspaces.return_value = 'Keyspaces list'
         mock_get_proxy.return_value = mock_proxy
 
         # Call the function
-        result = list_keyspaces()
+        result = await list_keyspaces()
 
         # Verify the result
         self.assertEqual(result, 'Keyspaces list')
         mock_proxy.handle_list_keyspaces.assert_called_once_with(None)
 
     @patch('awslabs.amazon_keyspaces_mcp_server.server.get_proxy')
-    def test_list_tables(self, mock_get_proxy):
+    async def test_list_tables(self, mock_get_proxy):
         """Test the list_tables tool."""
         # Set up the mock
-        mock_proxy = Mock()
+        mock_proxy = AsyncMock()
         mock_proxy._handle_list_tables.return_value = 'Tables list'
         mock_get_proxy.return_value = mock_proxy
 
         # Call the function
-        result = list_tables('mykeyspace')
+        result = await list_tables('mykeyspace')
 
         # Verify the result
         self.assertEqual(result, 'Tables list')
         mock_proxy._handle_list_tables.assert_called_once_with('mykeyspace', None)
 
     @patch('awslabs.amazon_keyspaces_mcp_server.server.get_proxy')
-    def test_describe_keyspace(self, mock_get_proxy):
+    async def test_describe_keyspace(self, mock_get_proxy):
         """Test the describe_keyspace tool."""
         # Set up the mock
-        mock_proxy = Mock()
+        mock_proxy = AsyncMock()
         mock_proxy._handle_describe_keyspace.return_value = 'Keyspace details'
         mock_get_proxy.return_value = mock_proxy
 
         # Call the function
-        result = describe_keyspace('mykeyspace')
+        result = await describe_keyspace('mykeyspace')
 
         # Verify the result
         self.assertEqual(result, 'Keyspace details')
         mock_proxy._handle_describe_keyspace.assert_called_once_with('mykeyspace', None)
 
     @patch('awslabs.amazon_keyspaces_mcp_server.server.get_proxy')
-    def test_describe_table(self, mock_get_proxy):
+    async def test_describe_table(self, mock_get_proxy):
         """Test the describe_table tool."""
         # Set up the mock
-        mock_proxy = Mock()
+        mock_proxy = AsyncMock()
         mock_proxy._handle_describe_table.return_value = 'Table details'
         mock_get_proxy.return_value = mock_proxy
 
         # Call the function
-        result = describe_table('mykeyspace', 'users')
+        result = await describe_table('mykeyspace', 'users')
 
         # Verify the result
         self.assertEqual(result, 'Table details')
         mock_proxy._handle_describe_table.assert_called_once_with('mykeyspace', 'users', None)
 
     @patch('awslabs.amazon_keyspaces_mcp_server.server.get_proxy')
-    def test_execute_query(self, mock_get_proxy):
+    async def test_execute_query(self, mock_get_proxy):
         """Test the execute_query tool."""
         # Set up the mock
-        mock_proxy = Mock()
+        mock_proxy = AsyncMock()
         mock_proxy._handle_execute_query.return_value = 'Query results'
         mock_get_proxy.return_value = mock_proxy
 
         # Call the function
-        result = execute_query('mykeyspace', 'SELECT * FROM users')
+        result = await execute_query('mykeyspace', 'SELECT * FROM users', 10, '0a0b')
 
         # Verify the result
         self.assertEqual(result, 'Query results')
         mock_proxy._handle_execute_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users', None
+            'mykeyspace', 'SELECT * FROM users', None, fetch_size=10, paging_state='0a0b'
         )
 
     @patch('awslabs.amazon_keyspaces_mcp_server.server.get_proxy')
-    def test_analyze_query_performance(self, mock_get_proxy):
+    async def test_scan_table(self, mock_get_proxy):
+        """Test the scan_table tool."""
+        # Set up the mock
+        mock_proxy = AsyncMock()
+        mock_proxy._handle_scan_table.return_value = 'Scan results'
+        mock_get_proxy.return_value = mock_proxy
+
+        # Call the function
+        result = await scan_table('mykeyspace', 'users', 50)
+
+        # Verify the result
+        self.assertEqual(result, 'Scan results')
+        mock_proxy._handle_scan_table.assert_called_once_with('mykeyspace', 'users', 50, None)
+
+    @patch('awslabs.amazon_keyspaces_mcp_server.server.get_proxy')
+    async def test_analyze_query_performance(self, mock_get_proxy):
         """Test the analyze_query_performance tool."""
         # Set up the mock
-        mock_proxy = Mock()
+        mock_proxy = AsyncMock()
         mock_proxy._handle_analyze_query_performance.return_value = 'Query analysis'
         mock_get_proxy.return_value = mock_proxy
 
         # Call the function
-        result = analyze_query_performance('mykeyspace', 'SELECT * FROM users')
+        result = await analyze_query_performance('mykeyspace', 'SELECT * FROM users')
 
         # Verify the result
         self.assertEqual(result, 'Query analysis')
@@ -125,20 +141,20 @@ class TestServerTools(unittest.TestCase):
         )
 
 
-class TestKeyspacesMcpStdioServer(unittest.TestCase):
+class TestKeyspacesMcpStdioServer(unittest.IsolatedAsyncioTestCase):
     """Tests for the KeyspacesMcpStdioServer class."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_data_service = Mock()
-        self.mock_query_analysis_service = Mock()
-        self.mock_schema_service = Mock()
+        self.mock_data_service = AsyncMock()
+        self.mock_query_analysis_service = AsyncMock()
+        self.mock_schema_service = AsyncMock()
         self.server = KeyspacesMcpStdioServer(
             self.mock_data_service, self.mock_query_analysis_service, self.mock_schema_service
         )
         self.mock_context = AsyncMock(spec=Context)
 
-    def test_handle_list_keyspaces(self):
+    async def test_handle_list_keyspaces(self):
         """Test the handle_list_keyspaces method."""
         # Set up the mock
         keyspace1 = KeyspaceInfo(name='system')
@@ -146,7 +162,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.list_keyspaces.return_value = [keyspace1, keyspace2]
 
         # Call the method
-        result = self.server.handle_list_keyspaces(self.mock_context)
+        result = await self.server.handle_list_keyspaces(self.mock_context)
 
         # Verify the result
         self.assertIn('## Available Keyspaces', result)
@@ -155,13 +171,13 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.list_keyspaces.assert_called_once()
         self.mock_context.info.assert_called_once()
 
-    def test_handle_list_keyspaces_empty(self):
+    async def test_handle_list_keyspaces_empty(self):
         """Test the handle_list_keyspaces method with no keyspaces."""
         # Set up the mock
         self.mock_schema_service.list_keyspaces.return_value = []
 
         # Call the method
-        result = self.server.handle_list_keyspaces(self.mock_context)
+        result = await self.server.handle_list_keyspaces(self.mock_context)
 
         # Verify the result
         self.assertIn('## Available Keyspaces', result)
@@ -169,19 +185,19 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.list_keyspaces.assert_called_once()
         self.mock_context.info.assert_called_once()
 
-    def test_handle_list_keyspaces_error(self):
+    async def test_handle_list_keyspaces_error(self):
         """Test the handle_list_keyspaces method with an error."""
         # Set up the mock
         self.mock_schema_service.list_keyspaces.side_effect = Exception('Test error')
 
         # Call the method and verify it raises an exception
         with self.assertRaises(Exception) as context:
-            self.server.handle_list_keyspaces(self.mock_context)
+            await self.server.handle_list_keyspaces(self.mock_context)
 
         self.assertIn('Error listing keyspaces', str(context.exception))
         self.mock_schema_service.list_keyspaces.assert_called_once()
 
-    def test_handle_list_tables(self):
+    async def test_handle_list_tables(self):
         """Test the _handle_list_tables method."""
         # Set up the mock
         table1 = TableInfo(name='users', keyspace='mykeyspace')
@@ -189,7 +205,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.list_tables.return_value = [table1, table2]
 
         # Call the method
-        result = self.server._handle_list_tables('mykeyspace', self.mock_context)
+        result = await self.server._handle_list_tables('mykeyspace', self.mock_context)
 
         # Verify the result
         self.assertIn('## Tables in Keyspace `mykeyspace`', result)
@@ -198,13 +214,13 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.list_tables.assert_called_once_with('mykeyspace')
         self.mock_context.info.assert_called_once()
 
-    def test_handle_list_tables_empty(self):
+    async def test_handle_list_tables_empty(self):
         """Test the _handle_list_tables method with no tables."""
         # Set up the mock
         self.mock_schema_service.list_tables.return_value = []
 
         # Call the method
-        result = self.server._handle_list_tables('mykeyspace', self.mock_context)
+        result = await self.server._handle_list_tables('mykeyspace', self.mock_context)
 
         # Verify the result
         self.assertIn('## Tables in Keyspace `mykeyspace`', result)
@@ -212,19 +228,19 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.list_tables.assert_called_once_with('mykeyspace')
         self.mock_context.info.assert_called_once()
 
-    def test_handle_list_tables_error(self):
+    async def test_handle_list_tables_error(self):
         """Test the _handle_list_tables method with an error."""
         # Set up the mock
         self.mock_schema_service.list_tables.side_effect = Exception('Test error')
 
         # Call the method and verify it raises an exception
         with self.assertRaises(Exception) as context:
-            self.server._handle_list_tables('mykeyspace', self.mock_context)
+            await self.server._handle_list_tables('mykeyspace', self.mock_context)
 
         self.assertIn('Error listing tables', str(context.exception))
         self.mock_schema_service.list_tables.assert_called_once_with('mykeyspace')
 
-    def test_handle_describe_keyspace(self):
+    async def test_handle_describe_keyspace(self):
         """Test the _handle_describe_keyspace method."""
         # Set up the mock
         keyspace_details = {
@@ -235,7 +251,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.describe_keyspace.return_value = keyspace_details
 
         # Call the method
-        result = self.server._handle_describe_keyspace('mykeyspace', self.mock_context)
+        result = await self.server._handle_describe_keyspace('mykeyspace', self.mock_context)
 
         # Verify the result
         self.assertIn('## Keyspace: `mykeyspace`', result)
@@ -246,7 +262,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.describe_keyspace.assert_called_once_with('mykeyspace')
         self.mock_context.info.assert_called_once()
 
-    def test_handle_describe_keyspace_simple_strategy(self):
+    async def test_handle_describe_keyspace_simple_strategy(self):
         """Test the _handle_describe_keyspace method with SimpleStrategy."""
         # Set up the mock
         keyspace_details = {
@@ -257,7 +273,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.describe_keyspace.return_value = keyspace_details
 
         # Call the method
-        result = self.server._handle_describe_keyspace('mykeyspace', self.mock_context)
+        result = await self.server._handle_describe_keyspace('mykeyspace', self.mock_context)
 
         # Verify the result
         self.assertIn('## Keyspace: `mykeyspace`', result)
@@ -268,19 +284,19 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.describe_keyspace.assert_called_once_with('mykeyspace')
         self.mock_context.info.assert_called_once()
 
-    def test_handle_describe_keyspace_error(self):
+    async def test_handle_describe_keyspace_error(self):
         """Test the _handle_describe_keyspace method with an error."""
         # Set up the mock
         self.mock_schema_service.describe_keyspace.side_effect = Exception('Test error')
 
         # Call the method and verify it raises an exception
         with self.assertRaises(Exception) as context:
-            self.server._handle_describe_keyspace('mykeyspace', self.mock_context)
+            await self.server._handle_describe_keyspace('mykeyspace', self.mock_context)
 
         self.assertIn('Error describing keyspace', str(context.exception))
         self.mock_schema_service.describe_keyspace.assert_called_once_with('mykeyspace')
 
-    def test_handle_describe_table(self):
+    async def test_handle_describe_table(self):
         """Test the _handle_describe_table method."""
         # Set up the mock
         table_details = {
@@ -297,7 +313,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.describe_table.return_value = table_details
 
         # Call the method
-        result = self.server._handle_describe_table('mykeyspace', 'users', self.mock_context)
+        result = await self.server._handle_describe_table('mykeyspace', 'users', self.mock_context)
 
         # Verify the result
         self.assertIn('## Table: `mykeyspace.users`', result)
@@ -312,7 +328,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.describe_table.assert_called_once_with('mykeyspace', 'users')
         self.mock_context.info.assert_called_once()
 
-    def test_handle_describe_table_with_clustering_columns(self):
+    async def test_handle_describe_table_with_clustering_columns(self):
         """Test the _handle_describe_table method with clustering columns."""
         # Set up the mock
         table_details = {
@@ -329,7 +345,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.describe_table.return_value = table_details
 
         # Call the method
-        result = self.server._handle_describe_table('mykeyspace', 'users', self.mock_context)
+        result = await self.server._handle_describe_table('mykeyspace', 'users', self.mock_context)
 
         # Verify the result
         self.assertIn('## Table: `mykeyspace.users`', result)
@@ -345,19 +361,19 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_schema_service.describe_table.assert_called_once_with('mykeyspace', 'users')
         self.mock_context.info.assert_called_once()
 
-    def test_handle_describe_table_error(self):
+    async def test_handle_describe_table_error(self):
         """Test the _handle_describe_table method with an error."""
         # Set up the mock
         self.mock_schema_service.describe_table.side_effect = Exception('Test error')
 
         # Call the method and verify it raises an exception
         with self.assertRaises(Exception) as context:
-            self.server._handle_describe_table('mykeyspace', 'users', self.mock_context)
+            await self.server._handle_describe_table('mykeyspace', 'users', self.mock_context)
 
         self.assertIn('Error describing table', str(context.exception))
         self.mock_schema_service.describe_table.assert_called_once_with('mykeyspace', 'users')
 
-    def test_handle_execute_query(self):
+    async def test_handle_execute_query(self):
         """Test the _handle_execute_query method."""
         # Set up the mock
         query_results = {
@@ -368,7 +384,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_data_service.execute_read_only_query.return_value = query_results
 
         # Call the method
-        result = self.server._handle_execute_query(
+        result = await self.server._handle_execute_query(
             'mykeyspace', 'SELECT * FROM users', self.mock_context
         )
 
@@ -379,18 +395,18 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.assertIn('| id | name |', result)
         self.assertIn('| 1 | test |', result)
         self.mock_data_service.execute_read_only_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users'
+            'mykeyspace', 'SELECT * FROM users', fetch_size=DEFAULT_FETCH_SIZE, paging_state=None
         )
         self.mock_context.info.assert_called_once()
 
-    def test_handle_execute_query_no_rows(self):
+    async def test_handle_execute_query_no_rows(self):
         """Test the _handle_execute_query method with no rows."""
         # Set up the mock
         query_results = {'columns': ['id', 'name'], 'rows': [], 'row_count': 0}
         self.mock_data_service.execute_read_only_query.return_value = query_results
 
         # Call the method
-        result = self.server._handle_execute_query(
+        result = await self.server._handle_execute_query(
             'mykeyspace', 'SELECT * FROM users WHERE id = 999', self.mock_context
         )
 
@@ -400,11 +416,14 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.assertIn('**Row Count:** 0', result)
         self.assertIn('No rows returned.', result)
         self.mock_data_service.execute_read_only_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users WHERE id = 999'
+            'mykeyspace',
+            'SELECT * FROM users WHERE id = 999',
+            fetch_size=DEFAULT_FETCH_SIZE,
+            paging_state=None,
         )
         self.mock_context.info.assert_called_once()
 
-    def test_handle_execute_query_many_rows(self):
+    async def test_handle_execute_query_many_rows(self):
         """Test the _handle_execute_query method with many rows."""
         # Set up the mock
         rows = []
@@ -415,7 +434,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_data_service.execute_read_only_query.return_value = query_results
 
         # Call the method
-        result = self.server._handle_execute_query(
+        result = await self.server._handle_execute_query(
             'mykeyspace', 'SELECT * FROM users', self.mock_context
         )
 
@@ -425,15 +444,15 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.assertIn(f'**Row Count:** {len(rows)}', result)
         self.assertIn('_Note: Showing', result)  # Truncation message
         self.mock_data_service.execute_read_only_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users'
+            'mykeyspace', 'SELECT * FROM users', fetch_size=DEFAULT_FETCH_SIZE, paging_state=None
         )
         self.mock_context.info.assert_called_once()
 
-    def test_handle_execute_query_non_select(self):
+    async def test_handle_execute_query_non_select(self):
         """Test the _handle_execute_query method with a non-SELECT query."""
         # Call the method and verify it raises an exception
         with self.assertRaises(Exception) as context:
-            self.server._handle_execute_query(
+            await self.server._handle_execute_query(
                 'mykeyspace',
                 "INSERT INTO users (id, name) VALUES (1, 'test')",
                 self.mock_context,
@@ -442,11 +461,11 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.assertIn('Only SELECT queries are allowed', str(context.exception))
         self.mock_data_service.execute_read_only_query.assert_not_called()
 
-    def test_handle_execute_query_unsafe_operations(self):
+    async def test_handle_execute_query_unsafe_operations(self):
         """Test the _handle_execute_query method with unsafe operations."""
         # Call the method and verify it raises an exception
         with self.assertRaises(Exception) as context:
-            self.server._handle_execute_query(
+            await self.server._handle_execute_query(
                 'mykeyspace',
                 'SELECT * FROM users; DROP TABLE users;',
                 self.mock_context,
@@ -455,23 +474,85 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.assertIn('potentially unsafe operations', str(context.exception))
         self.mock_data_service.execute_read_only_query.assert_not_called()
 
-    def test_handle_execute_query_error(self):
+    async def test_handle_execute_query_error(self):
         """Test the _handle_execute_query method with an error."""
         # Set up the mock
         self.mock_data_service.execute_read_only_query.side_effect = Exception('Test error')
 
         # Call the method and verify it raises an exception
         with self.assertRaises(Exception) as context:
-            self.server._handle_execute_query(
+            await self.server._handle_execute_query(
                 'mykeyspace', 'SELECT * FROM users', self.mock_context
             )
 
         self.assertIn('Error executing query', str(context.exception))
         self.mock_data_service.execute_read_only_query.assert_called_once_with(
-            'mykeyspace', 'SELECT * FROM users'
+            'mykeyspace', 'SELECT * FROM users', fetch_size=DEFAULT_FETCH_SIZE, paging_state=None
+        )
+
+    async def test_handle_execute_query_next_page(self):
+        """Test that the paging state of the next page is shown and can be passed back."""
+        query_results = {
+            'columns': ['id'],
+            'rows': [{'id': 1}],
+            'row_count': 1,
+            'paging_state': '0a0b',
+            'truncated': False,
+        }
+        self.mock_data_service.execute_read_only_query.return_value = query_results
+
+        result = await self.server._handle_execute_query(
+            'mykeyspace', 'SELECT * FROM users', None, fetch_size=1, paging_state='0102'
         )
 
-    def test_handle_analyze_query_performance(self):
+        self.assertIn('**Next Page:**', result)
+        self.assertIn('paging_state `0a0b`', result)
+        self.mock_data_service.execute_read_only_query.assert_called_once_with(
+            'mykeyspace', 'SELECT * FROM users', fetch_size=1, paging_state='0102'
+        )
+
+    async def test_handle_execute_query_truncated(self):
+        """Test that a page cut off at the result size limit is reported."""
+        query_results = {
+            'columns': ['id'],
+            'rows': [{'id': 1}],
+            'row_count': 1,
+            'paging_state': None,
+            'truncated': True,
+        }
+        self.mock_data_service.execute_read_only_query.return_value = query_results
+
+        result = await self.server._handle_execute_query('mykeyspace', 'SELECT * FROM users')
+
+        self.assertIn('smaller fetch_size', result)
+        self.assertNotIn('**Next Page:**', result)
+
+    async def test_handle_scan_table(self):
+        """Test the _handle_scan_table method."""
+        self.mock_data_service.scan_table.return_value = {
+            'columns': ['id'],
+            'rows': [{'id': 1}, {'id': 2}],
+            'row_count': 2,
+            'truncated': True,
+        }
+
+        result = await self.server._handle_scan_table('mykeyspace', 'users', 2)
+
+        self.assertIn('## Scan Results: `mykeyspace.users`', result)
+        self.assertIn('**Row Count:** 2', result)
+        self.assertIn('scan stopped', result)
+        self.mock_data_service.scan_table.assert_called_once_with(
+            'mykeyspace', 'users', max_rows=2
+        )
+
+    async def test_handle_scan_table_no_table(self):
+        """Test that the _handle_scan_table method requires a table name."""
+        with self.assertRaises(Exception) as context:
+            await self.server._handle_scan_table('mykeyspace', '')
+
+        self.assertIn('Table name is required', str(context.exception))
+
+    async def test_handle_analyze_query_performance(self):
         """Test the _handle_analyze_query_performance method."""
         # Set up the mock
         analysis_result = QueryAnalysisResult(
@@ -484,7 +565,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_query_analysis_service.analyze_query.return_value = analysis_result
 
         # Call the method
-        result = self.server._handle_analyze_query_performance(
+        result = await self.server._handle_analyze_query_performance(
             'mykeyspace',
             'SELECT * FROM users WHERE id = 1',
             self.mock_context,
@@ -503,7 +584,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         )
         self.mock_context.info.assert_called_once()
 
-    def test_handle_analyze_query_performance_no_recommendations(self):
+    async def test_handle_analyze_query_performance_no_recommendations(self):
         """Test the _handle_analyze_query_performance method with no recommendations."""
         # Set up the mock
         analysis_result = QueryAnalysisResult(
@@ -516,7 +597,7 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         self.mock_query_analysis_service.analyze_query.return_value = analysis_result
 
         # Call the method
-        result = self.server._handle_analyze_query_performance(
+        result = await self.server._handle_analyze_query_performance(
             'mykeyspace',
             'SELECT * FROM users WHERE id = 1',
             self.mock_context,
@@ -534,14 +615,14 @@ class TestKeyspacesMcpStdioServer(unittest.TestCase):
         )
         self.mock_context.info.assert_called_once()
 
-    def test_handle_analyze_query_performance_error(self):
+    async def test_handle_analyze_query_performance_error(self):
         """Test the _handle_analyze_query_performance method with an error."""
         # Set up the mock
         self.mock_query_analysis_service.analyze_query.side_effect = Exception('Test error')
 
         # Call the method and verify it raises an exception
         with self.assertRaises(Exception) as context:
-            self.server._handle_analyze_query_performance(
+            await self.server._handle_analyze_query_performance(
                 'mykeyspace', 'SELECT * FROM users', self.mock_context
             )
 
@@ -11,23 +11,25 @@
 """Unit tests for the services module."""
 
 import unittest
+from awslabs.amazon_keyspaces_mcp_server.client import UnifiedCassandraClient
 from awslabs.amazon_keyspaces_mcp_server.models import (
     KeyspaceInfo,
     TableInfo,
 )
 from awslabs.amazon_keyspaces_mcp_server.services import (
     DataService,
+    SchemaCache,
     SchemaService,
 )
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 
-class TestDataService(unittest.TestCase):
+class TestDataService(unittest.IsolatedAsyncioTestCase):
     """Tests for the DataService class."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_client = Mock()
+        self.mock_client = Mock(spec=UnifiedCassandraClient)
         self.mock_client.is_using_keyspaces.return_value = True
         self.mock_client.execute_read_only_query.return_value = {
             'columns': ['id', 'name', 'value'],
@@ -36,12 +38,12 @@ class TestDataService(unittest.TestCase):
         }
         self.data_service = DataService(self.mock_client)
 
-    def test_execute_read_only_query_without_keyspace_qualifier(self):
+    async def test_execute_read_only_query_without_keyspace_qualifier(self):
         """Test executing a query without a keyspace qualifier."""
         keyspace_name = 'my_keyspace'
         query = 'SELECT * FROM my_table'
 
-        result = self.data_service.execute_read_only_query(keyspace_name, query)
+        result = await self.data_service.execute_read_only_query(keyspace_name, query)
 
         # Verify the client was called with the qualified query
         self.mock_client.execute_read_only_query.assert_called_once()
@@ -53,25 +55,29 @@ class TestDataService(unittest.TestCase):
         self.assertEqual(result['columns'], ['id', 'name', 'value'])
         self.assertEqual(len(result['rows']), 1)
 
-    def test_execute_read_only_query_with_keyspace_qualifier(self):
+    async def test_execute_read_only_query_with_keyspace_qualifier(self):
         """Test executing a query that already has a keyspace qualifier."""
         keyspace_name = 'my_keyspace'
         query = 'SELECT * FROM my_keyspace.my_table'
 
-        result = self.data_service.execute_read_only_query(keyspace_name, query)
+        result = await self.data_service.execute_read_only_query(
+            keyspace_name, query, fetch_size=10, paging_state='0a0b'
+        )
 
-        # Verify the client was called with the original query
-        self.mock_client.execute_read_only_query.assert_called_once_with(query)
+        # Verify the client was called with the original query and the paging arguments
+        self.mock_client.execute_read_only_query.assert_called_once_with(
+            query, fetch_size=10, paging_state='0a0b'
+        )
 
         # Verify the result is returned correctly
         self.assertEqual(result['row_count'], 1)
 
-    def test_execute_read_only_query_with_complex_query(self):
+    async def test_execute_read_only_query_with_complex_query(self):
         """Test executing a more complex query."""
         keyspace_name = 'my_keyspace'
         query = 'SELECT id, name FROM my_table WHERE id = 1 ORDER BY name'
 
-        self.data_service.execute_read_only_query(keyspace_name, query)
+        await self.data_service.execute_read_only_query(keyspace_name, query)
 
         # Verify the client was called with the qualified query
         self.mock_client.execute_read_only_query.assert_called_once()
@@ -80,24 +86,33 @@ class TestDataService(unittest.TestCase):
             call_args, 'SELECT id, name FROM my_keyspace.my_table WHERE id = 1 ORDER BY name'
         )
 
+    async def test_scan_table(self):
+        """Test that a table scan is delegated to the client."""
+        self.mock_client.scan_table.return_value = {'rows': [], 'row_count': 0}
+
+        result = await self.data_service.scan_table('my_keyspace', 'my_table', max_rows=50)
+
+        self.mock_client.scan_table.assert_called_once_with('my_keyspace', 'my_table', max_rows=50)
+        self.assertEqual(result['row_count'], 0)
+
 
-class TestSchemaService(unittest.TestCase):
+class TestSchemaService(unittest.IsolatedAsyncioTestCase):
     """Tests for the SchemaService class."""
 
     def setUp(self):
         """Set up test fixtures."""
-        self.mock_client = Mock()
+        self.mock_client = Mock(spec=UnifiedCassandraClient)
         self.mock_client.is_using_keyspaces.return_value = True
         self.schema_service = SchemaService(self.mock_client)
 
-    def test_list_keyspaces(self):
+    async def test_list_keyspaces(self):
         """Test listing keyspaces."""
         # Set up mock return value
         mock_keyspaces = [KeyspaceInfo(name='system'), KeyspaceInfo(name='my_keyspace')]
         self.mock_client.list_keyspaces.return_value = mock_keyspaces
 
         # Call the method
-        result = self.schema_service.list_keyspaces()
+        result = await self.schema_service.list_keyspaces()
 
         # Verify the client was called
         self.mock_client.list_keyspaces.assert_called_once()
@@ -107,7 +122,7 @@ class TestSchemaService(unittest.TestCase):
         self.assertEqual(result[0].name, 'system')
         self.assertEqual(result[1].name, 'my_keyspace')
 
-    def test_list_tables(self):
+    async def test_list_tables(self):
         """Test listing tables in a keyspace."""
         # Set up mock return value
         mock_tables = [
@@ -117,7 +132,7 @@ class TestSchemaService(unittest.TestCase):
         self.mock_client.list_tables.return_value = mock_tables
 
         # Call the method
-        result = self.schema_service.list_tables('my_keyspace')
+        result = await self.schema_service.list_tables('my_keyspace')
 
         # Verify the client was called with the correct keyspace
         self.mock_client.list_tables.assert_called_once_with('my_keyspace')
@@ -127,7 +142,7 @@ class TestSchemaService(unittest.TestCase):
         self.assertEqual(result[0].name, 'users')
         self.assertEqual(result[1].name, 'products')
 
-    def test_describe_keyspace(self):
+    async def test_describe_keyspace(self):
         """Test describing a keyspace."""
         # Set up mock return value
         mock_keyspace_details = {
@@ -138,7 +153,7 @@ class TestSchemaService(unittest.TestCase):
         self.mock_client.describe_keyspace.return_value = mock_keyspace_details
 
         # Call the method
-        result = self.schema_service.describe_keyspace('my_keyspace')
+        result = await self.schema_service.describe_keyspace('my_keyspace')
 
         # Verify the client was called with the correct keyspace
         self.mock_client.describe_keyspace.assert_called_once_with('my_keyspace')
@@ -148,7 +163,7 @@ class TestSchemaService(unittest.TestCase):
         self.assertEqual(result['replication']['class'], 'NetworkTopologyStrategy')
         self.assertTrue(result['durable_writes'])
 
-    def test_describe_table(self):
+    async def test_describe_table(self):
         """Test describing a table."""
         # Set up mock return value
         mock_table_details = {
@@ -164,7 +179,7 @@ class TestSchemaService(unittest.TestCase):
         self.mock_client.describe_table.return_value = mock_table_details
 
         # Call the method
-        result = self.schema_service.describe_table('my_keyspace', 'users')
+        result = await self.schema_service.describe_table('my_keyspace', 'users')
 
         # Verify the client was called with the correct keyspace and table
         self.mock_client.describe_table.assert_called_once_with('my_keyspace', 'users')
@@ -175,3 +190,50 @@ class TestSchemaService(unittest.TestCase):
         self.assertEqual(len(result['columns']), 2)
         self.assertEqual(result['columns'][0]['name'], 'user_id')
         self.assertEqual(result['partition_key'], ['user_id'])
+
+    async def test_schema_metadata_cached(self):
+        """Test that schema metadata is read once while the schema version is unchanged."""
+        self.mock_client.list_tables.return_value = [TableInfo(name='users', keyspace='ks')]
+
+        await self.schema_service.list_tables('ks')
+        result = await self.schema_service.list_tables('ks')
+
+        self.mock_client.list_tables.assert_awaited_once_with('ks')
+        self.mock_client.schema_version.assert_called_with('ks')
+        self.assertEqual(result[0].name, 'users')
+
+    async def test_schema_metadata_refreshed_on_schema_change(self):
+        """Test that schema metadata is read again when the driver reports a schema change."""
+        self.mock_client.describe_table.return_value = {'name': 'users'}
+        self.mock_client.schema_version.side_effect = ['v1', 'v1', 'v2']
+
+        for _ in range(3):
+            await self.schema_service.describe_table('ks', 'users')
+
+        self.assertEqual(self.mock_client.describe_table.await_count, 2)
+
+
+class TestSchemaCache(unittest.IsolatedAsyncioTestCase):
+    """Tests for the SchemaCache class."""
+
+    async def test_expired_entries_are_reloaded(self):
+        """Test that entries are loaded again once their TTL has expired."""
+        cache = SchemaCache(ttl=0)
+        load = AsyncMock(return_value='value')
+
+        await cache.get(('key',), None, load)
+        result = await cache.get(('key',), None, load)
+
+        self.assertEqual(load.await_count, 2)
+        self.assertEqual(result, 'value')
+
+    async def test_invalidate(self):
+        """Test that invalidate drops the cached entries."""
+        cache = SchemaCache()
+        load = AsyncMock(return_value='value')
+
+        await cache.get(('key',), None, load)
+        cache.invalidate()
+        await cache.get(('key',), None, load)
+
+        self.assertEqual(load.await_count, 2)
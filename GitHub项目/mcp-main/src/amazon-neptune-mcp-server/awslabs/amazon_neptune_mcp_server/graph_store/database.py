@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import boto3
+import hashlib
 import json
+import os
 from awslabs.amazon_neptune_mcp_server.exceptions import NeptuneException
 from awslabs.amazon_neptune_mcp_server.graph_store.base import NeptuneGraph
 from awslabs.amazon_neptune_mcp_server.models import (
@@ -23,6 +25,7 @@ from awslabs.amazon_neptune_mcp_server.models import (
     Relationship,
     RelationshipPattern,
 )
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -35,6 +38,8 @@ class NeptuneDatabase(NeptuneGraph):
         port: port number for the database instance, default is 8182
         use_https: whether to use secure connection, default is True
         credentials_profile_name: optional AWS profile name
+        schema_cache_dir: optional directory in which the schema is persisted per
+            endpoint, so that it is refreshed incrementally across restarts
 
     Example:
         .. code-block:: python
@@ -46,6 +51,10 @@ class NeptuneDatabase(NeptuneGraph):
     """
 
     schema: Optional[GraphSchema] = None
+    # Number of labels queried by each batched schema query
+    schema_batch_size: int = 50
+    # Number of batched schema queries run concurrently
+    schema_max_workers: int = 8
 
     def __init__(
         self,
@@ -53,8 +62,11 @@ class NeptuneDatabase(NeptuneGraph):
         port: int = 8182,
         use_https: bool = True,
         credentials_profile_name: Optional[str] = None,
+        schema_cache_dir: Optional[str] = None,
     ) -> None:
         """Create a new Neptune graph wrapper instance."""
+        self.schema_cache_dir = schema_cache_dir
+        self._schema_state: Optional[Dict[str, Any]] = None
         try:
             if not credentials_profile_name:
                 session = boto3.Session()
@@ -63,7 +75,8 @@ class NeptuneDatabase(NeptuneGraph):
 
             client_params = {}
             protocol = 'https' if use_https else 'http'
-            client_params['endpoint_url'] = f'{protocol}://{host}:{port}'
+            self.endpoint_url = f'{protocol}://{host}:{port}'
+            client_params['endpoint_url'] = self.endpoint_url
             self.client = session.client('neptunedata', **client_params)
 
         except Exception as e:
@@ -136,7 +149,7 @@ class NeptuneDatabase(NeptuneGraph):
         """Retrieves relationship patterns (triples) from the graph based on edge labels.
 
         This method queries the graph to find distinct patterns of node-edge-node
-        relationships for each edge label.
+        relationships for each edge label, using a single batched query for all labels.
 
         Args:
             e_labels (List[str]): List of edge labels to query for relationship patterns
@@ -152,15 +165,12 @@ class NeptuneDatabase(NeptuneGraph):
         """
 
         triple_schema: List[RelationshipPattern] = []
-        for label in e_labels:
-            q = triple_query.format(e_label=label)
-            data = self.query_opencypher(q)
-            for d in data:
-                triple_schema.append(
-                    RelationshipPattern(
-                        left_node=d['from'][0], right_node=d['to'][0], relation=d['edge']
-                    )
+        for d in self._query_batch(triple_query, e_labels):
+            triple_schema.append(
+                RelationshipPattern(
+                    left_node=d['from'][0], right_node=d['to'][0], relation=d['edge']
                 )
+            )
 
         return triple_schema
 
@@ -168,7 +178,7 @@ class NeptuneDatabase(NeptuneGraph):
         """Retrieves property information for each node label in the graph.
 
         This method queries the graph to find all properties associated with each
-        node label and their data types.
+        node label and their data types, using a single batched query for all labels.
 
         Args:
             n_labels (List[str]): List of node labels to query for properties
@@ -178,35 +188,20 @@ class NeptuneDatabase(NeptuneGraph):
             List[Node]: List of Node objects with their properties
         """
         node_properties_query = """
-        MATCH (a:`{n_label}`)
-        RETURN properties(a) AS props
-        LIMIT 100
+        MATCH (a:`{label}`)
+        WITH a LIMIT 100
+        RETURN $label_{index} AS label, properties(a) AS props
         """
-        nodes = []
-        for label in n_labels:
-            q = node_properties_query.format(n_label=label)
-            resp = self.query_opencypher(q)
-            props = {}
-            for p in resp:
-                for k, v in p['props'].items():
-                    prop_type = types[type(v).__name__]
-                    if k not in props:
-                        props[k] = {prop_type}
-                    else:
-                        props[k].update([prop_type])
-
-            properties = []
-            for k, v in props.items():
-                properties.append(Property(name=k, type=list(v)))
-
-            nodes.append(Node(labels=label, properties=properties))
-        return nodes
+        props = self._collect_properties(
+            self._query_batch(node_properties_query, n_labels), n_labels, types
+        )
+        return [Node(labels=label, properties=props[label]) for label in n_labels]
 
     def _get_edge_properties(self, e_labels: List[str], types: Dict[str, Any]) -> List:
         """Retrieves property information for each edge label in the graph.
 
         This method queries the graph to find all properties associated with each
-        edge label and their data types.
+        edge label and their data types, using a single batched query for all labels.
 
         Args:
             e_labels (List[str]): List of edge labels to query for properties
@@ -216,36 +211,157 @@ class NeptuneDatabase(NeptuneGraph):
             List[Relationship]: List of Relationship objects with their properties
         """
         edge_properties_query = """
-        MATCH ()-[e:`{e_label}`]->()
-        RETURN properties(e) AS props
-        LIMIT 100
+        MATCH ()-[e:`{label}`]->()
+        WITH e LIMIT 100
+        RETURN $label_{index} AS label, properties(e) AS props
+        """
+        props = self._collect_properties(
+            self._query_batch(edge_properties_query, e_labels), e_labels, types
+        )
+        return [Relationship(type=label, properties=props[label]) for label in e_labels]
+
+    def _query_batch(self, query: str, labels: List[str]) -> List[Dict]:
+        """Runs a per-label query for several labels as one UNION ALL query.
+
+        The label is inserted into the query as an escaped identifier with the
+        ``e_label`` or ``label`` placeholder, and is also available as the
+        ``$label_<index>`` parameter, so the ``LIMIT`` of each label is kept.
+
+        Args:
+            query (str): The per-label openCypher query template
+            labels (List[str]): The labels to run the query for
+
+        Returns:
+            List[Dict]: The rows returned for all labels
+        """
+        if not labels:
+            return []
+        branches = []
+        params = {}
+        for index, label in enumerate(labels):
+            escaped = label.replace('`', '``')
+            branches.append(query.format(e_label=escaped, label=escaped, index=index))
+            params[f'label_{index}'] = label
+        return self.query_opencypher('UNION ALL'.join(branches), params)
+
+    @staticmethod
+    def _collect_properties(
+        rows: List[Dict], labels: List[str], types: Dict[str, Any]
+    ) -> Dict[str, List[Property]]:
+        """Groups the sampled properties of batched query results by label.
+
+        Args:
+            rows (List[Dict]): Rows with the ``label`` and ``props`` of each sampled element
+            labels (List[str]): The labels that were queried
+            types (Dict[str, Any]): Dictionary mapping Python types to Neptune data types
+
+        Returns:
+            Dict[str, List[Property]]: The properties found for each label
+        """
+        props: Dict[str, Dict[str, set]] = {label: {} for label in labels}
+        for p in rows:
+            label_props = props.setdefault(p['label'], {})
+            for k, v in p['props'].items():
+                label_props.setdefault(k, set()).add(types[type(v).__name__])
+
+        return {
+            label: [Property(name=k, type=list(v)) for k, v in label_props.items()]
+            for label, label_props in props.items()
+        }
+
+    @staticmethod
+    def _summary_state(summary: Dict) -> Dict[str, Any]:
+        """Returns the parts of a graph summary that the schema depends on.
+
+        The summary only changes when Neptune recomputes its statistics, so an
+        unchanged state means the cached schema is still current.
+
+        Args:
+            summary (Dict): The graph summary returned by _get_summary
+
+        Returns:
+            Dict[str, Any]: The node and edge counts, labels and property counts
         """
-        edges = []
-        for label in e_labels:
-            q = edge_properties_query.format(e_label=label)
-            resp = self.query_opencypher(q)
-            props = {}
-            for p in resp:
-                for k, v in p['props'].items():
-                    prop_type = types[type(v).__name__]
-                    if k not in props:
-                        props[k] = {prop_type}
-                    else:
-                        props[k].update([prop_type])
-
-            properties = []
-            for k, v in props.items():
-                properties.append(Property(name=k, type=list(v)))
-
-            edges.append(Relationship(type=label, properties=properties))
-
-        return edges
+
+        def property_counts(properties: List[Dict[str, int]]) -> Dict[str, int]:
+            return {name: count for prop in properties for name, count in prop.items()}
+
+        return {
+            'numNodes': summary.get('numNodes'),
+            'numEdges': summary.get('numEdges'),
+            'nodeLabels': sorted(summary['nodeLabels']),
+            'edgeLabels': sorted(summary['edgeLabels']),
+            'nodeProperties': property_counts(summary.get('nodeProperties', [])),
+            'edgeProperties': property_counts(summary.get('edgeProperties', [])),
+        }
+
+    def _schema_cache_path(self) -> Optional[str]:
+        """Returns the path of the schema cache file of this endpoint.
+
+        Returns:
+            Optional[str]: The cache file path, or None if the schema is not persisted
+        """
+        if not self.schema_cache_dir:
+            return None
+        key = hashlib.sha256(self.endpoint_url.encode()).hexdigest()[:16]
+        return os.path.join(self.schema_cache_dir, f'schema-{key}.json')
+
+    def _load_schema_cache(self) -> Tuple[Optional[GraphSchema], Optional[Dict[str, Any]]]:
+        """Loads the persisted schema and summary state of this endpoint.
+
+        Returns:
+            Tuple[Optional[GraphSchema], Optional[Dict[str, Any]]]: The cached schema and
+                the summary state it was built from, or None for both if there is no
+                usable cache
+        """
+        path = self._schema_cache_path()
+        if path is None or not os.path.exists(path):
+            return None, None
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            if cached['endpoint'] != self.endpoint_url:
+                return None, None
+            return GraphSchema.model_validate(cached['schema']), cached['summary']
+        except Exception:
+            logger.warning(f'Ignoring unreadable schema cache {path}')
+            return None, None
+
+    def _save_schema_cache(self, schema: GraphSchema, state: Dict[str, Any]) -> None:
+        """Persists the schema and the summary state it was built from.
+
+        Args:
+            schema (GraphSchema): The schema to persist
+            state (Dict[str, Any]): The summary state returned by _summary_state
+        """
+        path = self._schema_cache_path()
+        if path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(
+                    {
+                        'endpoint': self.endpoint_url,
+                        'summary': state,
+                        'schema': schema.model_dump(),
+                    },
+                    f,
+                )
+            os.replace(tmp_path, path)
+        except Exception:
+            logger.warning(f'Could not write schema cache {path}')
 
     def _refresh_schema(self) -> GraphSchema:
         """Refreshes the Neptune graph schema information.
 
-        This method queries the graph to build a complete schema representation
-        including nodes, relationships, and relationship patterns.
+        This method builds a complete schema representation including nodes,
+        relationships, and relationship patterns. If the graph summary is
+        unchanged since the previous schema, kept in memory or persisted for the
+        endpoint, that schema is reused without queries. Otherwise all labels are
+        queried again, since the summary counts do not tell which labels changed.
+        Labels are queried in batches that run concurrently.
 
         Returns:
             GraphSchema: Complete schema information for the graph
@@ -258,14 +374,42 @@ class NeptuneDatabase(NeptuneGraph):
             'dict': 'MAP',
             'bool': 'BOOLEAN',
         }
-        n_labels, e_labels = self._get_labels()
-        triple_schema = self._get_triples(e_labels)
-        nodes = self._get_node_properties(n_labels, types)
-        rels = self._get_edge_properties(e_labels, types)
+        summary = self._get_summary()
+        n_labels, e_labels = summary['nodeLabels'], summary['edgeLabels']
+        state = self._summary_state(summary)
+
+        if self.schema is not None and self._schema_state is not None:
+            previous, previous_state = self.schema, self._schema_state
+        else:
+            previous, previous_state = self._load_schema_cache()
+
+        if previous is not None and previous_state == state:
+            self.schema, self._schema_state = previous, state
+            return previous
+
+        batch = self.schema_batch_size
+        with ThreadPoolExecutor(max_workers=self.schema_max_workers) as executor:
+            triple_futures = [
+                executor.submit(self._get_triples, e_labels[i : i + batch])
+                for i in range(0, len(e_labels), batch)
+            ]
+            node_futures = [
+                executor.submit(self._get_node_properties, n_labels[i : i + batch], types)
+                for i in range(0, len(n_labels), batch)
+            ]
+            edge_futures = [
+                executor.submit(self._get_edge_properties, e_labels[i : i + batch], types)
+                for i in range(0, len(e_labels), batch)
+            ]
+            nodes = [node for future in node_futures for node in future.result()]
+            rels = [rel for future in edge_futures for rel in future.result()]
+            triple_schema = [p for future in triple_futures for p in future.result()]
 
         graph = GraphSchema(nodes=nodes, relationships=rels, relationship_patterns=triple_schema)
 
         self.schema = graph
+        self._schema_state = state
+        self._save_schema_cache(graph, state)
         return graph
 
     def get_schema(self) -> GraphSchema:
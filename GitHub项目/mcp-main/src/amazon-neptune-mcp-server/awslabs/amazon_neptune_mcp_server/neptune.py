@@ -44,13 +44,23 @@ class NeptuneServer:
 
     graph: NeptuneGraph
 
-    def __init__(self, endpoint: str, use_https: bool = True, port: int = 8182, *args, **kwargs):
+    def __init__(
+        self,
+        endpoint: str,
+        use_https: bool = True,
+        port: int = 8182,
+        schema_cache_dir: Optional[str] = None,
+        *args,
+        **kwargs,
+    ):
         """Initialize a connection to a Neptune instance.
 
         Args:
             endpoint (str): Neptune endpoint URL (must start with neptune-db:// or neptune-graph://)
             use_https (bool, optional): Whether to use HTTPS connection. Defaults to True.
             port (int, optional): Port number for connection. Defaults to 8182.
+            schema_cache_dir (str, optional): Directory in which the Neptune Database schema
+                is persisted. Defaults to None, which disables persistence.
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
 
@@ -62,7 +72,9 @@ class NeptuneServer:
             if endpoint.startswith('neptune-db://'):
                 # This is a Neptune Database Cluster
                 endpoint = endpoint.replace('neptune-db://', '')
-                self.graph = NeptuneDatabase(endpoint, port, use_https=use_https)
+                self.graph = NeptuneDatabase(
+                    endpoint, port, use_https=use_https, schema_cache_dir=schema_cache_dir
+                )
                 logger.debug('Creating Neptune Database session for %s', endpoint)
             elif endpoint.startswith('neptune-graph://'):
                 # This is a Neptune Analytics Graph
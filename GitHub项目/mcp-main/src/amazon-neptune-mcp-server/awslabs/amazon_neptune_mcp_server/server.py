@@ -65,7 +65,11 @@ def get_graph():
             't',
         )
 
-        _graph = NeptuneServer(endpoint, use_https=use_https)
+        schema_cache_dir = os.environ.get('NEPTUNE_SCHEMA_CACHE_DIR')
+
+        _graph = NeptuneServer(
+            endpoint, use_https=use_https, schema_cache_dir=schema_cache_dir or None
+        )
 
     return _graph
 
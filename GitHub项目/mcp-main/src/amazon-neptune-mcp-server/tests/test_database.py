@@ -15,6 +15,7 @@
 
 import json
 import pytest
+import re
 from awslabs.amazon_neptune_mcp_server.exceptions import NeptuneException
 from awslabs.amazon_neptune_mcp_server.graph_store.database import NeptuneDatabase
 from awslabs.amazon_neptune_mcp_server.models import GraphSchema
@@ -493,3 +494,144 @@ class TestNeptuneDatabase:
             # Assert
             NeptuneDatabase._refresh_schema.assert_called_once()
             assert result == mock_schema
+
+
+def _fake_graph_query(queries):
+    """Create a fake execute_open_cypher_query for a graph with Person-[KNOWS]->Person.
+
+    The executed queries are appended to the given list.
+    """
+
+    def execute(openCypherQuery, parameters=None):
+        queries.append(openCypherQuery)
+        params = json.loads(parameters) if parameters else {}
+        results = []
+        if 'type(e) AS edge' in openCypherQuery:
+            for label in re.findall(r'\[e:`([^`]+)`\]', openCypherQuery):
+                results.append({'from': ['Person'], 'edge': label, 'to': ['Person']})
+        else:
+            for label in params.values():
+                results.append({'label': label, 'props': {'name': 'x', 'since': 2020}})
+        return {'results': results}
+
+    return execute
+
+
+@pytest.mark.asyncio
+class TestNeptuneDatabaseSchemaDiscovery:
+    """Test class for the batched and incremental schema discovery."""
+
+    summary = {
+        'numNodes': 10,
+        'numEdges': 20,
+        'nodeLabels': ['Person'],
+        'edgeLabels': ['KNOWS'],
+        'nodeProperties': [{'name': 10}],
+        'edgeProperties': [{'since': 20}],
+    }
+
+    def _create_db(self, mock_session, summary, queries, schema_cache_dir=None):
+        mock_client = MagicMock()
+        mock_session.return_value.client.return_value = mock_client
+        mock_client.get_propertygraph_summary.return_value = {'payload': {'graphSummary': summary}}
+        mock_client.execute_open_cypher_query.side_effect = _fake_graph_query(queries)
+        return NeptuneDatabase(host='test-endpoint', schema_cache_dir=schema_cache_dir)
+
+    @patch('boto3.Session')
+    async def test_node_properties_batched(self, mock_session):
+        """Test that the properties of several labels are read with one UNION ALL query."""
+        queries = []
+        with patch.object(NeptuneDatabase, '_refresh_schema'):
+            db = self._create_db(mock_session, self.summary, queries)
+
+        nodes = db._get_node_properties(
+            ['Person', 'Odd`Label'], {'str': 'STRING', 'int': 'INTEGER'}
+        )
+
+        assert len(queries) == 1
+        assert queries[0].count('UNION ALL') == 1
+        assert '`Odd``Label`' in queries[0]
+        assert [node.labels for node in nodes] == ['Person', 'Odd`Label']
+        assert {p.name: p.type for p in nodes[1].properties} == {
+            'name': ['STRING'],
+            'since': ['INTEGER'],
+        }
+
+    @patch('boto3.Session')
+    async def test_schema_batches_run_concurrently(self, mock_session):
+        """Test that labels are split into batches of schema_batch_size."""
+        summary = dict(self.summary, nodeLabels=[f'L{i}' for i in range(5)])
+        queries = []
+        with patch.object(NeptuneDatabase, 'schema_batch_size', 2):
+            db = self._create_db(mock_session, summary, queries)
+
+        # Three node property batches, one edge property and one triple batch
+        assert len(queries) == 5
+        assert [node.labels for node in db.schema.nodes] == [f'L{i}' for i in range(5)]
+
+    @patch('boto3.Session')
+    async def test_schema_persisted_and_reused(self, mock_session, tmp_path):
+        """Test that a persisted schema is reused without queries when the summary is unchanged."""
+        queries = []
+        db = self._create_db(mock_session, self.summary, queries, str(tmp_path))
+        assert len(queries) == 3
+        assert len(list(tmp_path.glob('schema-*.json'))) == 1
+
+        queries.clear()
+        restarted = self._create_db(mock_session, self.summary, queries, str(tmp_path))
+
+        assert queries == []
+        assert restarted.schema == db.schema
+
+    @patch('boto3.Session')
+    async def test_schema_refreshed_on_summary_change(self, mock_session, tmp_path):
+        """Test that all labels are queried again when the summary changed."""
+        self._create_db(mock_session, self.summary, [], str(tmp_path))
+
+        queries = []
+        summary = dict(self.summary, nodeLabels=['Person', 'City'], numNodes=11)
+        db = self._create_db(mock_session, summary, queries, str(tmp_path))
+
+        node_queries = [q for q in queries if 'properties(a)' in q]
+        assert len(node_queries) == 1
+        assert '`City`' in node_queries[0] and '`Person`' in node_queries[0]
+        assert len([q for q in queries if 'type(e) AS edge' in q]) == 1
+        assert len([q for q in queries if 'properties(e)' in q]) == 1
+        assert [node.labels for node in db.schema.nodes] == ['Person', 'City']
+
+    @patch('boto3.Session')
+    async def test_label_properties_refreshed_on_count_change(self, mock_session, tmp_path):
+        """Test that a changed property count requeries the existing labels."""
+        self._create_db(mock_session, self.summary, [], str(tmp_path))
+
+        queries = []
+        summary = dict(self.summary, nodeProperties=[{'name': 12}])
+        self._create_db(mock_session, summary, queries, str(tmp_path))
+
+        node_queries = [q for q in queries if 'properties(a)' in q]
+        assert len(node_queries) == 1 and '`Person`' in node_queries[0]
+
+    @patch('boto3.Session')
+    async def test_schema_not_persisted_without_cache_dir(
+        self, mock_session, tmp_path, monkeypatch
+    ):
+        """Test that the schema is only kept in memory without a cache directory."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        db = self._create_db(mock_session, self.summary, [])
+
+        assert db._schema_cache_path() is None
+        assert list(tmp_path.iterdir()) == []
+
+    @patch('boto3.Session')
+    async def test_unreadable_schema_cache_ignored(self, mock_session, tmp_path):
+        """Test that an unreadable schema cache leads to a full refresh."""
+        queries = []
+        db = self._create_db(mock_session, self.summary, queries, str(tmp_path))
+        cache_path = db._schema_cache_path()
+        with open(cache_path, 'w') as f:
+            f.write('not json')
+
+        queries.clear()
+        self._create_db(mock_session, self.summary, queries, str(tmp_path))
+
+        assert len(queries) == 3
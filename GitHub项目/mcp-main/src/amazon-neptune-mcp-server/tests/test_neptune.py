@@ -41,7 +41,9 @@ class TestNeptuneServer:
 
         # Assert
         assert server.graph == mock_db_instance
-        mock_neptune_db.assert_called_once_with('test-endpoint', 8182, use_https=True)
+        mock_neptune_db.assert_called_once_with(
+            'test-endpoint', 8182, use_https=True, schema_cache_dir=None
+        )
 
     @patch('awslabs.amazon_neptune_mcp_server.neptune.NeptuneAnalytics')
     async def test_init_neptune_analytics(self, mock_neptune_analytics):
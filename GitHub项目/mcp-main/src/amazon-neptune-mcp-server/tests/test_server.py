@@ -197,6 +197,7 @@ class TestGraphInitialization:
         mock_environ_get.side_effect = lambda key, default=None: {
             'NEPTUNE_ENDPOINT': 'neptune-db://test-endpoint',
             'NEPTUNE_USE_HTTPS': 'True',
+            'NEPTUNE_SCHEMA_CACHE_DIR': '/tmp/neptune-schema',
         }.get(key, default)
 
         mock_server = MagicMock()
@@ -207,7 +208,9 @@ class TestGraphInitialization:
 
         # Assert
         assert graph == mock_server
-        mock_neptune_server.assert_called_once_with('neptune-db://test-endpoint', use_https=True)
+        mock_neptune_server.assert_called_once_with(
+            'neptune-db://test-endpoint', use_https=True, schema_cache_dir='/tmp/neptune-schema'
+        )
 
         # Call again to verify singleton behavior
         graph2 = get_graph()
@@ -242,7 +245,8 @@ class TestGraphInitialization:
         """Test that get_graph correctly handles HTTPS settings from environment variables.
         This test verifies that:
         1. When NEPTUNE_USE_HTTPS is set to "false", use_https is set to False
-        2. NeptuneServer is initialized with the correct parameters.
+        2. When NEPTUNE_SCHEMA_CACHE_DIR is not set, the schema is not persisted
+        3. NeptuneServer is initialized with the correct parameters.
         """
         # Arrange
         mock_environ_get.side_effect = lambda key, default=None: {
@@ -263,7 +267,9 @@ class TestGraphInitialization:
 
         # Assert
         assert graph == mock_server
-        mock_neptune_server.assert_called_once_with('neptune-db://test-endpoint', use_https=False)
+        mock_neptune_server.assert_called_once_with(
+            'neptune-db://test-endpoint', use_https=False, schema_cache_dir=None
+        )
 
 
 @pytest.mark.asyncio
@@ -16,6 +16,14 @@ DSQL_MCP_SERVER_APPLICATION_NAME = 'awslabs.aurora-dsql-mcp-server'
 DSQL_DB_NAME = 'postgres'
 DSQL_DB_PORT = '5432'
 
+# IAM auth tokens are valid for 15 minutes by default. They are only checked when a connection
+# is opened, and pooled connections are replaced well before their token would have expired.
+DSQL_AUTH_TOKEN_VALIDITY_SECONDS = 900
+POOL_MIN_SIZE = 1
+POOL_MAX_SIZE = 10
+POOL_MAX_LIFETIME_SECONDS = 600
+SCHEMA_CACHE_TTL_SECONDS = 300
+
 ERROR_EMPTY_SQL_PASSED_TO_READONLY_QUERY = (
     'Incorrect invocation: readonly_query invoked without a SQL statement'
 )
@@ -21,6 +21,7 @@ import httpx
 import psycopg
 import psycopg.rows
 import sys
+import time
 from awslabs.aurora_dsql_mcp_server.consts import (
     BEGIN_READ_ONLY_TRANSACTION_SQL,
     BEGIN_TRANSACTION_SQL,
@@ -44,18 +45,24 @@ from awslabs.aurora_dsql_mcp_server.consts import (
     ERROR_WRITE_QUERY_PROHIBITED,
     GET_SCHEMA_SQL,
     INTERNAL_ERROR,
+    POOL_MAX_LIFETIME_SECONDS,
+    POOL_MAX_SIZE,
+    POOL_MIN_SIZE,
     READ_ONLY_QUERY_WRITE_ERROR,
     ROLLBACK_TRANSACTION_SQL,
+    SCHEMA_CACHE_TTL_SECONDS,
 )
 from awslabs.aurora_dsql_mcp_server.mutable_sql_detector import (
+    DDL_REGEX,
     check_sql_injection_risk,
     detect_mutating_keywords,
     detect_transaction_bypass_attempt,
 )
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
+from psycopg_pool import AsyncConnectionPool
 from pydantic import Field
-from typing import Annotated, Any, List
+from typing import Annotated, Any, Dict, List, Tuple
 from urllib.parse import urlparse
 
 
@@ -65,7 +72,9 @@ database_user = None
 region = None
 read_only = False
 dsql_client: Any = None
-persistent_connection = None
+connection_pool: AsyncConnectionPool | None = None
+# get_schema results per table name, with the monotonic time they were fetched at
+schema_cache: Dict[str, Tuple[float, List[dict]]] = {}
 aws_profile = None
 knowledge_server = 'https://xmfe3hc3pk.execute-api.us-east-2.amazonaws.com'
 knowledge_timeout = 30.0
@@ -87,7 +96,8 @@ mcp = FastMCP(
     - In READ-WRITE mode: Use for any transactions including mutation. Supports all DDL and DML statements.
 
     ### get_schema
-    Returns the schema of a table.
+    Returns the schema of a table. Schemas are cached for a few minutes and refreshed after DDL
+    statements run through transact.
 
     ### dsql_search_documentation
     Search Aurora DSQL documentation.
@@ -179,26 +189,29 @@ async def readonly_query(
         conn = await get_connection(ctx)
 
         try:
-            await execute_query(ctx, conn, BEGIN_READ_ONLY_TRANSACTION_SQL)
-        except Exception as e:
-            logger.error(f'{ERROR_BEGIN_READ_ONLY_TRANSACTION}: {str(e)}')
-            await ctx.error(INTERNAL_ERROR)
-            raise Exception(INTERNAL_ERROR)
+            try:
+                await execute_query(ctx, conn, BEGIN_READ_ONLY_TRANSACTION_SQL)
+            except Exception as e:
+                logger.error(f'{ERROR_BEGIN_READ_ONLY_TRANSACTION}: {str(e)}')
+                await ctx.error(INTERNAL_ERROR)
+                raise Exception(INTERNAL_ERROR)
 
-        try:
-            rows = await execute_query(ctx, conn, sql)
-            await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
-            return rows
-        except psycopg.errors.ReadOnlySqlTransaction:
-            await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
-            raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
-        except Exception as e:
-            raise e
-        finally:
             try:
-                await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                rows = await execute_query(ctx, conn, sql)
+                await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
+                return rows
+            except psycopg.errors.ReadOnlySqlTransaction:
+                await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
+                raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
             except Exception as e:
-                logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(e)}')
+                raise e
+            finally:
+                try:
+                    await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                except Exception as e:
+                    logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(e)}')
+        finally:
+            await release_connection(conn)
 
     except Exception as e:
         await ctx.error(f'{ERROR_READONLY_QUERY}: {str(e)}')
@@ -303,32 +316,41 @@ async def transact(
     try:
         conn = await get_connection(ctx)
 
-        # Use read-only transaction in read-only mode, regular transaction otherwise
-        begin_sql = BEGIN_READ_ONLY_TRANSACTION_SQL if read_only else BEGIN_TRANSACTION_SQL
-
         try:
-            await execute_query(ctx, conn, begin_sql)
-        except Exception as e:
-            error_msg = ERROR_BEGIN_READ_ONLY_TRANSACTION if read_only else ERROR_BEGIN_TRANSACTION
-            logger.error(f'{error_msg}: {str(e)}')
-            await ctx.error(f'{error_msg}: {str(e)}')
-            raise Exception(f'{error_msg}: {str(e)}')
+            # Use read-only transaction in read-only mode, regular transaction otherwise
+            begin_sql = BEGIN_READ_ONLY_TRANSACTION_SQL if read_only else BEGIN_TRANSACTION_SQL
 
-        try:
-            rows = []
-            for query in sql_list:
-                rows = await execute_query(ctx, conn, query)
-            await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
-            return rows
-        except psycopg.errors.ReadOnlySqlTransaction:
-            await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
-            raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
-        except Exception as e:
             try:
-                await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
-            except Exception as re:
-                logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
-            raise e
+                await execute_query(ctx, conn, begin_sql)
+            except Exception as e:
+                error_msg = (
+                    ERROR_BEGIN_READ_ONLY_TRANSACTION if read_only else ERROR_BEGIN_TRANSACTION
+                )
+                logger.error(f'{error_msg}: {str(e)}')
+                await ctx.error(f'{error_msg}: {str(e)}')
+                raise Exception(f'{error_msg}: {str(e)}')
+
+            try:
+                rows = []
+                for query in sql_list:
+                    rows = await execute_query(ctx, conn, query)
+                await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
+            except psycopg.errors.ReadOnlySqlTransaction:
+                await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
+                raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
+            except Exception as e:
+                try:
+                    await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                except Exception as re:
+                    logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
+                raise e
+        finally:
+            await release_connection(conn)
+
+        if any(DDL_REGEX.match(query) for query in sql_list):
+            logger.info('Clearing cached table schemas after DDL')
+            schema_cache.clear()
+        return rows
 
     except Exception as e:
         await ctx.error(f'{ERROR_TRANSACT}: {str(e)}')
@@ -355,9 +377,18 @@ async def get_schema(
         await ctx.error(ERROR_EMPTY_TABLE_NAME_PASSED_TO_SCHEMA)
         raise ValueError(ERROR_EMPTY_TABLE_NAME_PASSED_TO_SCHEMA)
 
+    cached = schema_cache.get(table_name)
+    if cached is not None and time.monotonic() - cached[0] < SCHEMA_CACHE_TTL_SECONDS:
+        return [dict(row) for row in cached[1]]
+
     try:
         conn = await get_connection(ctx)
-        return await execute_query(ctx, conn, GET_SCHEMA_SQL, [table_name])
+        try:
+            rows = await execute_query(ctx, conn, GET_SCHEMA_SQL, [table_name])
+        finally:
+            await release_connection(conn)
+        schema_cache[table_name] = (time.monotonic(), [dict(row) for row in rows])
+        return rows
     except Exception as e:
         await ctx.error(f'{ERROR_GET_SCHEMA}: {str(e)}')
         raise Exception(f'{ERROR_GET_SCHEMA}: {str(e)}')
@@ -512,26 +543,16 @@ async def get_password_token():  # noqa: D103
         return dsql_client.generate_db_connect_auth_token(cluster_endpoint, region)
 
 
-async def get_connection(ctx):  # noqa: D103
-    """Get a connection to the database, creating one if needed or reusing the existing one.
+async def get_connection_params() -> dict:
+    """Return the parameters for a new connection, with a freshly generated auth token.
 
-    Args:
-        ctx: MCP context for logging and state management
-
-    Returns:
-        A database connection
+    Used by the connection pool every time it opens a connection, so that tokens are only
+    generated when needed and are never expired when a connection is established.
     """
-    global persistent_connection
-
-    # Return the existing connection without health check
-    # The caller will handle reconnection if needed
-    if persistent_connection is not None:
-        return persistent_connection
-
-    # Create a new connection
     password_token = await get_password_token()
 
-    conn_params = {
+    logger.info(f'Creating new connection to {cluster_endpoint} as user {database_user}')
+    return {
         'dbname': DSQL_DB_NAME,
         'user': database_user,
         'host': cluster_endpoint,
@@ -539,26 +560,86 @@ async def get_connection(ctx):  # noqa: D103
         'password': password_token,
         'application_name': DSQL_MCP_SERVER_APPLICATION_NAME,
         'sslmode': 'require',
+        'autocommit': True,
     }
 
-    logger.info(f'Creating new connection to {cluster_endpoint} as user {database_user}')
-    try:
-        persistent_connection = await psycopg.AsyncConnection.connect(
-            **conn_params, autocommit=True
+
+async def get_pool() -> AsyncConnectionPool:
+    """Get the connection pool, creating and opening it on first use.
+
+    Connections are checked before they are handed out, and are replaced after
+    POOL_MAX_LIFETIME_SECONDS, which is shorter than the validity of the auth token they were
+    opened with.
+
+    Returns:
+        The open connection pool
+    """
+    global connection_pool
+
+    if connection_pool is None:
+        logger.info(
+            f'Creating connection pool to {cluster_endpoint} with min_size={POOL_MIN_SIZE}, '
+            f'max_size={POOL_MAX_SIZE}'
         )
-        return persistent_connection
+        connection_pool = AsyncConnectionPool(
+            kwargs=get_connection_params,
+            min_size=POOL_MIN_SIZE,
+            max_size=POOL_MAX_SIZE,
+            max_lifetime=POOL_MAX_LIFETIME_SECONDS,
+            check=AsyncConnectionPool.check_connection,
+            open=False,
+        )
+
+    # Opening an already open pool is a no-op, so concurrent first calls are safe
+    await connection_pool.open()
+    return connection_pool
+
+
+async def close_pool():
+    """Close the connection pool, if it was created."""
+    global connection_pool
+
+    if connection_pool is not None:
+        pool, connection_pool = connection_pool, None
+        await pool.close()
+
+
+async def get_connection(ctx):
+    """Check out a connection from the pool.
+
+    Every connection checked out must be handed back with release_connection.
+
+    Args:
+        ctx: MCP context for logging and state management
+
+    Returns:
+        A database connection
+    """
+    try:
+        pool = await get_pool()
+        return await pool.getconn()
     except Exception as e:
         logger.error(f'{ERROR_CREATE_CONNECTION} : {e}')
         await ctx.error(f'{ERROR_CREATE_CONNECTION} : {e}')
         raise e
 
 
+async def release_connection(conn):
+    """Return a connection checked out with get_connection to the pool.
+
+    Args:
+        conn: The connection to return
+    """
+    if connection_pool is not None:
+        await connection_pool.putconn(conn)
+
+
 async def execute_query(ctx, conn_to_use, query: str, params=None) -> List[dict]:
     """Execute a SQL query against the database.
 
     Args:
         ctx: MCP context for error handling
-        conn_to_use: Database connection to use, or None to get a new one
+        conn_to_use: Database connection to use, or None to check one out for this query only
         query: SQL query string to execute
         params: Optional query parameters
 
@@ -567,30 +648,13 @@ async def execute_query(ctx, conn_to_use, query: str, params=None) -> List[dict]
     """
     if conn_to_use is None:
         conn = await get_connection(ctx)
-    else:
-        conn = conn_to_use
-
-    try:
-        async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
-            await cur.execute(query, params)  # pyright: ignore[reportArgumentType]
-            if cur.rownumber is None:
-                return []
-            else:
-                return await cur.fetchall()
-    except (psycopg.OperationalError, psycopg.InterfaceError) as e:
-        # Connection issue - reconnect and retry
-        logger.warning(f'Connection error, reconnecting: {e}')
-        global persistent_connection
         try:
-            if persistent_connection:
-                await persistent_connection.close()
-        except Exception:
-            pass  # Ignore errors when closing an already broken connection
-        persistent_connection = None
+            return await execute_query(ctx, conn, query, params)
+        finally:
+            await release_connection(conn)
 
-        # Get a fresh connection and retry
-        conn = await get_connection(ctx)
-        async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
+    try:
+        async with conn_to_use.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
             await cur.execute(query, params)  # pyright: ignore[reportArgumentType]
             if cur.rownumber is None:
                 return []
@@ -602,6 +666,21 @@ async def execute_query(ctx, conn_to_use, query: str, params=None) -> List[dict]
         raise e
 
 
+async def validate_connection(ctx):
+    """Run a query to validate the connection settings, then close the pool.
+
+    The pool is bound to the event loop it was opened in, so it is closed here and opened again
+    by the first tool call in the event loop of the MCP server.
+
+    Args:
+        ctx: MCP context for error handling
+    """
+    try:
+        await execute_query(ctx, None, 'SELECT 1')
+    finally:
+        await close_pool()
+
+
 def main():
     """Run the MCP server with CLI argument support."""
     parser = argparse.ArgumentParser(
@@ -702,9 +781,8 @@ def main():
 
     try:
         # Validate connection by trying to execute a simple query directly
-        # Connection errors will be handled in execute_query
         ctx = NoOpCtx()
-        asyncio.run(execute_query(ctx, None, 'SELECT 1'))
+        asyncio.run(validate_connection(ctx))
     except Exception as e:
         logger.error(
             f'Failed to create and validate db connection to Aurora DSQL. Exit the MCP server. error: {e}'
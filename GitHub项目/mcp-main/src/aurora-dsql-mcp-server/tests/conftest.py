@@ -0,0 +1,27 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared fixtures for the Aurora DSQL MCP server tests."""
+
+import awslabs.aurora_dsql_mcp_server.server as server
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_server_state():
+    """Reset the connection pool and the schema cache before and after each test."""
+    server.connection_pool = None
+    server.schema_cache.clear()
+    yield
+    server.connection_pool = None
+    server.schema_cache.clear()
@@ -1,72 +1,138 @@
-"""Tests for the connection reuse mechanism in server.py."""
+"""Tests for the connection pool in server.py."""
 
+import asyncio
 import pytest
-import psycopg
 from unittest.mock import AsyncMock, patch, MagicMock
-from awslabs.aurora_dsql_mcp_server.server import execute_query, get_connection
+from awslabs.aurora_dsql_mcp_server.consts import (
+    DSQL_AUTH_TOKEN_VALIDITY_SECONDS,
+    POOL_MAX_LIFETIME_SECONDS,
+)
+from awslabs.aurora_dsql_mcp_server.server import (
+    execute_query,
+    get_connection,
+    get_connection_params,
+    readonly_query,
+    release_connection,
+    validate_connection,
+)
 
 ctx = AsyncMock()
 
-@pytest.fixture
-async def reset_persistent_connection():
-    """Reset the persistent connection before and after each test."""
-    import awslabs.aurora_dsql_mcp_server.server as server
-    server.persistent_connection = None
-    yield
-    server.persistent_connection = None
 
-def create_mock_connection():
-    """Create a mock connection with cursor context manager."""
-    mock_conn = AsyncMock()
+def create_mock_pool(mocker):
+    """Patch AsyncConnectionPool with a mock handing out a new connection per checkout."""
+    mock_pool_class = mocker.patch('awslabs.aurora_dsql_mcp_server.server.AsyncConnectionPool')
+    mock_pool = mock_pool_class.return_value
+    mock_pool.open = AsyncMock()
+    mock_pool.close = AsyncMock()
+    mock_pool.getconn = AsyncMock(side_effect=lambda: AsyncMock())
+    mock_pool.putconn = AsyncMock()
+    return mock_pool_class, mock_pool
+
+
+@pytest.mark.asyncio
+async def test_connection_reuse(mocker):
+    """Test that one pool is created and reused by all checkouts."""
+    mock_pool_class, mock_pool = create_mock_pool(mocker)
+
+    conn1 = await get_connection(ctx)
+    await release_connection(conn1)
+    conn2 = await get_connection(ctx)
+    await release_connection(conn2)
+
+    assert mock_pool_class.call_count == 1
+    assert mock_pool.getconn.await_count == 2
+    mock_pool.putconn.assert_has_awaits([mocker.call(conn1), mocker.call(conn2)])
+
+
+@pytest.mark.asyncio
+async def test_pool_checks_connections_and_generates_tokens_lazily(mocker):
+    """Test that connections are checked, opened with lazy tokens and recycled in time."""
+    mock_pool_class, _ = create_mock_pool(mocker)
+
+    await get_connection(ctx)
+
+    pool_kwargs = mock_pool_class.call_args.kwargs
+    assert pool_kwargs['kwargs'] is get_connection_params
+    assert pool_kwargs['check'] is mock_pool_class.check_connection
+    assert pool_kwargs['max_lifetime'] == POOL_MAX_LIFETIME_SECONDS
+    assert POOL_MAX_LIFETIME_SECONDS < DSQL_AUTH_TOKEN_VALIDITY_SECONDS
+
+
+@pytest.mark.asyncio
+@patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
+@patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
+async def test_get_connection_params_generates_fresh_token(mocker):
+    """Test that every new connection gets a freshly generated token."""
+    mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
+    mock_auth.side_effect = ['token1', 'token2']
+
+    params1 = await get_connection_params()
+    params2 = await get_connection_params()
+
+    assert params1['password'] == 'token1'  # pragma: allowlist secret
+    assert params2['password'] == 'token2'  # pragma: allowlist secret
+
+
+@pytest.mark.asyncio
+async def test_execute_query_without_connection_checks_out_and_releases(mocker):
+    """Test that execute_query without a connection returns its connection to the pool."""
+    _, mock_pool = create_mock_pool(mocker)
+    mock_conn = MagicMock()
     mock_cursor = AsyncMock()
     mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
     mock_cursor.__aexit__ = AsyncMock(return_value=None)
-    mock_cursor.execute = AsyncMock()
+    mock_cursor.rownumber = 0
+    mock_cursor.fetchall = AsyncMock(return_value=[{'result': 1}])
     mock_conn.cursor = MagicMock(return_value=mock_cursor)
-    mock_conn.closed = False
-    return mock_conn, mock_cursor
+    mock_pool.getconn = AsyncMock(return_value=mock_conn)
+
+    result = await execute_query(ctx, None, 'SELECT 1')
+
+    assert result == [{'result': 1}]
+    mock_pool.putconn.assert_awaited_once_with(mock_conn)
+
 
 @pytest.mark.asyncio
-@patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
-@patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_connection_reuse(mocker, reset_persistent_connection):
-    """Test that connections are reused when possible."""
-    mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
-    mock_auth.return_value = 'auth_token'
-    mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
+async def test_validate_connection_closes_pool(mocker):
+    """Test that the pool opened to validate the connection is closed afterwards."""
+    import awslabs.aurora_dsql_mcp_server.server as server
 
-    # Create mock connection with working cursor
-    mock_conn, mock_cursor = create_mock_connection()
-    mock_connect.return_value = mock_conn
+    _, mock_pool = create_mock_pool(mocker)
+    mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query', new=AsyncMock())
+    await get_connection(ctx)
 
-    # First connection attempt should create a new connection
-    result1 = await get_connection(ctx)
-    assert mock_connect.call_count == 1
-    assert result1 is mock_conn
+    await validate_connection(ctx)
 
-    # Second connection attempt should reuse the existing connection
-    result2 = await get_connection(ctx)
-    assert mock_connect.call_count == 1  # Connection count should not increase
-    assert result2 is mock_conn  # Should be the same connection object
-    assert result1 is result2  # Should be the exact same object
+    mock_pool.close.assert_awaited_once()
+    assert server.connection_pool is None
 
 
 @pytest.mark.asyncio
-@patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
-@patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_connection_reuse_with_broken_connection(mocker, reset_persistent_connection):
-    """Test handling of broken connections during reuse attempts."""
-    mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
-    mock_auth.return_value = 'auth_token'
-    mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
+async def test_readonly_queries_run_in_parallel(mocker):
+    """Test that concurrent readonly_query calls run on separate pooled connections."""
+    _, mock_pool = create_mock_pool(mocker)
+    both_started = asyncio.Event()
+    used_connections = set()
+
+    async def mock_execute_query(ctx, conn, query, params=None):
+        if query.startswith('SELECT'):
+            used_connections.add(id(conn))
+            if len(used_connections) == 2:
+                both_started.set()
+            # Only returns once both queries are executing at the same time
+            await asyncio.wait_for(both_started.wait(), timeout=5)
+            return [{'query': query}]
+        return []
 
-    # Create two mock connections
-    mock_conn1, mock_cursor1 = create_mock_connection()
-    mock_conn2, mock_cursor2 = create_mock_connection()
-    mock_connect.side_effect = [mock_conn1, mock_conn2]
+    mocker.patch(
+        'awslabs.aurora_dsql_mcp_server.server.execute_query', side_effect=mock_execute_query
+    )
 
-    # Simulate a broken connection that appears open but fails on use
-    mock_cursor1.execute.side_effect = psycopg.InterfaceError("Connection broken")
+    results = await asyncio.gather(
+        readonly_query('SELECT 1', ctx), readonly_query('SELECT 2', ctx)
+    )
 
-    await execute_query(ctx, None, "SELECT 1;")
-    assert mock_connect.call_count == 2
+    assert results == [[{'query': 'SELECT 1'}], [{'query': 'SELECT 2'}]]
+    assert len(used_connections) == 2
+    assert mock_pool.putconn.await_count == 2
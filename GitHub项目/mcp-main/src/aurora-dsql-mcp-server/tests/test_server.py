@@ -28,12 +28,14 @@ from awslabs.aurora_dsql_mcp_server.consts import (
     BEGIN_TRANSACTION_SQL,
     GET_SCHEMA_SQL,
     INTERNAL_ERROR,
+    SCHEMA_CACHE_TTL_SECONDS,
     READ_ONLY_QUERY_WRITE_ERROR,
     ERROR_BEGIN_TRANSACTION,
     ERROR_BEGIN_READ_ONLY_TRANSACTION,
 )
 from awslabs.aurora_dsql_mcp_server.server import (
     get_connection,
+    get_connection_params,
     get_password_token,
     readonly_query,
     get_schema,
@@ -58,15 +60,6 @@ def create_mock_connection():
     return mock_conn, mock_cursor
 
 
-@pytest.fixture
-async def reset_persistent_connection():
-    """Reset the persistent connection before and after each test."""
-    import awslabs.aurora_dsql_mcp_server.server as server
-    server.persistent_connection = None
-    yield
-    server.persistent_connection = None
-
-
 async def test_readonly_query_throws_exception_on_empty_input():
     with pytest.raises(ValueError) as excinfo:
         await readonly_query('', ctx)
@@ -161,38 +154,43 @@ async def test_get_password_token_for_non_admin_user(mocker):
 
 @patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
 @patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_get_connection(mocker, reset_persistent_connection):
+async def test_get_connection_params(mocker):
     mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
     mock_auth.return_value = 'auth_token'
-    mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
-
-    # Create mock connection with working cursor
-    mock_conn, mock_cursor = create_mock_connection()
-    mock_connect.return_value = mock_conn
 
-    result = await get_connection(ctx)
-    assert result is mock_conn
+    result = await get_connection_params()
 
-    conn_params = {
+    assert result == {
         'dbname': DSQL_DB_NAME,
         'user': 'admin',
         'host': 'test_ce',
         'port': DSQL_DB_PORT,
         'password': 'auth_token', # pragma: allowlist secret - test credential for unit tests only
         'application_name': DSQL_MCP_SERVER_APPLICATION_NAME,
-        'sslmode': 'require'
+        'sslmode': 'require',
+        'autocommit': True,
     }
 
-    mock_connect.assert_called_once_with(**conn_params, autocommit=True)
 
+async def test_get_connection(mocker):
+    mock_pool_class = mocker.patch('awslabs.aurora_dsql_mcp_server.server.AsyncConnectionPool')
+    mock_pool = mock_pool_class.return_value
+    mock_pool.open = AsyncMock()
+    mock_conn, mock_cursor = create_mock_connection()
+    mock_pool.getconn = AsyncMock(return_value=mock_conn)
 
-@patch('awslabs.aurora_dsql_mcp_server.server.database_user', 'admin')
-@patch('awslabs.aurora_dsql_mcp_server.server.cluster_endpoint', 'test_ce')
-async def test_get_connection_failure(mocker, reset_persistent_connection):
-    mock_auth = mocker.patch('awslabs.aurora_dsql_mcp_server.server.get_password_token')
-    mock_auth.return_value = 'auth_token'
-    mock_connect = mocker.patch('psycopg.AsyncConnection.connect')
-    mock_connect.side_effect = Exception('Connection error')
+    result = await get_connection(ctx)
+
+    assert result is mock_conn
+    mock_pool.open.assert_awaited_once()
+    assert mock_pool_class.call_args.kwargs['kwargs'] is get_connection_params
+
+
+async def test_get_connection_failure(mocker):
+    mock_pool_class = mocker.patch('awslabs.aurora_dsql_mcp_server.server.AsyncConnectionPool')
+    mock_pool = mock_pool_class.return_value
+    mock_pool.open = AsyncMock()
+    mock_pool.getconn = AsyncMock(side_effect=Exception('Connection error'))
 
     with pytest.raises(Exception) as excinfo:
         await get_connection(ctx)
@@ -206,11 +204,11 @@ async def test_get_schema(mocker):
     mock_conn = AsyncMock()
     mock_get_connection.return_value = mock_conn
     mock_execute_query = mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query')
-    mock_execute_query.return_value = {'col1': 'integer'}
+    mock_execute_query.return_value = [{'col1': 'integer'}]
 
     result = await get_schema('table1', ctx)
 
-    assert result == {'col1': 'integer'}
+    assert result == [{'col1': 'integer'}]
 
     mock_execute_query.assert_called_once_with(
         ctx,
@@ -438,44 +436,6 @@ async def test_transact_rollback_error_logging(mocker):
     assert mock_execute_query.call_count == 3
 
 
-async def test_execute_query_connection_retry(mocker):
-    """Test that execute_query retries on connection errors."""
-    from awslabs.aurora_dsql_mcp_server.server import execute_query
-    from psycopg.errors import OperationalError
-
-    # Mock persistent_connection
-    mocker.patch('awslabs.aurora_dsql_mcp_server.server.persistent_connection', None)
-
-    mock_get_connection = mocker.patch(
-        'awslabs.aurora_dsql_mcp_server.server.get_connection'
-    )
-
-    # First connection fails with OperationalError
-    mock_conn1 = AsyncMock()
-    mock_cursor1 = AsyncMock()
-    mock_cursor1.__aenter__ = AsyncMock(side_effect=OperationalError('Connection lost'))
-    mock_cursor1.__aexit__ = AsyncMock(return_value=None)
-    mock_conn1.cursor = MagicMock(return_value=mock_cursor1)
-    mock_conn1.close = AsyncMock()
-
-    # Second connection succeeds
-    mock_conn2 = AsyncMock()
-    mock_cursor2 = AsyncMock()
-    mock_cursor2.__aenter__ = AsyncMock(return_value=mock_cursor2)
-    mock_cursor2.__aexit__ = AsyncMock(return_value=None)
-    mock_cursor2.execute = AsyncMock()
-    mock_cursor2.rownumber = 1
-    mock_cursor2.fetchall = AsyncMock(return_value=[{'result': 1}])
-    mock_conn2.cursor = MagicMock(return_value=mock_cursor2)
-
-    mock_get_connection.side_effect = [mock_conn1, mock_conn2]
-
-    result = await execute_query(ctx, None, 'SELECT 1')
-
-    assert result == [{'result': 1}]
-    assert mock_get_connection.call_count == 2
-
-
 async def test_execute_query_returns_empty_on_no_rows(mocker):
     """Test that execute_query returns empty list when rownumber is None."""
     from awslabs.aurora_dsql_mcp_server.server import execute_query
@@ -503,74 +463,53 @@ async def test_execute_query_returns_empty_on_no_rows(mocker):
 # because the SQL injection check (lines 161-167) catches the same patterns first.
 # This is acceptable as both checks provide defense-in-depth security.
 
-async def test_execute_query_with_interface_error_retry(mocker):
-    """Test that execute_query retries on InterfaceError."""
-    from awslabs.aurora_dsql_mcp_server.server import execute_query
-    from psycopg.errors import InterfaceError
-
-    mocker.patch('awslabs.aurora_dsql_mcp_server.server.persistent_connection', None)
 
+async def test_get_schema_is_cached_per_table(mocker):
     mock_get_connection = mocker.patch(
         'awslabs.aurora_dsql_mcp_server.server.get_connection'
     )
+    mock_get_connection.return_value = AsyncMock()
+    mock_execute_query = mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query')
+    mock_execute_query.side_effect = lambda ctx, conn, sql, params: [{'table': params[0]}]
 
-    # First connection fails with InterfaceError
-    mock_conn1 = AsyncMock()
-    mock_cursor1 = AsyncMock()
-    mock_cursor1.__aenter__ = AsyncMock(side_effect=InterfaceError('Interface error'))
-    mock_cursor1.__aexit__ = AsyncMock(return_value=None)
-    mock_conn1.cursor = MagicMock(return_value=mock_cursor1)
-    mock_conn1.close = AsyncMock()
-
-    # Second connection succeeds
-    mock_conn2 = AsyncMock()
-    mock_cursor2 = AsyncMock()
-    mock_cursor2.__aenter__ = AsyncMock(return_value=mock_cursor2)
-    mock_cursor2.__aexit__ = AsyncMock(return_value=None)
-    mock_cursor2.execute = AsyncMock()
-    mock_cursor2.rownumber = 1
-    mock_cursor2.fetchall = AsyncMock(return_value=[{'result': 1}])
-    mock_conn2.cursor = MagicMock(return_value=mock_cursor2)
+    assert await get_schema('table1', ctx) == [{'table': 'table1'}]
+    assert await get_schema('table1', ctx) == [{'table': 'table1'}]
+    assert await get_schema('table2', ctx) == [{'table': 'table2'}]
 
-    mock_get_connection.side_effect = [mock_conn1, mock_conn2]
+    assert mock_execute_query.call_count == 2
 
-    result = await execute_query(ctx, None, 'SELECT 1')
 
-    assert result == [{'result': 1}]
-    assert mock_get_connection.call_count == 2
+async def test_get_schema_cache_expires(mocker):
+    mock_get_connection = mocker.patch(
+        'awslabs.aurora_dsql_mcp_server.server.get_connection'
+    )
+    mock_get_connection.return_value = AsyncMock()
+    mock_execute_query = mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query')
+    mock_execute_query.return_value = [{'col1': 'integer'}]
+    mock_time = mocker.patch('awslabs.aurora_dsql_mcp_server.server.time.monotonic')
+    mock_time.return_value = 1000.0
 
+    await get_schema('table1', ctx)
+    mock_time.return_value = 1000.0 + SCHEMA_CACHE_TTL_SECONDS
+    await get_schema('table1', ctx)
 
-async def test_execute_query_retry_returns_empty(mocker):
-    """Test that execute_query returns empty list after retry when rownumber is None."""
-    from awslabs.aurora_dsql_mcp_server.server import execute_query
-    from psycopg.errors import OperationalError
+    assert mock_execute_query.call_count == 2
 
-    mocker.patch('awslabs.aurora_dsql_mcp_server.server.persistent_connection', None)
 
+@patch('awslabs.aurora_dsql_mcp_server.server.read_only', False)
+async def test_transact_ddl_invalidates_schema_cache(mocker):
     mock_get_connection = mocker.patch(
         'awslabs.aurora_dsql_mcp_server.server.get_connection'
     )
+    mock_get_connection.return_value = AsyncMock()
+    mock_execute_query = mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query')
+    mock_execute_query.return_value = [{'col1': 'integer'}]
 
-    # First connection fails
-    mock_conn1 = AsyncMock()
-    mock_cursor1 = AsyncMock()
-    mock_cursor1.__aenter__ = AsyncMock(side_effect=OperationalError('Connection lost'))
-    mock_cursor1.__aexit__ = AsyncMock(return_value=None)
-    mock_conn1.cursor = MagicMock(return_value=mock_cursor1)
-    mock_conn1.close = AsyncMock()
-
-    # Second connection succeeds but returns no rows
-    mock_conn2 = AsyncMock()
-    mock_cursor2 = AsyncMock()
-    mock_cursor2.__aenter__ = AsyncMock(return_value=mock_cursor2)
-    mock_cursor2.__aexit__ = AsyncMock(return_value=None)
-    mock_cursor2.execute = AsyncMock()
-    mock_cursor2.rownumber = None
-    mock_conn2.cursor = MagicMock(return_value=mock_cursor2)
-
-    mock_get_connection.side_effect = [mock_conn1, mock_conn2]
+    await get_schema('table1', ctx)
+    await transact(['INSERT INTO table1 VALUES (1)'], ctx)
+    await get_schema('table1', ctx)
+    assert mock_execute_query.call_args_list.count(call(ctx, mocker.ANY, GET_SCHEMA_SQL, ['table1'])) == 1
 
-    result = await execute_query(ctx, None, 'SELECT 1 WHERE FALSE')
-
-    assert result == []
-    assert mock_get_connection.call_count == 2
+    await transact(['ALTER TABLE table1 ADD COLUMN col2 TEXT'], ctx)
+    await get_schema('table1', ctx)
+    assert mock_execute_query.call_args_list.count(call(ctx, mocker.ANY, GET_SCHEMA_SQL, ['table1'])) == 2
@@ -17,18 +17,23 @@
 import boto3
 from awslabs.aws_iot_sitewise_mcp_server import __version__
 from botocore.config import Config
+from typing import Optional
 
 
-def create_sitewise_client(region: str = 'us-east-1'):
+def create_sitewise_client(region: str = 'us-east-1', max_pool_connections: Optional[int] = None):
     """Create a standardized AWS IoT SiteWise client with proper user agent.
 
     Args:
         region: AWS region name (default: us-east-1)
+        max_pool_connections: Size of the connection pool, for clients shared by concurrent
+            requests (default: botocore default of 10)
 
     Returns:
         boto3 IoT SiteWise client instance
     """
     config = Config(user_agent_extra=f'awslabs/mcp/aws-iot-sitewise-mcp-server/{__version__}')
+    if max_pool_connections:
+        config = config.merge(Config(max_pool_connections=max_pool_connections))
 
     return boto3.client('iotsitewise', region_name=region, config=config)
 
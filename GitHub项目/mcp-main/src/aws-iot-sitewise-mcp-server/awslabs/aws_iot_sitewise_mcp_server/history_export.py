@@ -0,0 +1,434 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bulk export of AWS IoT SiteWise property history and aggregates."""
+
+import csv
+import time
+from awslabs.aws_iot_sitewise_mcp_server.throttling import (
+    RETRYABLE_ERROR_CODES,
+    RateLimiter,
+    backoff_delay,
+)
+from awslabs.aws_iot_sitewise_mcp_server.validation import SiteWiseQuotas
+from botocore.exceptions import ClientError
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+# Keys of the aggregate values of BatchGetAssetPropertyAggregates and their column names
+AGGREGATE_COLUMNS = {
+    'AVERAGE': ('average', 'average'),
+    'COUNT': ('count', 'count'),
+    'MAXIMUM': ('maximum', 'maximum'),
+    'MINIMUM': ('minimum', 'minimum'),
+    'SUM': ('sum', 'sum'),
+    'STANDARD_DEVIATION': ('standardDeviation', 'standard_deviation'),
+}
+
+# Length in seconds of the aggregate resolutions supported by the batch aggregates API
+RESOLUTION_SECONDS = {'1m': 60, '15m': 900, '1h': 3600, '1d': 86400}
+
+# Columns of exported raw property values
+HISTORY_COLUMNS = ['series', 'timestamp', 'quality', 'value', 'string_value']
+
+
+def time_slices(
+    start: datetime, end: datetime, slice_seconds: float
+) -> List[Tuple[datetime, datetime]]:
+    """Split the range from start (exclusive) to end (inclusive) into consecutive slices."""
+    slices = []
+    step = timedelta(seconds=slice_seconds)
+    while start < end:
+        slices.append((start, min(start + step, end)))
+        start += step
+    return slices
+
+
+def series_name(entry: Dict[str, Any], index: int) -> str:
+    """Return the name of the series of an entry, its entryId, alias or asset and property ID."""
+    if entry.get('entryId'):
+        return entry['entryId']
+    if entry.get('propertyAlias'):
+        return entry['propertyAlias']
+    if entry.get('assetId') and entry.get('propertyId'):
+        return f'{entry["assetId"]}/{entry["propertyId"]}'
+    return str(index)
+
+
+def _timestamp_ns(timestamp: Any) -> int:
+    """Return a history timestamp structure or an aggregate datetime as nanoseconds."""
+    if isinstance(timestamp, datetime):
+        seconds = int(timestamp.replace(tzinfo=timestamp.tzinfo or timezone.utc).timestamp())
+        return seconds * 10**9 + timestamp.microsecond * 1000
+    return timestamp['timeInSeconds'] * 10**9 + timestamp.get('offsetInNanos', 0)
+
+
+def _isoformat(timestamp_ns: int) -> str:
+    return datetime.fromtimestamp(timestamp_ns / 10**9, tz=timezone.utc).isoformat()
+
+
+def _numeric_value(variant: Dict[str, Any]) -> Optional[float]:
+    for key in ('doubleValue', 'integerValue', 'booleanValue'):
+        if variant.get(key) is not None:
+            return float(variant[key])
+    return None
+
+
+class SeriesSummary:
+    """Streaming statistics and downsampled buckets of the values of one series."""
+
+    def __init__(self, start_ns: int, bucket_ns: int, buckets: Optional[int] = None):
+        """Initialize empty statistics with buckets of the given length from start.
+
+        Points after the last of a given number of buckets, such as the inclusive end of the
+        range, are added to the last bucket.
+        """
+        self.start_ns = start_ns
+        self.bucket_ns = bucket_ns
+        self.last_bucket = buckets - 1 if buckets else None
+        self.points = 0
+        self.values = 0
+        self.total = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+        self.first_ns: Optional[int] = None
+        self.last_ns: Optional[int] = None
+        self.buckets: Dict[int, List[float]] = {}
+
+    def add(self, timestamp_ns: int, value: Optional[float]) -> None:
+        """Add a point, with None for values that are not numeric."""
+        self.points += 1
+        self.first_ns = timestamp_ns if self.first_ns is None else min(self.first_ns, timestamp_ns)
+        self.last_ns = timestamp_ns if self.last_ns is None else max(self.last_ns, timestamp_ns)
+        if value is None:
+            return
+        self.values += 1
+        self.total += value
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+        if self.bucket_ns:
+            index = max(0, (timestamp_ns - self.start_ns) // self.bucket_ns)
+            if self.last_bucket is not None:
+                index = min(index, self.last_bucket)
+            bucket = self.buckets.get(index)
+            if bucket is None:
+                self.buckets[index] = [1, value, value, value]
+            else:
+                bucket[0] += 1
+                bucket[1] += value
+                bucket[2] = min(bucket[2], value)
+                bucket[3] = max(bucket[3], value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the statistics, with the downsampled buckets in chronological order."""
+        result: Dict[str, Any] = {
+            'points': self.points,
+            'first_timestamp': _isoformat(self.first_ns) if self.first_ns is not None else None,
+            'last_timestamp': _isoformat(self.last_ns) if self.last_ns is not None else None,
+            'min': self.minimum,
+            'max': self.maximum,
+            'mean': self.total / self.values if self.values else None,
+        }
+        if self.bucket_ns:
+            result['downsampled'] = [
+                {
+                    'timestamp': _isoformat(self.start_ns + index * self.bucket_ns),
+                    'count': int(count),
+                    'mean': total / count,
+                    'min': minimum,
+                    'max': maximum,
+                }
+                for index, (count, total, minimum, maximum) in sorted(self.buckets.items())
+            ]
+        return result
+
+
+class _CsvSink:
+    """Writes column batches to a CSV file with a header row."""
+
+    def __init__(self, path: str, columns: List[str]):
+        self.file = open(path, 'w', newline='', encoding='utf-8')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(columns)
+
+    def write(self, batch: Dict[str, List[Any]]) -> None:
+        timestamps = [_isoformat(value) for value in batch['timestamp']]
+        columns = [timestamps if name == 'timestamp' else values for name, values in batch.items()]
+        self.writer.writerows(zip(*columns))
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _ParquetSink:
+    """Writes column batches to a Parquet file, one row group per batch."""
+
+    def __init__(self, path: str, columns: List[str]):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ValueError(
+                'Parquet output requires pyarrow, install it with the parquet extra: '
+                'awslabs.aws-iot-sitewise-mcp-server[parquet]'
+            ) from e
+
+        types = {
+            'series': pa.dictionary(pa.int32(), pa.string()),
+            'timestamp': pa.timestamp('ns', tz='UTC'),
+            'quality': pa.dictionary(pa.int8(), pa.string()),
+            'string_value': pa.string(),
+        }
+        self.pa = pa
+        self.schema = pa.schema([(name, types.get(name, pa.float64())) for name in columns])
+        self.writer = pq.ParquetWriter(path, self.schema, compression='zstd')
+
+    def write(self, batch: Dict[str, List[Any]]) -> None:
+        table = self.pa.Table.from_arrays(
+            [
+                self.pa.array(values, type=field.type)
+                for values, field in zip(batch.values(), self.schema)
+            ],
+            schema=self.schema,
+        )
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+SINKS = {'csv': _CsvSink, 'parquet': _ParquetSink}
+
+
+class HistoryExport:
+    """Concurrent, paginated export of the history or aggregates of many properties.
+
+    The time range is split into slices and the properties into groups of the maximum number
+    of entries of a batch request. Every slice and group is a unit of work that follows all
+    pages of BatchGetAssetPropertyValueHistory, or BatchGetAssetPropertyAggregates when
+    aggregate types are given. Units run concurrently under a shared request rate limit,
+    throttled requests are retried with backoff, and the values of each finished unit are
+    streamed to a CSV or Parquet file and into per-series statistics. At most twice as many
+    units as run concurrently are submitted at a time, and each unit is dropped once its values
+    are written, so memory is bounded by that window of units.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        entries: List[Dict[str, Any]],
+        start: datetime,
+        end: datetime,
+        slice_seconds: float,
+        aggregate_types: Optional[List[str]] = None,
+        resolution: str = '1h',
+        qualities: Optional[List[str]] = None,
+        summary_points: int = 0,
+        max_concurrency: int = 8,
+        max_requests_per_second: float = SiteWiseQuotas.DATA_PLANE_RPS,
+        max_retries: int = 5,
+    ):
+        """Initialize an export of the given entries over the range from start to end."""
+        self.client = client
+        self.series = [series_name(entry, index) for index, entry in enumerate(entries)]
+        self.entries = [
+            {key: value for key, value in entry.items() if key != 'entryId'} for entry in entries
+        ]
+        self.aggregate_types = aggregate_types
+        self.resolution = resolution
+        self.qualities = qualities
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.limiter = RateLimiter(max_requests_per_second)
+
+        if aggregate_types:
+            # Align slices to the resolution so that no aggregation interval is split
+            interval = RESOLUTION_SECONDS[resolution]
+            slice_seconds = max(interval, slice_seconds // interval * interval)
+            self.columns = ['series', 'timestamp', 'quality'] + [
+                AGGREGATE_COLUMNS[name][1] for name in aggregate_types
+            ]
+            self.summary_column = AGGREGATE_COLUMNS[aggregate_types[0]][1]
+        else:
+            self.columns = list(HISTORY_COLUMNS)
+            self.summary_column = 'value'
+        self.slices = time_slices(start, end, slice_seconds)
+
+        start_ns = _timestamp_ns(start)
+        span_ns = _timestamp_ns(end) - start_ns
+        bucket_ns = -(-span_ns // summary_points) if summary_points > 0 else 0
+        self.summaries = {
+            name: SeriesSummary(start_ns, bucket_ns, summary_points) for name in self.series
+        }
+        self.errors: List[Dict[str, Any]] = []
+        self.requests = 0
+        self.rows = 0
+
+    def units(self) -> List[Tuple[datetime, datetime, List[int]]]:
+        """Return the units of work, as slice bounds and the indexes of their entries."""
+        size = SiteWiseQuotas.MAX_BATCH_GET_ENTRIES
+        groups = [
+            list(range(start, min(start + size, len(self.entries))))
+            for start in range(0, len(self.entries), size)
+        ]
+        return [(start, end, group) for start, end in self.slices for group in groups]
+
+    def _request(self, start: datetime, end: datetime, group: List[int], next_token: str):
+        entries = []
+        for position, index in enumerate(group):
+            entry = dict(self.entries[index], entryId=str(position), startDate=start, endDate=end)
+            if self.qualities:
+                entry['qualities'] = self.qualities
+            if self.aggregate_types:
+                entry['aggregateTypes'] = self.aggregate_types
+                entry['resolution'] = self.resolution
+            else:
+                entry['timeOrdering'] = 'ASCENDING'
+            entries.append(entry)
+
+        params: Dict[str, Any] = {
+            'entries': entries,
+            'maxResults': SiteWiseQuotas.MAX_BATCH_GET_RESULTS,
+        }
+        if next_token:
+            params['nextToken'] = next_token
+        if self.aggregate_types:
+            return self.client.batch_get_asset_property_aggregates(**params)
+        return self.client.batch_get_asset_property_value_history(**params)
+
+    def fetch_unit(
+        self, start: datetime, end: datetime, group: List[int]
+    ) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]], int]:
+        """Fetch all pages of one unit of work.
+
+        Returns:
+            The values as column lists, the errors of the entries, and the number of requests
+        """
+        batch: Dict[str, List[Any]] = {name: [] for name in self.columns}
+        errors: Dict[str, Dict[str, Any]] = {}
+        requests = 0
+        next_token = ''
+        attempt = 0
+        while True:
+            self.limiter.acquire()
+            requests += 1
+            try:
+                response = self._request(start, end, group, next_token)
+            except ClientError as e:
+                code = e.response['Error']['Code']
+                if code in RETRYABLE_ERROR_CODES and attempt < self.max_retries:
+                    time.sleep(backoff_delay(attempt))
+                    attempt += 1
+                    continue
+                for index in group:
+                    errors[self.series[index]] = {'errorCode': code, 'errorMessage': str(e)}
+                break
+            attempt = 0
+
+            for success in response.get('successEntries', []):
+                self._add_values(batch, self.series[group[int(success['entryId'])]], success)
+            for error in response.get('errorEntries', []):
+                errors[self.series[group[int(error['entryId'])]]] = {
+                    'errorCode': error.get('errorCode'),
+                    'errorMessage': error.get('errorMessage'),
+                }
+            next_token = response.get('nextToken')
+            if not next_token:
+                break
+
+        error_list = [
+            dict(error, series=name, start=start.isoformat(), end=end.isoformat())
+            for name, error in errors.items()
+        ]
+        return batch, error_list, requests
+
+    def _add_values(self, batch: Dict[str, List[Any]], series: str, success: Dict[str, Any]):
+        if self.aggregate_types:
+            for point in success.get('aggregatedValues', []):
+                batch['series'].append(series)
+                batch['timestamp'].append(_timestamp_ns(point['timestamp']))
+                batch['quality'].append(point.get('quality', 'GOOD'))
+                for name in self.aggregate_types:
+                    key, column = AGGREGATE_COLUMNS[name]
+                    batch[column].append(point['value'].get(key))
+        else:
+            for point in success.get('assetPropertyValueHistory', []):
+                variant = point.get('value', {})
+                batch['series'].append(series)
+                batch['timestamp'].append(_timestamp_ns(point['timestamp']))
+                batch['quality'].append(point.get('quality', 'GOOD'))
+                batch['value'].append(_numeric_value(variant))
+                batch['string_value'].append(variant.get('stringValue'))
+
+    def run(
+        self,
+        output_path: Optional[str] = None,
+        output_format: str = 'parquet',
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Run all units of work and write their values to the output file, if given.
+
+        Args:
+            output_path: File to write the values to, or None to only summarize them
+            output_format: Format of the output file ('csv' or 'parquet')
+            progress: Callback called with the numbers of finished and total units
+
+        Returns:
+            Dictionary containing the number of slices, requests and rows, the per-series
+            summaries and the errors of the entries
+        """
+        units = self.units()
+        remaining = iter(units)
+        window = 2 * self.max_concurrency
+        pending: Set[Future] = set()
+        done = 0
+        sink = SINKS[output_format](output_path, self.columns) if output_path else None
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                while True:
+                    for unit in islice(remaining, window - len(pending)):
+                        pending.add(executor.submit(self.fetch_unit, *unit))
+                    if not pending:
+                        break
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        batch, errors, requests = future.result()
+                        self.requests += requests
+                        self.errors.extend(errors)
+                        self.rows += len(batch['series'])
+                        for series, timestamp, value in zip(
+                            batch['series'], batch['timestamp'], batch[self.summary_column]
+                        ):
+                            self.summaries[series].add(
+                                timestamp, float(value) if value is not None else None
+                            )
+                        if sink is not None and batch['series']:
+                            sink.write(batch)
+                        done += 1
+                        if progress is not None:
+                            progress(done, len(units))
+        finally:
+            if sink is not None:
+                sink.close()
+
+        return {
+            'slices': len(self.slices),
+            'requests': self.requests,
+            'rows': self.rows,
+            'series': {name: summary.to_dict() for name, summary in self.summaries.items()},
+            'errors': self.errors,
+        }
@@ -80,10 +80,12 @@ from awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data import (
     create_bulk_import_job_tool,
     describe_bulk_import_job_tool,
     execute_query_tool,
+    export_asset_property_history_tool,
     get_asset_property_aggregates_tool,
     get_asset_property_value_history_tool,
     get_asset_property_value_tool,
     get_interpolated_asset_property_values_tool,
+    ingest_asset_property_values_tool,
     list_bulk_import_jobs_tool,
 )
 from awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_executions import (
@@ -163,6 +165,7 @@ all_tools = [
     list_asset_model_properties_tool,
     create_asset_model_composite_model_tool,
     batch_put_asset_property_value_tool,
+    ingest_asset_property_values_tool,
     get_asset_property_value_tool,
     get_asset_property_value_history_tool,
     get_asset_property_aggregates_tool,
@@ -170,6 +173,7 @@ all_tools = [
     batch_get_asset_property_value_tool,
     batch_get_asset_property_value_history_tool,
     batch_get_asset_property_aggregates_tool,
+    export_asset_property_history_tool,
     create_bulk_import_job_tool,
     create_buffered_ingestion_job_tool,
     create_bulk_import_iam_role_tool,
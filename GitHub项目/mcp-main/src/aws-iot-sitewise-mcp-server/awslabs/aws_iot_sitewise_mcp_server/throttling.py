@@ -0,0 +1,92 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rate limiting and retry helpers for high-throughput AWS IoT SiteWise data plane calls."""
+
+import random
+import threading
+import time
+from typing import Optional
+
+
+# Error codes of failed requests and error entries that succeed when sent again later
+RETRYABLE_ERROR_CODES = frozenset(
+    {
+        'ThrottlingException',
+        'LimitExceededException',
+        'InternalFailureException',
+        'ServiceUnavailableException',
+    }
+)
+
+# Bounds of the exponential backoff between retries, in seconds
+BACKOFF_BASE_SECONDS = 0.1
+BACKOFF_MAX_SECONDS = 5.0
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting the rate of an operation.
+
+    Tokens are refilled continuously at `rate` per second up to `burst`, and acquire blocks
+    until the requested number of tokens is available, so any number of threads sharing a
+    limiter stay together under the rate.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """Initialize a full bucket refilled at the given rate per second.
+
+        Args:
+            rate: Number of tokens added per second
+            burst: Maximum number of tokens in the bucket (default: one second of tokens)
+        """
+        if rate <= 0:
+            raise ValueError('Rate must be greater than 0')
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until the given number of tokens is available and take them.
+
+        Requests for more tokens than the bucket holds wait for a full bucket.
+        """
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def backoff_delay(
+    attempt: int, base: float = BACKOFF_BASE_SECONDS, cap: float = BACKOFF_MAX_SECONDS
+) -> float:
+    """Return the delay before a retry, using exponential backoff with full jitter.
+
+    Args:
+        attempt: Number of the retry, starting at 0
+        base: Upper bound of the delay of the first retry, in seconds
+        cap: Maximum delay, in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
@@ -14,8 +14,13 @@
 
 """AWS IoT SiteWise Data Ingestion and Retrieval Tools."""
 
+import asyncio
 import json
+import os
+import tempfile
+import time
 from ..validation import (
+    SiteWiseQuotas,
     ValidationError,
     check_storage_configuration_requirements,
     validate_asset_id,
@@ -24,13 +29,30 @@ from ..validation import (
     validate_region,
 )
 from awslabs.aws_iot_sitewise_mcp_server.client import create_iam_client, create_sitewise_client
+from awslabs.aws_iot_sitewise_mcp_server.history_export import (
+    AGGREGATE_COLUMNS,
+    RESOLUTION_SECONDS,
+    HistoryExport,
+)
+from awslabs.aws_iot_sitewise_mcp_server.throttling import (
+    RETRYABLE_ERROR_CODES,
+    RateLimiter,
+    backoff_delay,
+)
 from awslabs.aws_iot_sitewise_mcp_server.tool_metadata import tool_metadata
 from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from mcp.server.fastmcp import Context
 from mcp.server.fastmcp.tools import Tool
 from pydantic import Field
 from pydantic.fields import FieldInfo
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Maximum number of failed entries returned by ingest_asset_property_values and
+# export_asset_property_history
+MAX_REPORTED_ERROR_ENTRIES = 100
 
 
 @tool_metadata(readonly=False)
@@ -368,6 +390,237 @@ def batch_put_asset_property_value(
         }
 
 
+def _timestamp_key(timestamp: Dict[str, Any]) -> Tuple[int, int]:
+    return timestamp['timeInSeconds'], timestamp.get('offsetInNanos', 0)
+
+
+def _chunk_entries(entries: List[Dict[str, Any]]) -> List[List[Tuple[str, Dict[str, Any]]]]:
+    """Split entries into BatchPutAssetPropertyValue requests within the API limits.
+
+    Entries with more property values than an entry may hold are split into several entries,
+    and the entries are grouped into requests of at most the number of entries per request.
+    Each request is a list of (entryId of the original entry, entry) pairs.
+    """
+    values_per_entry = SiteWiseQuotas.MAX_PROPERTY_VALUES_PER_ENTRY
+    entries_per_request = SiteWiseQuotas.MAX_BATCH_PUT_ENTRIES
+
+    split: List[Tuple[str, Dict[str, Any]]] = []
+    for index, entry in enumerate(entries):
+        entry_id = entry.get('entryId') or str(index)
+        values = entry['propertyValues']
+        for start in range(0, len(values), values_per_entry):
+            part = {key: value for key, value in entry.items() if key != 'entryId'}
+            part['propertyValues'] = values[start : start + values_per_entry]
+            split.append((entry_id, part))
+    return [
+        split[start : start + entries_per_request]
+        for start in range(0, len(split), entries_per_request)
+    ]
+
+
+def _put_request(
+    client: Any,
+    request: List[Tuple[str, Dict[str, Any]]],
+    request_limiter: RateLimiter,
+    point_limiter: RateLimiter,
+    max_retries: int,
+) -> Tuple[int, int, List[Dict[str, Any]]]:
+    """Send one request, retrying throttled and retryable failures with backoff.
+
+    Requests that fail as a whole with a retryable error are sent again, and of the error
+    entries of a response only the property values whose timestamps failed with a retryable
+    error are sent again. Entry IDs are replaced by their position in the request, so that
+    entries split from the same entry stay unique, and mapped back in the reported errors.
+
+    Returns:
+        Number of ingested property values, number of retries, and the failed entries in
+        the errorEntries format of the API
+    """
+    pending = request
+    ingested = 0
+    retries = 0
+    failed: List[Dict[str, Any]] = []
+    retryable: List[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]] = []
+
+    for attempt in range(max_retries + 1):
+        if attempt:
+            retries += 1
+            time.sleep(backoff_delay(attempt - 1))
+
+        points = sum(len(entry['propertyValues']) for _, entry in pending)
+        request_limiter.acquire()
+        point_limiter.acquire(points)
+
+        retryable = []
+        try:
+            response = client.batch_put_asset_property_value(
+                entries=[
+                    dict(entry, entryId=str(position))
+                    for position, (_, entry) in enumerate(pending)
+                ]
+            )
+        except ClientError as e:
+            code = e.response['Error']['Code']
+            for entry_id, entry in pending:
+                error = {
+                    'errorCode': code,
+                    'errorMessage': str(e),
+                    'timestamps': [value['timestamp'] for value in entry['propertyValues']],
+                }
+                if code in RETRYABLE_ERROR_CODES:
+                    retryable.append((entry_id, entry, [error]))
+                else:
+                    failed.append({'entryId': entry_id, 'errors': [error]})
+        else:
+            ingested += points
+            for error_entry in response.get('errorEntries', []):
+                entry_id, entry = pending[int(error_entry['entryId'])]
+                retry_timestamps = set()
+                retry_errors = []
+                permanent_errors = []
+                for error in error_entry.get('errors', []):
+                    timestamps = error.get('timestamps') or [
+                        value['timestamp'] for value in entry['propertyValues']
+                    ]
+                    error = dict(error, timestamps=timestamps)
+                    ingested -= len(timestamps)
+                    if error['errorCode'] in RETRYABLE_ERROR_CODES:
+                        retry_timestamps.update(_timestamp_key(t) for t in timestamps)
+                        retry_errors.append(error)
+                    else:
+                        permanent_errors.append(error)
+                if permanent_errors:
+                    failed.append({'entryId': entry_id, 'errors': permanent_errors})
+                if retry_timestamps:
+                    values = [
+                        value
+                        for value in entry['propertyValues']
+                        if _timestamp_key(value['timestamp']) in retry_timestamps
+                    ]
+                    retryable.append((entry_id, dict(entry, propertyValues=values), retry_errors))
+
+        if not retryable:
+            break
+        pending = [(entry_id, entry) for entry_id, entry, _ in retryable]
+
+    failed.extend({'entryId': entry_id, 'errors': errors} for entry_id, _, errors in retryable)
+    return ingested, retries, failed
+
+
+@tool_metadata(readonly=False)
+def ingest_asset_property_values(
+    entries: List[Dict[str, Any]] = Field(
+        ...,
+        description='List of asset property value entries to ingest. Entries may hold any '
+        'number of property values and any number of entries may be given',
+    ),
+    max_concurrency: int = Field(8, description='Maximum number of requests in flight (1-64)'),
+    max_requests_per_second: float = Field(
+        SiteWiseQuotas.DATA_PLANE_RPS,
+        description='Maximum number of BatchPutAssetPropertyValue requests per second',
+    ),
+    max_points_per_second: float = Field(
+        SiteWiseQuotas.DATA_POINTS_INGESTED_PER_SECOND,
+        description='Maximum number of property values ingested per second',
+    ),
+    max_retries: int = Field(
+        5, description='Maximum number of retries of throttled and retryable failures (0-10)'
+    ),
+    region: str = Field('us-east-1', description='AWS region'),
+) -> Dict[str, Any]:
+    """Ingest any number of asset property values into AWS IoT SiteWise at high throughput.
+
+    Entries are split to the BatchPutAssetPropertyValue limits of 10 entries per request and
+    10 property values per entry, and the requests are sent concurrently, limited to the
+    given request and data point rates. Lower the rates below the account quotas when other
+    producers share them. Throttled requests and error entries with retryable error codes
+    are sent again with exponential backoff.
+
+    Args:
+        entries: The list of asset property value entries, each with an entryId, the
+            assetId and propertyId or the propertyAlias, and its propertyValues
+        max_concurrency: Maximum number of requests in flight (1-64, default: 8)
+        max_requests_per_second: Maximum request rate (default: 1000)
+        max_points_per_second: Maximum data point rate (default: 100000)
+        max_retries: Maximum number of retries per request (0-10, default: 5)
+        region: AWS region (default: us-east-1)
+
+    Returns:
+        Dictionary containing the number of requests, submitted, ingested and failed
+        property values, retries, elapsed time, sustained points per second, and the
+        entries that failed after all retries
+
+    Example:
+        result = ingest_asset_property_values(
+            entries=[
+                {
+                    "entryId": "turbine-1-wind-speed",
+                    "propertyAlias": "/windfarm/turbine-1/wind-speed",
+                    "propertyValues": [
+                        {"value": {"doubleValue": 12.5}, "timestamp": {"timeInSeconds": t}}
+                        for t in range(1640995200, 1640998800)
+                    ],
+                }
+            ],
+            max_requests_per_second=200,
+        )
+    """
+    try:
+        if not isinstance(region, FieldInfo):
+            validate_region(region)
+        if not entries:
+            raise ValidationError('Entries cannot be empty')
+        for i, entry in enumerate(entries):
+            if not entry.get('propertyValues'):
+                raise ValidationError(f"Entry {i} missing required 'propertyValues'")
+        if not 1 <= max_concurrency <= 64:
+            raise ValidationError('Max concurrency must be between 1 and 64')
+        if max_requests_per_second <= 0 or max_points_per_second <= 0:
+            raise ValidationError('Rate limits must be greater than 0')
+        if not 0 <= max_retries <= 10:
+            raise ValidationError('Max retries must be between 0 and 10')
+
+        requests = _chunk_entries(entries)
+        points_submitted = sum(len(entry['propertyValues']) for entry in entries)
+        request_limiter = RateLimiter(max_requests_per_second)
+        point_limiter = RateLimiter(max_points_per_second)
+
+        client = create_sitewise_client(region, max_pool_connections=max_concurrency)
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            results = list(
+                executor.map(
+                    lambda request: _put_request(
+                        client, request, request_limiter, point_limiter, max_retries
+                    ),
+                    requests,
+                )
+            )
+        elapsed = time.monotonic() - started
+
+        points_ingested = sum(ingested for ingested, _, _ in results)
+        failed = [error_entry for _, _, errors in results for error_entry in errors]
+        return {
+            'success': not failed,
+            'requests': len(requests),
+            'points_submitted': points_submitted,
+            'points_ingested': points_ingested,
+            'points_failed': points_submitted - points_ingested,
+            'retries': sum(retries for _, retries, _ in results),
+            'elapsed_seconds': round(elapsed, 3),
+            'points_per_second': round(points_ingested / elapsed, 1) if elapsed else 0.0,
+            'error_entries': failed[:MAX_REPORTED_ERROR_ENTRIES],
+            'error_entries_truncated': len(failed) > MAX_REPORTED_ERROR_ENTRIES,
+        }
+
+    except (ValidationError, ClientError) as e:
+        return {
+            'success': False,
+            'error': str(e),
+        }
+
+
 @tool_metadata(readonly=True)
 def get_asset_property_value(
     asset_id: Optional[str] = Field(None, description='The ID of the asset'),
@@ -867,6 +1120,179 @@ def batch_get_asset_property_aggregates(
         }
 
 
+@tool_metadata(readonly=True)
+async def export_asset_property_history(
+    ctx: Context,
+    entries: List[Dict[str, Any]] = Field(
+        ...,
+        description='List of properties to export, each with the assetId and propertyId or '
+        'the propertyAlias, and optionally an entryId naming its series',
+    ),
+    start_date: str = Field(..., description='The exclusive start of the range (ISO 8601 format)'),
+    end_date: str = Field(..., description='The inclusive end of the range (ISO 8601 format)'),
+    aggregate_types: Optional[List[str]] = Field(
+        None,
+        description='Export aggregates instead of raw values (AVERAGE, COUNT, MAXIMUM, '
+        'MINIMUM, SUM, STANDARD_DEVIATION)',
+    ),
+    resolution: str = Field('1h', description='The aggregation interval (1m, 15m, 1h, 1d)'),
+    qualities: Optional[List[str]] = Field(
+        None, description='The quality by which to filter asset data (GOOD, BAD, UNCERTAIN)'
+    ),
+    slice_hours: float = Field(
+        24, description='Length of the time slices fetched concurrently, in hours'
+    ),
+    output_format: Optional[str] = Field(
+        None,
+        description="Write the values to a local 'csv' or 'parquet' file. Parquet requires "
+        'pyarrow. Without a format only the summary is returned',
+    ),
+    summary_points: int = Field(
+        100,
+        description='Number of downsampled points per series in the summary (0-1000, '
+        '0 for statistics only)',
+    ),
+    max_concurrency: int = Field(8, description='Maximum number of requests in flight (1-64)'),
+    max_requests_per_second: float = Field(
+        SiteWiseQuotas.DATA_PLANE_RPS, description='Maximum number of requests per second'
+    ),
+    region: str = Field('us-east-1', description='AWS region'),
+) -> Dict[str, Any]:
+    """Export the full history or aggregates of many asset properties over a time range.
+
+    The range is split into slices, and the properties into groups of 16 entries. All pages
+    of every slice and group are fetched concurrently with BatchGetAssetPropertyValueHistory,
+    or BatchGetAssetPropertyAggregates when aggregate_types is given, under a request rate
+    limit and with retries of throttled requests. Progress is reported as slices and groups
+    finish.
+
+    The values are written to a temporary CSV or Parquet file when output_format is given,
+    with the columns series, timestamp, quality and value and string_value, or one column
+    per aggregate type. The result always contains per-series statistics and a downsampled
+    summary of the values, or of the first aggregate type, so that multi-property,
+    multi-week analysis needs a single call.
+
+    Args:
+        ctx: MCP context used to report progress
+        entries: The properties to export
+        start_date: The exclusive start of the range (ISO 8601 format)
+        end_date: The inclusive end of the range (ISO 8601 format)
+        aggregate_types: The aggregates to export instead of raw values
+        resolution: The aggregation interval (1m, 15m, 1h, 1d, default: 1h)
+        qualities: The quality by which to filter asset data (GOOD, BAD, UNCERTAIN)
+        slice_hours: Length of the time slices in hours (default: 24)
+        output_format: 'csv' or 'parquet' to write the values to a file (default: None)
+        summary_points: Number of downsampled points per series (0-1000, default: 100)
+        max_concurrency: Maximum number of requests in flight (1-64, default: 8)
+        max_requests_per_second: Maximum request rate (default: 1000)
+        region: AWS region (default: us-east-1)
+
+    Returns:
+        Dictionary containing the number of slices, requests and rows, the output file, the
+        per-series summaries, the errors of entries and the elapsed time
+
+    Example:
+        result = await export_asset_property_history(
+            ctx,
+            entries=[
+                {"entryId": "speed", "propertyAlias": "/windfarm/turbine-1/wind-speed"},
+                {"entryId": "power", "propertyAlias": "/windfarm/turbine-1/power"},
+            ],
+            start_date="2024-01-01T00:00:00Z",
+            end_date="2024-01-29T00:00:00Z",
+            output_format="parquet",
+        )
+    """
+    try:
+        if not isinstance(region, FieldInfo):
+            validate_region(region)
+        if not entries:
+            raise ValidationError('Entries cannot be empty')
+        for i, entry in enumerate(entries):
+            if not entry.get('propertyAlias') and not (
+                entry.get('assetId') and entry.get('propertyId')
+            ):
+                raise ValidationError(
+                    f"Entry {i} requires 'propertyAlias' or 'assetId' and 'propertyId'"
+                )
+        start = datetime.fromisoformat(start_date.replace('Z', '+00:00'))
+        end = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+        if end <= start:
+            raise ValidationError('End date must be after start date')
+        if aggregate_types:
+            unknown = [name for name in aggregate_types if name not in AGGREGATE_COLUMNS]
+            if unknown:
+                raise ValidationError(f'Invalid aggregate types: {", ".join(unknown)}')
+            if resolution not in RESOLUTION_SECONDS:
+                raise ValidationError(
+                    f'Resolution must be one of: {", ".join(RESOLUTION_SECONDS)}'
+                )
+        if output_format not in (None, 'csv', 'parquet'):
+            raise ValidationError("Output format must be 'csv' or 'parquet'")
+        if slice_hours <= 0:
+            raise ValidationError('Slice hours must be greater than 0')
+        if not 0 <= summary_points <= 1000:
+            raise ValidationError('Summary points must be between 0 and 1000')
+        if not 1 <= max_concurrency <= 64:
+            raise ValidationError('Max concurrency must be between 1 and 64')
+        if max_requests_per_second <= 0:
+            raise ValidationError('Rate limits must be greater than 0')
+
+        export = HistoryExport(
+            create_sitewise_client(region, max_pool_connections=max_concurrency),
+            entries,
+            start,
+            end,
+            slice_seconds=slice_hours * 3600,
+            aggregate_types=aggregate_types,
+            resolution=resolution,
+            qualities=qualities,
+            summary_points=summary_points,
+            max_concurrency=max_concurrency,
+            max_requests_per_second=max_requests_per_second,
+        )
+        if len(set(export.series)) != len(export.series):
+            raise ValidationError('Entries must name distinct series')
+
+        output_file = None
+        if output_format:
+            fd, output_file = tempfile.mkstemp(
+                prefix='sitewise-history-', suffix=f'.{output_format}'
+            )
+            os.close(fd)
+
+        loop = asyncio.get_running_loop()
+
+        def progress(done: int, total: int) -> None:
+            asyncio.run_coroutine_threadsafe(ctx.report_progress(done, total), loop)
+
+        started = time.monotonic()
+        try:
+            result = await asyncio.to_thread(
+                export.run, output_file, output_format or 'csv', progress
+            )
+        except Exception:
+            if output_file:
+                os.remove(output_file)
+            raise
+        errors = result.pop('errors')
+        return {
+            'success': not errors,
+            **result,
+            'output_file': output_file,
+            'output_format': output_format,
+            'elapsed_seconds': round(time.monotonic() - started, 3),
+            'errors': errors[:MAX_REPORTED_ERROR_ENTRIES],
+            'errors_truncated': len(errors) > MAX_REPORTED_ERROR_ENTRIES,
+        }
+
+    except (ValidationError, ValueError, ClientError) as e:
+        return {
+            'success': False,
+            'error': str(e),
+        }
+
+
 @tool_metadata(readonly=True)
 def list_bulk_import_jobs(
     filter: Optional[str] = Field(
@@ -1463,6 +1889,17 @@ batch_put_asset_property_value_tool = Tool.from_function(
     description=('Send a list of asset property values to AWS IoT SiteWise for data ingestion.'),
 )
 
+ingest_asset_property_values_tool = Tool.from_function(
+    fn=ingest_asset_property_values,
+    name='ingest_asset_property_values',
+    description=(
+        'Ingest any number of asset property values into AWS IoT SiteWise at high throughput. '
+        'Splits entries to the BatchPutAssetPropertyValue limits, sends the requests '
+        'concurrently under request and data point rate limits, retries throttled and '
+        'retryable error entries with backoff, and reports the sustained points per second.'
+    ),
+)
+
 get_asset_property_value_tool = Tool.from_function(
     fn=get_asset_property_value,
     name='get_asset_property_value',
@@ -1509,6 +1946,17 @@ batch_get_asset_property_aggregates_tool = Tool.from_function(
     description=('Get aggregated values for multiple asset properties in AWS IoT SiteWise.'),
 )
 
+export_asset_property_history_tool = Tool.from_function(
+    fn=export_asset_property_history,
+    name='export_asset_property_history',
+    description=(
+        'Export the full history or aggregates of many asset properties over a long time '
+        'range in one call. Splits the range into slices, fetches all pages concurrently '
+        'with the batch history or aggregates APIs, reports progress, and writes the values '
+        'to a local CSV or Parquet file and/or returns a downsampled summary per property.'
+    ),
+)
+
 list_bulk_import_jobs_tool = Tool.from_function(
     fn=list_bulk_import_jobs,
     name='list_bulk_import_jobs',
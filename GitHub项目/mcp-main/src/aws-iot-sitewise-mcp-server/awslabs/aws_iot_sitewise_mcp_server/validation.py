@@ -306,6 +306,7 @@ class SiteWiseQuotas:
     MAX_BATCH_PUT_ENTRIES = 10
     MAX_BATCH_GET_ENTRIES = 16
     MAX_PROPERTY_VALUES_PER_ENTRY = 10
+    MAX_BATCH_GET_RESULTS = 4000
 
     MAX_GATEWAYS_PER_ACCOUNT = 1000
     MAX_TIME_SERIES_PER_ACCOUNT = 1000000
@@ -315,6 +316,9 @@ class SiteWiseQuotas:
     DATA_PLANE_RPS = 1000
     QUERY_RPS = 10
 
+    # Data points ingested per second per account
+    DATA_POINTS_INGESTED_PER_SECOND = 100000
+
 
 def validate_service_quotas(operation: str, current_count: int = 0) -> None:
     """Validate against service quotas where applicable."""
@@ -56,6 +56,15 @@ class TestClient(unittest.TestCase):
         self.assertEqual(kwargs['region_name'], 'us-west-2')
         self.assertEqual(result, mock_client)
 
+    @patch('awslabs.aws_iot_sitewise_mcp_server.client.boto3.client')
+    def test_create_sitewise_client_max_pool_connections(self, mock_boto_client):
+        """Test creating SiteWise client with a connection pool for concurrent requests."""
+        create_sitewise_client('us-west-2', max_pool_connections=32)
+
+        config = mock_boto_client.call_args.kwargs['config']
+        self.assertEqual(config.max_pool_connections, 32)
+        self.assertIn('awslabs/mcp/aws-iot-sitewise-mcp-server', config.user_agent_extra)
+
     @patch('awslabs.aws_iot_sitewise_mcp_server.client.boto3.client')
     def test_create_iam_client_default_region(self, mock_boto_client):
         """Test creating IAM client with default region."""
@@ -0,0 +1,269 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for history_export.py module."""
+
+import csv
+import pytest
+from awslabs.aws_iot_sitewise_mcp_server.history_export import (
+    HistoryExport,
+    SeriesSummary,
+    time_slices,
+)
+from botocore.exceptions import ClientError
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 1, 3, tzinfo=timezone.utc)
+DAY = 86400
+
+
+def _point(seconds, value):
+    return {
+        'value': {'doubleValue': value},
+        'timestamp': {'timeInSeconds': seconds, 'offsetInNanos': 0},
+        'quality': 'GOOD',
+    }
+
+
+def _history_client(pages_per_request=2):
+    """Return a client whose history requests return one point per entry on every page."""
+    client = Mock()
+
+    def batch_get(entries, maxResults, nextToken=None):
+        page = int(nextToken or 0)
+        seconds = int(entries[0]['startDate'].timestamp()) + 60 * (page + 1)
+        return {
+            'successEntries': [
+                {
+                    'entryId': entry['entryId'],
+                    'assetPropertyValueHistory': [_point(seconds, float(page))],
+                }
+                for entry in entries
+            ],
+            'nextToken': str(page + 1) if page + 1 < pages_per_request else None,
+        }
+
+    client.batch_get_asset_property_value_history.side_effect = batch_get
+    return client
+
+
+class TestTimeSlices:
+    """Test cases for time_slices."""
+
+    def test_slices_cover_range(self):
+        """Test that slices are consecutive and the last one ends at the end of the range."""
+        slices = time_slices(START, datetime(2024, 1, 2, 12, tzinfo=timezone.utc), DAY)
+
+        assert slices == [
+            (START, datetime(2024, 1, 2, tzinfo=timezone.utc)),
+            (
+                datetime(2024, 1, 2, tzinfo=timezone.utc),
+                datetime(2024, 1, 2, 12, tzinfo=timezone.utc),
+            ),
+        ]
+
+
+class TestSeriesSummary:
+    """Test cases for SeriesSummary."""
+
+    def test_statistics_and_buckets(self):
+        """Test that values are summarized and downsampled into buckets."""
+        summary = SeriesSummary(start_ns=0, bucket_ns=10 * 10**9)
+        for seconds, value in [(1, 1.0), (2, 3.0), (15, 5.0)]:
+            summary.add(seconds * 10**9, value)
+        summary.add(16 * 10**9, None)
+
+        result = summary.to_dict()
+
+        assert result['points'] == 4
+        assert result['min'] == 1.0
+        assert result['max'] == 5.0
+        assert result['mean'] == 3.0
+        assert result['last_timestamp'] == '1970-01-01T00:00:16+00:00'
+        assert result['downsampled'] == [
+            {
+                'timestamp': '1970-01-01T00:00:00+00:00',
+                'count': 2,
+                'mean': 2.0,
+                'min': 1.0,
+                'max': 3.0,
+            },
+            {
+                'timestamp': '1970-01-01T00:00:10+00:00',
+                'count': 1,
+                'mean': 5.0,
+                'min': 5.0,
+                'max': 5.0,
+            },
+        ]
+
+
+class TestHistoryExport:
+    """Test cases for HistoryExport."""
+
+    def test_units_follow_all_pages(self):
+        """Test that every slice and group of 16 entries is fetched with all its pages."""
+        client = _history_client()
+        entries = [{'propertyAlias': f'/p/{i}'} for i in range(20)]
+        progress = Mock()
+
+        export = HistoryExport(client, entries, START, END, slice_seconds=DAY, summary_points=2)
+        result = export.run(progress=progress)
+
+        assert result['slices'] == 2
+        assert result['requests'] == 8
+        assert result['rows'] == 2 * 2 * 20
+        assert result['errors'] == []
+        assert result['series']['/p/0']['points'] == 4
+        assert len(result['series']['/p/19']['downsampled']) == 2
+        assert progress.call_count == 4
+        progress.assert_called_with(4, 4)
+
+        sizes = sorted(
+            len(call.kwargs['entries'])
+            for call in client.batch_get_asset_property_value_history.call_args_list
+        )
+        assert sizes == [4, 4, 4, 4, 16, 16, 16, 16]
+        first = client.batch_get_asset_property_value_history.call_args_list[0].kwargs
+        assert first['maxResults'] == 4000
+        assert first['entries'][0]['timeOrdering'] == 'ASCENDING'
+
+    def test_units_submitted_in_bounded_window(self):
+        """Test that only a window of units is submitted ahead of the consumed ones."""
+        export = HistoryExport(
+            _history_client(pages_per_request=1),
+            [{'propertyAlias': '/a'}],
+            START,
+            START.replace(day=11),
+            DAY,
+            max_concurrency=2,
+        )
+        ahead = []
+        with patch.object(export, 'fetch_unit', wraps=export.fetch_unit) as fetch_unit:
+            result = export.run(
+                progress=lambda done, total: ahead.append(fetch_unit.call_count - done)
+            )
+
+        assert result['rows'] == 10
+        assert len(ahead) == 10
+        assert max(ahead) < 4
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.history_export.time.sleep')
+    def test_throttled_requests_are_retried_and_errors_reported(self, mock_sleep):
+        """Test that throttled pages are retried and entry errors are reported per series."""
+        client = Mock()
+        client.batch_get_asset_property_value_history.side_effect = [
+            ClientError(
+                {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+                'BatchGetAssetPropertyValueHistory',
+            ),
+            {
+                'successEntries': [
+                    {'entryId': '0', 'assetPropertyValueHistory': [_point(1704067260, 1.0)]}
+                ],
+                'errorEntries': [
+                    {'entryId': '1', 'errorCode': 'ResourceNotFoundException', 'errorMessage': 'x'}
+                ],
+            },
+        ]
+        entries = [
+            {'entryId': 'ok', 'propertyAlias': '/a'},
+            {'entryId': 'missing', 'propertyAlias': '/b'},
+        ]
+
+        result = HistoryExport(client, entries, START, END, slice_seconds=2 * DAY).run()
+
+        assert result['requests'] == 2
+        assert result['rows'] == 1
+        assert result['errors'] == [
+            {
+                'errorCode': 'ResourceNotFoundException',
+                'errorMessage': 'x',
+                'series': 'missing',
+                'start': START.isoformat(),
+                'end': END.isoformat(),
+            }
+        ]
+        mock_sleep.assert_called_once()
+        sent = client.batch_get_asset_property_value_history.call_args.kwargs['entries']
+        assert 'entryId' in sent[0] and sent[0]['entryId'] == '0'
+
+    def test_aggregates_are_aligned_to_resolution(self):
+        """Test that aggregate exports use resolution-aligned slices and aggregate columns."""
+        client = Mock()
+        client.batch_get_asset_property_aggregates.return_value = {
+            'successEntries': [
+                {
+                    'entryId': '0',
+                    'aggregatedValues': [
+                        {
+                            'timestamp': datetime(2024, 1, 1, 1, tzinfo=timezone.utc),
+                            'quality': 'GOOD',
+                            'value': {'average': 2.5, 'maximum': 4.0},
+                        }
+                    ],
+                }
+            ]
+        }
+
+        export = HistoryExport(
+            client,
+            [{'propertyAlias': '/a'}],
+            START,
+            END,
+            slice_seconds=5400,
+            aggregate_types=['AVERAGE', 'MAXIMUM'],
+            resolution='1h',
+        )
+        result = export.run()
+
+        assert export.columns == ['series', 'timestamp', 'quality', 'average', 'maximum']
+        assert result['slices'] == 48
+        assert result['series']['/a']['mean'] == 2.5
+        request = client.batch_get_asset_property_aggregates.call_args.kwargs['entries'][0]
+        assert request['aggregateTypes'] == ['AVERAGE', 'MAXIMUM']
+        assert request['resolution'] == '1h'
+
+    def test_write_csv(self, tmp_path):
+        """Test that values are written to a CSV file with a header row."""
+        path = tmp_path / 'history.csv'
+
+        HistoryExport(
+            _history_client(pages_per_request=1), [{'propertyAlias': '/a'}], START, END, DAY
+        ).run(str(path), 'csv')
+
+        with open(path, newline='') as file:
+            rows = list(csv.reader(file))
+        assert rows[0] == ['series', 'timestamp', 'quality', 'value', 'string_value']
+        assert sorted(row[1] for row in rows[1:]) == [
+            '2024-01-01T00:01:00+00:00',
+            '2024-01-02T00:01:00+00:00',
+        ]
+
+    def test_write_parquet(self, tmp_path):
+        """Test that values are written to a Parquet file with typed columns."""
+        pq = pytest.importorskip('pyarrow.parquet')
+        path = tmp_path / 'history.parquet'
+
+        HistoryExport(
+            _history_client(), [{'propertyAlias': '/a'}, {'propertyAlias': '/b'}], START, END, DAY
+        ).run(str(path), 'parquet')
+
+        table = pq.read_table(path)
+        assert table.num_rows == 8
+        assert str(table.schema.field('timestamp').type) == 'timestamp[ns, tz=UTC]'
+        assert table.column('value').to_pylist().count(1.0) == 4
@@ -0,0 +1,64 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for throttling.py module."""
+
+import pytest
+from awslabs.aws_iot_sitewise_mcp_server.throttling import RateLimiter, backoff_delay
+from unittest.mock import patch
+
+
+class TestRateLimiter:
+    """Test cases for the RateLimiter class."""
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.throttling.time')
+    def test_acquire_waits_for_tokens(self, mock_time):
+        """Test that acquire takes available tokens and waits for missing ones."""
+        clock = [100.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
+        limiter = RateLimiter(rate=10)
+        limiter.acquire(10)
+        mock_time.sleep.assert_not_called()
+
+        limiter.acquire(5)
+        mock_time.sleep.assert_called_once_with(pytest.approx(0.5))
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.throttling.time')
+    def test_acquire_more_than_capacity(self, mock_time):
+        """Test that requests larger than the bucket wait for a full bucket."""
+        clock = [0.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+
+        limiter = RateLimiter(rate=10, burst=20)
+        limiter.acquire(100)
+        limiter.acquire(100)
+
+        mock_time.sleep.assert_called_once_with(pytest.approx(2.0))
+
+    def test_invalid_rate(self):
+        """Test that a rate of zero is rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0)
+
+
+def test_backoff_delay_bounds():
+    """Test that backoff delays grow exponentially up to the cap."""
+    with patch('awslabs.aws_iot_sitewise_mcp_server.throttling.random.uniform') as uniform:
+        uniform.side_effect = lambda low, high: high
+        assert backoff_delay(0, base=0.1, cap=1.0) == pytest.approx(0.1)
+        assert backoff_delay(3, base=0.1, cap=1.0) == pytest.approx(0.8)
+        assert backoff_delay(10, base=0.1, cap=1.0) == 1.0
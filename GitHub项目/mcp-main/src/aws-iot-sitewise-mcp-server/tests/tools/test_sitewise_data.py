@@ -27,14 +27,16 @@ from awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data import (
     create_bulk_import_job,
     describe_bulk_import_job,
     execute_query,
+    export_asset_property_history,
     get_asset_property_aggregates,
     get_asset_property_value,
     get_asset_property_value_history,
     get_interpolated_asset_property_values,
+    ingest_asset_property_values,
     list_bulk_import_jobs,
 )
 from botocore.exceptions import ClientError
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 
 # Add the project root directory and its parent to Python path
@@ -1750,5 +1752,290 @@ class TestSiteWiseData:
         assert 'Max results must be at least 1' in result['error']
 
 
+class TestIngestAssetPropertyValues:
+    """Test cases for the chunked, concurrent ingestion tool."""
+
+    @staticmethod
+    def _entry(entry_id, count, start=1640995200):
+        return {
+            'entryId': entry_id,
+            'propertyAlias': f'/plant/{entry_id}',
+            'propertyValues': [
+                {'value': {'doubleValue': 1.0}, 'timestamp': {'timeInSeconds': start + i}}
+                for i in range(count)
+            ],
+        }
+
+    @staticmethod
+    def _ingest(entries, **kwargs):
+        params = {
+            'max_concurrency': 4,
+            'max_requests_per_second': 1000,
+            'max_points_per_second': 100000,
+            'max_retries': 3,
+            'region': 'us-east-1',
+        }
+        params.update(kwargs)
+        return ingest_asset_property_values(entries=entries, **params)
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.create_sitewise_client')
+    def test_entries_are_chunked_to_api_limits(self, mock_create_client):
+        """Test that entries are split to 10 values per entry and 10 entries per request."""
+        mock_client = Mock()
+        mock_client.batch_put_asset_property_value.return_value = {'errorEntries': []}
+        mock_create_client.return_value = mock_client
+
+        entries = [self._entry('a', 25)] + [self._entry(f'e{i}', 10) for i in range(9)]
+        result = self._ingest(entries)
+
+        assert result['success'] is True
+        assert result['requests'] == 2
+        assert result['points_submitted'] == 115
+        assert result['points_ingested'] == 115
+        assert result['points_failed'] == 0
+        assert result['retries'] == 0
+        assert result['points_per_second'] > 0
+        mock_create_client.assert_called_once_with('us-east-1', max_pool_connections=4)
+
+        requests = [
+            call.kwargs['entries']
+            for call in mock_client.batch_put_asset_property_value.call_args_list
+        ]
+        assert sorted(len(request) for request in requests) == [2, 10]
+        for request in requests:
+            assert [entry['entryId'] for entry in request] == [str(i) for i in range(len(request))]
+            assert all(len(entry['propertyValues']) <= 10 for entry in request)
+        first = next(request for request in requests if len(request) == 10)
+        assert [len(entry['propertyValues']) for entry in first[:3]] == [10, 10, 5]
+        assert first[0]['propertyAlias'] == '/plant/a'
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.time.sleep')
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.create_sitewise_client')
+    def test_retryable_error_entries_are_retried(self, mock_create_client, mock_sleep):
+        """Test that only the values of retryable error entries are sent again."""
+        mock_client = Mock()
+        mock_client.batch_put_asset_property_value.side_effect = [
+            {
+                'errorEntries': [
+                    {
+                        'entryId': '0',
+                        'errors': [
+                            {
+                                'errorCode': 'ThrottlingException',
+                                'errorMessage': 'Rate exceeded',
+                                'timestamps': [{'timeInSeconds': 1640995201}],
+                            },
+                            {
+                                'errorCode': 'TimestampOutOfRangeException',
+                                'errorMessage': 'Too old',
+                                'timestamps': [{'timeInSeconds': 1640995202}],
+                            },
+                        ],
+                    }
+                ]
+            },
+            {'errorEntries': []},
+        ]
+        mock_create_client.return_value = mock_client
+
+        result = self._ingest([self._entry('a', 3)])
+
+        assert result['success'] is False
+        assert result['points_ingested'] == 2
+        assert result['points_failed'] == 1
+        assert result['retries'] == 1
+        assert result['error_entries'] == [
+            {
+                'entryId': 'a',
+                'errors': [
+                    {
+                        'errorCode': 'TimestampOutOfRangeException',
+                        'errorMessage': 'Too old',
+                        'timestamps': [{'timeInSeconds': 1640995202}],
+                    }
+                ],
+            }
+        ]
+        retry = mock_client.batch_put_asset_property_value.call_args_list[1].kwargs['entries']
+        assert [value['timestamp'] for value in retry[0]['propertyValues']] == [
+            {'timeInSeconds': 1640995201}
+        ]
+        mock_sleep.assert_called_once()
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.time.sleep')
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.create_sitewise_client')
+    def test_throttled_request_is_retried(self, mock_create_client, mock_sleep):
+        """Test that a request throttled as a whole is sent again."""
+        mock_client = Mock()
+        mock_client.batch_put_asset_property_value.side_effect = [
+            ClientError(
+                {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+                'BatchPutAssetPropertyValue',
+            ),
+            {'errorEntries': []},
+        ]
+        mock_create_client.return_value = mock_client
+
+        result = self._ingest([self._entry('a', 5)])
+
+        assert result['success'] is True
+        assert result['points_ingested'] == 5
+        assert result['retries'] == 1
+        assert mock_client.batch_put_asset_property_value.call_count == 2
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.time.sleep')
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.create_sitewise_client')
+    def test_failures_reported_after_retries(self, mock_create_client, mock_sleep):
+        """Test that non-retryable failures and exhausted retries are reported."""
+        mock_client = Mock()
+        mock_client.batch_put_asset_property_value.side_effect = ClientError(
+            {'Error': {'Code': 'ServiceUnavailableException', 'Message': 'Unavailable'}},
+            'BatchPutAssetPropertyValue',
+        )
+        mock_create_client.return_value = mock_client
+
+        result = self._ingest([self._entry('a', 2)], max_retries=2)
+
+        assert result['success'] is False
+        assert result['points_failed'] == 2
+        assert result['retries'] == 2
+        assert mock_client.batch_put_asset_property_value.call_count == 3
+        assert result['error_entries'][0]['entryId'] == 'a'
+        assert result['error_entries'][0]['errors'][0]['errorCode'] == (
+            'ServiceUnavailableException'
+        )
+
+        mock_client.batch_put_asset_property_value.reset_mock()
+        mock_client.batch_put_asset_property_value.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDeniedException', 'Message': 'Denied'}},
+            'BatchPutAssetPropertyValue',
+        )
+
+        result = self._ingest([self._entry('a', 2)])
+
+        assert result['points_failed'] == 2
+        assert result['retries'] == 0
+        mock_client.batch_put_asset_property_value.assert_called_once()
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.create_sitewise_client')
+    def test_validation(self, mock_create_client):
+        """Test that invalid entries and limits are rejected before any request."""
+        assert 'cannot be empty' in self._ingest([])['error']
+        assert 'propertyValues' in self._ingest([{'entryId': 'a'}])['error']
+        assert 'concurrency' in self._ingest([self._entry('a', 1)], max_concurrency=0)['error']
+        assert (
+            'Rate limits' in self._ingest([self._entry('a', 1)], max_points_per_second=0)['error']
+        )
+        mock_create_client.assert_not_called()
+
+
+class TestExportAssetPropertyHistory:
+    """Test cases for the bulk history export tool."""
+
+    @staticmethod
+    async def _export(ctx, **kwargs):
+        params = {
+            'entries': [{'entryId': 'speed', 'propertyAlias': '/plant/speed'}],
+            'start_date': '2024-01-01T00:00:00Z',
+            'end_date': '2024-01-15T00:00:00Z',
+            'aggregate_types': None,
+            'resolution': '1h',
+            'qualities': None,
+            'slice_hours': 24,
+            'output_format': None,
+            'summary_points': 7,
+            'max_concurrency': 4,
+            'max_requests_per_second': 1000,
+            'region': 'us-east-1',
+        }
+        params.update(kwargs)
+        return await export_asset_property_history(ctx, **params)
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.create_sitewise_client')
+    async def test_export_summary_and_progress(self, mock_create_client):
+        """Test that a multi-week range is exported in one call with progress reports."""
+        mock_client = Mock()
+        mock_client.batch_get_asset_property_value_history.side_effect = lambda **kwargs: {
+            'successEntries': [
+                {
+                    'entryId': '0',
+                    'assetPropertyValueHistory': [
+                        {
+                            'value': {'integerValue': 3},
+                            'timestamp': {
+                                'timeInSeconds': int(kwargs['entries'][0]['endDate'].timestamp())
+                            },
+                            'quality': 'GOOD',
+                        }
+                    ],
+                }
+            ]
+        }
+        mock_create_client.return_value = mock_client
+        ctx = Mock()
+        ctx.report_progress = AsyncMock()
+
+        result = await self._export(ctx)
+
+        assert result['success'] is True
+        assert result['slices'] == 14
+        assert result['requests'] == 14
+        assert result['rows'] == 14
+        assert result['output_file'] is None
+        summary = result['series']['speed']
+        assert summary['points'] == 14
+        assert summary['mean'] == 3.0
+        assert [bucket['count'] for bucket in summary['downsampled']] == [1, 2, 2, 2, 2, 2, 3]
+        mock_create_client.assert_called_once_with('us-east-1', max_pool_connections=4)
+        assert ctx.report_progress.await_count == 14
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.create_sitewise_client')
+    async def test_export_to_csv_file(self, mock_create_client):
+        """Test that values are written to a temporary file of the requested format."""
+        mock_client = Mock()
+        mock_client.batch_get_asset_property_value_history.return_value = {'successEntries': []}
+        mock_create_client.return_value = mock_client
+        ctx = Mock()
+        ctx.report_progress = AsyncMock()
+
+        result = await self._export(ctx, output_format='csv', summary_points=0)
+
+        try:
+            assert result['output_file'].endswith('.csv')
+            assert 'downsampled' not in result['series']['speed']
+            with open(result['output_file']) as file:
+                assert file.read().strip() == 'series,timestamp,quality,value,string_value'
+        finally:
+            os.remove(result['output_file'])
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.history_export._ParquetSink')
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.create_sitewise_client')
+    async def test_export_failure_removes_file(self, mock_create_client, mock_sink):
+        """Test that the output file is removed when the export fails."""
+        mock_sink.side_effect = ValueError('Parquet output requires pyarrow')
+        ctx = Mock()
+
+        with patch.dict(
+            'awslabs.aws_iot_sitewise_mcp_server.history_export.SINKS', {'parquet': mock_sink}
+        ):
+            result = await self._export(ctx, output_format='parquet')
+
+        assert result == {'success': False, 'error': 'Parquet output requires pyarrow'}
+        assert not os.path.exists(mock_sink.call_args.args[0])
+
+    @patch('awslabs.aws_iot_sitewise_mcp_server.tools.sitewise_data.create_sitewise_client')
+    async def test_export_validation(self, mock_create_client):
+        """Test that invalid entries, ranges and options are rejected before any request."""
+        ctx = Mock()
+
+        assert 'propertyAlias' in (await self._export(ctx, entries=[{'assetId': 'a'}]))['error']
+        assert 'after start' in (await self._export(ctx, end_date='2023-12-01T00:00:00Z'))['error']
+        assert 'aggregate types' in (await self._export(ctx, aggregate_types=['MEDIAN']))['error']
+        assert 'Output format' in (await self._export(ctx, output_format='json'))['error']
+        duplicate = [{'propertyAlias': '/a'}, {'propertyAlias': '/a'}]
+        assert 'distinct' in (await self._export(ctx, entries=duplicate))['error']
+        mock_create_client.return_value.batch_get_asset_property_value_history.assert_not_called()
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -31,6 +31,7 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_logs.models import (
 )
 from awslabs.cloudwatch_mcp_server.common import (
     clean_up_pattern,
+    epoch_ms_to_utc_iso,
     filter_by_prefixes,
     remove_null_values,
 )
@@ -42,6 +43,13 @@ from timeit import default_timer as timer
 from typing import Annotated, Dict, List, Literal, Optional
 
 
+# Logs Insights returns at most this many rows per query, regardless of the requested limit
+LOGS_INSIGHTS_MAX_RESULTS = 10000
+
+# Default account quota for concurrently running Logs Insights queries
+LOGS_INSIGHTS_MAX_CONCURRENT_QUERIES = 30
+
+
 class CloudWatchLogsTools:
     """CloudWatch Logs tools for MCP server."""
 
@@ -212,6 +220,201 @@ class CloudWatchLogsTools:
             'results': [],
         }
 
+    def _build_query_shards(
+        self,
+        log_group_names: Optional[List[str]],
+        log_group_identifiers: Optional[List[str]],
+        start_time: str,
+        end_time: str,
+        time_shards: Optional[int],
+        log_groups_per_shard: Optional[int],
+    ) -> List[Dict]:
+        """Split a query window and log group list into independent sub-query shards.
+
+        The time range is split into contiguous, non-overlapping windows (Logs Insights treats both
+        startTime and endTime as inclusive, so each window ends one second before the next starts).
+        The log group list is optionally chunked as well, and every time window is combined with
+        every log group chunk.
+
+        Args:
+            log_group_names: List of log group names
+            log_group_identifiers: List of log group identifiers
+            start_time: Start time in ISO 8601 format
+            end_time: End time in ISO 8601 format
+            time_shards: Number of time windows, or None to use one window per day
+            log_groups_per_shard: Maximum log groups per shard, or None to keep them together
+
+        Returns:
+            List of shard dictionaries with startTime, endTime and the log group parameter
+        """
+        start_ts = self._convert_time_to_timestamp(start_time)
+        end_ts = self._convert_time_to_timestamp(end_time)
+        if end_ts <= start_ts:
+            raise ValueError('end_time must be after start_time')
+
+        total_seconds = end_ts - start_ts
+        if time_shards is None:
+            time_shards = -(-total_seconds // 86400)
+        time_shards = max(1, min(time_shards, total_seconds))
+
+        windows = []
+        for i in range(time_shards):
+            window_start = start_ts + (total_seconds * i) // time_shards
+            window_end = start_ts + (total_seconds * (i + 1)) // time_shards
+            if i < time_shards - 1:
+                window_end -= 1
+            windows.append((window_start, window_end))
+
+        group_key = 'logGroupNames' if log_group_names else 'logGroupIdentifiers'
+        log_groups = log_group_names or log_group_identifiers or []
+        chunk_size = log_groups_per_shard or len(log_groups)
+        group_chunks = [
+            log_groups[i : i + chunk_size] for i in range(0, len(log_groups), chunk_size)
+        ]
+
+        return [
+            {'startTime': window_start, 'endTime': window_end, group_key: chunk}
+            for window_start, window_end in windows
+            for chunk in group_chunks
+        ]
+
+    async def _execute_query_shard(
+        self,
+        logs_client,
+        shard: Dict,
+        query_string: str,
+        limit: Optional[int],
+        max_timeout: int,
+        semaphore: asyncio.Semaphore,
+        ctx: Context,
+    ) -> Dict:
+        """Run a single query shard once a concurrency slot is available.
+
+        Args:
+            logs_client: The CloudWatch Logs client to use
+            shard: Shard dictionary as built by _build_query_shards
+            query_string: CloudWatch Logs Insights query string
+            limit: Maximum number of results to return for the shard
+            max_timeout: Maximum time to wait for the shard in seconds
+            semaphore: Semaphore bounding the number of concurrently running queries
+            ctx: MCP context for warnings
+
+        Returns:
+            Processed query results dictionary for the shard
+        """
+        async with semaphore:
+            kwargs = {**shard, 'queryString': query_string, 'limit': limit}
+            try:
+                start_response = await asyncio.to_thread(
+                    logs_client.start_query, **remove_null_values(kwargs)
+                )
+            except Exception as e:
+                logger.error(f'Error starting query shard {shard}: {str(e)}')
+                return {
+                    'queryId': '',
+                    'status': 'Error',
+                    'message': f'Error starting query: {str(e)}',
+                    'results': [],
+                }
+
+            query_id = start_response['queryId']
+            logger.info(f'Started query shard with ID: {query_id}')
+            result = await self._poll_for_query_completion(logs_client, query_id, max_timeout, ctx)
+
+            if result['status'] == 'Polling Timeout':
+                # A running query keeps scanning and counts against the concurrent query quota
+                try:
+                    await asyncio.to_thread(logs_client.stop_query, queryId=query_id)
+                    result['message'] = (
+                        f'Query {query_id} did not complete within {max_timeout} seconds and was stopped.'
+                    )
+                except Exception as e:
+                    logger.warning(f'Error stopping timed out query shard {query_id}: {str(e)}')
+            return result
+
+    def _merge_shard_results(
+        self,
+        shards: List[Dict],
+        shard_results: List[Dict],
+        sort_field: Optional[str],
+        sort_order: str,
+        limit: Optional[int],
+        elapsed: float,
+    ) -> Dict:
+        """Merge shard results into a single, re-sorted result with per-shard statistics.
+
+        Args:
+            shards: Shard dictionaries as built by _build_query_shards
+            shard_results: Query results for each shard, in the same order as shards
+            sort_field: Result field to sort the merged rows by, or None to keep shard order
+            sort_order: Either 'asc' or 'desc'
+            limit: Maximum number of merged rows to return
+            elapsed: Wall clock time spent running all shards in seconds
+
+        Returns:
+            Merged query results dictionary
+        """
+        per_shard_limit = min(limit or LOGS_INSIGHTS_MAX_RESULTS, LOGS_INSIGHTS_MAX_RESULTS)
+        totals = {'recordsMatched': 0.0, 'recordsScanned': 0.0, 'bytesScanned': 0.0}
+        shard_statistics = []
+        rows = []
+
+        for index, (shard, result) in enumerate(zip(shards, shard_results)):
+            statistics = result.get('statistics', {})
+            for key in totals:
+                totals[key] += statistics.get(key, 0.0)
+
+            shard_rows = result.get('results', [])
+            rows.extend(shard_rows)
+            shard_statistics.append(
+                {
+                    'shard': index,
+                    'queryId': result.get('queryId', ''),
+                    'status': result['status'],
+                    'startTime': epoch_ms_to_utc_iso(shard['startTime'] * 1000),
+                    'endTime': epoch_ms_to_utc_iso(shard['endTime'] * 1000),
+                    'logGroups': shard.get('logGroupNames') or shard.get('logGroupIdentifiers'),
+                    'resultCount': len(shard_rows),
+                    'truncated': len(shard_rows) >= per_shard_limit,
+                    'statistics': statistics,
+                    **({'message': result['message']} if 'message' in result else {}),
+                }
+            )
+
+        if sort_field:
+            with_field = [row for row in rows if sort_field in row]
+            without_field = [row for row in rows if sort_field not in row]
+            with_field.sort(key=lambda row: row[sort_field], reverse=sort_order == 'desc')
+            rows = with_field + without_field
+
+        completed = sum(1 for s in shard_statistics if s['status'] == 'Complete')
+        truncated = [s['shard'] for s in shard_statistics if s['truncated']]
+        if completed == len(shards):
+            status = 'Complete'
+        elif completed:
+            status = 'Partial'
+        else:
+            status = 'Error'
+
+        merged = {
+            'status': status,
+            'statistics': {
+                **totals,
+                'shardCount': len(shards),
+                'completedShards': completed,
+                'truncatedShards': len(truncated),
+                'elapsedSeconds': round(elapsed, 3),
+            },
+            'shards': shard_statistics,
+            'results': rows[:limit] if limit else rows,
+        }
+        if truncated:
+            merged['message'] = (
+                f'Shards {truncated} returned the maximum of {per_shard_limit} rows and may be '
+                'missing results. Increase time_shards or narrow the query to retrieve them.'
+            )
+        return merged
+
     def register(self, mcp):
         """Register all CloudWatch Logs tools with the MCP server."""
         # Register describe_log_groups tool
@@ -223,6 +426,11 @@ class CloudWatchLogsTools:
         # Register execute_log_insights_query tool
         mcp.tool(name='execute_log_insights_query')(self.execute_log_insights_query)
 
+        # Register execute_sharded_log_insights_query tool
+        mcp.tool(name='execute_sharded_log_insights_query')(
+            self.execute_sharded_log_insights_query
+        )
+
         # Register get_logs_insight_query_results tool
         mcp.tool(name='get_logs_insight_query_results')(self.get_logs_insight_query_results)
 
@@ -613,6 +821,165 @@ class CloudWatchLogsTools:
                 'results': [],
             }
 
+    async def execute_sharded_log_insights_query(
+        self,
+        ctx: Context,
+        log_group_names: Annotated[
+            List[str] | None,
+            Field(
+                description='The list of log group names to be queried. Lists longer than 50 must be split with log_groups_per_shard. CRITICAL: Exactly one of [log_group_names, log_group_identifiers] should be non-null.',
+            ),
+        ] = None,
+        log_group_identifiers: Annotated[
+            List[str] | None,
+            Field(
+                description="The list of logGroupIdentifiers to query. You can specify them by the log group name or ARN. If a log group that you're querying is in a source account and you're using a monitoring account, you must use the ARN. Lists longer than 50 must be split with log_groups_per_shard. CRITICAL: Exactly one of [log_group_names, log_group_identifiers] should be non-null.",
+            ),
+        ] = None,
+        start_time: str = Field(
+            ...,
+            description=(
+                'ISO 8601 formatted start time for the CloudWatch Logs Insights query window (e.g., "2025-04-01T00:00:00+00:00").'
+            ),
+        ),
+        end_time: str = Field(
+            ...,
+            description=(
+                'ISO 8601 formatted end time for the CloudWatch Logs Insights query window (e.g., "2025-04-30T00:00:00+00:00").'
+            ),
+        ),
+        query_string: str = Field(
+            ...,
+            description='The query string in the Cloudwatch Log Insights Query Language. See https://docs.aws.amazon.com/AmazonCloudWatch/latest/logs/CWL_QuerySyntax.html.',
+        ),
+        limit: Annotated[
+            int | None,
+            Field(
+                description='The maximum number of log events to return from each shard and from the merged result. It is critical to use either this parameter or a `| limit <int>` operator in the query to avoid consuming too many tokens of the agent.'
+            ),
+        ] = None,
+        time_shards: Annotated[
+            int | None,
+            Field(
+                ge=1,
+                le=100,
+                description='Number of equal time windows to split the query range into. Defaults to one window per day of the query range.',
+            ),
+        ] = None,
+        log_groups_per_shard: Annotated[
+            int | None,
+            Field(
+                ge=1,
+                le=50,
+                description='Maximum number of log groups per sub-query. Defaults to querying all log groups together.',
+            ),
+        ] = None,
+        max_concurrent_queries: Annotated[
+            int,
+            Field(
+                ge=1,
+                le=LOGS_INSIGHTS_MAX_CONCURRENT_QUERIES,
+                description='Maximum number of sub-queries to run at the same time. Keep this below the account quota for concurrent Logs Insights queries, leaving room for other users.',
+            ),
+        ] = 10,
+        sort_field: Annotated[
+            str | None,
+            Field(
+                description='Result field to sort the merged rows by. Set to null to keep the rows in shard order.'
+            ),
+        ] = '@timestamp',
+        sort_order: Annotated[
+            Literal['asc', 'desc'],
+            Field(description='Sort order of the merged rows.'),
+        ] = 'desc',
+        max_timeout: Annotated[
+            int,
+            Field(
+                description='Maximum time in second to poll for complete results of each sub-query before giving up'
+            ),
+        ] = 60,
+        region: Annotated[
+            str,
+            Field(description='AWS region to query. Defaults to us-east-1.'),
+        ] = 'us-east-1',
+    ) -> Dict:
+        """Executes a CloudWatch Logs Insights query over a large time range by splitting it into concurrently executed sub-queries.
+
+        IMPORTANT: The operation must include exactly one of the following parameters: log_group_names, or log_group_identifiers.
+
+        CRITICAL: The volume of returned logs can easily overwhelm the agent context window. Always include a limit in the query
+        (| limit 50) or using the limit parameter.
+
+        The time range is split into time_shards windows (and the log groups into chunks of log_groups_per_shard), each window is
+        queried separately within the concurrency limit, and the rows of all sub-queries are merged and re-sorted. Each sub-query
+        is subject to the Logs Insights result cap of 10,000 rows, so sharding retrieves results that a single query would truncate.
+
+        Usage: Use instead of execute_log_insights_query when querying many days of high-volume logs, or more than 50 log groups.
+        Queries returning raw log events merge naturally. Aggregations are computed per sub-query: `stats ... by bin(...)` results
+        stay correct as long as the bin divides the shard window, while global aggregates (e.g. `stats count(*)`) return one row per shard.
+
+        Returns:
+        --------
+            A dictionary containing the merged query results, including:
+                - status: Complete if all sub-queries completed, Partial if only some did, Error otherwise
+                - results: The merged and re-sorted rows of all sub-queries
+                - statistics: Totals of records matched, records scanned and bytes scanned, plus shard counts and elapsed time
+                - shards: Per sub-query time window, log groups, query ID, status, result count, truncation flag and statistics
+                - message: Present when sub-queries hit the result cap and may be missing rows
+        """
+        try:
+            # Validate parameters
+            self._validate_log_group_parameters(log_group_names, log_group_identifiers)
+
+            shards = self._build_query_shards(
+                log_group_names,
+                log_group_identifiers,
+                start_time,
+                end_time,
+                time_shards,
+                log_groups_per_shard,
+            )
+            for shard in shards:
+                if len(shard.get('logGroupNames') or shard.get('logGroupIdentifiers') or []) > 50:
+                    raise ValueError(
+                        'A sub-query can target at most 50 log groups, set log_groups_per_shard to split them'
+                    )
+            logger.info(f'Executing Logs Insights query as {len(shards)} shards')
+
+            # Create logs client for the specified region
+            logs_client = self._get_logs_client(region)
+            semaphore = asyncio.Semaphore(max_concurrent_queries)
+
+            start = timer()
+            shard_results = await asyncio.gather(
+                *[
+                    self._execute_query_shard(
+                        logs_client, shard, query_string, limit, max_timeout, semaphore, ctx
+                    )
+                    for shard in shards
+                ]
+            )
+            merged = self._merge_shard_results(
+                shards, shard_results, sort_field, sort_order, limit, timer() - start
+            )
+
+            if 'message' in merged:
+                logger.warning(merged['message'])
+                await ctx.warning(merged['message'])
+            return merged
+
+        except Exception as e:
+            logger.error(f'Error in execute_sharded_log_insights_query_tool: {str(e)}')
+            error_msg = f'Error executing sharded CloudWatch Logs Insights query: {str(e)}'
+            await ctx.error(error_msg)
+
+            return {
+                'status': 'Error',
+                'message': error_msg,
+                'shards': [],
+                'results': [],
+            }
+
     async def get_logs_insight_query_results(
         self,
         ctx: Context,
@@ -0,0 +1,286 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.constants import (
+    NUMERICAL_STABILITY_THRESHOLD,
+)
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_data_decomposer import (
+    MetricDataDecomposer,
+)
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import Seasonality, Trend
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+
+class BatchMetricAnalyzer:
+    """Vectorized metric analysis over many series sampled on a shared time grid.
+
+    Produces the same results as MetricAnalyzer.analyze_metric_data for each series, but computes
+    statistics, interpolation, seasonality and trend as NumPy operations over a 2-D array with one
+    row per series, instead of one series at a time.
+    """
+
+    # Trends are tracked as the sign of the significant slope while working on arrays
+    TRENDS_BY_SIGN = {1: Trend.POSITIVE, -1: Trend.NEGATIVE, 0: Trend.NONE}
+
+    SEASONAL_PERIODS_SECONDS = [
+        Seasonality.FIFTEEN_MINUTES.value,
+        Seasonality.ONE_HOUR.value,
+        Seasonality.SIX_HOURS.value,
+        Seasonality.ONE_DAY.value,
+        Seasonality.ONE_WEEK.value,
+    ]
+
+    def analyze(self, values: np.ndarray, period_seconds: int) -> List[Dict[str, Any]]:
+        """Analyze a batch of metric series.
+
+        Args:
+            values: 2-D array of shape (series, grid points), with NaN where a series has no datapoint
+            period_seconds: The period in seconds between two grid points
+
+        Returns:
+            List with one analysis result dictionary per series, in row order
+        """
+        values = np.asarray(values, dtype=float)
+        n_series, n_points = values.shape
+        valid = np.isfinite(values)
+        counts = valid.sum(axis=1)
+
+        results: List[Dict[str, Any]] = [{} for _ in range(n_series)]
+        for row in np.flatnonzero(counts == 0):
+            results[row] = {'message': 'No metric data available for analysis'}
+        for row in np.flatnonzero(counts == 1):
+            results[row] = {'message': 'Insufficient valid data points for analysis'}
+
+        rows = np.flatnonzero(counts >= 2)
+        if rows.size == 0:
+            return results
+
+        values, valid, counts = values[rows], valid[rows], counts[rows]
+        first = valid.argmax(axis=1)
+        last = n_points - 1 - valid[:, ::-1].argmax(axis=1)
+
+        gap = self._compute_publishing_gap(valid)
+        density_ratio = self._compute_density_ratio(valid, first, gap, counts)
+        statistics = self._compute_statistics(np.where(valid, values, np.nan))
+        filled = self._interpolate(values, valid)
+
+        seasonality = np.zeros(rows.size, dtype=int)
+        trend = np.zeros(rows.size, dtype=int)
+
+        # Series are decomposed together when they share the same grid after interpolation
+        groups: Dict[Tuple[int, int, int], List[int]] = defaultdict(list)
+        for i in np.flatnonzero(density_ratio > 0.5):
+            groups[(int(first[i]), int(last[i]), int(gap[i]))].append(int(i))
+
+        for (group_first, group_last, group_gap), members in groups.items():
+            grid_index = np.minimum(
+                np.arange(group_first, group_last + group_gap, group_gap), n_points - 1
+            )
+            grid = filled[members][:, grid_index]
+            group_seasonality, group_trend = self._detect_strongest_seasonality(
+                grid, period_seconds * group_gap
+            )
+            seasonality[members] = group_seasonality
+            trend[members] = group_trend
+
+        for i, row in enumerate(rows):
+            results[row] = {
+                'data_points_found': int(counts[i]),
+                'seasonality_seconds': int(seasonality[i]),
+                'trend': self.TRENDS_BY_SIGN[int(trend[i])],
+                'statistics': {key: stat[i] for key, stat in statistics.items()},
+                'data_quality': {
+                    'total_points': int(counts[i]),
+                    'density_ratio': float(density_ratio[i]),
+                    'publishing_period_seconds': int(period_seconds * gap[i]),
+                },
+                'message': 'Metric analysis completed successfully',
+            }
+        return results
+
+    def _compute_publishing_gap(self, valid: np.ndarray) -> np.ndarray:
+        """Compute the most common number of grid points between consecutive datapoints per series."""
+        n_series, n_points = valid.shape
+        index = np.arange(n_points)
+        previous = np.maximum.accumulate(np.where(valid, index, -1), axis=1)
+        previous = np.concatenate([np.full((n_series, 1), -1), previous[:, :-1]], axis=1)
+        has_gap = valid & (previous >= 0)
+
+        row_ids, cols = np.nonzero(has_gap)
+        gaps = cols - previous[row_ids, cols]
+        gap_counts = np.bincount(row_ids * n_points + gaps, minlength=n_series * n_points)
+        return gap_counts.reshape(n_series, n_points).argmax(axis=1)
+
+    def _compute_density_ratio(
+        self, valid: np.ndarray, first: np.ndarray, gap: np.ndarray, counts: np.ndarray
+    ) -> np.ndarray:
+        """Calculate the ratio of datapoints that fall within a perfect timeline per series."""
+        n_points = valid.shape[1]
+        perfect_end = np.minimum(first + gap * (counts - 1), n_points - 1)
+        points_in_range = np.take_along_axis(
+            np.cumsum(valid, axis=1), perfect_end[:, None], axis=1
+        )[:, 0]
+        return points_in_range / counts
+
+    def _compute_statistics(self, values: np.ndarray) -> Dict[str, List[Any]]:
+        """Compute essential statistical measures per series, ignoring missing datapoints."""
+        mean = np.nanmean(values, axis=1)
+        std = np.nanstd(values, axis=1, ddof=0)
+        stable = np.abs(mean) > NUMERICAL_STABILITY_THRESHOLD
+        cv = np.divide(std, np.abs(mean), out=np.zeros_like(std), where=stable)
+
+        return {
+            'min': np.nanmin(values, axis=1).tolist(),
+            'max': np.nanmax(values, axis=1).tolist(),
+            'std_deviation': std.tolist(),
+            'coefficient_of_variation': [float(c) if s else None for c, s in zip(cv, stable)],
+            'median': np.nanmedian(values, axis=1).tolist(),
+        }
+
+    def _interpolate(self, values: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """Linearly interpolate missing datapoints of every series, like np.interp per row."""
+        n_points = values.shape[1]
+        index = np.arange(n_points)
+        previous = np.maximum.accumulate(np.where(valid, index, -1), axis=1)
+        following = np.minimum.accumulate(np.where(valid, index, n_points)[:, ::-1], axis=1)[
+            :, ::-1
+        ]
+        # Outside the first and last datapoint, hold the nearest value
+        previous = np.where(previous < 0, following, previous)
+        following = np.where(following >= n_points, previous, following)
+
+        previous_values = np.take_along_axis(values, previous, axis=1)
+        following_values = np.take_along_axis(values, following, axis=1)
+        span = following - previous
+        weight = np.divide(index - previous, span, out=np.zeros(values.shape), where=span > 0)
+        return previous_values + weight * (following_values - previous_values)
+
+    def _detect_strongest_seasonality(
+        self, values: np.ndarray, period_seconds: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Detect the strongest seasonal period and the trend of every series in a 2-D array.
+
+        Returns:
+            Tuple of (seasonality in seconds, trend sign) arrays with one entry per series
+        """
+        n_series, n_points = values.shape
+        lo, hi = np.quantile(values, [0.001, 0.999], axis=1)
+        winsorized = np.clip(values, lo[:, None], hi[:, None])
+
+        best_strength = np.zeros(n_series)
+        best_candidate = np.full(n_series, -1)
+        deseasonalized_by_candidate = {}
+
+        for candidate, seasonal_period_seconds in enumerate(self.SEASONAL_PERIODS_SECONDS):
+            datapoints_per_period = seasonal_period_seconds / period_seconds
+            if n_points < datapoints_per_period * 2 or int(datapoints_per_period) <= 0:
+                continue
+
+            strength, deseasonalized = self._calculate_seasonal_strength(
+                winsorized, int(datapoints_per_period)
+            )
+            improved = strength > best_strength
+            best_strength[improved] = strength[improved]
+            best_candidate[improved] = candidate
+            deseasonalized_by_candidate[candidate] = deseasonalized
+
+        seasonal = best_strength > MetricDataDecomposer.SEASONALITY_STRENGTH_THRESHOLD
+        best_candidate[~seasonal] = -1
+
+        seasonality = np.zeros(n_series, dtype=int)
+        trend = np.zeros(n_series, dtype=int)
+        for candidate in np.unique(best_candidate):
+            members = best_candidate == candidate
+            if candidate < 0:
+                trend[members] = self._compute_trend(winsorized[members])
+            else:
+                seasonality[members] = self.SEASONAL_PERIODS_SECONDS[candidate]
+                trend[members] = self._compute_trend(
+                    deseasonalized_by_candidate[candidate][members]
+                )
+        return seasonality, trend
+
+    def _calculate_seasonal_strength(
+        self, values: np.ndarray, seasonal_period: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate the seasonal strength and deseasonalized values of every series.
+
+        Returns:
+            Tuple of (strength, deseasonalized_values) where deseasonalized = original - seasonal_pattern
+        """
+        n_series, n_points = values.shape
+        n_cycles = n_points // seasonal_period
+        truncated = values[:, : n_cycles * seasonal_period]
+
+        # Calculate seasonal pattern (mean across cycles)
+        seasonal_pattern = truncated.reshape(n_series, n_cycles, seasonal_period).mean(axis=1)
+        tiled_pattern = np.tile(seasonal_pattern, (1, n_cycles))
+
+        trend = self._centered_moving_average(truncated, seasonal_period)
+        detrended = truncated - trend
+        remainder = detrended - tiled_pattern
+
+        # Seasonal strength = 1 - Var(remainder) / Var(detrended)
+        var_remainder = np.var(remainder, axis=1)
+        var_detrended = np.var(detrended, axis=1)
+        stable = var_detrended > NUMERICAL_STABILITY_THRESHOLD
+        ratio = np.divide(var_remainder, var_detrended, out=np.ones(n_series), where=stable)
+        strength = np.maximum(0.0, 1 - ratio)
+
+        return strength, truncated - tiled_pattern
+
+    def _centered_moving_average(self, values: np.ndarray, window: int) -> np.ndarray:
+        """Centered moving average with partial windows at the edges, like pandas rolling(center=True)."""
+        n_series, n_points = values.shape
+        cumulative = np.concatenate([np.zeros((n_series, 1)), np.cumsum(values, axis=1)], axis=1)
+        index = np.arange(n_points)
+        start = np.maximum(0, index - window // 2)
+        end = np.minimum(n_points, index + (window - 1) // 2 + 1)
+        return (cumulative[:, end] - cumulative[:, start]) / (end - start)
+
+    def _compute_trend(self, values: np.ndarray) -> np.ndarray:
+        """Compute the trend of every series with a closed-form OLS fit against time.
+
+        Returns:
+            Array with one entry per series: 1 for a positive, -1 for a negative and 0 for no trend
+        """
+        from scipy.stats import t as t_distribution
+
+        n_series, n_points = values.shape
+        trend = np.zeros(n_series, dtype=int)
+        if n_points <= 2:
+            return trend
+
+        x = np.arange(n_points) / (n_points - 1 + NUMERICAL_STABILITY_THRESHOLD)
+        x_centered = x - x.mean()
+        sxx = np.sum(x_centered**2)
+
+        y_centered = values - values.mean(axis=1, keepdims=True)
+        slope = y_centered @ x_centered / sxx
+        residuals = y_centered - slope[:, None] * x_centered
+        standard_error = np.sqrt(np.sum(residuals**2, axis=1) / (n_points - 2) / sxx)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_values = np.abs(slope) / standard_error
+        t_values = np.where(standard_error > 0, t_values, np.inf)
+        p_values = 2 * t_distribution.sf(t_values, n_points - 2)
+
+        significant = (np.std(values, axis=1) >= NUMERICAL_STABILITY_THRESHOLD) & (
+            p_values < MetricDataDecomposer.STATISTICAL_SIGNIFICANCE_THRESHOLD
+        )
+        trend[significant & (slope > 0)] = 1
+        trend[significant & (slope <= 0)] = -1
+        return trend
@@ -22,6 +22,11 @@ DAYS_PER_WEEK = 7
 
 # Analysis constants
 DEFAULT_ANALYSIS_PERIOD_MINUTES = 20160  # 2 weeks
+MAX_BATCH_ANALYSIS_METRICS = 500  # GetMetricData limit of queries per request
+
+# Metric data cache constants
+METRIC_DATA_CACHE_MAX_DATAPOINTS = 1_000_000
+METRIC_DATA_FINALITY_DELAY_SECONDS = 900  # Datapoints younger than this may still change
 
 # Threshold constants
 COMPARISON_OPERATOR_ANOMALY = 'LessThanLowerOrGreaterThanUpperThreshold'
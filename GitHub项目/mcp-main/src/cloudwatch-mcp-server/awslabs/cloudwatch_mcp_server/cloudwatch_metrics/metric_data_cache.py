@@ -0,0 +1,158 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+@dataclass
+class CachedSeries:
+    """Datapoints and covered time ranges cached for one metric query."""
+
+    # Sorted, non-overlapping half-open [start, end) ranges in epoch seconds known to be final
+    covered: List[Tuple[int, int]] = field(default_factory=list)
+    points: Dict[int, float] = field(default_factory=dict)
+    label: str = ''
+
+
+class MetricDataCache:
+    """Bounded in-memory cache of CloudWatch metric time series with gap-only fetching.
+
+    Series are keyed by the caller (region, metric query, statistic and period). For each request
+    the cache reports which parts of the time range it does not cover, so that only those have to
+    be fetched from GetMetricData. Fetched datapoints are merged into the cached series.
+
+    Only whole periods that ended more than finality_delay_seconds ago are cached, because
+    CloudWatch keeps updating recent datapoints while late data arrives. Everything newer is
+    always fetched live. The least recently used series are evicted once max_datapoints is
+    exceeded.
+    """
+
+    def __init__(self, max_datapoints: int = 1_000_000, finality_delay_seconds: int = 900):
+        """Initialize the metric data cache.
+
+        Args:
+            max_datapoints: Maximum number of datapoints kept across all series
+            finality_delay_seconds: Age after which a datapoint is considered final and cacheable
+        """
+        self.max_datapoints = max_datapoints
+        self.finality_delay_seconds = finality_delay_seconds
+        self._series: 'OrderedDict[Hashable, CachedSeries]' = OrderedDict()
+        self._datapoints = 0
+        self._lock = threading.Lock()
+
+    def missing_ranges(self, key: Hashable, start: int, end: int) -> List[Tuple[int, int]]:
+        """Return the parts of [start, end) not covered by the cache, in epoch seconds."""
+        with self._lock:
+            series = self._series.get(key)
+            covered = list(series.covered) if series else []
+
+        missing = []
+        cursor = start
+        for covered_start, covered_end in covered:
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > cursor:
+                missing.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end:
+            missing.append((cursor, end))
+        return missing
+
+    def store(
+        self,
+        key: Hashable,
+        start: int,
+        end: int,
+        period: int,
+        timestamps: List[int],
+        values: List[float],
+        label: str,
+        now: int,
+    ) -> None:
+        """Merge datapoints fetched for [start, end) into the cache.
+
+        Only the whole periods inside the fetched range that are older than the finality delay are
+        marked as covered, and only datapoints inside them are kept.
+
+        Args:
+            key: The series key
+            start: Start of the fetched range in epoch seconds
+            end: End of the fetched range in epoch seconds
+            period: The period of the series in seconds
+            timestamps: Datapoint timestamps in epoch seconds
+            values: Datapoint values
+            label: The label returned by GetMetricData for the series
+            now: The current time in epoch seconds
+        """
+        covered_start = -(-start // period) * period
+        covered_end = min(end, now - self.finality_delay_seconds) // period * period
+        if covered_end <= covered_start:
+            return
+
+        with self._lock:
+            series = self._series.setdefault(key, CachedSeries())
+            self._series.move_to_end(key)
+            series.label = label or series.label
+
+            before = len(series.points)
+            for ts, value in zip(timestamps, values):
+                if covered_start <= ts < covered_end:
+                    series.points[ts] = value
+            self._datapoints += len(series.points) - before
+            series.covered = self._merge_ranges(series.covered + [(covered_start, covered_end)])
+
+            self._evict(keep=key)
+
+    def get(self, key: Hashable, start: int, end: int) -> Tuple[Dict[int, float], str]:
+        """Return the cached datapoints within [start, end) and the label of the series."""
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return {}, ''
+            self._series.move_to_end(key)
+            return (
+                {ts: value for ts, value in series.points.items() if start <= ts < end},
+                series.label,
+            )
+
+    def clear(self) -> None:
+        """Remove all cached series."""
+        with self._lock:
+            self._series.clear()
+            self._datapoints = 0
+
+    def _evict(self, keep: Optional[Hashable] = None) -> None:
+        """Evict least recently used series until the datapoint budget is met."""
+        while self._datapoints > self.max_datapoints and len(self._series) > 1:
+            oldest_key = next(iter(self._series))
+            if oldest_key == keep:
+                self._series.move_to_end(oldest_key)
+                continue
+            self._datapoints -= len(self._series.pop(oldest_key).points)
+
+    @staticmethod
+    def _merge_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Merge overlapping or adjacent half-open ranges."""
+        merged: List[Tuple[int, int]] = []
+        for range_start, range_end in sorted(ranges):
+            if merged and range_start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+            else:
+                merged.append((range_start, range_end))
+        return merged
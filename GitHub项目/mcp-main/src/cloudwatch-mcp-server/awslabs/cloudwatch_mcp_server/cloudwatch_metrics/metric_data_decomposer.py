@@ -13,8 +13,6 @@
 # limitations under the License.
 
 import numpy as np
-import pandas as pd
-import statsmodels.api as sm
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.constants import (
     NUMERICAL_STABILITY_THRESHOLD,
 )
@@ -24,12 +22,15 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     Trend,
 )
 from loguru import logger
-from statsmodels.regression.linear_model import OLS
 from typing import List, Optional, Tuple
 
 
 class MetricDataDecomposer:
-    """Decomposes metric time series data into seasonal and trend components."""
+    """Decomposes metric time series data into seasonal and trend components.
+
+    pandas and statsmodels are imported on first use so that server startup does not pay
+    their import cost.
+    """
 
     SEASONALITY_STRENGTH_THRESHOLD = 0.6  # See https://robjhyndman.com/hyndsight/tsoutliers/
     STATISTICAL_SIGNIFICANCE_THRESHOLD = 0.05
@@ -155,6 +156,8 @@ class MetricDataDecomposer:
         seasonal_pattern = np.mean(reshaped, axis=0)
         tiled_pattern = np.tile(seasonal_pattern, n_cycles)
 
+        import pandas as pd
+
         # Calculate trend (moving average) for seasonal strength calculation
         trend_series = (
             pd.Series(truncated_values)
@@ -186,6 +189,9 @@ class MetricDataDecomposer:
             return Trend.NONE
 
         try:
+            import statsmodels.api as sm
+            from statsmodels.regression.linear_model import OLS
+
             valid_data = [
                 (i, v) for i, v in enumerate(values) if not np.isnan(v) and not np.isinf(v)
             ]
@@ -81,6 +81,21 @@ class Dimension(BaseModel):
     value: str = Field(..., description='The value of the dimension')
 
 
+class MetricIdentifier(BaseModel):
+    """Identifies a single CloudWatch metric by namespace, name and dimensions."""
+
+    namespace: str = Field(
+        ..., description="The namespace of the metric (e.g., 'AWS/EC2', 'AWS/Lambda')"
+    )
+    metric_name: str = Field(
+        ..., description="The name of the metric (e.g., 'CPUUtilization', 'Duration')"
+    )
+    dimensions: List[Dimension] = Field(
+        default_factory=list,
+        description='List of dimensions that identify the metric, each with name and value',
+    )
+
+
 class MetricDataPoint(BaseModel):
     """Represents a single CloudWatch metric data point."""
 
@@ -14,18 +14,27 @@
 
 """CloudWatch Metrics tools for MCP server."""
 
+import asyncio
 import boto3
 import json
+import numpy as np
 import os
 from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.batch_metric_analyzer import (
+    BatchMetricAnalyzer,
+)
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.cloudformation_template_generator import (
     CloudFormationTemplateGenerator,
 )
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.constants import (
     COMPARISON_OPERATOR_ANOMALY,
     DEFAULT_ANALYSIS_PERIOD_MINUTES,
+    MAX_BATCH_ANALYSIS_METRICS,
+    METRIC_DATA_CACHE_MAX_DATAPOINTS,
+    METRIC_DATA_FINALITY_DELAY_SECONDS,
 )
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_analyzer import MetricAnalyzer
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_data_cache import MetricDataCache
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_data_decomposer import Seasonality
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     AlarmRecommendation,
@@ -38,6 +47,7 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     MetricData,
     MetricDataPoint,
     MetricDataResult,
+    MetricIdentifier,
     MetricMetadata,
     MetricMetadataIndexKey,
     StaticAlarmThreshold,
@@ -63,6 +73,11 @@ class CloudWatchMetricsTools:
         logger.info(f'Loaded {len(self.metric_metadata_index)} metric metadata entries')
         self.cloudformation_generator = CloudFormationTemplateGenerator()
         self.metric_analyzer = MetricAnalyzer()
+        self.batch_metric_analyzer = BatchMetricAnalyzer()
+        self.metric_data_cache = MetricDataCache(
+            max_datapoints=METRIC_DATA_CACHE_MAX_DATAPOINTS,
+            finality_delay_seconds=METRIC_DATA_FINALITY_DELAY_SECONDS,
+        )
 
     def _get_cloudwatch_client(self, region: str):
         """Create a CloudWatch client for the specified region."""
@@ -154,6 +169,9 @@ class CloudWatchMetricsTools:
         # Register analyze_metric tool
         mcp.tool(name='analyze_metric')(self.analyze_metric)
 
+        # Register analyze_metrics_batch tool
+        mcp.tool(name='analyze_metrics_batch')(self.analyze_metrics_batch)
+
         # Register get_recommended_metric_alarms tool
         mcp.tool(name='get_recommended_metric_alarms')(self.get_recommended_metric_alarms)
 
@@ -241,6 +259,10 @@ class CloudWatchMetricsTools:
 
         When using group_by_dimension, you must include that dimension in schema_dimension_keys.
 
+        Standard GetMetricData results are cached per region, metric, statistic and period. Repeated or
+        overlapping requests only fetch the parts of the time range that are not cached yet, and datapoints from
+        the last 15 minutes are always fetched live because CloudWatch may still update them.
+
         Usage: Use this tool to get actual metric data from CloudWatch for analysis or visualization.
 
         Returns:
@@ -373,10 +395,15 @@ class CloudWatchMetricsTools:
             # Create CloudWatch client for the specified region
             cloudwatch_client = self._get_cloudwatch_client(region)
 
-            # Call the GetMetricData API
-            response = cloudwatch_client.get_metric_data(
-                MetricDataQueries=[metric_query], StartTime=start_time, EndTime=end_time
-            )
+            # Call the GetMetricData API, serving standard metric queries from the cache where possible
+            if use_metrics_insights:
+                response = cloudwatch_client.get_metric_data(
+                    MetricDataQueries=[metric_query], StartTime=start_time, EndTime=end_time
+                )
+            else:
+                response = self._get_metric_data_with_cache(
+                    cloudwatch_client, region, metric_query, start_time, end_time
+                )
 
             # Process the response
             return self._process_metric_data_response(response)
@@ -386,6 +413,82 @@ class CloudWatchMetricsTools:
             await ctx.error(f'Error getting metric data: {str(e)}')
             raise
 
+    def _get_metric_data_with_cache(
+        self, cloudwatch_client, region, metric_query, start_time, end_time
+    ) -> Dict[str, Any]:
+        """Call GetMetricData for a standard metric query, fetching only ranges missing from the cache.
+
+        The requested range is aligned to the period, the uncovered parts are fetched and merged
+        into the cache, and a GetMetricData-shaped response is assembled from the cached and
+        freshly fetched datapoints that fall within the requested range.
+        """
+        period = metric_query['MetricStat']['Period']
+        key = (region, json.dumps(metric_query['MetricStat'], sort_keys=True))
+        start_seconds = int(start_time.timestamp())
+        end_seconds = int(end_time.timestamp())
+        start = start_seconds // period * period
+        end = -(-end_seconds // period) * period
+        now = int(datetime.now(timezone.utc).timestamp())
+
+        fetched: Dict[int, float] = {}
+        label = ''
+        status_code = 'Complete'
+        result_messages: List[Dict[str, Any]] = []
+        messages: List[Dict[str, Any]] = []
+
+        for range_start, range_end in self.metric_data_cache.missing_ranges(key, start, end):
+            response = cloudwatch_client.get_metric_data(
+                MetricDataQueries=[metric_query],
+                StartTime=datetime.fromtimestamp(range_start, tz=timezone.utc),
+                EndTime=datetime.fromtimestamp(range_end, tz=timezone.utc),
+            )
+            messages.extend(response.get('Messages', []))
+
+            timestamps: List[int] = []
+            values: List[float] = []
+            range_status = 'Complete'
+            for result in response.get('MetricDataResults', []):
+                label = result.get('Label', label)
+                result_messages.extend(result.get('Messages', []))
+                if result.get('StatusCode', 'Complete') != 'Complete':
+                    range_status = result['StatusCode']
+                for ts in result.get('Timestamps', []):
+                    if ts.tzinfo is None:
+                        ts = ts.replace(tzinfo=timezone.utc)
+                    timestamps.append(int(ts.timestamp()))
+                values.extend(result.get('Values', []))
+
+            fetched.update(zip(timestamps, values))
+            if range_status == 'Complete':
+                self.metric_data_cache.store(
+                    key, range_start, range_end, period, timestamps, values, label, now
+                )
+            else:
+                status_code = range_status
+
+        cached, cached_label = self.metric_data_cache.get(key, start, end)
+        cached.update(fetched)
+        # The aligned range can reach before the requested start, keep only the requested points
+        points = sorted(
+            (ts, value) for ts, value in cached.items() if start_seconds <= ts < end_seconds
+        )
+
+        return {
+            'MetricDataResults': [
+                {
+                    'Id': metric_query['Id'],
+                    'Label': label or cached_label,
+                    'StatusCode': status_code,
+                    'Timestamps': [
+                        datetime.fromtimestamp(ts, tz=timezone.utc) for ts, _ in points
+                    ],
+                    'Values': [value for _, value in points],
+                    'Messages': result_messages,
+                }
+            ],
+            'Messages': messages,
+        }
+
     def _prepare_time_parameters(self, start_time, end_time, target_datapoints):
         """Process time parameters and calculate the period."""
         # Convert string times to datetime objects
@@ -1163,3 +1266,164 @@ class CloudWatchMetricsTools:
             logger.error(f'Error in analyze_metric: {str(e)}')
             await ctx.error(f'Error encountered when analyzing metric: {str(e)}')
             raise
+
+    def _fetch_metric_batch(
+        self,
+        cloudwatch_client,
+        metrics: List[MetricIdentifier],
+        statistic: str,
+        start_time: datetime,
+        end_time: datetime,
+        period: int,
+    ) -> np.ndarray:
+        """Fetch many metrics with one set of GetMetricData requests into a 2-D array.
+
+        All metrics are sent as queries of the same GetMetricData request and the response pages
+        are followed until exhausted. Datapoints are placed on a shared time grid with one column
+        per period, starting at start_time rounded down to the period.
+
+        Returns:
+            Array of shape (len(metrics), grid points), with NaN where a metric has no datapoint
+        """
+        queries = []
+        for i, metric in enumerate(metrics):
+            query = self._build_standard_metric_query(
+                metric.namespace, metric.metric_name, metric.dimensions, statistic, period
+            )
+            query['Id'] = f'm{i}'
+            queries.append(query)
+
+        origin = int(start_time.timestamp()) // period * period
+        n_points = (int(end_time.timestamp()) - origin) // period + 1
+        values = np.full((len(metrics), n_points), np.nan)
+
+        paginator = cloudwatch_client.get_paginator('get_metric_data')
+        for page in paginator.paginate(
+            MetricDataQueries=queries,
+            StartTime=start_time,
+            EndTime=end_time,
+            ScanBy='TimestampAscending',
+        ):
+            for result in page.get('MetricDataResults', []):
+                row = int(result['Id'][1:])
+                timestamps = np.array(
+                    [int(ts.timestamp()) for ts in result.get('Timestamps', [])], dtype=np.int64
+                )
+                columns = (timestamps - origin) // period
+                in_range = (columns >= 0) & (columns < n_points)
+                values[row, columns[in_range]] = np.asarray(result.get('Values', []))[in_range]
+
+        return values
+
+    async def analyze_metrics_batch(
+        self,
+        ctx: Context,
+        metrics: Annotated[
+            List[MetricIdentifier],
+            Field(
+                min_length=1,
+                max_length=MAX_BATCH_ANALYSIS_METRICS,
+                description='The metrics to analyze, each identified by namespace, metric name and dimensions. Up to 500 metrics.',
+            ),
+        ],
+        region: Annotated[
+            str,
+            Field(description='AWS region to query. Defaults to us-east-1.'),
+        ] = 'us-east-1',
+        statistic: Annotated[
+            Literal[
+                'AVG',
+                'COUNT',
+                'MAX',
+                'MIN',
+                'SUM',
+                'Average',
+                'Sum',
+                'Maximum',
+                'Minimum',
+                'SampleCount',
+            ],
+            Field(description='The statistic to use for the metric analysis'),
+        ] = 'AVG',
+    ) -> Dict[str, Any]:
+        """Analyzes many CloudWatch metrics at once to determine seasonality, trend, data density and statistical properties.
+
+        This tool performs the same analysis as analyze_metric for up to 500 metrics in a single call. All metrics are
+        retrieved with one batched GetMetricData request set and analyzed together, which makes fleet-wide triage (for
+        example the CPUUtilization of hundreds of instances) practical.
+
+        Usage: Use this tool instead of calling analyze_metric repeatedly when comparing the same metric across many
+        resources, or many metrics of one resource.
+
+        Args:
+            ctx: The MCP context object for error handling and logging.
+            metrics: The metrics to analyze, each with namespace, metric_name and dimensions
+            statistic: The statistic to use for metric analysis. For guidance on choosing the correct statistic, refer to the get_recommended_metric_alarms tool.
+            region: AWS region to query. Defaults to 'us-east-1'.
+
+        Returns:
+            Dict[str, Any]: Analysis results including:
+                - message: Status message
+                - results: One analysis result per requested metric, in request order, with the same fields as
+                  analyze_metric (seasonality_seconds, trend, statistics, data_quality, message, metric_info)
+                - time_range: Start and end of the analyzed time range
+
+        Example:
+            analysis = await analyze_metrics_batch(
+                ctx,
+                metrics=[
+                    MetricIdentifier(
+                        namespace="AWS/EC2",
+                        metric_name="CPUUtilization",
+                        dimensions=[Dimension(name="InstanceId", value=instance_id)],
+                    )
+                    for instance_id in instance_ids
+                ],
+            )
+            for result in analysis['results']:
+                print(f"{result['metric_info']['dimensions']}: {result.get('trend')}")
+        """
+        try:
+            analysis_period_minutes = DEFAULT_ANALYSIS_PERIOD_MINUTES
+
+            logger.info(f'Analyzing batch of {len(metrics)} metrics in region {region}')
+
+            end_time = datetime.now(timezone.utc)
+            start_time = end_time - timedelta(minutes=analysis_period_minutes)
+            _, _, period_seconds = self._prepare_time_parameters(
+                start_time, end_time, analysis_period_minutes
+            )
+
+            cloudwatch_client = self._get_cloudwatch_client(region)
+            values = await asyncio.to_thread(
+                self._fetch_metric_batch,
+                cloudwatch_client,
+                metrics,
+                statistic,
+                start_time,
+                end_time,
+                period_seconds,
+            )
+            analysis_results = self.batch_metric_analyzer.analyze(values, period_seconds)
+
+            for metric, analysis_result in zip(metrics, analysis_results):
+                analysis_result['metric_info'] = {
+                    'namespace': metric.namespace,
+                    'metric_name': metric.metric_name,
+                    'statistic': statistic,
+                    'dimensions': [{'name': d.name, 'value': d.value} for d in metric.dimensions],
+                }
+
+            return {
+                'message': f'Analyzed {len(metrics)} metrics',
+                'analysis_period_minutes': analysis_period_minutes,
+                'time_range': {
+                    'start': start_time.isoformat(),
+                    'end': end_time.isoformat(),
+                },
+                'results': analysis_results,
+            }
+        except Exception as e:
+            logger.error(f'Error in analyze_metrics_batch: {str(e)}')
+            await ctx.error(f'Error encountered when analyzing metrics: {str(e)}')
+            raise
@@ -412,12 +412,13 @@ class TestEdgeCases:
             tools.register(mock_mcp)
 
             # Verify all tools are registered
-            assert mock_mcp.tool.call_count == 5
+            assert mock_mcp.tool.call_count == 6
             tool_calls = [call[1]['name'] for call in mock_mcp.tool.call_args_list]
             expected_tools = [
                 'describe_log_groups',
                 'analyze_log_group',
                 'execute_log_insights_query',
+                'execute_sharded_log_insights_query',
                 'get_logs_insight_query_results',
                 'cancel_logs_insight_query',
             ]
@@ -0,0 +1,283 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for sharded CloudWatch Logs Insights query execution."""
+
+import itertools
+import pytest
+import pytest_asyncio
+from awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools import CloudWatchLogsTools
+from unittest.mock import AsyncMock, Mock, patch
+
+
+@pytest_asyncio.fixture
+async def mock_context():
+    """Create mock MCP context."""
+    context = Mock()
+    context.info = AsyncMock()
+    context.warning = AsyncMock()
+    context.error = AsyncMock()
+    return context
+
+
+def _make_client(rows_by_start):
+    """Create a mock logs client answering each query with the rows registered for its startTime."""
+    client = Mock()
+    queries = {}
+
+    def start_query(**kwargs):
+        query_id = f'q-{len(queries)}'
+        queries[query_id] = kwargs
+        return {'queryId': query_id}
+
+    def get_query_results(queryId):
+        kwargs = queries[queryId]
+        rows = rows_by_start.get(kwargs['startTime'], [])
+        return {
+            'status': 'Complete',
+            'statistics': {'recordsMatched': len(rows), 'recordsScanned': 10, 'bytesScanned': 100},
+            'results': [
+                [{'field': '@timestamp', 'value': ts}, {'field': '@message', 'value': msg}]
+                for ts, msg in rows
+            ],
+        }
+
+    client.start_query.side_effect = start_query
+    client.get_query_results.side_effect = get_query_results
+    client.queries = queries
+    return client
+
+
+class TestBuildQueryShards:
+    """Tests for splitting queries into shards."""
+
+    def test_time_windows_are_contiguous_and_non_overlapping(self):
+        """Test that time windows cover the whole range without overlap."""
+        tools = CloudWatchLogsTools()
+        shards = tools._build_query_shards(
+            ['group'],
+            None,
+            '2025-01-01T00:00:00+00:00',
+            '2025-01-01T03:00:00+00:00',
+            3,
+            None,
+        )
+
+        assert [(s['startTime'], s['endTime']) for s in shards] == [
+            (1735689600, 1735693199),
+            (1735693200, 1735696799),
+            (1735696800, 1735700400),
+        ]
+        assert all(s['logGroupNames'] == ['group'] for s in shards)
+
+    def test_defaults_to_one_window_per_day(self):
+        """Test that the default shard count is one window per started day."""
+        tools = CloudWatchLogsTools()
+        shards = tools._build_query_shards(
+            None,
+            ['arn-a'],
+            '2025-01-01T00:00:00+00:00',
+            '2025-01-31T12:00:00+00:00',
+            None,
+            None,
+        )
+
+        assert len(shards) == 31
+        assert all(s['logGroupIdentifiers'] == ['arn-a'] for s in shards)
+
+    def test_log_groups_are_chunked(self):
+        """Test that every time window is combined with every log group chunk."""
+        tools = CloudWatchLogsTools()
+        shards = tools._build_query_shards(
+            ['a', 'b', 'c'],
+            None,
+            '2025-01-01T00:00:00+00:00',
+            '2025-01-03T00:00:00+00:00',
+            2,
+            2,
+        )
+
+        assert [s['logGroupNames'] for s in shards] == [['a', 'b'], ['c'], ['a', 'b'], ['c']]
+
+    def test_invalid_time_range(self):
+        """Test that an empty time range is rejected."""
+        tools = CloudWatchLogsTools()
+        with pytest.raises(ValueError, match='end_time must be after start_time'):
+            tools._build_query_shards(
+                ['a'], None, '2025-01-02T00:00:00+00:00', '2025-01-01T00:00:00+00:00', 2, None
+            )
+
+
+class TestExecuteShardedLogInsightsQuery:
+    """Tests for execute_sharded_log_insights_query tool."""
+
+    @pytest.mark.asyncio
+    async def test_results_are_merged_and_sorted(self, mock_context):
+        """Test that shard results are merged, re-sorted and limited."""
+        client = _make_client(
+            {
+                1735689600: [('2025-01-01 10:00:00.000', 'first')],
+                1735776000: [
+                    ('2025-01-02 11:00:00.000', 'third'),
+                    ('2025-01-02 09:00:00.000', 'second'),
+                ],
+            }
+        )
+        with patch(
+            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
+        ) as mock_session:
+            mock_session.return_value.client.return_value = client
+            tools = CloudWatchLogsTools()
+
+            result = await tools.execute_sharded_log_insights_query(
+                mock_context,
+                log_group_names=['group'],
+                log_group_identifiers=None,
+                start_time='2025-01-01T00:00:00+00:00',
+                end_time='2025-01-03T00:00:00+00:00',
+                query_string='fields @timestamp, @message',
+                limit=2,
+                time_shards=None,
+                log_groups_per_shard=None,
+                max_concurrent_queries=2,
+                sort_field='@timestamp',
+                sort_order='desc',
+                max_timeout=5,
+            )
+
+        assert result['status'] == 'Complete'
+        assert [r['@message'] for r in result['results']] == ['third', 'second']
+        assert result['statistics']['shardCount'] == 2
+        assert result['statistics']['completedShards'] == 2
+        assert result['statistics']['recordsMatched'] == 3
+        assert result['statistics']['bytesScanned'] == 200
+        assert [s['resultCount'] for s in result['shards']] == [1, 2]
+        assert result['shards'][1]['truncated'] is True
+        assert 'message' in result
+        mock_context.warning.assert_called_once()
+        assert all(q['limit'] == 2 for q in client.queries.values())
+
+    @pytest.mark.asyncio
+    async def test_partial_failure(self, mock_context):
+        """Test that a failing shard is reported without discarding the other shards."""
+        client = _make_client({1735689600: [('2025-01-01 10:00:00.000', 'ok')]})
+        original_start_query = client.start_query.side_effect
+
+        def start_query(**kwargs):
+            if kwargs['startTime'] != 1735689600:
+                raise Exception('LimitExceededException')
+            return original_start_query(**kwargs)
+
+        client.start_query.side_effect = start_query
+        with patch(
+            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
+        ) as mock_session:
+            mock_session.return_value.client.return_value = client
+            tools = CloudWatchLogsTools()
+
+            result = await tools.execute_sharded_log_insights_query(
+                mock_context,
+                log_group_names=['group'],
+                log_group_identifiers=None,
+                start_time='2025-01-01T00:00:00+00:00',
+                end_time='2025-01-03T00:00:00+00:00',
+                query_string='fields @timestamp, @message',
+                limit=None,
+                time_shards=2,
+                log_groups_per_shard=None,
+                max_concurrent_queries=1,
+                sort_field=None,
+                sort_order='desc',
+                max_timeout=5,
+            )
+
+        assert result['status'] == 'Partial'
+        assert [r['@message'] for r in result['results']] == ['ok']
+        assert result['shards'][1]['status'] == 'Error'
+        assert 'LimitExceededException' in result['shards'][1]['message']
+
+    @pytest.mark.asyncio
+    async def test_timed_out_shards_are_stopped(self, mock_context):
+        """Test that shards still running at the poll timeout are stopped."""
+        client = _make_client({1735689600: [('2025-01-01 10:00:00.000', 'ok')]})
+        original_get_query_results = client.get_query_results.side_effect
+
+        def get_query_results(queryId):
+            if client.queries[queryId]['startTime'] != 1735689600:
+                return {'status': 'Running', 'results': []}
+            return original_get_query_results(queryId)
+
+        client.get_query_results.side_effect = get_query_results
+        with (
+            patch(
+                'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
+            ) as mock_session,
+            patch(
+                'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.asyncio.sleep',
+                new=AsyncMock(),
+            ),
+            patch(
+                'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.timer',
+                side_effect=itertools.count(),
+            ),
+        ):
+            mock_session.return_value.client.return_value = client
+            tools = CloudWatchLogsTools()
+
+            result = await tools.execute_sharded_log_insights_query(
+                mock_context,
+                log_group_names=['group'],
+                log_group_identifiers=None,
+                start_time='2025-01-01T00:00:00+00:00',
+                end_time='2025-01-03T00:00:00+00:00',
+                query_string='fields @timestamp, @message',
+                limit=None,
+                time_shards=2,
+                log_groups_per_shard=None,
+                max_concurrent_queries=2,
+                sort_field=None,
+                sort_order='desc',
+                max_timeout=5,
+            )
+
+        assert result['status'] == 'Partial'
+        assert [shard['status'] for shard in result['shards']] == ['Complete', 'Polling Timeout']
+        client.stop_query.assert_called_once_with(queryId='q-1')
+        assert 'was stopped' in result['shards'][1]['message']
+
+    @pytest.mark.asyncio
+    async def test_too_many_log_groups_per_shard(self, mock_context):
+        """Test that sub-queries over more than 50 log groups are rejected."""
+        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+            tools = CloudWatchLogsTools()
+
+            result = await tools.execute_sharded_log_insights_query(
+                mock_context,
+                log_group_names=[f'group-{i}' for i in range(60)],
+                log_group_identifiers=None,
+                start_time='2025-01-01T00:00:00+00:00',
+                end_time='2025-01-02T00:00:00+00:00',
+                query_string='fields @message',
+                limit=10,
+                time_shards=1,
+                log_groups_per_shard=None,
+                max_concurrent_queries=10,
+                sort_field='@timestamp',
+                sort_order='desc',
+                max_timeout=5,
+            )
+
+        assert result['status'] == 'Error'
+        assert 'log_groups_per_shard' in result['message']
+        mock_context.error.assert_called_once()
@@ -8,10 +8,14 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     Dimension,
 )
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools import CloudWatchMetricsTools
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, Mock, patch
 
 
+# Datapoints must fall inside the analyzed window, which ends now
+RECENT = datetime.now(timezone.utc).replace(second=0, microsecond=0) - timedelta(hours=6)
+
+
 class TestAnalyzeMetric:
     """Test cases for analyze_metric tool."""
 
@@ -50,14 +54,12 @@ class TestAnalyzeMetric:
     @pytest.mark.asyncio
     async def test_analyze_metric_with_data(self, ctx, cloudwatch_metrics_tools):
         """Test analyze_metric with valid data."""
-        from datetime import datetime
-
         with patch.object(cloudwatch_metrics_tools, '_get_cloudwatch_client') as mock_client:
             mock_cloudwatch = Mock()
             mock_client.return_value = mock_cloudwatch
 
             # Mock response with data
-            mock_timestamps = [datetime(2023, 1, 1, i) for i in range(5)]
+            mock_timestamps = [RECENT - timedelta(hours=i) for i in range(5)]
             mock_values = [10.0 + i for i in range(5)]
 
             mock_cloudwatch.get_metric_data.return_value = {
@@ -145,8 +147,8 @@ class TestAnalyzeMetric:
                         'Id': 'm1',
                         'Label': 'CPUUtilization',
                         'Timestamps': [
-                            datetime(2023, 1, 1, 12, 0),
-                            datetime(2023, 1, 1, 12, 5),
+                            RECENT,
+                            RECENT + timedelta(minutes=5),
                         ],  # 2 timestamps
                         'Values': [50.0, 60.0, 70.0],  # 3 values - mismatch!
                         'StatusCode': 'Complete',
@@ -173,7 +175,7 @@ class TestAnalyzeMetric:
                     {
                         'Id': 'm1',
                         'Label': 'CPUUtilization',
-                        'Timestamps': [datetime(2023, 1, 1, 12, 0), datetime(2023, 1, 1, 12, 5)],
+                        'Timestamps': [RECENT, RECENT + timedelta(minutes=5)],
                         'Values': [50.0, float('nan')],
                         'StatusCode': 'Complete',
                     }
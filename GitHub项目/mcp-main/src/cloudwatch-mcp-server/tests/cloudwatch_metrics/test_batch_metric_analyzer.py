@@ -0,0 +1,168 @@
+"""Tests for BatchMetricAnalyzer and the analyze_metrics_batch tool."""
+
+import numpy as np
+import pytest
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.batch_metric_analyzer import (
+    BatchMetricAnalyzer,
+)
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_analyzer import MetricAnalyzer
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
+    Dimension,
+    MetricData,
+    MetricIdentifier,
+    Trend,
+)
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools import CloudWatchMetricsTools
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+
+PERIOD_SECONDS = 300
+
+
+def _make_series(n_points: int = 2016) -> np.ndarray:
+    """Create a batch of series covering seasonal, trending, flat, sparse and missing data."""
+    rng = np.random.default_rng(42)
+    t = np.arange(n_points)
+    daily = 20 * np.sin(2 * np.pi * t / 288)
+    series = [
+        50 + daily + rng.normal(0, 2, n_points),
+        0.05 * t + rng.normal(0, 1, n_points),
+        -0.05 * t + rng.normal(0, 1, n_points) + 30 * np.sin(2 * np.pi * t / 12),
+        rng.normal(0, 1, n_points),
+        np.full(n_points, 5.0),
+        50 + daily + rng.normal(0, 2, n_points),
+        np.full(n_points, np.nan),
+    ]
+    series[5][::2] = np.nan
+    series[0][rng.choice(n_points, 200, replace=False)] = np.nan
+    series[1][:300] = np.nan
+    return np.array(series)
+
+
+class TestBatchMetricAnalyzer:
+    """Test cases for BatchMetricAnalyzer."""
+
+    def test_matches_single_series_analysis(self):
+        """Test that every series gets the same result as MetricAnalyzer.analyze_metric_data."""
+        values = _make_series()
+        batch_results = BatchMetricAnalyzer().analyze(values, PERIOD_SECONDS)
+        analyzer = MetricAnalyzer()
+
+        for row, batch_result in zip(values, batch_results):
+            valid = np.isfinite(row)
+            single_result = analyzer.analyze_metric_data(
+                MetricData(
+                    period_seconds=PERIOD_SECONDS,
+                    timestamps=(np.flatnonzero(valid) * PERIOD_SECONDS * 1000).tolist(),
+                    values=row[valid].tolist(),
+                )
+            )
+
+            assert batch_result['message'] == single_result['message']
+            if 'statistics' not in single_result:
+                continue
+            assert batch_result['seasonality_seconds'] == single_result['seasonality_seconds']
+            assert batch_result['trend'] == single_result['trend']
+            assert batch_result['data_quality'] == pytest.approx(single_result['data_quality'])
+            for key, value in single_result['statistics'].items():
+                if value is None:
+                    assert batch_result['statistics'][key] is None
+                else:
+                    assert batch_result['statistics'][key] == pytest.approx(value)
+
+    def test_detects_seasonality_and_trend(self):
+        """Test the expected seasonality and trend of known patterns."""
+        results = BatchMetricAnalyzer().analyze(_make_series(), PERIOD_SECONDS)
+
+        assert results[0]['seasonality_seconds'] == 86400
+        assert results[1]['trend'] == Trend.POSITIVE
+        assert results[2]['trend'] == Trend.NEGATIVE
+        assert results[4]['trend'] == Trend.NONE
+        assert results[5]['data_quality']['publishing_period_seconds'] == 2 * PERIOD_SECONDS
+        assert results[6] == {'message': 'No metric data available for analysis'}
+
+    def test_single_datapoint(self):
+        """Test that series with a single datapoint are reported as insufficient."""
+        values = np.full((1, 10), np.nan)
+        values[0, 3] = 1.0
+
+        results = BatchMetricAnalyzer().analyze(values, PERIOD_SECONDS)
+
+        assert results == [{'message': 'Insufficient valid data points for analysis'}]
+
+
+class TestAnalyzeMetricsBatch:
+    """Test cases for analyze_metrics_batch tool."""
+
+    @pytest.fixture
+    def cloudwatch_metrics_tools(self):
+        """Create CloudWatchMetricsTools instance."""
+        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+            return CloudWatchMetricsTools()
+
+    @pytest.fixture
+    def ctx(self):
+        """Create mock context."""
+        ctx = AsyncMock()
+        ctx.error = AsyncMock()
+        return ctx
+
+    @pytest.mark.asyncio
+    async def test_fetches_all_metrics_in_one_request_set(self, ctx, cloudwatch_metrics_tools):
+        """Test that all metrics are queried together and results are returned in order."""
+        now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        timestamps = [
+            datetime.fromtimestamp(now.timestamp() - i * 60, tz=timezone.utc) for i in range(5)
+        ]
+        metrics = [
+            MetricIdentifier(
+                namespace='AWS/EC2',
+                metric_name='CPUUtilization',
+                dimensions=[Dimension(name='InstanceId', value=f'i-{i}')],
+            )
+            for i in range(3)
+        ]
+
+        with patch.object(cloudwatch_metrics_tools, '_get_cloudwatch_client') as mock_client:
+            mock_cloudwatch = Mock()
+            mock_client.return_value = mock_cloudwatch
+            mock_cloudwatch.get_paginator.return_value.paginate.return_value = [
+                {
+                    'MetricDataResults': [
+                        {'Id': 'm0', 'Timestamps': timestamps, 'Values': [1.0, 2, 3, 4, 5]},
+                        {'Id': 'm2', 'Timestamps': timestamps[:1], 'Values': [7.0]},
+                    ]
+                },
+                {'MetricDataResults': [{'Id': 'm1', 'Timestamps': [], 'Values': []}]},
+            ]
+
+            result = await cloudwatch_metrics_tools.analyze_metrics_batch(ctx, metrics=metrics)
+
+        mock_cloudwatch.get_paginator.assert_called_once_with('get_metric_data')
+        queries = mock_cloudwatch.get_paginator.return_value.paginate.call_args[1][
+            'MetricDataQueries'
+        ]
+        assert [q['Id'] for q in queries] == ['m0', 'm1', 'm2']
+
+        results = result['results']
+        assert len(results) == 3
+        assert results[0]['message'] == 'Metric analysis completed successfully'
+        assert results[0]['statistics']['max'] == 5.0
+        assert results[0]['metric_info']['dimensions'] == [{'name': 'InstanceId', 'value': 'i-0'}]
+        assert results[1]['message'] == 'No metric data available for analysis'
+        assert results[2]['message'] == 'Insufficient valid data points for analysis'
+
+    @pytest.mark.asyncio
+    async def test_error_handling(self, ctx, cloudwatch_metrics_tools):
+        """Test that API errors are reported to the context and raised."""
+        with patch.object(cloudwatch_metrics_tools, '_get_cloudwatch_client') as mock_client:
+            mock_client.return_value.get_paginator.side_effect = Exception('API Error')
+
+            with pytest.raises(Exception, match='API Error'):
+                await cloudwatch_metrics_tools.analyze_metrics_batch(
+                    ctx,
+                    metrics=[MetricIdentifier(namespace='AWS/EC2', metric_name='CPUUtilization')],
+                )
+
+        ctx.error.assert_called_once()
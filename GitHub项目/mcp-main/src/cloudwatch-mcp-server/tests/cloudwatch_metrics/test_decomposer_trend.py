@@ -252,9 +252,7 @@ class TestDecomposerTrend:
         values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
 
         # Mock OLS to raise an exception
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_data_decomposer.OLS'
-        ) as mock_ols:
+        with patch('statsmodels.regression.linear_model.OLS') as mock_ols:
             mock_ols.side_effect = Exception('OLS error')
 
             result = decomposer._compute_trend(values)
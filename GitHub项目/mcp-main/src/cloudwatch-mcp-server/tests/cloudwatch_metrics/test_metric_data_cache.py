@@ -0,0 +1,204 @@
+"""Tests for MetricDataCache and cached get_metric_data retrieval."""
+
+import pytest
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.metric_data_cache import MetricDataCache
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import Dimension
+from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools import CloudWatchMetricsTools
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+NOW = 28_333_333 * 60
+
+
+class TestMetricDataCache:
+    """Test cases for MetricDataCache."""
+
+    def test_missing_ranges_without_cache(self):
+        """Test that an uncached key is missing entirely."""
+        cache = MetricDataCache()
+        assert cache.missing_ranges('key', 0, 600) == [(0, 600)]
+
+    def test_store_and_get(self):
+        """Test that stored datapoints are returned and the range is covered."""
+        cache = MetricDataCache(finality_delay_seconds=0)
+        cache.store('key', 0, 600, 60, [0, 60, 540], [1.0, 2.0, 3.0], 'label', NOW)
+
+        assert cache.missing_ranges('key', 0, 600) == []
+        assert cache.missing_ranges('key', -120, 720) == [(-120, 0), (600, 720)]
+        points, label = cache.get('key', 60, 600)
+        assert points == {60: 2.0, 540: 3.0}
+        assert label == 'label'
+
+    def test_only_whole_periods_are_covered(self):
+        """Test that partial periods at the edges of a fetched range are not covered."""
+        cache = MetricDataCache(finality_delay_seconds=0)
+        cache.store('key', 30, 610, 60, [0, 60, 600], [1.0, 2.0, 3.0], '', NOW)
+
+        assert cache.missing_ranges('key', 0, 660) == [(0, 60), (600, 660)]
+        assert cache.get('key', 0, 660)[0] == {60: 2.0}
+
+    def test_recent_datapoints_are_not_cached(self):
+        """Test that datapoints inside the finality delay are not cached."""
+        cache = MetricDataCache(finality_delay_seconds=300)
+        start = NOW - 900
+        cache.store('key', start, NOW, 60, [start, NOW - 120], [1.0, 2.0], '', NOW)
+
+        covered_end = (NOW - 300) // 60 * 60
+        assert cache.missing_ranges('key', start, NOW) == [(covered_end, NOW)]
+        assert cache.get('key', start, NOW)[0] == {start: 1.0}
+
+    def test_adjacent_ranges_are_merged(self):
+        """Test that adjacent covered ranges merge into one."""
+        cache = MetricDataCache(finality_delay_seconds=0)
+        cache.store('key', 0, 300, 60, [], [], '', NOW)
+        cache.store('key', 600, 900, 60, [], [], '', NOW)
+        cache.store('key', 300, 600, 60, [], [], '', NOW)
+
+        assert cache._series['key'].covered == [(0, 900)]
+
+    def test_least_recently_used_series_are_evicted(self):
+        """Test that the datapoint budget evicts the least recently used series."""
+        cache = MetricDataCache(max_datapoints=4, finality_delay_seconds=0)
+        cache.store('a', 0, 180, 60, [0, 60, 120], [1.0, 1.0, 1.0], '', NOW)
+        cache.store('b', 0, 120, 60, [0, 60], [1.0, 1.0], '', NOW)
+
+        assert cache.missing_ranges('a', 0, 180) == [(0, 180)]
+        assert cache.missing_ranges('b', 0, 120) == []
+
+
+class TestCachedGetMetricData:
+    """Test cases for get_metric_data served from the cache."""
+
+    @pytest.fixture
+    def cloudwatch_metrics_tools(self):
+        """Create CloudWatchMetricsTools instance."""
+        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+            return CloudWatchMetricsTools()
+
+    @pytest.fixture
+    def ctx(self):
+        """Create mock context."""
+        return AsyncMock()
+
+    @staticmethod
+    def _respond(**kwargs):
+        """Return one datapoint per minute of the requested range."""
+        timestamps = []
+        ts = kwargs['StartTime']
+        while ts < kwargs['EndTime']:
+            timestamps.append(ts)
+            ts += timedelta(minutes=1)
+        return {
+            'MetricDataResults': [
+                {
+                    'Id': 'm1',
+                    'Label': 'CPUUtilization',
+                    'StatusCode': 'Complete',
+                    'Timestamps': timestamps,
+                    'Values': [float(t.minute) for t in timestamps],
+                }
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_overlapping_request_fetches_only_the_gap(self, ctx, cloudwatch_metrics_tools):
+        """Test that a zoomed out request only fetches the part that is not cached yet."""
+        mock_client = MagicMock()
+        mock_client.get_metric_data.side_effect = self._respond
+        start = datetime(2023, 1, 1, 0, 0, tzinfo=timezone.utc)
+
+        with patch.object(
+            cloudwatch_metrics_tools, '_get_cloudwatch_client', return_value=mock_client
+        ):
+
+            async def get(start_time, end_time, target_datapoints):
+                return await cloudwatch_metrics_tools.get_metric_data(
+                    ctx,
+                    namespace='AWS/EC2',
+                    metric_name='CPUUtilization',
+                    start_time=start_time,
+                    dimensions=[Dimension(name='InstanceId', value='i-1234567890abcdef0')],
+                    end_time=end_time,
+                    statistic='AVG',
+                    target_datapoints=target_datapoints,
+                )
+
+            first = await get(start, start + timedelta(hours=1), 60)
+            repeated = await get(start, start + timedelta(hours=1), 60)
+            assert mock_client.get_metric_data.call_count == 1
+            assert repeated == first
+
+            # Same one minute period over a longer range
+            extended = await get(start, start + timedelta(hours=2), 120)
+
+        assert mock_client.get_metric_data.call_count == 2
+        last_call = mock_client.get_metric_data.call_args[1]
+        assert last_call['StartTime'] == start + timedelta(hours=1)
+        assert last_call['EndTime'] == start + timedelta(hours=2)
+
+        datapoints = extended.metricDataResults[0].datapoints
+        assert len(datapoints) == 120
+        assert datapoints[0].timestamp == start
+        assert extended.metricDataResults[0].label == 'CPUUtilization'
+
+    @pytest.mark.asyncio
+    async def test_partial_data_is_not_cached(self, ctx, cloudwatch_metrics_tools):
+        """Test that responses with PartialData status are fetched again."""
+        mock_client = MagicMock()
+        mock_client.get_metric_data.return_value = {
+            'MetricDataResults': [
+                {
+                    'Id': 'm1',
+                    'Label': 'CPUUtilization',
+                    'StatusCode': 'PartialData',
+                    'Timestamps': [datetime(2023, 1, 1, tzinfo=timezone.utc)],
+                    'Values': [1.0],
+                }
+            ]
+        }
+
+        with patch.object(
+            cloudwatch_metrics_tools, '_get_cloudwatch_client', return_value=mock_client
+        ):
+            results = [
+                await cloudwatch_metrics_tools.get_metric_data(
+                    ctx,
+                    namespace='AWS/EC2',
+                    metric_name='CPUUtilization',
+                    start_time=datetime(2023, 1, 1, tzinfo=timezone.utc),
+                    end_time=datetime(2023, 1, 1, 1, tzinfo=timezone.utc),
+                )
+                for _ in range(2)
+            ]
+
+        assert mock_client.get_metric_data.call_count == 2
+        assert [result.metricDataResults[0].statusCode for result in results] == [
+            'PartialData',
+            'PartialData',
+        ]
+
+    @pytest.mark.asyncio
+    async def test_points_before_unaligned_start_are_dropped(self, ctx, cloudwatch_metrics_tools):
+        """Test that aligning the start down to the period does not return earlier points."""
+        mock_client = MagicMock()
+        mock_client.get_metric_data.side_effect = self._respond
+        start = datetime(2023, 1, 1, 0, 0, 30, tzinfo=timezone.utc)
+
+        with patch.object(
+            cloudwatch_metrics_tools, '_get_cloudwatch_client', return_value=mock_client
+        ):
+            result = await cloudwatch_metrics_tools.get_metric_data(
+                ctx,
+                namespace='AWS/EC2',
+                metric_name='CPUUtilization',
+                start_time=start,
+                end_time=start + timedelta(hours=1),
+                statistic='AVG',
+                target_datapoints=60,
+            )
+
+        assert mock_client.get_metric_data.call_args[1]['StartTime'] == start.replace(second=0)
+        datapoints = result.metricDataResults[0].datapoints
+        assert len(datapoints) == 60
+        assert datapoints[0].timestamp == start.replace(minute=1, second=0)
@@ -473,12 +473,13 @@ class TestEdgeCases:
             tools.register(mock_mcp)
 
             # Verify all tools are registered
-            assert mock_mcp.tool.call_count == 4
+            assert mock_mcp.tool.call_count == 5
             tool_calls = [call[1]['name'] for call in mock_mcp.tool.call_args_list]
             expected_tools = [
                 'get_metric_data',
                 'get_metric_metadata',
                 'analyze_metric',
+                'analyze_metrics_batch',
                 'get_recommended_metric_alarms',
             ]
             for tool in expected_tools:
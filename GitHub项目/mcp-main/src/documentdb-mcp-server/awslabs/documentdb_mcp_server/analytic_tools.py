@@ -15,11 +15,20 @@
 """Analytic tools for DocumentDB MCP Server."""
 
 from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
+from awslabs.documentdb_mcp_server.schema_inference import (
+    SchemaInference,
+    from_pre_aggregation,
+    pre_aggregation_pipeline,
+)
 from loguru import logger
 from pydantic import Field
 from typing import Annotated, Any, Dict, List, Optional
 
 
+# Number of sampled documents fetched per cursor batch during schema analysis
+SCHEMA_SAMPLE_BATCH_SIZE = 1000
+
+
 async def count_documents(
     connection_id: Annotated[
         str, Field(description='The connection ID returned by the connect tool')
@@ -53,7 +62,7 @@ async def count_documents(
         if filter is None:
             filter = {}
 
-        count = coll.count_documents(filter)
+        count = await coll.count_documents(filter)
 
         logger.info(f"Counted {count} documents in '{database}.{collection}'")
         return {'count': count, 'database': database, 'collection': collection, 'filter': filter}
@@ -90,7 +99,7 @@ async def get_database_stats(
         db = client[database]
 
         # Get database stats
-        stats = db.command('dbStats')
+        stats = await db.command('dbStats')
 
         logger.info(f"Retrieved database statistics for '{database}'")
         return {'stats': stats, 'database': database}
@@ -128,7 +137,7 @@ async def get_collection_stats(
         db = client[database]
 
         # Get collection stats
-        stats = db.command('collStats', collection)
+        stats = await db.command('collStats', collection)
 
         logger.info(f"Retrieved collection statistics for '{database}.{collection}'")
         return {'stats': stats, 'database': database, 'collection': collection}
@@ -140,61 +149,6 @@ async def get_collection_stats(
         raise ValueError(f'Failed to get collection statistics: {str(e)}')
 
 
-def get_field_type(docs, path):
-    """Helper function to determine the data type of a field across documents."""
-    parts = path.split('.')
-    types = set()
-
-    for doc in docs:
-        value = doc
-        try:
-            for part in parts:
-                if '[' in part:
-                    # Handle array indexing
-                    array_part = part.split('[')[0]
-                    if array_part in value:
-                        value = value[array_part]
-                        # Try to get array item
-                        if isinstance(value, list) and len(value) > 0:
-                            index = int(part.split('[')[1].split(']')[0])
-                            if len(value) > index:
-                                value = value[index]
-                            else:
-                                value = None
-                                break
-                        else:
-                            value = None
-                            break
-                    else:
-                        value = None
-                        break
-                else:
-                    if isinstance(value, dict) and part in value:
-                        value = value[part]
-                    else:
-                        value = None
-                        break
-
-            if value is not None:
-                value_type = type(value).__name__
-                if value_type == 'dict':
-                    types.add('object')
-                elif value_type == 'list':
-                    types.add('array')
-                else:
-                    types.add(value_type)
-        except (ValueError, IndexError, KeyError, TypeError, AttributeError) as e:
-            logger.warning(f'Error processing document: {doc}. Error: {e}')
-            continue
-
-    if not types:
-        return 'null'
-    elif len(types) == 1:
-        return next(iter(types))
-    else:
-        return list(types)
-
-
 async def analyze_schema(
     connection_id: Annotated[
         str, Field(description='The connection ID returned by the connect tool')
@@ -202,13 +156,24 @@ async def analyze_schema(
     database: Annotated[str, Field(description='Name of the database')],
     collection: Annotated[str, Field(description='Name of the collection to analyze')],
     sample_size: Annotated[
-        int, Field(description='Number of documents to sample (default: 100)')
+        int,
+        Field(
+            description='Number of documents to sample (default: 100); tens of thousands of documents can be analyzed'
+        ),
     ] = 100,
+    pre_aggregate: Annotated[
+        bool,
+        Field(
+            description='Aggregate top-level fields on the server instead of transferring the sampled documents; nested fields and distinct value counts are not reported'
+        ),
+    ] = False,
 ) -> Dict[str, Any]:
     """Analyze the schema of a collection by sampling documents.
 
     This tool samples documents from a collection and provides information about
-    the document structure and field coverage across the sampled documents.
+    the document structure and field coverage across the sampled documents. For every
+    field, it reports the types found, the ratio of null values, the minimum, maximum
+    and average length of array values, and an estimate of the number of distinct values.
 
     Returns:
         Dict[str, Any]: Schema analysis results including field coverage
@@ -225,7 +190,7 @@ async def analyze_schema(
         coll = db[collection]
 
         # Count total documents to adjust sample size if needed
-        total_docs = coll.count_documents({})
+        total_docs = await coll.count_documents({})
         actual_sample_size = min(sample_size, total_docs)
 
         if actual_sample_size == 0:
@@ -236,43 +201,19 @@ async def analyze_schema(
                 'sampled_documents': 0,
             }
 
-        # Sample documents (using aggregation with $sample stage)
-        sample_pipeline = [{'$sample': {'size': actual_sample_size}}]
-        sampled_docs = list(coll.aggregate(sample_pipeline))
-
-        # Analyze schema and calculate field coverage
-        field_paths = set()
-        field_counts = {}
-
-        def extract_paths(obj, prefix=''):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if key == '_id':
-                        continue  # Skip _id field
-
-                    path = f'{prefix}.{key}' if prefix else key
-                    field_paths.add(path)
-
-                    if path not in field_counts:
-                        field_counts[path] = 0
-                    field_counts[path] += 1
-
-                    extract_paths(value, path)
-            elif isinstance(obj, list) and len(obj) > 0:
-                # For arrays, we'll only analyze the first item to avoid complexity
-                extract_paths(obj[0], f'{prefix}[0]')
-
-        for doc in sampled_docs:
-            extract_paths(doc)
-
-        # Calculate coverage percentages
-        coverage = {}
-        for path, count in field_counts.items():
-            coverage[path] = {
-                'count': count,
-                'percentage': round((count / actual_sample_size) * 100, 2),
-                'data_type': get_field_type(sampled_docs, path),
-            }
+        if pre_aggregate:
+            # Let the server reduce the sample to one document per top-level field and type
+            cursor = await coll.aggregate(pre_aggregation_pipeline(actual_sample_size))
+            groups = [group async for group in cursor]
+            coverage = from_pre_aggregation(groups, actual_sample_size)
+        else:
+            # Stream the sample (using aggregation with $sample stage) through a single pass
+            sample_pipeline = [{'$sample': {'size': actual_sample_size}}]
+            cursor = await coll.aggregate(sample_pipeline, batchSize=SCHEMA_SAMPLE_BATCH_SIZE)
+            inference = SchemaInference()
+            async for doc in cursor:
+                inference.add(doc)
+            coverage = inference.to_dict()
 
         logger.info(
             f"Analyzed schema for '{database}.{collection}' with {actual_sample_size} documents"
@@ -347,7 +288,7 @@ async def explain_operation(
             if not query:
                 query = {}
 
-            explanation = db.command(
+            explanation = await db.command(
                 {'explain': {'find': collection, 'filter': query}, 'verbosity': verbosity}
             )
             logger.info(f"Explained find operation on '{database}.{collection}'")
@@ -356,7 +297,7 @@ async def explain_operation(
             if not pipeline:
                 raise ValueError('Pipeline is required for aggregate operations')
 
-            explanation = db.command(
+            explanation = await db.command(
                 {
                     'explain': {'aggregate': collection, 'pipeline': pipeline, 'cursor': {}},
                     'verbosity': verbosity,
@@ -24,9 +24,11 @@ class ServerConfig:
     def __init__(self):
         """Initialize server configuration with default values.
 
-        By default, the server starts in read-only mode for safety.
+        By default, the server starts in read-only mode for safety, and the documents
+        returned by a query are limited to 1 MiB of BSON.
         """
         self.read_only_mode = True
+        self.max_result_bytes = 1024 * 1024
 
 
 # Singleton instance
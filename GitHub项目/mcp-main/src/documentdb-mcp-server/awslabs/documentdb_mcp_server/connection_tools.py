@@ -18,7 +18,7 @@ import uuid
 from datetime import datetime, timedelta
 from loguru import logger
 from pydantic import Field
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient
 from pymongo.errors import ConnectionFailure, OperationFailure
 from typing import Annotated, Any, Dict
 from urllib.parse import parse_qs, urlparse
@@ -27,12 +27,12 @@ from urllib.parse import parse_qs, urlparse
 class ConnectionInfo:
     """Stores information about a DocumentDB connection."""
 
-    def __init__(self, connection_string: str, client: MongoClient):
+    def __init__(self, connection_string: str, client: AsyncMongoClient):
         """Initialize a ConnectionInfo object.
 
         Args:
             connection_string: The connection string used to connect to DocumentDB
-            client: The MongoDB client instance connected to DocumentDB
+            client: The asyncio MongoDB client instance connected to DocumentDB
         """
         self.connection_string = connection_string
         self.client = client
@@ -41,7 +41,11 @@ class ConnectionInfo:
 
 
 class DocumentDBConnection:
-    """Manages connections to DocumentDB."""
+    """Manages connections to DocumentDB.
+
+    Connections use the asyncio client of pymongo, so that tool calls waiting on DocumentDB do
+    not block the event loop and concurrent tool calls run concurrently.
+    """
 
     # Connection pool mapped by connection_id
     _connections = {}
@@ -50,7 +54,7 @@ class DocumentDBConnection:
     _idle_timeout = 30
 
     @classmethod
-    def create_connection(cls, connection_string: str) -> ConnectionInfo:
+    async def create_connection(cls, connection_string: str) -> ConnectionInfo:
         """Create a new connection to DocumentDB.
 
         Args:
@@ -62,14 +66,15 @@ class DocumentDBConnection:
         """
         logger.info('Creating new DocumentDB connection')
         DocumentDBConnection.validate_retry_writes_false(connection_string)
-        client = MongoClient(connection_string)
+        client = AsyncMongoClient(connection_string)
 
         # Test connection
         try:
-            client.admin.command('ping')
+            await client.admin.command('ping')
             logger.info('Connected successfully to DocumentDB')
         except (ConnectionFailure, OperationFailure) as e:
             logger.error(f'Failed to connect to DocumentDB: {str(e)}')
+            await client.close()
             raise
 
         # Store connection info
@@ -79,14 +84,14 @@ class DocumentDBConnection:
         return connection_info
 
     @classmethod
-    def get_connection(cls, connection_id: str) -> MongoClient:
+    def get_connection(cls, connection_id: str) -> AsyncMongoClient:
         """Get an existing connection by ID.
 
         Args:
             connection_id: The connection ID returned by create_connection
 
         Returns:
-            An active pymongo client connected to DocumentDB
+            An active asyncio pymongo client connected to DocumentDB
 
         Raises:
             ValueError: If the connection ID is not found
@@ -101,7 +106,7 @@ class DocumentDBConnection:
         return connection_info.client
 
     @classmethod
-    def close_connection(cls, connection_id: str) -> None:
+    async def close_connection(cls, connection_id: str) -> None:
         """Close a specific connection by ID.
 
         Args:
@@ -114,12 +119,11 @@ class DocumentDBConnection:
             raise ValueError(f'Connection ID {connection_id} not found')
 
         logger.info(f'Closing DocumentDB connection {connection_id}')
-        connection_info = cls._connections[connection_id]
-        connection_info.client.close()
-        del cls._connections[connection_id]
+        connection_info = cls._connections.pop(connection_id)
+        await connection_info.client.close()
 
     @classmethod
-    def close_idle_connections(cls) -> None:
+    async def close_idle_connections(cls) -> None:
         """Close connections that have been idle for longer than the timeout."""
         now = datetime.now()
         idle_threshold = now - timedelta(minutes=cls._idle_timeout)
@@ -132,16 +136,16 @@ class DocumentDBConnection:
 
         for conn_id in idle_connections:
             logger.info(f'Closing idle DocumentDB connection {conn_id}')
-            cls._connections[conn_id].client.close()
-            del cls._connections[conn_id]
+            await cls._connections.pop(conn_id).client.close()
 
     @classmethod
-    def close_all_connections(cls) -> None:
+    async def close_all_connections(cls) -> None:
         """Close all open connections."""
-        for conn_id, conn_info in list(cls._connections.items()):
-            logger.info(f'Closing DocumentDB connection {conn_id}')
-            conn_info.client.close()
+        connections = list(cls._connections.items())
         cls._connections.clear()
+        for conn_id, conn_info in connections:
+            logger.info(f'Closing DocumentDB connection {conn_id}')
+            await conn_info.client.close()
 
     @staticmethod
     def validate_retry_writes_false(conn_str: str) -> None:
@@ -187,11 +191,11 @@ async def connect(
     """
     try:
         # Create connection and get connection info
-        connection_info = DocumentDBConnection.create_connection(connection_string)
+        connection_info = await DocumentDBConnection.create_connection(connection_string)
         client = connection_info.client
 
         # List available databases
-        databases = client.list_database_names()
+        databases = await client.list_database_names()
 
         return {
             'connection_id': connection_info.connection_id,
@@ -216,7 +220,7 @@ async def disconnect(
         Dict[str, Any]: Confirmation of successful disconnection
     """
     try:
-        DocumentDBConnection.close_connection(connection_id)
+        await DocumentDBConnection.close_connection(connection_id)
         return {'success': True, 'message': f'Successfully closed connection {connection_id}'}
     except ValueError as e:
         logger.error(f'Error disconnecting from DocumentDB: {str(e)}')
@@ -35,7 +35,7 @@ async def list_databases(
     """
     try:
         client = DocumentDBConnection.get_connection(connection_id)
-        databases = client.list_database_names()
+        databases = await client.list_database_names()
         logger.info(f'Found {len(databases)} databases')
         return {'databases': databases, 'count': len(databases)}
     except ValueError as e:
@@ -76,7 +76,7 @@ async def create_collection(
         db = client[database]
 
         # Check if collection already exists
-        existing_collections = db.list_collection_names()
+        existing_collections = await db.list_collection_names()
         if collection in existing_collections:
             return {
                 'success': False,
@@ -84,7 +84,7 @@ async def create_collection(
             }
 
         # Create the collection
-        db.create_collection(collection)
+        await db.create_collection(collection)
 
         logger.info(f"Created collection '{collection}' in database '{database}'")
         return {'success': True, 'message': f"Collection '{collection}' created successfully"}
@@ -117,7 +117,7 @@ async def list_collections(
         connection_info = DocumentDBConnection._connections[connection_id]
         client = connection_info.client
         db = client[database]
-        collections = db.list_collection_names()
+        collections = await db.list_collection_names()
         logger.info(f"Found {len(collections)} collections in database '{database}'")
         return collections
     except ValueError as e:
@@ -159,7 +159,7 @@ async def drop_collection(
         db = client[database]
 
         # Check if collection exists
-        existing_collections = db.list_collection_names()
+        existing_collections = await db.list_collection_names()
         if collection not in existing_collections:
             return {
                 'success': False,
@@ -167,7 +167,7 @@ async def drop_collection(
             }
 
         # Drop the collection
-        db.drop_collection(collection)
+        await db.drop_collection(collection)
 
         logger.info(f"Dropped collection '{collection}' from database '{database}'")
         return {'success': True, 'message': f"Collection '{collection}' dropped successfully"}
@@ -14,12 +14,57 @@
 
 """Query tools for DocumentDB MCP Server."""
 
+import bson
+from awslabs.documentdb_mcp_server.config import serverConfig
 from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
 from loguru import logger
 from pydantic import Field
 from typing import Annotated, Any, Dict, List, Optional
 
 
+# Upper bound of the number of documents fetched per cursor batch
+MAX_BATCH_SIZE = 1000
+
+
+def batch_size_for(limit: int) -> int:
+    """Return the cursor batch size for a result limit.
+
+    A limited result is fetched in a single round trip, while an unlimited one is streamed in
+    batches of MAX_BATCH_SIZE documents.
+    """
+    return min(limit, MAX_BATCH_SIZE) if limit > 0 else MAX_BATCH_SIZE
+
+
+async def collect_documents(cursor, max_bytes: int) -> List[Dict[str, Any]]:
+    """Stream documents from a cursor until it is exhausted or the byte budget is used up.
+
+    Args:
+        cursor: The asyncio cursor of a find or aggregate operation
+        max_bytes: Maximum total BSON size of the returned documents
+
+    Returns:
+        List[Dict[str, Any]]: The documents, with ObjectId values of _id converted to strings
+    """
+    result = []
+    used = 0
+    try:
+        async for doc in cursor:
+            used += len(bson.encode(doc))
+            if used > max_bytes:
+                logger.warning(
+                    f'Result truncated to {len(result)} documents at the limit of {max_bytes} bytes'
+                )
+                break
+
+            # Convert ObjectId to string for JSON serialization
+            if '_id' in doc and not isinstance(doc['_id'], str):
+                doc['_id'] = str(doc['_id'])
+            result.append(doc)
+    finally:
+        await cursor.close()
+    return result
+
+
 async def find(
     connection_id: Annotated[
         str, Field(description='The connection ID returned by the connect tool')
@@ -40,6 +85,8 @@ async def find(
     """Run a query against a DocumentDB collection.
 
     This tool queries documents from a specified collection based on a filter.
+    Use the projection to return only the fields you need; results are cut off
+    once the documents exceed the result size limit of the server.
 
     Returns:
         List[Dict[str, Any]]: List of matching documents
@@ -55,12 +102,8 @@ async def find(
         db = client[database]
         coll = db[collection]
 
-        result = list(coll.find(query, projection).limit(limit))
-
-        # Convert ObjectId to string for JSON serialization
-        for doc in result:
-            if '_id' in doc and not isinstance(doc['_id'], str):
-                doc['_id'] = str(doc['_id'])
+        cursor = coll.find(query, projection).limit(limit).batch_size(batch_size_for(limit))
+        result = await collect_documents(cursor, serverConfig.max_result_bytes)
 
         logger.info(f'Query returned {len(result)} documents')
         return result
@@ -84,10 +127,17 @@ async def aggregate(
     limit: Annotated[
         int, Field(description='Maximum number of documents to return (default: 10)')
     ] = 10,
+    projection: Annotated[
+        Optional[Dict[str, Any]],
+        Field(
+            description='Fields to include/exclude in the results, applied as a final $project stage (e.g., {"_id": 0, "name": 1})'
+        ),
+    ] = None,
 ) -> List[Dict[str, Any]]:
     """Run an aggregation pipeline against a DocumentDB collection.
 
     This tool executes a DocumentDB aggregation pipeline on a specified collection.
+    Results are cut off once the documents exceed the result size limit of the server.
 
     Returns:
         List[Dict[str, Any]]: List of aggregation results
@@ -104,15 +154,14 @@ async def aggregate(
         coll = db[collection]
 
         # Add limit stage if not already in pipeline
+        pipeline = list(pipeline)
         if limit > 0 and not any('$limit' in stage for stage in pipeline):
             pipeline.append({'$limit': limit})
+        if projection:
+            pipeline.append({'$project': projection})
 
-        result = list(coll.aggregate(pipeline))
-
-        # Convert ObjectId to string for JSON serialization
-        for doc in result:
-            if '_id' in doc and not isinstance(doc['_id'], str):
-                doc['_id'] = str(doc['_id'])
+        cursor = await coll.aggregate(pipeline, batchSize=batch_size_for(limit))
+        result = await collect_documents(cursor, serverConfig.max_result_bytes)
 
         logger.info(f'Aggregation returned {len(result)} results')
         return result
@@ -0,0 +1,254 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Single-pass schema inference for DocumentDB MCP Server."""
+
+import hashlib
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+
+# Number of smallest value hashes kept by a distinct value sketch
+SKETCH_SIZE = 256
+
+# Python type names reported for BSON type names of the $type aggregation operator
+BSON_TYPE_NAMES = {
+    'string': 'str',
+    'int': 'int',
+    'long': 'int',
+    'double': 'float',
+    'decimal': 'Decimal128',
+    'bool': 'bool',
+    'object': 'object',
+    'array': 'array',
+    'objectId': 'ObjectId',
+    'date': 'datetime',
+    'binData': 'bytes',
+    'null': 'NoneType',
+}
+
+
+def type_name(value: Any) -> str:
+    """Return the name of the type of a field value, with 'object' and 'array' for documents."""
+    if isinstance(value, dict):
+        return 'object'
+    if isinstance(value, list):
+        return 'array'
+    return type(value).__name__
+
+
+def summarize_types(types: Iterable[str]) -> Union[str, List[str]]:
+    """Return a single type name, a list of type names, or 'null' if there are none."""
+    names = [name for name in types if name != 'NoneType']
+    if not names:
+        return 'null'
+    if len(names) == 1:
+        return names[0]
+    return names
+
+
+class DistinctSketch:
+    """K minimum values sketch estimating the number of distinct values in a stream.
+
+    Only the SKETCH_SIZE smallest 64-bit hashes are kept, so memory stays bounded for any
+    number of values, and the count is exact until that many distinct values were seen.
+    """
+
+    def __init__(self, size: int = SKETCH_SIZE):
+        """Initialize an empty sketch keeping the given number of hashes."""
+        self.size = size
+        self._heap: List[int] = []
+        self._hashes = set()
+
+    def add(self, value: Any) -> None:
+        """Add a value to the sketch."""
+        digest = hashlib.blake2b(repr(value).encode(), digest_size=8).digest()
+        value_hash = int.from_bytes(digest, 'big')
+        if value_hash in self._hashes:
+            return
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, -value_hash)
+            self._hashes.add(value_hash)
+        elif value_hash < -self._heap[0]:
+            self._hashes.discard(-heapq.heapreplace(self._heap, -value_hash))
+            self._hashes.add(value_hash)
+
+    def estimate(self) -> int:
+        """Return the estimated number of distinct values."""
+        if len(self._heap) < self.size:
+            return len(self._heap)
+        return round((self.size - 1) * 2**64 / (-self._heap[0] + 1))
+
+
+class FieldStats:
+    """Statistics of the values of one field path."""
+
+    __slots__ = (
+        'count',
+        'types',
+        'nulls',
+        'array_count',
+        'array_min',
+        'array_max',
+        'array_sum',
+        'distinct',
+    )
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.types: Dict[str, int] = {}
+        self.nulls = 0
+        self.array_count = 0
+        self.array_min: Optional[int] = None
+        self.array_max: Optional[int] = None
+        self.array_sum = 0
+        self.distinct: Optional[DistinctSketch] = None
+
+    def add_array_length(self, length: int) -> None:
+        """Add the length of an array value."""
+        self.array_count += 1
+        self.array_sum += length
+        self.array_min = length if self.array_min is None else min(self.array_min, length)
+        self.array_max = length if self.array_max is None else max(self.array_max, length)
+
+    def to_dict(self, sampled: int) -> Dict[str, Any]:
+        """Return the statistics of the field in documents of a sample of the given size."""
+        result: Dict[str, Any] = {
+            'count': self.count,
+            'percentage': round((self.count / sampled) * 100, 2),
+            'data_type': summarize_types(self.types),
+            'types': dict(self.types),
+            'null_ratio': round(self.nulls / self.count, 4) if self.count else 0.0,
+        }
+        if self.array_count:
+            result['array_length'] = {
+                'min': self.array_min,
+                'max': self.array_max,
+                'avg': round(self.array_sum / self.array_count, 2),
+            }
+        if self.distinct is not None:
+            result['distinct_values'] = self.distinct.estimate()
+        return result
+
+
+class SchemaInference:
+    """Streaming schema inference that walks every document once.
+
+    Nested fields are reported as dotted paths, the fields of documents in arrays under the path
+    of their first element, e.g. 'items[0].price', and _id fields are skipped. For every path,
+    the number of documents and the type counts, null ratio, array lengths and an estimate of
+    the number of distinct scalar values are accumulated while documents stream in, so
+    documents are never kept.
+    """
+
+    def __init__(self):
+        """Initialize an empty inference."""
+        self.documents = 0
+        self.fields: Dict[str, FieldStats] = {}
+
+    def add(self, doc: Dict[str, Any]) -> None:
+        """Add the fields of one document."""
+        self.documents += 1
+        self._walk(doc, '')
+
+    def add_all(self, docs: Iterable[Dict[str, Any]]) -> 'SchemaInference':
+        """Add the fields of all documents of an iterable, such as a cursor."""
+        for doc in docs:
+            self.add(doc)
+        return self
+
+    def _walk(self, obj: Dict[str, Any], prefix: str) -> None:
+        for key, value in obj.items():
+            if key == '_id':
+                continue
+            path = f'{prefix}.{key}' if prefix else key
+            stats = self.fields.get(path)
+            if stats is None:
+                stats = self.fields[path] = FieldStats()
+            stats.count += 1
+
+            name = type_name(value)
+            stats.types[name] = stats.types.get(name, 0) + 1
+            if value is None:
+                stats.nulls += 1
+            elif name == 'object':
+                self._walk(value, path)
+            elif name == 'array':
+                stats.add_array_length(len(value))
+                if value and isinstance(value[0], dict):
+                    self._walk(value[0], f'{path}[0]')
+            else:
+                if stats.distinct is None:
+                    stats.distinct = DistinctSketch()
+                stats.distinct.add(value)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return the statistics of all field paths."""
+        return {path: stats.to_dict(self.documents) for path, stats in self.fields.items()}
+
+
+def pre_aggregation_pipeline(sample_size: int) -> List[Dict[str, Any]]:
+    """Return a pipeline computing the statistics of top-level fields on the server.
+
+    Each sampled document is turned into its fields with $objectToArray, and the fields are
+    grouped by name and BSON type, so only one small document per field and type is returned.
+    """
+    return [
+        {'$sample': {'size': sample_size}},
+        {'$project': {'_id': 0, 'fields': {'$objectToArray': '$$ROOT'}}},
+        {'$unwind': '$fields'},
+        {'$match': {'fields.k': {'$ne': '_id'}}},
+        {
+            '$project': {
+                'k': '$fields.k',
+                't': {'$type': '$fields.v'},
+                'n': {'$cond': [{'$isArray': '$fields.v'}, {'$size': '$fields.v'}, None]},
+            }
+        },
+        {
+            '$group': {
+                '_id': {'k': '$k', 't': '$t'},
+                'count': {'$sum': 1},
+                'min_length': {'$min': '$n'},
+                'max_length': {'$max': '$n'},
+                'sum_length': {'$sum': '$n'},
+            }
+        },
+    ]
+
+
+def from_pre_aggregation(groups: Iterable[Dict[str, Any]], sampled: int) -> Dict[str, Any]:
+    """Return the statistics of top-level fields from the results of pre_aggregation_pipeline.
+
+    The statistics have the same format as those of SchemaInference, without distinct values.
+    """
+    fields: Dict[str, FieldStats] = {}
+    for group in groups:
+        path = group['_id']['k']
+        bson_type = group['_id']['t']
+        name = BSON_TYPE_NAMES.get(bson_type) or str(bson_type)
+        stats = fields.get(path)
+        if stats is None:
+            stats = fields[path] = FieldStats()
+        stats.count += group['count']
+        stats.types[name] = stats.types.get(name, 0) + group['count']
+        if name == 'NoneType':
+            stats.nulls += group['count']
+        elif name == 'array':
+            stats.array_count += group['count']
+            stats.array_sum += group['sum_length']
+            stats.array_min = group['min_length']
+            stats.array_max = group['max_length']
+    return {path: stats.to_dict(sampled) for path, stats in fields.items()}
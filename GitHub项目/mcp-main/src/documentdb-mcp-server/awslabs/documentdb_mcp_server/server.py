@@ -36,10 +36,20 @@ from awslabs.documentdb_mcp_server.db_management_tools import (
 )
 from awslabs.documentdb_mcp_server.query_tools import aggregate, find
 from awslabs.documentdb_mcp_server.write_tools import delete, insert, update
+from contextlib import asynccontextmanager
 from loguru import logger
 from mcp.server.fastmcp import FastMCP
 
 
+@asynccontextmanager
+async def server_lifespan(server: FastMCP):
+    """Close all DocumentDB connections when the server shuts down."""
+    try:
+        yield
+    finally:
+        await DocumentDBConnection.close_all_connections()
+
+
 # Create the FastMCP server
 mcp = FastMCP(
     'awslabs.documentdb-mcp-server',
@@ -58,6 +68,7 @@ mcp = FastMCP(
         'loguru',
         'pymongo',
     ],
+    lifespan=server_lifespan,
 )
 
 
@@ -108,6 +119,12 @@ def main():
         default=30,
         help='Idle connection timeout in minutes (default: 30)',
     )
+    parser.add_argument(
+        '--max-result-bytes',
+        type=int,
+        default=serverConfig.max_result_bytes,
+        help='Maximum total BSON size of the documents returned by find and aggregate (default: 1 MiB)',
+    )
     parser.add_argument(
         '--allow-write',
         action='store_true',
@@ -131,6 +148,9 @@ def main():
     DocumentDBConnection._idle_timeout = args.connection_timeout
     logger.info(f'Idle connection timeout: {args.connection_timeout} minutes')
 
+    serverConfig.max_result_bytes = args.max_result_bytes
+    logger.info(f'Maximum result size: {args.max_result_bytes} bytes')
+
     # Configure read-only mode
     serverConfig.read_only_mode = not args.allow_write
     if serverConfig.read_only_mode:
@@ -139,12 +159,10 @@ def main():
         logger.info('Server is running with WRITE operations ENABLED. Database can be modified.')
 
     try:
+        # Connections are closed by the lifespan of the server
         mcp.run()
     except Exception as e:
         logger.critical(f'Failed to start server: {str(e)}')
-    finally:
-        # Close all DB connections
-        DocumentDBConnection.close_all_connections()
 
 
 if __name__ == '__main__':
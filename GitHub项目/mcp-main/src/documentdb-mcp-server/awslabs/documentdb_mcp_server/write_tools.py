@@ -57,11 +57,11 @@ async def insert(
 
         # Handle single document or multiple documents
         if isinstance(documents, dict):
-            result = coll.insert_one(documents)
+            result = await coll.insert_one(documents)
             inserted_ids = [str(result.inserted_id)]
             count = 1
         else:
-            result = coll.insert_many(documents)
+            result = await coll.insert_many(documents)
             inserted_ids = [str(id) for id in result.inserted_ids]
             count = len(inserted_ids)
 
@@ -123,17 +123,17 @@ async def update(
 
         # If the update doesn't have any operators, then it's a replace
         if not any(key.startswith('$') for key in update.keys()):
-            result = coll.replace_one(filter, update, upsert=upsert)
+            result = await coll.replace_one(filter, update, upsert=upsert)
             matched = result.matched_count
             modified = result.modified_count
         # If the update needs to update multiple documents
         elif many:
-            result = coll.update_many(filter, update, upsert=upsert)
+            result = await coll.update_many(filter, update, upsert=upsert)
             matched = result.matched_count
             modified = result.modified_count
         # Else only a single document needs to be updated
         else:
-            result = coll.update_one(filter, update, upsert=upsert)
+            result = await coll.update_one(filter, update, upsert=upsert)
             matched = result.matched_count
             modified = result.modified_count
 
@@ -189,10 +189,10 @@ async def delete(
         coll = db[collection]
 
         if many:
-            result = coll.delete_many(filter)
+            result = await coll.delete_many(filter)
             deleted = result.deleted_count
         else:
-            result = coll.delete_one(filter)
+            result = await coll.delete_one(filter)
             deleted = result.deleted_count
 
         logger.info(f'Deleted {deleted} documents')
@@ -449,12 +449,13 @@ class MockCollection:
         result.upserted_id = upserted_id
         return result
 
-    def aggregate(self, pipeline, explain=False):
+    def aggregate(self, pipeline, explain=False, **kwargs):
         """Mock aggregate operation with pipeline processing.
 
         Args:
             pipeline: Aggregation pipeline
             explain: Whether to explain the operation
+            **kwargs: Cursor options such as batchSize, which do not affect the results
 
         Returns:
             MockCursor or dict: A cursor for the aggregation results or explanation
@@ -780,6 +781,134 @@ class MockDocumentDBClient:
         pass
 
 
+class AsyncMockCursor:
+    """Asyncio cursor over the documents of a mock cursor."""
+
+    def __init__(self, cursor):
+        """Initialize an asyncio cursor.
+
+        Args:
+            cursor: Iterator over the documents, such as a MockCursor
+        """
+        self._cursor = cursor
+        self.batch = None
+        self.closed = False
+
+    def limit(self, limit_value):
+        """Set limit on the cursor.
+
+        Args:
+            limit_value: Maximum number of documents to return
+
+        Returns:
+            AsyncMockCursor: Self
+        """
+        self._cursor.limit(limit_value)
+        return self
+
+    def batch_size(self, batch_size):
+        """Set the number of documents fetched per batch.
+
+        Args:
+            batch_size: Number of documents per batch
+
+        Returns:
+            AsyncMockCursor: Self
+        """
+        self.batch = batch_size
+        return self
+
+    def __aiter__(self):
+        """Get asynchronous iterator for the cursor.
+
+        Returns:
+            AsyncMockCursor: Self
+        """
+        return self
+
+    async def __anext__(self):
+        """Get next document from the cursor.
+
+        Returns:
+            dict: Next document
+
+        Raises:
+            StopAsyncIteration: When no more documents are available
+        """
+        try:
+            return next(self._cursor)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def close(self):
+        """Close the cursor."""
+        self.closed = True
+
+
+class AsyncMockWrapper:
+    """Asyncio facade of a mock, with coroutines for the methods of the wrapped mock.
+
+    Methods are looked up on the wrapped mock when called, so tests can patch the mock.
+    """
+
+    def __init__(self, wrapped):
+        """Initialize the facade.
+
+        Args:
+            wrapped: The synchronous mock to wrap
+        """
+        self._wrapped = wrapped
+
+    def __getattr__(self, name):
+        """Get a coroutine function calling a method of the wrapped mock.
+
+        Args:
+            name: Name of the method
+
+        Returns:
+            Coroutine function with the arguments of the method
+        """
+
+        async def method(*args, **kwargs):
+            return getattr(self._wrapped, name)(*args, **kwargs)
+
+        return method
+
+
+class AsyncMockCollection(AsyncMockWrapper):
+    """Asyncio facade of a MockCollection."""
+
+    def find(self, *args, **kwargs):
+        """Mock find operation returning an asyncio cursor."""
+        return AsyncMockCursor(self._wrapped.find(*args, **kwargs))
+
+    async def aggregate(self, pipeline, **kwargs):
+        """Mock aggregate operation returning an asyncio cursor."""
+        self.aggregate_kwargs = kwargs
+        return AsyncMockCursor(self._wrapped.aggregate(pipeline, **kwargs))
+
+
+class AsyncMockDatabase(AsyncMockWrapper):
+    """Asyncio facade of a MockDatabase."""
+
+    def __getitem__(self, collection_name):
+        """Get a collection by name."""
+        return AsyncMockCollection(self._wrapped[collection_name])
+
+
+class AsyncMockDocumentDBClient(AsyncMockWrapper):
+    """Asyncio facade of a MockDocumentDBClient, standing in for AsyncMongoClient."""
+
+    @property
+    def admin(self):
+        """Get the admin database."""
+        return AsyncMockWrapper(self._wrapped.admin)
+
+    def __getitem__(self, db_name):
+        """Get a database by name."""
+        return AsyncMockDatabase(self._wrapped[db_name])
+
+
 class MockContext:
     """Mock implementation of MCP context for testing."""
 
@@ -813,13 +942,14 @@ def mock_documentdb_client():
 
 @pytest.fixture
 def patch_client(monkeypatch):
-    """Fixture that patches MongoClient with our mock.
+    """Fixture that patches AsyncMongoClient with an asyncio facade of our mock.
 
     Args:
         monkeypatch: pytest monkeypatch fixture
 
     Returns:
-        function: Function to create and install a mock DocumentDB client
+        function: Function to create and install a mock DocumentDB client, returning the
+            synchronous mock to set up test data with
     """
     # Import here to avoid circular imports
     from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
@@ -839,12 +969,11 @@ def patch_client(monkeypatch):
         nonlocal original_connections
         original_connections = DocumentDBConnection._connections.copy()
 
-        # Patch MongoClient in all relevant modules - server.py imports from connection_tools, so we only need to patch there
+        # Patch AsyncMongoClient in all relevant modules - server.py imports from connection_tools, so we only need to patch there
         monkeypatch.setattr(
-            'awslabs.documentdb_mcp_server.connection_tools.MongoClient',
-            lambda *args, **kwargs: mock_client,
+            'awslabs.documentdb_mcp_server.connection_tools.AsyncMongoClient',
+            lambda *args, **kwargs: AsyncMockDocumentDBClient(mock_client),
         )
-        monkeypatch.setattr('pymongo.MongoClient', lambda *args, **kwargs: mock_client)
 
         # Make sure we don't lose our connections after patching
         for conn_id, conn_info in original_connections.items():
@@ -21,7 +21,6 @@ from awslabs.documentdb_mcp_server.analytic_tools import (
     explain_operation,
     get_collection_stats,
     get_database_stats,
-    get_field_type,
 )
 from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
 from bson import ObjectId
@@ -35,7 +34,7 @@ class TestCountDocumentsTool:
         """Test successful counting of documents."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -64,7 +63,7 @@ class TestCountDocumentsTool:
         """Test counting documents with a filter."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -103,7 +102,7 @@ class TestCountDocumentsTool:
         """Test handling of generic exceptions during count_documents."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -126,7 +125,7 @@ class TestGetDatabaseStatsTool:
         """Test successful retrieval of database statistics."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -162,7 +161,7 @@ class TestGetDatabaseStatsTool:
         """Test handling of generic exceptions during get_database_stats."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -185,7 +184,7 @@ class TestGetCollectionStatsTool:
         """Test successful retrieval of collection statistics."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -221,7 +220,7 @@ class TestGetCollectionStatsTool:
         """Test handling of generic exceptions during get_collection_stats."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -244,7 +243,7 @@ class TestAnalyzeSchemaTool:
         """Test successful schema analysis."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -280,13 +279,44 @@ class TestAnalyzeSchemaTool:
         assert 'tags' in result['field_coverage']
         # Active appears only in doc 2
         assert 'active' in result['field_coverage']
+        assert result['field_coverage']['tags']['array_length'] == {'min': 1, 'max': 2, 'avg': 1.5}
+        assert result['field_coverage']['value']['distinct_values'] == 3
+
+    @pytest.mark.asyncio
+    async def test_analyze_schema_pre_aggregate(self, mock_ctx, patch_client, monkeypatch):
+        """Test that pre-aggregation analyzes fields grouped on the server."""
+        # Arrange
+        mock_client = patch_client()  # noqa: F841
+        connection_info = await DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+        connection_id = connection_info.connection_id
+        mock_client['test_db']['test_collection'].insert_one({'name': 'Document 1'})
+        pipelines = []
+
+        def mock_aggregate(self, pipeline, **kwargs):
+            pipelines.append(pipeline)
+            return iter([{'_id': {'k': 'name', 't': 'string'}, 'count': 1, 'sum_length': 0}])
+
+        monkeypatch.setattr('conftest.MockCollection.aggregate', mock_aggregate)
+
+        # Act
+        result = await analyze_schema(
+            connection_id, 'test_db', 'test_collection', 100, pre_aggregate=True
+        )
+
+        # Assert
+        assert pipelines[0][0] == {'$sample': {'size': 1}}
+        assert {'$unwind': '$fields'} in pipelines[0]
+        assert result['field_coverage']['name']['data_type'] == 'str'
+        assert result['sampled_documents'] == 1
 
     @pytest.mark.asyncio
     async def test_analyze_schema_empty_collection(self, mock_ctx, patch_client):
         """Test analyze_schema with empty collection."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -314,7 +344,7 @@ class TestAnalyzeSchemaTool:
         """Test handling of generic exceptions during analyze_schema."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -337,7 +367,7 @@ class TestExplainOperationTool:
         """Test explaining a find operation."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -371,7 +401,7 @@ class TestExplainOperationTool:
         """Test explaining an aggregate operation."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -413,7 +443,7 @@ class TestExplainOperationTool:
         """Test explainOperation with invalid operation type."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -435,7 +465,7 @@ class TestExplainOperationTool:
         """Test explainOperation with missing pipeline for aggregate operation."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -460,59 +490,3 @@ class TestExplainOperationTool:
             await explain_operation(
                 str(uuid.uuid4()), 'test_db', 'test_collection', 'find', {}, None, 'queryPlanner'
             )
-
-
-class TestHelperFunctions:
-    """Tests for helper functions used by the tools."""
-
-    def test_get_field_type_number(self):
-        """Test get_field_type for numeric values."""
-        docs = [{'value': 10}, {'value': 20}]
-
-        field_type = get_field_type(docs, 'value')
-        assert field_type == 'int'
-
-    def test_get_field_type_string(self):
-        """Test get_field_type for string values."""
-        docs = [{'name': 'Document 1'}, {'name': 'Document 2'}]
-
-        field_type = get_field_type(docs, 'name')
-        assert field_type == 'str'
-
-    def test_get_field_type_boolean(self):
-        """Test get_field_type for boolean values."""
-        docs = [{'active': True}, {'active': False}]
-
-        field_type = get_field_type(docs, 'active')
-        assert field_type == 'bool'
-
-    def test_get_field_type_list(self):
-        """Test get_field_type for list values."""
-        docs = [{'tags': ['a', 'b']}, {'tags': ['c']}]
-
-        field_type = get_field_type(docs, 'tags')
-        assert field_type == 'array'
-
-    def test_get_field_type_nested_object(self):
-        """Test get_field_type for nested objects."""
-        docs = [{'metadata': {'created': '2023-01-01'}}, {'metadata': {'created': '2023-01-02'}}]
-
-        field_type = get_field_type(docs, 'metadata')
-        assert field_type == 'object'
-
-    def test_get_field_type_mixed_types(self):
-        """Test get_field_type for fields with mixed types."""
-        docs = [{'value': 10}, {'value': 'string'}]
-
-        field_type = get_field_type(docs, 'value')
-        # Should return a list of types
-        assert isinstance(field_type, list)
-        assert 'int' in field_type
-        assert 'str' in field_type
-
-    def test_get_field_type_missing_field(self):
-        """Test get_field_type for missing fields."""
-        docs = [{'name': 'Document 1'}, {'name': 'Document 2'}]
-
-        field_type = get_field_type(docs, 'non_existent_field')
-        assert field_type == 'null'
@@ -27,13 +27,14 @@ from pymongo.errors import ConnectionFailure
 class TestDocumentDBConnection:
     """Tests for the DocumentDBConnection class."""
 
-    def test_create_connection(self, patch_client):
+    @pytest.mark.asyncio
+    async def test_create_connection(self, patch_client):
         """Test creating a new connection."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
 
         # Act
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
 
@@ -45,22 +46,24 @@ class TestDocumentDBConnection:
         assert isinstance(connection_info.connection_id, str)
         assert isinstance(connection_info.last_used, datetime)
 
-    def test_create_connection_failure(self, patch_client):
+    @pytest.mark.asyncio
+    async def test_create_connection_failure(self, patch_client):
         """Test connection failure."""
         # Arrange
         patch_client(raise_on_connect=ConnectionFailure('Connection refused'))
 
         # Act/Assert
         with pytest.raises(ConnectionFailure):
-            DocumentDBConnection.create_connection(
+            await DocumentDBConnection.create_connection(
                 'mongodb://example.com:27017/?retryWrites=false'
             )
 
-    def test_get_connection(self, patch_client):
+    @pytest.mark.asyncio
+    async def test_get_connection(self, patch_client):
         """Test getting an existing connection."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         orig_last_used = connection_info.last_used
@@ -69,7 +72,7 @@ class TestDocumentDBConnection:
         client = DocumentDBConnection.get_connection(connection_info.connection_id)
 
         # Assert
-        assert client is mock_client
+        assert client._wrapped is mock_client
         assert connection_info.last_used > orig_last_used
 
     def test_get_connection_not_found(self):
@@ -78,35 +81,38 @@ class TestDocumentDBConnection:
         with pytest.raises(ValueError, match='Connection ID .* not found'):
             DocumentDBConnection.get_connection(str(uuid.uuid4()))
 
-    def test_close_connection(self, patch_client):
+    @pytest.mark.asyncio
+    async def test_close_connection(self, patch_client):
         """Test closing a connection."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
 
         # Act
-        DocumentDBConnection.close_connection(connection_id)
+        await DocumentDBConnection.close_connection(connection_id)
 
         # Assert
         assert connection_id not in DocumentDBConnection._connections
 
-    def test_close_connection_not_found(self):
+    @pytest.mark.asyncio
+    async def test_close_connection_not_found(self):
         """Test closing a non-existent connection."""
         # Act/Assert
         with pytest.raises(ValueError, match='Connection ID .* not found'):
-            DocumentDBConnection.close_connection(str(uuid.uuid4()))
+            await DocumentDBConnection.close_connection(str(uuid.uuid4()))
 
-    def test_close_idle_connections(self, patch_client):
+    @pytest.mark.asyncio
+    async def test_close_idle_connections(self, patch_client):
         """Test closing idle connections."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info1 = DocumentDBConnection.create_connection(
+        connection_info1 = await DocumentDBConnection.create_connection(
             'mongodb://example1.com:27017/?retryWrites=false'
         )
-        connection_info2 = DocumentDBConnection.create_connection(
+        connection_info2 = await DocumentDBConnection.create_connection(
             'mongodb://example2.com:27017/?retryWrites=false'
         )
 
@@ -114,25 +120,26 @@ class TestDocumentDBConnection:
         connection_info1.last_used = datetime.now() - timedelta(minutes=31)
 
         # Act
-        DocumentDBConnection.close_idle_connections()
+        await DocumentDBConnection.close_idle_connections()
 
         # Assert
         assert connection_info1.connection_id not in DocumentDBConnection._connections
         assert connection_info2.connection_id in DocumentDBConnection._connections
 
-    def test_close_all_connections(self, patch_client):
+    @pytest.mark.asyncio
+    async def test_close_all_connections(self, patch_client):
         """Test closing all connections."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info1 = DocumentDBConnection.create_connection(  # noqa: F841
+        connection_info1 = await DocumentDBConnection.create_connection(  # noqa: F841
             'mongodb://example1.com:27017/?retryWrites=false'
         )
-        connection_info2 = DocumentDBConnection.create_connection(  # noqa: F841
+        connection_info2 = await DocumentDBConnection.create_connection(  # noqa: F841
             'mongodb://example2.com:27017/?retryWrites=false'
         )
 
         # Act
-        DocumentDBConnection.close_all_connections()
+        await DocumentDBConnection.close_all_connections()
 
         # Assert
         assert len(DocumentDBConnection._connections) == 0
@@ -199,7 +206,7 @@ class TestDisconnectTool:
         """Test successful disconnection."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -33,7 +33,7 @@ class TestListDatabasesTool:
         """Test successful listing of databases."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -67,7 +67,7 @@ class TestListDatabasesTool:
         """Test handling of generic exceptions during list_databases."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -94,7 +94,7 @@ class TestCreateCollectionTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', True)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -112,7 +112,7 @@ class TestCreateCollectionTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -135,7 +135,7 @@ class TestCreateCollectionTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -169,7 +169,7 @@ class TestCreateCollectionTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -192,7 +192,7 @@ class TestListCollectionsTool:
         """Test successful listing of collections."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -223,7 +223,7 @@ class TestListCollectionsTool:
         """Test handling of generic exceptions during list_collections."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -250,7 +250,7 @@ class TestDropCollectionTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', True)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -271,7 +271,7 @@ class TestDropCollectionTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -301,7 +301,7 @@ class TestDropCollectionTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -332,7 +332,7 @@ class TestDropCollectionTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
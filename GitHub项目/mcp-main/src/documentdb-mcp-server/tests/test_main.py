@@ -13,7 +13,9 @@
 # limitations under the License.
 """Tests for the main function in server.py."""
 
-from awslabs.documentdb_mcp_server.server import main
+import pytest
+from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
+from awslabs.documentdb_mcp_server.server import main, mcp, server_lifespan
 from unittest.mock import patch
 
 
@@ -30,6 +32,18 @@ class TestMain:
         # Check that mcp.run was called with the correct arguments
         mock_run.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_server_lifespan_closes_connections(self, patch_client):
+        """Test that all connections are closed when the server shuts down."""
+        patch_client()
+
+        async with server_lifespan(mcp):
+            await DocumentDBConnection.create_connection(
+                'mongodb://example.com:27017/?retryWrites=false'
+            )
+
+        assert DocumentDBConnection._connections == {}
+
     def test_module_execution(self):
         """Test the module execution when run as __main__."""
         # This test directly executes the code in the if __name__ == '__main__': block
@@ -15,12 +15,17 @@
 
 import pytest
 import uuid
+from awslabs.documentdb_mcp_server.config import serverConfig
 from awslabs.documentdb_mcp_server.connection_tools import DocumentDBConnection
 from awslabs.documentdb_mcp_server.query_tools import (
+    MAX_BATCH_SIZE,
     aggregate,
+    batch_size_for,
+    collect_documents,
     find,
 )
 from bson import ObjectId
+from conftest import AsyncMockCursor
 
 
 class TestFindTool:
@@ -31,7 +36,7 @@ class TestFindTool:
         """Test successful find operation with filtering."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -65,7 +70,7 @@ class TestFindTool:
         """Test find with projection."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -103,7 +108,7 @@ class TestFindTool:
         """Test find with limit."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -146,7 +151,7 @@ class TestFindTool:
         """Test handling of generic exceptions during find."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -161,6 +166,86 @@ class TestFindTool:
             await find(connection_id, 'test_db', 'test_collection', {}, None, 10)
 
 
+class TestResultStreaming:
+    """Tests for the streaming of find and aggregate results."""
+
+    def test_batch_size_for(self):
+        """Test that limited results are fetched in one batch and others in bounded batches."""
+        assert batch_size_for(10) == 10
+        assert batch_size_for(0) == MAX_BATCH_SIZE
+        assert batch_size_for(10 * MAX_BATCH_SIZE) == MAX_BATCH_SIZE
+
+    @pytest.mark.asyncio
+    async def test_collect_documents_byte_budget(self):
+        """Test that streaming stops at the byte budget and the cursor is closed."""
+        docs = [{'_id': ObjectId(), 'payload': 'x' * 100} for _ in range(10)]
+        cursor = AsyncMockCursor(iter(docs))
+
+        result = await collect_documents(cursor, max_bytes=400)
+
+        assert len(result) == 2
+        assert all(isinstance(doc['_id'], str) for doc in result)
+        assert cursor.closed is True
+
+    @pytest.mark.asyncio
+    async def test_find_result_size_limit(self, mock_ctx, patch_client, monkeypatch):
+        """Test that find returns no more documents than the result size limit allows."""
+        # Arrange
+        mock_client = patch_client()
+        connection_info = await DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+        for i in range(20):
+            mock_client['test_db']['test_collection'].insert_one({'value': i, 'pad': 'x' * 50})
+        monkeypatch.setattr(serverConfig, 'max_result_bytes', 200)
+
+        # Act
+        result = await find(
+            connection_info.connection_id, 'test_db', 'test_collection', {}, None, 0
+        )
+
+        # Assert
+        assert len(result) == 2
+
+    @pytest.mark.asyncio
+    async def test_aggregate_projection_pushdown(self, mock_ctx, patch_client):
+        """Test that the projection is added to a copy of the pipeline with the batch size."""
+        # Arrange
+        mock_client = patch_client()
+        connection_info = await DocumentDBConnection.create_connection(
+            'mongodb://example.com:27017/?retryWrites=false'
+        )
+        mock_client['test_db']['test_collection'].insert_one({'name': 'a', 'value': 1})
+        pipelines = []
+
+        def mock_aggregate(pipeline, **kwargs):
+            pipelines.append((pipeline, kwargs))
+            return iter([{'name': 'a'}])
+
+        mock_client['test_db']['test_collection'].aggregate = mock_aggregate
+        pipeline = [{'$match': {}}]
+
+        # Act
+        result = await aggregate(
+            connection_info.connection_id,
+            'test_db',
+            'test_collection',
+            pipeline,
+            5,
+            projection={'_id': 0, 'name': 1},
+        )
+
+        # Assert
+        assert result == [{'name': 'a'}]
+        assert pipelines == [
+            (
+                [{'$match': {}}, {'$limit': 5}, {'$project': {'_id': 0, 'name': 1}}],
+                {'batchSize': 5},
+            )
+        ]
+        assert pipeline == [{'$match': {}}]
+
+
 class TestAggregateTool:
     """Tests for the aggregate tool."""
 
@@ -169,7 +254,7 @@ class TestAggregateTool:
         """Test successful aggregate operation with grouping."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -215,7 +300,7 @@ class TestAggregateTool:
         """Test aggregate with limit."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -252,7 +337,7 @@ class TestAggregateTool:
         """Test aggregate with limit already in pipeline."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -297,7 +382,7 @@ class TestAggregateTool:
         """Test handling of generic exceptions during aggregate."""
         # Arrange
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -0,0 +1,174 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the single-pass schema inference of the DocumentDB MCP Server."""
+
+from awslabs.documentdb_mcp_server.schema_inference import (
+    DistinctSketch,
+    SchemaInference,
+    from_pre_aggregation,
+    pre_aggregation_pipeline,
+    summarize_types,
+    type_name,
+)
+from bson import ObjectId
+
+
+class TestSchemaInference:
+    """Tests for the SchemaInference class."""
+
+    def test_nested_fields_and_statistics(self):
+        """Test that every path gets its coverage, types, nulls, array lengths and cardinality."""
+        docs = [
+            {'_id': ObjectId(), 'name': 'a', 'tags': ['x', 'y'], 'meta': {'score': 1}},
+            {'_id': ObjectId(), 'name': 'b', 'tags': [], 'meta': {'score': 'high'}},
+            {'_id': ObjectId(), 'name': None, 'items': [{'price': 5, '_id': 1}]},
+            {'_id': ObjectId(), 'name': 'a'},
+        ]
+
+        fields = SchemaInference().add_all(iter(docs)).to_dict()
+
+        assert set(fields) == {'name', 'tags', 'meta', 'meta.score', 'items', 'items[0].price'}
+        assert fields['name'] == {
+            'count': 4,
+            'percentage': 100.0,
+            'data_type': 'str',
+            'types': {'str': 3, 'NoneType': 1},
+            'null_ratio': 0.25,
+            'distinct_values': 2,
+        }
+        assert fields['tags']['data_type'] == 'array'
+        assert fields['tags']['percentage'] == 50.0
+        assert fields['tags']['array_length'] == {'min': 0, 'max': 2, 'avg': 1.0}
+        assert fields['meta']['data_type'] == 'object'
+        assert 'distinct_values' not in fields['meta']
+        assert sorted(fields['meta.score']['data_type']) == ['int', 'str']
+        assert fields['items[0].price']['count'] == 1
+
+    def test_only_null_values(self):
+        """Test that a field that is always null has the 'null' data type."""
+        fields = SchemaInference().add_all([{'a': None}]).to_dict()
+
+        assert fields['a']['data_type'] == 'null'
+        assert fields['a']['null_ratio'] == 1.0
+
+
+class TestDistinctSketch:
+    """Tests for the DistinctSketch class."""
+
+    def test_exact_below_size(self):
+        """Test that small numbers of distinct values are counted exactly."""
+        sketch = DistinctSketch(size=16)
+        for value in [1, 2, 2, 3, '3', 1]:
+            sketch.add(value)
+
+        assert sketch.estimate() == 4
+
+    def test_estimate_above_size(self):
+        """Test that large numbers of distinct values are estimated with bounded memory."""
+        sketch = DistinctSketch(size=256)
+        for value in range(20000):
+            sketch.add(value)
+            sketch.add(value)
+
+        assert len(sketch._heap) == 256
+        assert 16000 < sketch.estimate() < 24000
+
+
+class TestPreAggregation:
+    """Tests for the server-side pre-aggregation of top-level fields."""
+
+    def test_pipeline_samples_and_groups_fields(self):
+        """Test that the pipeline samples, splits documents into fields and groups them."""
+        pipeline = pre_aggregation_pipeline(500)
+
+        assert pipeline[0] == {'$sample': {'size': 500}}
+        assert pipeline[1]['$project']['fields'] == {'$objectToArray': '$$ROOT'}
+        assert pipeline[-1]['$group']['_id'] == {'k': '$k', 't': '$t'}
+
+    def test_from_pre_aggregation(self):
+        """Test that grouped fields are converted to the statistics of the inference."""
+        groups = [
+            {'_id': {'k': 'name', 't': 'string'}, 'count': 3, 'sum_length': 0},
+            {'_id': {'k': 'name', 't': 'null'}, 'count': 1, 'sum_length': 0},
+            {
+                '_id': {'k': 'tags', 't': 'array'},
+                'count': 2,
+                'min_length': 0,
+                'max_length': 4,
+                'sum_length': 4,
+            },
+        ]
+
+        fields = from_pre_aggregation(groups, 4)
+
+        assert fields['name'] == {
+            'count': 4,
+            'percentage': 100.0,
+            'data_type': 'str',
+            'types': {'str': 3, 'NoneType': 1},
+            'null_ratio': 0.25,
+        }
+        assert fields['tags']['array_length'] == {'min': 0, 'max': 4, 'avg': 2.0}
+
+
+class TestFieldTypes:
+    """Tests for the data types reported for field paths."""
+
+    def _data_type(self, docs, path):
+        fields = SchemaInference().add_all(docs).to_dict()
+        return fields[path]['data_type'] if path in fields else summarize_types([])
+
+    def test_number(self):
+        """Test the data type of numeric values."""
+        assert self._data_type([{'value': 10}, {'value': 20}], 'value') == 'int'
+
+    def test_string(self):
+        """Test the data type of string values."""
+        assert self._data_type([{'name': 'Document 1'}, {'name': 'Document 2'}], 'name') == 'str'
+
+    def test_boolean(self):
+        """Test the data type of boolean values."""
+        assert self._data_type([{'active': True}, {'active': False}], 'active') == 'bool'
+
+    def test_list(self):
+        """Test the data type of list values."""
+        assert self._data_type([{'tags': ['a', 'b']}, {'tags': ['c']}], 'tags') == 'array'
+
+    def test_nested_object(self):
+        """Test the data type of nested objects and their fields."""
+        docs = [{'metadata': {'created': '2023-01-01'}}, {'metadata': {'created': '2023-01-02'}}]
+
+        assert self._data_type(docs, 'metadata') == 'object'
+        assert self._data_type(docs, 'metadata.created') == 'str'
+
+    def test_mixed_types(self):
+        """Test that fields with mixed types report a list of types."""
+        field_type = self._data_type([{'value': 10}, {'value': 'string'}], 'value')
+
+        assert isinstance(field_type, list)
+        assert sorted(field_type) == ['int', 'str']
+
+    def test_missing_field(self):
+        """Test that missing fields are reported as null."""
+        assert self._data_type([{'name': 'Document 1'}], 'non_existent_field') == 'null'
+
+    def test_type_name(self):
+        """Test the type names of documents, arrays and scalars."""
+        assert [type_name(v) for v in [{}, [], 1, 1.5, None]] == [
+            'object',
+            'array',
+            'int',
+            'float',
+            'NoneType',
+        ]
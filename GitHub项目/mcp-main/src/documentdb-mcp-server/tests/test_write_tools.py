@@ -31,7 +31,7 @@ class TestInsertTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', True)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -54,7 +54,7 @@ class TestInsertTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', True)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -75,7 +75,7 @@ class TestInsertTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -99,7 +99,7 @@ class TestInsertTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -137,7 +137,7 @@ class TestInsertTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -170,7 +170,7 @@ class TestUpdateTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', True)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -192,7 +192,7 @@ class TestUpdateTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -221,7 +221,7 @@ class TestUpdateTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -256,7 +256,7 @@ class TestUpdateTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -282,7 +282,7 @@ class TestUpdateTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -324,7 +324,7 @@ class TestUpdateTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -358,7 +358,7 @@ class TestDeleteTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', True)
 
         mock_client = patch_client()  # noqa: F841
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -379,7 +379,7 @@ class TestDeleteTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -405,7 +405,7 @@ class TestDeleteTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
@@ -448,7 +448,7 @@ class TestDeleteTool:
         monkeypatch.setattr(serverConfig, 'read_only_mode', False)
 
         mock_client = patch_client()
-        connection_info = DocumentDBConnection.create_connection(
+        connection_info = await DocumentDBConnection.create_connection(
             'mongodb://example.com:27017/?retryWrites=false'
         )
         connection_id = connection_info.connection_id
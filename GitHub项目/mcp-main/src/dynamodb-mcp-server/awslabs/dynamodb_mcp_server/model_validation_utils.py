@@ -13,8 +13,11 @@
 # limitations under the License.
 
 import boto3
+import hashlib
+import json
 import os
 import psutil
+import random
 import shutil
 import socket
 import subprocess
@@ -23,10 +26,14 @@ import tarfile
 import tempfile
 import time
 import urllib.request
+from awslabs.aws_api_mcp_server.core.aws.pagination import build_result
+from awslabs.aws_api_mcp_server.core.aws.services import extract_pagination_config
+from awslabs.aws_api_mcp_server.core.parser.parser import parse
 from botocore.exceptions import ClientError, EndpointConnectionError
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from loguru import logger
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 
@@ -44,6 +51,12 @@ class DynamoDBLocalConfig:
     JAVA_PROPERTY_NAME = CONTAINER_NAME.replace('-', '.')
     DOWNLOAD_TIMEOUT = 30
     BATCH_SIZE = 25
+    # Parallel requests, matching the default connection pool size of a boto3 client
+    MAX_WORKERS = 10
+    BATCH_WRITE_MAX_RETRIES = 8
+    BATCH_WRITE_BASE_DELAY = 0.05
+    BATCH_WRITE_MAX_DELAY = 2.0
+    WARM_POOL_ENV_VAR = 'DYNAMODB_VALIDATION_WARM_POOL'
 
 
 class ContainerTools:
@@ -658,18 +671,29 @@ def setup_dynamodb_local() -> str:
 
 
 def create_validation_resources(
-    resources: Dict[str, Any], endpoint_url: Optional[str] = None
+    resources: Dict[str, Any], endpoint_url: Optional[str] = None, warm_pool: bool = False
 ) -> Dict[str, Any]:
     """Create DynamoDB resources for data model validation.
 
+    With warm_pool, the seeded state is restored from the snapshot of a previous validation of
+    the same tables and items when possible, and a snapshot is taken after a full rebuild.
+
     Args:
         resources: Valid dictionary containing tables and items
         endpoint_url: DynamoDB endpoint URL
+        warm_pool: Whether to restore from and save to the warm pool snapshot
 
     Returns:
-        Dictionary with response from both table creation and item insertion
+        Dictionary with response from both table creation and item insertion, or from the
+        snapshot restore
     """
     dynamodb_client = _create_dynamodb_client(endpoint_url)
+    fingerprint = _data_model_fingerprint(resources)
+
+    if warm_pool:
+        restored = DynamoDBLocalPool.restore(dynamodb_client, endpoint_url, fingerprint)
+        if restored is not None:
+            return {'tables': restored, 'items': {}, 'snapshot': 'restored'}
 
     logger.info('Cleaning up existing tables in DynamoDB local for Model Validation')
     cleanup_validation_resources(dynamodb_client)
@@ -685,8 +709,21 @@ def create_validation_resources(
 
     table_creation_response = create_tables(dynamodb_client, tables)
     item_insertion_response = insert_items(dynamodb_client, items)
+    response = {'tables': table_creation_response, 'items': item_insertion_response}
+
+    if warm_pool:
+        # Only a completely seeded state is worth restoring later
+        seeded = all(
+            result['status'] == 'success'
+            for result in [*table_creation_response.values(), *item_insertion_response.values()]
+        )
+        if seeded:
+            DynamoDBLocalPool.save(
+                dynamodb_client, endpoint_url, fingerprint, list(table_creation_response)
+            )
+            response['snapshot'] = 'created'
 
-    return {'tables': table_creation_response, 'items': item_insertion_response}
+    return response
 
 
 def cleanup_validation_resources(dynamodb_client) -> Dict[str, Any]:
@@ -786,42 +823,318 @@ def create_tables(dynamodb_client, tables: list) -> Dict[str, Any]:
     return table_creation_response
 
 
+def _write_batch(dynamodb_client, table_name: str, batch_items: list) -> Dict[str, int]:
+    """Write one batch of items, retrying unprocessed items with exponential backoff.
+
+    Args:
+        dynamodb_client: Valid boto3 DynamoDB client
+        table_name: Name of the table to write to
+        batch_items: Up to BATCH_SIZE write requests
+
+    Returns:
+        Dictionary with the number of items written, left unprocessed and retries made.
+    """
+    pending = batch_items
+    retries = 0
+    while True:
+        response = dynamodb_client.batch_write_item(RequestItems={table_name: pending})
+        unprocessed = response.get('UnprocessedItems', {}).get(table_name, [])
+        if not unprocessed or retries >= DynamoDBLocalConfig.BATCH_WRITE_MAX_RETRIES:
+            return {
+                'written': len(batch_items) - len(unprocessed),
+                'unprocessed': len(unprocessed),
+                'retries': retries,
+            }
+
+        # Full jitter keeps parallel writers from retrying in lockstep
+        delay = min(
+            DynamoDBLocalConfig.BATCH_WRITE_MAX_DELAY,
+            DynamoDBLocalConfig.BATCH_WRITE_BASE_DELAY * 2**retries,
+        )
+        time.sleep(random.uniform(0, delay))
+        pending = unprocessed
+        retries += 1
+
+
 def insert_items(dynamodb_client, items: dict) -> Dict[str, Any]:
     """Insert items into DynamoDB tables using batch_write_item.
 
+    The batches of all tables are written in parallel, and unprocessed items are retried with
+    exponential backoff until written or BATCH_WRITE_MAX_RETRIES is reached.
+
     Args:
         dynamodb_client: Valid boto3 DynamoDB client
         items: Dictionary of table names to item lists
 
     Returns:
-        Dictionary with insertion response for each table.
+        Dictionary with insertion response for each table, including the items processed,
+        retries and throughput.
     """
-    item_insertion_response = {}
-
-    for table_name, table_items in items.items():
-        if not isinstance(table_items, list):
+    batches = [
+        (table_name, table_items[i : i + DynamoDBLocalConfig.BATCH_SIZE])
+        for table_name, table_items in items.items()
+        if isinstance(table_items, list)
+        for i in range(0, len(table_items), DynamoDBLocalConfig.BATCH_SIZE)
+    ]
+    totals = {
+        table_name: {'items_processed': 0, 'items_unprocessed': 0, 'retries': 0}
+        for table_name, table_items in items.items()
+        if isinstance(table_items, list)
+    }
+    errors: Dict[str, str] = {}
+
+    start = time.monotonic()
+    if batches:
+        with ThreadPoolExecutor(
+            max_workers=min(DynamoDBLocalConfig.MAX_WORKERS, len(batches))
+        ) as executor:
+            futures = {
+                executor.submit(_write_batch, dynamodb_client, table_name, batch_items): table_name
+                for table_name, batch_items in batches
+            }
+            for future in as_completed(futures):
+                table_name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors.setdefault(table_name, str(e))
+                    continue
+                totals[table_name]['items_processed'] += result['written']
+                totals[table_name]['items_unprocessed'] += result['unprocessed']
+                totals[table_name]['retries'] += result['retries']
+    elapsed = time.monotonic() - start
+
+    item_insertion_response: Dict[str, Any] = {}
+    for table_name, table_totals in totals.items():
+        if table_name in errors:
+            item_insertion_response[table_name] = {
+                'status': 'error',
+                'error': errors[table_name],
+                **table_totals,
+            }
             continue
+        item_insertion_response[table_name] = {
+            'status': 'success' if not table_totals['items_unprocessed'] else 'partial',
+            **table_totals,
+        }
+
+    written = sum(table_totals['items_processed'] for table_totals in totals.values())
+    if written:
+        logger.info(
+            f'Inserted {written} items into {len(totals)} tables in {elapsed:.2f}s '
+            f'({written / max(elapsed, 1e-6):.0f} items/s)'
+        )
+    for response in item_insertion_response.values():
+        response['elapsed_seconds'] = round(elapsed, 3)
+        response['items_per_second'] = round(response['items_processed'] / max(elapsed, 1e-6))
+
+    return item_insertion_response
+
+
+def _data_model_fingerprint(resources: Dict[str, Any]) -> str:
+    """Return a fingerprint of the tables and items of a data model."""
+    seed = {'tables': resources.get('tables', []), 'items': resources.get('items', {})}
+    return hashlib.sha256(json.dumps(seed, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _item_key(item: Dict[str, Any], key_attributes: List[str]) -> str:
+    """Return a hashable primary key of an item in DynamoDB JSON."""
+    return json.dumps([item.get(name) for name in key_attributes], sort_keys=True, default=str)
+
+
+def _scan_table(dynamodb_client, table_name: str) -> List[Dict[str, Any]]:
+    """Return all items of a table."""
+    paginator = dynamodb_client.get_paginator('scan')
+    return [
+        item
+        for page in paginator.paginate(TableName=table_name, ConsistentRead=True)
+        for item in page.get('Items', [])
+    ]
+
+
+def snapshot_tables(dynamodb_client, table_names: List[str]) -> Dict[str, Any]:
+    """Snapshot the key schema and items of tables.
+
+    Args:
+        dynamodb_client: Valid boto3 DynamoDB client configured for DynamoDB Local
+        table_names: Names of the tables to snapshot
+
+    Returns:
+        Dictionary of table names to their key attributes and items
+    """
+    snapshot = {}
+    for table_name in table_names:
+        table = dynamodb_client.describe_table(TableName=table_name)['Table']
+        snapshot[table_name] = {
+            'key_attributes': [key['AttributeName'] for key in table['KeySchema']],
+            'items': _scan_table(dynamodb_client, table_name),
+        }
+    return snapshot
+
 
-        total_items = len(table_items)
-        processed_items = 0
+def restore_tables(dynamodb_client, snapshot: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Restore tables to a snapshot by rewriting only the items that changed since.
+
+    Args:
+        dynamodb_client: Valid boto3 DynamoDB client configured for DynamoDB Local
+        snapshot: Snapshot returned by snapshot_tables
+
+    Returns:
+        Dictionary with the items rewritten and deleted for each table, or None if the tables
+        no longer match the snapshot and have to be recreated
+    """
+    if set(list_tables(dynamodb_client)) != set(snapshot):
+        return None
+
+    restore_response = {}
+    for table_name, table in snapshot.items():
+        key_attributes = table['key_attributes']
+        seeded = {_item_key(item, key_attributes): item for item in table['items']}
+        current = {
+            _item_key(item, key_attributes): item
+            for item in _scan_table(dynamodb_client, table_name)
+        }
+
+        requests = [
+            {'DeleteRequest': {'Key': {name: item[name] for name in key_attributes}}}
+            for key, item in current.items()
+            if key not in seeded
+        ]
+        deleted = len(requests)
+        requests.extend(
+            {'PutRequest': {'Item': item}}
+            for key, item in seeded.items()
+            if current.get(key) != item
+        )
+
+        for i in range(0, len(requests), DynamoDBLocalConfig.BATCH_SIZE):
+            result = _write_batch(
+                dynamodb_client, table_name, requests[i : i + DynamoDBLocalConfig.BATCH_SIZE]
+            )
+            if result['unprocessed']:
+                return None
+
+        restore_response[table_name] = {
+            'status': 'restored',
+            'items_rewritten': len(requests) - deleted,
+            'items_deleted': deleted,
+        }
+    return restore_response
+
+
+class DynamoDBLocalPool:
+    """Warm DynamoDB Local instance reused across data model validations.
+
+    The endpoint of the instance is kept after the first setup and only probed on later
+    validations, and the seeded tables are snapshotted so that the next validation of the same
+    tables and items only rewrites the items that the access patterns changed.
+    """
+
+    _endpoint_url: Optional[str] = None
+    _snapshot: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def get_endpoint(cls) -> str:
+        """Return the endpoint of the warm instance, setting up DynamoDB Local if needed.
+
+        Returns:
+            str: DynamoDB Local endpoint URL
+
+        Raises:
+            RuntimeError: If neither Docker nor Java is available or setup fails
+        """
+        if cls._endpoint_url:
+            try:
+                _create_dynamodb_client(cls._endpoint_url).list_tables(Limit=1)
+                return cls._endpoint_url
+            except (ClientError, EndpointConnectionError) as e:
+                logger.info(f'Warm DynamoDB Local at {cls._endpoint_url} is gone: {e}')
+                cls.reset()
+
+        cls._endpoint_url = setup_dynamodb_local()
+        return cls._endpoint_url
+
+    @classmethod
+    def save(
+        cls, dynamodb_client, endpoint_url: Optional[str], fingerprint: str, table_names: list
+    ) -> None:
+        """Snapshot the seeded tables of a data model."""
+        cls._snapshot = {
+            'endpoint_url': endpoint_url,
+            'fingerprint': fingerprint,
+            'tables': snapshot_tables(dynamodb_client, table_names),
+        }
+
+    @classmethod
+    def restore(
+        cls, dynamodb_client, endpoint_url: Optional[str], fingerprint: str
+    ) -> Optional[Dict[str, Any]]:
+        """Restore the snapshot of a data model, or return None if there is none to restore."""
+        snapshot = cls._snapshot
+        if (
+            snapshot is None
+            or snapshot['endpoint_url'] != endpoint_url
+            or snapshot['fingerprint'] != fingerprint
+        ):
+            return None
 
         try:
-            # Process items in batches
-            for i in range(0, total_items, DynamoDBLocalConfig.BATCH_SIZE):
-                batch_items = table_items[i : i + DynamoDBLocalConfig.BATCH_SIZE]
-                response = dynamodb_client.batch_write_item(RequestItems={table_name: batch_items})
-                processed_items += len(batch_items) - len(
-                    response.get('UnprocessedItems', {}).get(table_name, [])
-                )
+            restored = restore_tables(dynamodb_client, snapshot['tables'])
+        except ClientError as e:
+            logger.info(f'Failed to restore the DynamoDB Local snapshot: {e}')
+            restored = None
+        if restored is None:
+            cls._snapshot = None
+        return restored
 
-            item_insertion_response[table_name] = {
-                'status': 'success',
-                'items_processed': processed_items,
-            }
-        except Exception as e:
-            item_insertion_response[table_name] = {'status': 'error', 'error': str(e)}
+    @classmethod
+    def reset(cls) -> None:
+        """Forget the warm instance and its snapshot."""
+        cls._endpoint_url = None
+        cls._snapshot = None
 
-    return item_insertion_response
+
+def execute_dynamodb_cli_command(dynamodb_client, command: str) -> Dict[str, Any]:
+    """Execute an AWS CLI DynamoDB command through a boto3 DynamoDB client.
+
+    The command is translated to API parameters with the AWS API MCP server parser, so that
+    many commands can run on one reusable client instead of a full CLI pipeline each.
+    Paginated operations are followed like the AWS CLI does, and --query is applied.
+
+    Args:
+        dynamodb_client: Valid boto3 DynamoDB client
+        command: AWS CLI command string starting with 'aws dynamodb'
+
+    Returns:
+        The API response without its response metadata
+
+    Raises:
+        ValueError: If the command is not a DynamoDB API operation
+        AwsApiMcpError: If the command cannot be parsed
+        ClientError: If the operation fails
+    """
+    ir_command = parse(command)
+    if ir_command.service_name != 'dynamodb' or ir_command.is_awscli_customization:
+        raise ValueError(f'Not a DynamoDB API command: {command}')
+
+    config_result = extract_pagination_config(ir_command.parameters)
+    operation_name = ir_command.operation_python_name
+    if dynamodb_client.can_paginate(operation_name):
+        response = build_result(
+            paginator=dynamodb_client.get_paginator(operation_name),
+            service_name=ir_command.service_name,
+            operation_name=ir_command.operation_name,
+            operation_parameters=config_result.parameters,
+            pagination_config=config_result.pagination_config,
+            client_side_filter=ir_command.client_side_filter,
+        )
+    else:
+        response = getattr(dynamodb_client, operation_name)(**config_result.parameters)
+        if ir_command.client_side_filter is not None:
+            response = {'Result': ir_command.client_side_filter.search(response)}
+
+    response.pop('ResponseMetadata', None)
+    return response
 
 
 def get_validation_result_transform_prompt() -> str:
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import pytest
@@ -12,6 +13,7 @@ from awslabs.dynamodb_mcp_server.server import (
     dynamodb_data_modeling,
     source_db_analyzer,
 )
+from botocore.exceptions import ClientError
 from hypothesis import given, settings
 from hypothesis import strategies as st
 from unittest.mock import mock_open, patch
@@ -693,7 +695,92 @@ async def test_execute_dynamodb_command_exception_handling():
         assert result == test_exception
 
 
+@pytest.mark.asyncio
+async def test_execute_dynamodb_command_with_client():
+    """Test that commands run on the given client, and API errors are returned as dicts."""
+    mock_client = object()
+    with (
+        patch('awslabs.dynamodb_mcp_server.server.call_aws') as mock_call_aws,
+        patch(
+            'awslabs.dynamodb_mcp_server.server.execute_dynamodb_cli_command'
+        ) as mock_execute_cli,
+    ):
+        mock_execute_cli.return_value = {'Items': []}
+        result = await _execute_dynamodb_command(
+            'aws dynamodb scan --table-name Users', 'http://localhost:8000', mock_client
+        )
+        assert result == {'Items': []}
+        mock_execute_cli.assert_called_once_with(
+            mock_client, 'aws dynamodb scan --table-name Users'
+        )
+
+        mock_execute_cli.side_effect = ClientError(
+            {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'missing'}}, 'Scan'
+        )
+        result = await _execute_dynamodb_command(
+            'aws dynamodb scan --table-name Users', 'http://localhost:8000', mock_client
+        )
+        assert result == {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'missing'}}
+        mock_call_aws.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_dynamodb_command_with_client_falls_back_to_cli():
+    """Test that commands the client path cannot parse run through call_aws."""
+    with patch('awslabs.dynamodb_mcp_server.server.call_aws') as mock_call_aws:
+        mock_call_aws.return_value = {'error': 'invalid operation'}
+
+        result = await _execute_dynamodb_command(
+            'aws dynamodb invalid-operation', 'http://localhost:8000', object()
+        )
+
+        assert result == {'error': 'invalid operation'}
+        args, _ = mock_call_aws.call_args
+        assert args[0] == 'aws dynamodb invalid-operation --endpoint-url http://localhost:8000'
+
+
 # Tests for execute_access_patterns function
+@pytest.mark.asyncio
+async def test_execute_access_patterns_reads_concurrently_writes_in_order():
+    """Test that consecutive reads overlap while writes run alone in order."""
+    events = []
+
+    async def execute(command, endpoint_url=None, dynamodb_client=None):
+        events.append(('start', command))
+        await asyncio.sleep(0.01)
+        events.append(('end', command))
+        return {'command': command}
+
+    commands = [
+        'aws dynamodb get-item --table-name A',
+        'aws dynamodb query --table-name A',
+        'aws dynamodb put-item --table-name A',
+        'aws dynamodb scan --table-name A',
+    ]
+    access_patterns = [{'pattern': f'AP{i}', 'implementation': c} for i, c in enumerate(commands)]
+    access_patterns.insert(1, {'pattern': 'AP-doc'})
+
+    with (
+        patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command', execute),
+        patch('awslabs.dynamodb_mcp_server.server._create_dynamodb_client'),
+        patch('builtins.open', mock_open()),
+    ):
+        result = await _execute_access_patterns(
+            '/tmp', access_patterns, endpoint_url='http://localhost:8000'
+        )
+
+    assert events[:2] == [('start', commands[0]), ('start', commands[1])]
+    assert events[4:] == [
+        ('start', commands[2]),
+        ('end', commands[2]),
+        ('start', commands[3]),
+        ('end', commands[3]),
+    ]
+    responses = result['validation_response']
+    assert responses[1] == {'pattern': 'AP-doc'}
+    assert [r['response']['command'] for r in responses if 'response' in r] == commands
+
+
 @pytest.mark.asyncio
 async def test_execute_access_patterns_success():
     """Test execute_access_patterns with successful execution."""
@@ -712,7 +799,10 @@ async def test_execute_access_patterns_success():
         },
     ]
 
-    with patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute:
+    with (
+        patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute,
+        patch('awslabs.dynamodb_mcp_server.server._create_dynamodb_client') as mock_client,
+    ):
         with patch('builtins.open', mock_open()) as mock_file:
             mock_execute.side_effect = [{'Items': []}, {'Item': {'id': {'S': '123'}}}]
 
@@ -720,6 +810,13 @@ async def test_execute_access_patterns_success():
                 '/tmp', access_patterns, endpoint_url='http://localhost:8000'
             )
 
+            mock_client.assert_called_once_with('http://localhost:8000')
+            mock_execute.assert_any_call(
+                'aws dynamodb scan --table-name Users',
+                'http://localhost:8000',
+                mock_client.return_value,
+            )
+
             assert 'validation_response' in result
             assert len(result['validation_response']) == 2
             assert result['validation_response'][0]['pattern_id'] == 'AP1'
@@ -794,6 +891,54 @@ async def test_dynamodb_data_model_validation_success():
                             assert 'Validation complete' in result
 
 
+@pytest.mark.asyncio
+async def test_dynamodb_data_model_validation_warm_pool(monkeypatch):
+    """Test that warm pool mode reuses the pooled endpoint and records phase timings."""
+    mock_data_model = {'tables': [], 'items': {}, 'access_patterns': []}
+    monkeypatch.setenv('DYNAMODB_VALIDATION_WARM_POOL', 'true')
+
+    with (
+        patch('os.path.exists', return_value=True),
+        patch('builtins.open', mock_open(read_data=json.dumps(mock_data_model))),
+        patch('awslabs.dynamodb_mcp_server.server.setup_dynamodb_local') as mock_setup,
+        patch('awslabs.dynamodb_mcp_server.server.DynamoDBLocalPool') as mock_pool,
+        patch(
+            'awslabs.dynamodb_mcp_server.server.create_validation_resources',
+            return_value={'tables': {}, 'items': {}, 'snapshot': 'restored'},
+        ) as mock_create,
+        patch('awslabs.dynamodb_mcp_server.server._execute_access_patterns') as mock_execute,
+    ):
+        mock_pool.get_endpoint.return_value = 'http://localhost:8000'
+
+        await dynamodb_data_model_validation(workspace_dir='/tmp')
+
+    mock_setup.assert_not_called()
+    mock_create.assert_called_once_with(mock_data_model, 'http://localhost:8000', warm_pool=True)
+    timings = mock_execute.call_args.kwargs['timings']
+    assert timings['snapshot'] == 'restored'
+    assert {'setup_seconds', 'resources_seconds'} <= set(timings)
+
+
+@pytest.mark.asyncio
+async def test_execute_access_patterns_records_timings(tmp_path):
+    """Test that the phase timings are saved with the validation results."""
+    timings = {'setup_seconds': 0.1}
+
+    with patch(
+        'awslabs.dynamodb_mcp_server.server._execute_dynamodb_command',
+        return_value={'Items': []},
+    ):
+        result = await _execute_access_patterns(
+            str(tmp_path),
+            [{'pattern': 'AP1', 'implementation': 'aws dynamodb scan --table-name Users'}],
+            timings=timings,
+        )
+
+    saved = json.loads((tmp_path / 'dynamodb_model_validation.json').read_text())
+    assert saved['timings'] == result['timings'] == timings
+    assert 'access_patterns_seconds' in timings
+
+
 @pytest.mark.asyncio
 async def test_dynamodb_data_model_validation_file_not_found():
     """Test dynamodb_data_model_validation when data model file doesn't exist."""
@@ -1197,7 +1342,10 @@ def test_property_access_pattern_response_format_consistency(
     }
 
     async def check_response_format():
-        with patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute:
+        with (
+            patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute,
+            patch('awslabs.dynamodb_mcp_server.server._create_dynamodb_client'),
+        ):
             with patch('builtins.open', mock_open()):
                 # Mock successful command execution
                 mock_execute.return_value = {'Items': [], 'Count': 0}
@@ -1291,7 +1439,10 @@ def test_property_error_response_format_consistency(
     }
 
     async def check_error_response_format():
-        with patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute:
+        with (
+            patch('awslabs.dynamodb_mcp_server.server._execute_dynamodb_command') as mock_execute,
+            patch('awslabs.dynamodb_mcp_server.server._create_dynamodb_client'),
+        ):
             with patch('builtins.open', mock_open()):
                 # Mock command execution returning an error (as exception object converted to string)
                 # This simulates what happens when _execute_dynamodb_command catches an exception
@@ -14,34 +14,130 @@
 
 """Connection management for Memcached MCP Server."""
 
+import asyncio
+import functools
 import os
+import socket
 import ssl
-from pymemcache.client.base import Client
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pymemcache.client.hash import HashClient
 from pymemcache.client.retrying import RetryingClient
 from pymemcache.exceptions import MemcacheError
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+DEFAULT_PORT = 11211
+
+
+class ShardedClient(HashClient):
+    """Consistent-hash client over memcached nodes with a connection pool per node.
+
+    Adds the server-wide commands missing from HashClient, returning the result of every node.
+    """
+
+    def stats(self, *args) -> Dict[str, Any]:
+        """Get the statistics of every node, by node."""
+        return {name: client.stats(*args) for name, client in self.clients.items()}
+
+    def version(self) -> Dict[str, Any]:
+        """Get the version of every node, by node."""
+        return {name: client.version() for name, client in self.clients.items()}
+
+
+def parse_server(spec: str) -> Tuple[str, int]:
+    """Parse a "host:port" server specification, defaulting to the memcached port."""
+    host, _, port = spec.strip().rpartition(':')
+    if not host:
+        return port, DEFAULT_PORT
+    return host, int(port)
+
+
+def parse_cluster_config(response: str) -> List[Tuple[str, int]]:
+    """Parse the node list of an ElastiCache auto-discovery response.
+
+    The response of "config get cluster" is a header line, a configuration version line and a
+    line of space-separated "hostname|ip|port" nodes, followed by END.
+
+    Raises:
+        MemcacheError: When the response has no node list
+    """
+    lines = response.split('\n')
+    if len(lines) < 3 or not lines[0].startswith(('CONFIG cluster', 'VALUE AmazonElastiCache')):
+        raise MemcacheError(f'Unexpected auto-discovery response: {response.strip()!r}')
+    nodes = []
+    for node in lines[2].split():
+        hostname, ip, port = node.split('|')
+        nodes.append((hostname or ip, int(port)))
+    return nodes
+
+
+def discover_nodes(
+    endpoint: Tuple[str, int], timeout: float, tls_context: Optional[ssl.SSLContext] = None
+) -> List[Tuple[str, int]]:
+    """Get the nodes of an ElastiCache cluster from its configuration endpoint.
+
+    Args:
+        endpoint: Host and port of the configuration endpoint
+        timeout: Connect and read timeout in seconds
+        tls_context: TLS context when in-transit encryption is enabled
+
+    Returns:
+        The host and port of every node
+
+    Raises:
+        MemcacheError: When the endpoint does not answer with a node list
+    """
+    sock: socket.socket = socket.create_connection(endpoint, timeout=timeout)
+    if tls_context:
+        sock = tls_context.wrap_socket(sock, server_hostname=endpoint[0])
+    response = b''
+    with sock:
+        # Engines before 1.4.14 only answer the legacy key lookup
+        for command in (b'config get cluster\r\n', b'get AmazonElastiCache:cluster\r\n'):
+            sock.sendall(command)
+            response = b''
+            while not response.endswith((b'END\r\n', b'ERROR\r\n')):
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                response += chunk
+            if not response.endswith(b'ERROR\r\n'):
+                break
+    return parse_cluster_config(response.decode())
 
 
 class MemcachedConnectionManager:
     """Manages connection to Memcached."""
 
     _client: Optional[RetryingClient] = None
+    _sharded_client: Optional[ShardedClient] = None
+    _executor: Optional[ThreadPoolExecutor] = None
+    _max_workers: int = 8
 
     @classmethod
     def get_connection(cls) -> RetryingClient:
         """Get or create a Memcached client connection.
 
+        The nodes are taken from the ElastiCache auto-discovery configuration endpoint in
+        MEMCACHED_CONFIG_ENDPOINT, else from the comma-separated MEMCACHED_SERVERS, else from
+        MEMCACHED_HOST and MEMCACHED_PORT. Keys are distributed over the nodes by consistent
+        hashing, with a pool of up to MEMCACHED_MAX_POOL_SIZE connections per node.
+
         Returns:
             RetryingClient: A Memcached client with retry capabilities
         """
         if cls._client is None:
             # Get configuration from environment
             host = os.getenv('MEMCACHED_HOST', '127.0.0.1')
-            port = int(os.getenv('MEMCACHED_PORT', '11211'))
+            port = int(os.getenv('MEMCACHED_PORT', str(DEFAULT_PORT)))
+            servers = os.getenv('MEMCACHED_SERVERS')
+            config_endpoint = os.getenv('MEMCACHED_CONFIG_ENDPOINT')
             timeout = float(os.getenv('MEMCACHED_TIMEOUT', '1'))
             connect_timeout = float(os.getenv('MEMCACHED_CONNECT_TIMEOUT', '5'))
             retry_timeout = float(os.getenv('MEMCACHED_RETRY_TIMEOUT', '1'))
             max_retries = int(os.getenv('MEMCACHED_MAX_RETRIES', '3'))
+            max_pool_size = int(os.getenv('MEMCACHED_MAX_POOL_SIZE', '8'))
 
             # SSL/TLS configuration
             use_tls = os.getenv('MEMCACHED_USE_TLS', 'false').lower() == 'true'
@@ -65,21 +161,33 @@ class MemcachedConnectionManager:
                 if tls_cert_path and tls_key_path:
                     tls_context.load_cert_chain(tls_cert_path, tls_key_path)
 
-            # Create base client
+            # Resolve the nodes
+            if config_endpoint:
+                nodes = discover_nodes(parse_server(config_endpoint), connect_timeout, tls_context)
+            elif servers:
+                nodes = [parse_server(server) for server in servers.split(',') if server.strip()]
+            else:
+                nodes = [(host, port)]
+
+            # Create consistent-hash client with a connection pool per node
             client_kwargs: Dict[str, Any] = {
-                'server': (host, port),
+                'servers': nodes,
                 'timeout': timeout,
                 'connect_timeout': connect_timeout,
                 'no_delay': True,  # Disable Nagle's algorithm
+                'use_pooling': True,
+                'max_pool_size': max_pool_size,
             }
             if tls_context:
                 client_kwargs['tls_context'] = tls_context
 
-            base_client = Client(**client_kwargs)
+            cls._sharded_client = ShardedClient(**client_kwargs)
+            # Every worker thread holds at most one connection of each node at a time
+            cls._max_workers = max_pool_size * len(nodes)
 
             # Wrap with retry capabilities
             cls._client = RetryingClient(
-                base_client,
+                cls._sharded_client,
                 attempts=max_retries,
                 retry_delay=int(retry_timeout),
                 retry_for=[MemcacheError],
@@ -87,9 +195,49 @@ class MemcachedConnectionManager:
 
         return cls._client
 
+    @classmethod
+    async def run(cls, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking client call on a worker thread without blocking the event loop.
+
+        Args:
+            func: The client method to call
+            *args: Positional arguments of the call
+            **kwargs: Keyword arguments of the call
+
+        Returns:
+            The result of the call
+        """
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=cls._max_workers, thread_name_prefix='memcached'
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls._executor, functools.partial(func, *args, **kwargs))
+
+    @classmethod
+    def group_by_node(cls, keys: Sequence[str]) -> List[List[str]]:
+        """Group keys by the node owning them, to send one multi-key command per node.
+
+        Args:
+            keys: The keys to group
+
+        Returns:
+            The groups of keys, a single group when there is only one node
+        """
+        if cls._sharded_client is None or len(cls._sharded_client.clients) < 2:
+            return [list(keys)]
+        groups: Dict[Optional[str], List[str]] = defaultdict(list)
+        for key in keys:
+            groups[cls._sharded_client.hasher.get_node(key)].append(key)
+        return list(groups.values())
+
     @classmethod
     def close_connection(cls) -> None:
         """Close the Memcached client connection."""
         if cls._client is not None:
             cls._client.close()
             cls._client = None
+        cls._sharded_client = None
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False)
+            cls._executor = None
@@ -14,6 +14,7 @@
 
 """Cache operations for Memcached MCP Server."""
 
+import asyncio
 from awslabs.memcached_mcp_server.common.connection import MemcachedConnectionManager
 from awslabs.memcached_mcp_server.common.server import mcp
 from awslabs.memcached_mcp_server.context import Context
@@ -33,7 +34,7 @@ async def cache_get(key: str) -> str:
     """
     try:
         client = MemcachedConnectionManager.get_connection()
-        result = client.get(key)
+        result = await MemcachedConnectionManager.run(client.get, key)
         if result is None:
             return f"Key '{key}' not found"
         return str(result)
@@ -53,7 +54,7 @@ async def cache_gets(key: str) -> str:
     """
     try:
         client = MemcachedConnectionManager.get_connection()
-        result = client.gets(key)
+        result = await MemcachedConnectionManager.run(client.gets, key)
         if result is None:
             return f"Key '{key}' not found"
         value, cas = result
@@ -74,7 +75,11 @@ async def cache_get_many(keys: List[str]) -> str:
     """
     try:
         client = MemcachedConnectionManager.get_connection()
-        result = client.get_many(keys)
+        groups = MemcachedConnectionManager.group_by_node(keys)
+        results = await asyncio.gather(
+            *[MemcachedConnectionManager.run(client.get_many, group) for group in groups]
+        )
+        result = {key: value for values in results for key, value in values.items()}
         if not result:
             return 'No keys found'
         return str(result)
@@ -112,7 +117,7 @@ async def cache_set(key: str, value: Any, expire: Optional[int] = None) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        client.set(key, value, expire=expire)
+        await MemcachedConnectionManager.run(client.set, key, value, expire=expire)
         expiry_msg = f' with {expire}s expiry' if expire else ''
         return f"Successfully set key '{key}'{expiry_msg}"
     except MemcacheError as e:
@@ -137,7 +142,7 @@ async def cache_cas(key: str, value: Any, cas: int, expire: Optional[int] = None
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        if client.cas(key, value, cas, expire=expire):
+        if await MemcachedConnectionManager.run(client.cas, key, value, cas, expire=expire):
             expiry_msg = f' with {expire}s expiry' if expire else ''
             return f"Successfully set key '{key}' using CAS{expiry_msg}"
         return f"CAS operation failed for key '{key}' (value changed)"
@@ -161,7 +166,16 @@ async def cache_set_many(mapping: Dict[str, Any], expire: Optional[int] = None)
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        failed = client.set_many(mapping, expire=expire)
+        groups = MemcachedConnectionManager.group_by_node(list(mapping))
+        results = await asyncio.gather(
+            *[
+                MemcachedConnectionManager.run(
+                    client.set_many, {key: mapping[key] for key in group}, expire=expire
+                )
+                for group in groups
+            ]
+        )
+        failed = [key for keys in results for key in keys]
         if not failed:
             expiry_msg = f' with {expire}s expiry' if expire else ''
             return f'Successfully set {len(mapping)} keys{expiry_msg}'
@@ -201,7 +215,7 @@ async def cache_add(key: str, value: Any, expire: Optional[int] = None) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        if client.add(key, value, expire=expire):
+        if await MemcachedConnectionManager.run(client.add, key, value, expire=expire):
             expiry_msg = f' with {expire}s expiry' if expire else ''
             return f"Successfully added key '{key}'{expiry_msg}"
         return f"Key '{key}' already exists"
@@ -226,7 +240,7 @@ async def cache_replace(key: str, value: Any, expire: Optional[int] = None) -> s
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        if client.replace(key, value, expire=expire):
+        if await MemcachedConnectionManager.run(client.replace, key, value, expire=expire):
             expiry_msg = f' with {expire}s expiry' if expire else ''
             return f"Successfully replaced key '{key}'{expiry_msg}"
         return f"Key '{key}' not found"
@@ -250,7 +264,7 @@ async def cache_append(key: str, value: str) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        if client.append(key, value):
+        if await MemcachedConnectionManager.run(client.append, key, value):
             return f"Successfully appended to key '{key}'"
         return f"Key '{key}' not found or not a string"
     except MemcacheError as e:
@@ -273,7 +287,7 @@ async def cache_prepend(key: str, value: str) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        if client.prepend(key, value):
+        if await MemcachedConnectionManager.run(client.prepend, key, value):
             return f"Successfully prepended to key '{key}'"
         return f"Key '{key}' not found or not a string"
     except MemcacheError as e:
@@ -295,7 +309,7 @@ async def cache_delete(key: str) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        if client.delete(key):
+        if await MemcachedConnectionManager.run(client.delete, key):
             return f"Successfully deleted key '{key}'"
         return f"Key '{key}' not found"
     except MemcacheError as e:
@@ -317,7 +331,7 @@ async def cache_delete_many(keys: List[str]) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        failed = client.delete_many(keys)
+        failed = await MemcachedConnectionManager.run(client.delete_many, keys)
         if not failed:
             return f'Successfully deleted {len(keys)} keys'
         return f'Failed to delete keys: {failed}'
@@ -354,7 +368,7 @@ async def cache_incr(key: str, value: int = 1) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        result = client.incr(key, value)
+        result = await MemcachedConnectionManager.run(client.incr, key, value)
         if result is None:
             return f"Key '{key}' not found or not a counter"
         return str(result)
@@ -378,7 +392,7 @@ async def cache_decr(key: str, value: int = 1) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        result = client.decr(key, value)
+        result = await MemcachedConnectionManager.run(client.decr, key, value)
         if result is None:
             return f"Key '{key}' not found or not a counter"
         return str(result)
@@ -402,7 +416,7 @@ async def cache_touch(key: str, expire: int) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        if client.touch(key, expire):
+        if await MemcachedConnectionManager.run(client.touch, key, expire):
             return f"Successfully updated expiry for key '{key}' to {expire}s"
         return f"Key '{key}' not found"
     except MemcacheError as e:
@@ -411,17 +425,17 @@ async def cache_touch(key: str, expire: int) -> str:
 
 @mcp.tool()
 async def cache_stats(args: Optional[List[str]] = None) -> str:
-    """Get cache statistics.
+    """Get cache statistics of every node.
 
     Args:
         args: Optional list of stats to retrieve
 
     Returns:
-        Statistics or error message
+        Statistics by node or error message
     """
     try:
         client = MemcachedConnectionManager.get_connection()
-        result = client.stats(*args if args else [])
+        result = await MemcachedConnectionManager.run(client.stats, *(args or []))
         return str(result)
     except MemcacheError as e:
         return f'Error getting stats: {str(e)}'
@@ -442,7 +456,7 @@ async def cache_flush_all(delay: int = 0) -> str:
 
     try:
         client = MemcachedConnectionManager.get_connection()
-        client.flush_all(delay=delay)
+        await MemcachedConnectionManager.run(client.flush_all, delay=delay)
         delay_msg = f' with {delay}s delay' if delay else ''
         return f'Successfully flushed all cache entries{delay_msg}'
     except MemcacheError as e:
@@ -451,14 +465,14 @@ async def cache_flush_all(delay: int = 0) -> str:
 
 @mcp.tool()
 async def cache_quit() -> str:
-    """Close the connection to the cache server.
+    """Close the connections to all cache nodes.
 
     Returns:
         Success message or error message
     """
     try:
         client = MemcachedConnectionManager.get_connection()
-        client.quit()
+        await MemcachedConnectionManager.run(client.quit)
         MemcachedConnectionManager.close_connection()
         return 'Successfully closed connection'
     except MemcacheError as e:
@@ -467,14 +481,14 @@ async def cache_quit() -> str:
 
 @mcp.tool()
 async def cache_version() -> str:
-    """Get the version of the cache server.
+    """Get the version of every cache node.
 
     Returns:
-        Version string or error message
+        Versions by node or error message
     """
     try:
         client = MemcachedConnectionManager.get_connection()
-        result = client.version()
+        result = await MemcachedConnectionManager.run(client.version)
         return str(result)
     except MemcacheError as e:
         return f'Error getting version: {str(e)}'
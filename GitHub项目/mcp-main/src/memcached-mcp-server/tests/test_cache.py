@@ -123,6 +123,32 @@ async def test_cache_get_many_success(mock_client):
     mock_client.get_many.assert_called_once_with(['key1', 'key2'])
 
 
+@pytest.mark.asyncio
+async def test_cache_get_many_fans_out_by_node(mock_client):
+    """Test that get_many sends one request per node and merges the results."""
+    mock_client.get_many.side_effect = lambda keys: {key: key.upper() for key in keys}
+    with patch.object(
+        cache.MemcachedConnectionManager, 'group_by_node', return_value=[['a', 'c'], ['b']]
+    ):
+        result = await cache.cache_get_many(['a', 'b', 'c'])
+    assert result == "{'a': 'A', 'c': 'C', 'b': 'B'}"
+    assert [call.args[0] for call in mock_client.get_many.call_args_list] == [['a', 'c'], ['b']]
+
+
+@pytest.mark.asyncio
+async def test_cache_set_many_fans_out_by_node(mock_client):
+    """Test that set_many sends one request per node and merges the failed keys."""
+    mock_client.set_many.side_effect = lambda mapping, expire=None: [
+        key for key in mapping if key == 'c'
+    ]
+    with patch.object(
+        cache.MemcachedConnectionManager, 'group_by_node', return_value=[['a', 'c'], ['b']]
+    ):
+        result = await cache.cache_set_many({'a': 1, 'b': 2, 'c': 3}, expire=10)
+    assert result == "Failed to set keys: ['c']"
+    mock_client.set_many.assert_any_call({'b': 2}, expire=10)
+
+
 @pytest.mark.asyncio
 async def test_cache_get_many_empty(mock_client):
     """Test get_many operation with no results."""
@@ -1,9 +1,17 @@
 """Unit tests for connection management."""
 
+import asyncio
 import os
 import ssl
+import threading
 import unittest
-from awslabs.memcached_mcp_server.common.connection import MemcachedConnectionManager
+from awslabs.memcached_mcp_server.common.connection import (
+    MemcachedConnectionManager,
+    ShardedClient,
+    discover_nodes,
+    parse_cluster_config,
+    parse_server,
+)
 from pymemcache.exceptions import MemcacheError
 from unittest.mock import MagicMock, patch
 
@@ -14,12 +22,15 @@ class TestMemcachedConnectionManager(unittest.TestCase):
     def setUp(self):
         """Reset the connection before each test."""
         MemcachedConnectionManager._client = None
+        MemcachedConnectionManager._sharded_client = None
 
     def tearDown(self):
         """Clean up after each test."""
         MemcachedConnectionManager._client = None
+        MemcachedConnectionManager._sharded_client = None
+        MemcachedConnectionManager._max_workers = 8
 
-    @patch('awslabs.memcached_mcp_server.common.connection.Client')
+    @patch('awslabs.memcached_mcp_server.common.connection.ShardedClient')
     @patch('awslabs.memcached_mcp_server.common.connection.RetryingClient')
     def test_get_connection_default_values(self, mock_retrying_client, mock_client):
         """Test get_connection with default environment values."""
@@ -32,10 +43,12 @@ class TestMemcachedConnectionManager(unittest.TestCase):
 
         # Verify Client constructor called with default values
         mock_client.assert_called_once_with(
-            server=('127.0.0.1', 11211),
+            servers=[('127.0.0.1', 11211)],
             timeout=1.0,
             connect_timeout=5.0,
             no_delay=True,
+            use_pooling=True,
+            max_pool_size=8,
         )
 
         # Verify RetryingClient constructor called with default values
@@ -48,7 +61,7 @@ class TestMemcachedConnectionManager(unittest.TestCase):
         # Verify same instance returned
         self.assertEqual(client, mock_instance)
 
-    @patch('awslabs.memcached_mcp_server.common.connection.Client')
+    @patch('awslabs.memcached_mcp_server.common.connection.ShardedClient')
     @patch('awslabs.memcached_mcp_server.common.connection.RetryingClient')
     def test_get_connection_custom_values(self, mock_retrying_client, mock_client):
         """Test get_connection with custom environment values."""
@@ -68,10 +81,12 @@ class TestMemcachedConnectionManager(unittest.TestCase):
 
             # Verify Client constructor called with custom values
             mock_client.assert_called_once_with(
-                server=('localhost', 11212),
+                servers=[('localhost', 11212)],
                 timeout=2.0,
                 connect_timeout=10.0,
                 no_delay=True,
+                use_pooling=True,
+                max_pool_size=8,
             )
 
             # Verify RetryingClient constructor called with custom values
@@ -81,7 +96,7 @@ class TestMemcachedConnectionManager(unittest.TestCase):
             self.assertEqual(kwargs['retry_delay'], 3.0)
             self.assertEqual(kwargs['retry_for'], [MemcacheError])
 
-    @patch('awslabs.memcached_mcp_server.common.connection.Client')
+    @patch('awslabs.memcached_mcp_server.common.connection.ShardedClient')
     @patch('awslabs.memcached_mcp_server.common.connection.RetryingClient')
     def test_get_connection_singleton(self, mock_retrying_client, mock_client):
         """Test get_connection returns same instance on multiple calls."""
@@ -122,7 +137,7 @@ class TestMemcachedConnectionManager(unittest.TestCase):
         MemcachedConnectionManager.close_connection()
         self.assertIsNone(MemcachedConnectionManager._client)
 
-    @patch('awslabs.memcached_mcp_server.common.connection.Client')
+    @patch('awslabs.memcached_mcp_server.common.connection.ShardedClient')
     @patch('awslabs.memcached_mcp_server.common.connection.ssl.create_default_context')
     def test_get_connection_with_tls_default(self, mock_ssl_context, mock_client):
         """Test get_connection with TLS enabled using default settings."""
@@ -143,14 +158,16 @@ class TestMemcachedConnectionManager(unittest.TestCase):
 
             # Verify client created with SSL context
             mock_client.assert_called_once_with(
-                server=('127.0.0.1', 11211),
+                servers=[('127.0.0.1', 11211)],
                 timeout=1.0,
                 connect_timeout=5.0,
                 no_delay=True,
+                use_pooling=True,
+                max_pool_size=8,
                 tls_context=mock_context,
             )
 
-    @patch('awslabs.memcached_mcp_server.common.connection.Client')
+    @patch('awslabs.memcached_mcp_server.common.connection.ShardedClient')
     @patch('awslabs.memcached_mcp_server.common.connection.ssl.create_default_context')
     def test_get_connection_with_tls_custom_certs(self, mock_ssl_context, mock_client):
         """Test get_connection with TLS enabled using custom certificates."""
@@ -176,14 +193,16 @@ class TestMemcachedConnectionManager(unittest.TestCase):
 
             # Verify client created with SSL context
             mock_client.assert_called_once_with(
-                server=('127.0.0.1', 11211),
+                servers=[('127.0.0.1', 11211)],
                 timeout=1.0,
                 connect_timeout=5.0,
                 no_delay=True,
+                use_pooling=True,
+                max_pool_size=8,
                 tls_context=mock_context,
             )
 
-    @patch('awslabs.memcached_mcp_server.common.connection.Client')
+    @patch('awslabs.memcached_mcp_server.common.connection.ShardedClient')
     @patch('awslabs.memcached_mcp_server.common.connection.ssl.create_default_context')
     def test_get_connection_with_tls_no_verify(self, mock_ssl_context, mock_client):
         """Test get_connection with TLS enabled but verification disabled."""
@@ -203,13 +222,135 @@ class TestMemcachedConnectionManager(unittest.TestCase):
 
             # Verify client created with SSL context
             mock_client.assert_called_once_with(
-                server=('127.0.0.1', 11211),
+                servers=[('127.0.0.1', 11211)],
                 timeout=1.0,
                 connect_timeout=5.0,
                 no_delay=True,
+                use_pooling=True,
+                max_pool_size=8,
                 tls_context=mock_context,
             )
 
+    @patch('awslabs.memcached_mcp_server.common.connection.ShardedClient')
+    def test_get_connection_with_servers(self, mock_client):
+        """Test get_connection with a list of nodes."""
+        env_vars = {
+            'MEMCACHED_SERVERS': 'node1:11211, node2:11212,node3',
+            'MEMCACHED_MAX_POOL_SIZE': '4',
+        }
+
+        with patch.dict(os.environ, env_vars):
+            MemcachedConnectionManager.get_connection()
+
+        _, kwargs = mock_client.call_args
+        self.assertEqual(kwargs['servers'], [('node1', 11211), ('node2', 11212), ('node3', 11211)])
+        self.assertEqual(kwargs['max_pool_size'], 4)
+        self.assertEqual(MemcachedConnectionManager._max_workers, 12)
+
+    @patch('awslabs.memcached_mcp_server.common.connection.discover_nodes')
+    @patch('awslabs.memcached_mcp_server.common.connection.ShardedClient')
+    def test_get_connection_with_config_endpoint(self, mock_client, mock_discover):
+        """Test get_connection with an ElastiCache auto-discovery configuration endpoint."""
+        mock_discover.return_value = [('node1', 11211), ('node2', 11211)]
+        env_vars = {
+            'MEMCACHED_CONFIG_ENDPOINT': 'cluster.cfg.cache.amazonaws.com:11211',
+            'MEMCACHED_SERVERS': 'ignored:11211',
+        }
+
+        with patch.dict(os.environ, env_vars):
+            MemcachedConnectionManager.get_connection()
+
+        mock_discover.assert_called_once_with(
+            ('cluster.cfg.cache.amazonaws.com', 11211), 5.0, None
+        )
+        _, kwargs = mock_client.call_args
+        self.assertEqual(kwargs['servers'], [('node1', 11211), ('node2', 11211)])
+
+    def test_group_by_node(self):
+        """Test that keys are grouped by the node the consistent hash maps them to."""
+        sharded = ShardedClient([('node1', 11211), ('node2', 11211), ('node3', 11211)])
+        MemcachedConnectionManager._sharded_client = sharded
+        keys = [f'key{i}' for i in range(30)]
+
+        groups = MemcachedConnectionManager.group_by_node(keys)
+
+        self.assertGreater(len(groups), 1)
+        self.assertEqual(sorted(key for group in groups for key in group), sorted(keys))
+        for group in groups:
+            self.assertEqual(len({sharded.hasher.get_node(key) for key in group}), 1)
+
+    def test_group_by_node_single_node(self):
+        """Test that all keys form one group without multiple nodes."""
+        self.assertEqual(MemcachedConnectionManager.group_by_node(['a', 'b']), [['a', 'b']])
+
+    def test_run_offloads_to_worker_thread(self):
+        """Test that blocking calls run on a worker thread."""
+        result = asyncio.run(
+            MemcachedConnectionManager.run(lambda x: (x, threading.current_thread().name), 1)
+        )
+
+        self.assertEqual(result[0], 1)
+        self.assertTrue(result[1].startswith('memcached'))
+        MemcachedConnectionManager.close_connection()
+        self.assertIsNone(MemcachedConnectionManager._executor)
+
+    def test_sharded_client_stats_and_version(self):
+        """Test that server-wide commands return the result of every node."""
+        sharded = ShardedClient([('node1', 11211), ('node2', 11211)])
+        for name, client in sharded.clients.items():
+            sharded.clients[name] = MagicMock()
+            sharded.clients[name].stats.return_value = {'curr_items': 1}
+            sharded.clients[name].version.return_value = b'1.6.22'
+
+        self.assertEqual(
+            sharded.stats('items'),
+            {'node1:11211': {'curr_items': 1}, 'node2:11211': {'curr_items': 1}},
+        )
+        self.assertEqual(sharded.version(), {'node1:11211': b'1.6.22', 'node2:11211': b'1.6.22'})
+        sharded.clients['node1:11211'].stats.assert_called_once_with('items')
+
+
+class TestAutoDiscovery(unittest.TestCase):
+    """Test cases for ElastiCache auto-discovery."""
+
+    RESPONSE = (
+        'CONFIG cluster 0 136\r\n12\n'
+        'node1.cache.amazonaws.com|10.0.0.1|11211 |10.0.0.2|11211\n\r\nEND\r\n'
+    )
+
+    def test_parse_server(self):
+        """Test parsing of server specifications."""
+        self.assertEqual(parse_server('node1:11212'), ('node1', 11212))
+        self.assertEqual(parse_server(' node1 '), ('node1', 11211))
+
+    def test_parse_cluster_config(self):
+        """Test that host names are preferred over IP addresses."""
+        self.assertEqual(
+            parse_cluster_config(self.RESPONSE),
+            [('node1.cache.amazonaws.com', 11211), ('10.0.0.2', 11211)],
+        )
+        with self.assertRaises(MemcacheError):
+            parse_cluster_config('ERROR\r\n')
+
+    @patch('awslabs.memcached_mcp_server.common.connection.socket.create_connection')
+    def test_discover_nodes_legacy_fallback(self, mock_connect):
+        """Test that engines without config get cluster are asked with the legacy key."""
+        sock = mock_connect.return_value
+        sock.__enter__.return_value = sock
+        sock.recv.side_effect = [
+            b'ERROR\r\n',
+            self.RESPONSE.replace('CONFIG cluster', 'VALUE AmazonElastiCache:cluster').encode(),
+        ]
+
+        nodes = discover_nodes(('cfg', 11211), 5.0)
+
+        self.assertEqual(len(nodes), 2)
+        self.assertEqual(
+            [call.args[0] for call in sock.sendall.call_args_list],
+            [b'config get cluster\r\n', b'get AmazonElastiCache:cluster\r\n'],
+        )
+        mock_connect.assert_called_once_with(('cfg', 11211), timeout=5.0)
+
 
 if __name__ == '__main__':
     unittest.main()
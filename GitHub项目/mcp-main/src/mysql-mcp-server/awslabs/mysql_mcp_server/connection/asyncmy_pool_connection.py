@@ -21,9 +21,83 @@ It supports both Aurora MySQL and RDS Mysql/MariaDB instances via direct connect
 import boto3
 import json
 from asyncmy import Pool, create_pool
+from asyncmy.constants import FIELD_TYPE
+from asyncmy.cursors import SSCursor
 from awslabs.mysql_mcp_server.connection.abstract_db_connection import AbstractDBConnection
 from loguru import logger
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Column types asyncmy already decodes into int, float or str values
+PLAIN_FIELD_TYPES = {
+    FIELD_TYPE.TINY,
+    FIELD_TYPE.SHORT,
+    FIELD_TYPE.LONG,
+    FIELD_TYPE.INT24,
+    FIELD_TYPE.LONGLONG,
+    FIELD_TYPE.YEAR,
+    FIELD_TYPE.FLOAT,
+    FIELD_TYPE.DOUBLE,
+    FIELD_TYPE.VARCHAR,
+    FIELD_TYPE.VAR_STRING,
+    FIELD_TYPE.STRING,
+    FIELD_TYPE.ENUM,
+    FIELD_TYPE.SET,
+    FIELD_TYPE.JSON,
+}
+
+# Column types decoded into Decimal, date, datetime or timedelta values, returned as strings
+STRING_FIELD_TYPES = {
+    FIELD_TYPE.DECIMAL,
+    FIELD_TYPE.NEWDECIMAL,
+    FIELD_TYPE.DATE,
+    FIELD_TYPE.NEWDATE,
+    FIELD_TYPE.DATETIME,
+    FIELD_TYPE.TIMESTAMP,
+    FIELD_TYPE.TIME,
+}
+
+# Values of these types are returned as they are, all others are converted to strings
+PLAIN_VALUE_TYPES = (str, bool, int, float, bytes)
+
+
+def _plain_value(value: Any) -> Any:
+    """Return a value of any type as a plain value."""
+    return value if value is None or isinstance(value, PLAIN_VALUE_TYPES) else str(value)
+
+
+def _string_value(value: Any) -> Optional[str]:
+    """Return a value as a string, keeping NULL as None."""
+    return None if value is None else str(value)
+
+
+def column_converter(type_code: Any) -> Optional[Callable[[Any], Any]]:
+    """Pick the converter for a column once from its cursor.description type code.
+
+    Returns None for columns whose values are returned as they are.
+    """
+    if type_code in PLAIN_FIELD_TYPES:
+        return None
+    if type_code in STRING_FIELD_TYPES:
+        return _string_value
+    return _plain_value
+
+
+def row_builder(description: Sequence[Sequence[Any]]) -> Callable[[Sequence[Any]], Dict[str, Any]]:
+    """Build a function turning result tuples into the {column: value} rows returned by run_query."""
+    names = [desc[0] for desc in description]
+    converters = [column_converter(desc[1]) for desc in description]
+
+    if not any(converters):
+        return lambda row: dict(zip(names, row))
+
+    def make_row(row: Sequence[Any]) -> Dict[str, Any]:
+        return {
+            name: value if convert is None else convert(value)
+            for name, convert, value in zip(names, converters, row)
+        }
+
+    return make_row
 
 
 class AsyncmyPoolConnection(AbstractDBConnection):
@@ -47,6 +121,9 @@ class AsyncmyPoolConnection(AbstractDBConnection):
         region: str,
         min_size: int = 1,
         max_size: int = 10,
+        max_result_rows: Optional[int] = None,
+        max_result_bytes: Optional[int] = None,
+        fetch_size: int = 1000,
     ):
         """Initialize a new DB connection pool.
 
@@ -59,6 +136,10 @@ class AsyncmyPoolConnection(AbstractDBConnection):
             region: AWS region for Secrets Manager
             min_size: Minimum number of connections in the pool
             max_size: Maximum number of connections in the pool
+            max_result_rows: Maximum number of rows returned by execute_query_rows, None for no limit
+            max_result_bytes: Maximum JSON size of the rows returned by execute_query_rows,
+                None for no limit
+            fetch_size: Number of rows fetched per round trip from unbuffered cursors
         """
         super().__init__(readonly)
         self.hostname = hostname
@@ -67,6 +148,9 @@ class AsyncmyPoolConnection(AbstractDBConnection):
         self.max_size = max_size
         self.pool: Optional[Pool] = None
         self.database = database
+        self.max_result_rows = max_result_rows
+        self.max_result_bytes = max_result_bytes
+        self.fetch_size = fetch_size
 
         # Get credentials from Secrets Manager
         logger.info(f'Retrieving credentials from Secrets Manager: {secret_arn}')
@@ -89,28 +173,12 @@ class AsyncmyPoolConnection(AbstractDBConnection):
                 password=self.password,
                 db=self.database,
                 autocommit=True,
+                # Read-only mode is set once when each pooled connection is opened
+                init_command='SET SESSION TRANSACTION READ ONLY' if self._readonly else None,
             )
 
             logger.info('Connection pool initialized successfully')
 
-            if self._readonly:
-                await self._set_all_connections_readonly()
-
-    async def _set_all_connections_readonly(self):
-        """Set all connections in the pool to read-only mode."""
-        if self.pool is None:
-            logger.warning('Connection pool is not initialized, cannot set read-only mode')
-            return
-
-        try:
-            async with self.pool.acquire() as conn:
-                async with conn.cursor() as cursor:
-                    await cursor.execute('SET SESSION TRANSACTION READ ONLY;')
-                    logger.info('Successfully set connection to read-only mode')
-        except Exception as e:
-            logger.warning(f'Failed to set connections to read-only mode: {str(e)}')
-            logger.warning('Continuing without setting read-only mode')
-
     async def _get_connection(self):
         """Get a database connection from the pool."""
         if self.pool is None:
@@ -128,8 +196,6 @@ class AsyncmyPoolConnection(AbstractDBConnection):
         try:
             async with await self._get_connection() as conn:
                 async with conn.cursor() as cursor:
-                    if self._readonly:
-                        await cursor.execute('SET TRANSACTION READ ONLY')
                     # Execute the query
                     if parameters:
                         params = list(_convert_parameters(self, parameters).values())
@@ -179,6 +245,73 @@ class AsyncmyPoolConnection(AbstractDBConnection):
             logger.error(f'Database connection error: {str(e)}')
             raise e
 
+    async def execute_query_rows(
+        self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Execute a SQL query and return its rows as {column: value} dictionaries.
+
+        Unlike execute_query, the result is streamed from an unbuffered cursor in batches of
+        fetch_size rows and rows are built directly, with a converter picked once per column
+        from cursor.description. Only the rows within max_result_rows and max_result_bytes are
+        converted and kept in memory, the rest of the result is only counted.
+
+        Args:
+            sql: The SQL query to execute
+            parameters: Optional parameters for the query
+
+        Returns:
+            Tuple of the rows and the total number of rows in the result
+        """
+        try:
+            async with await self._get_connection() as conn:
+                async with conn.cursor(SSCursor) as cursor:
+                    if parameters:
+                        params = list(_convert_parameters(self, parameters).values())
+                        await cursor.execute(sql, params)
+                    else:
+                        await cursor.execute(sql)
+
+                    if not cursor.description:
+                        # No results (e.g., for INSERT, UPDATE, etc.)
+                        return [], 0
+
+                    return await self._fetch_rows(cursor)
+
+        except Exception as e:
+            logger.error(f'Database connection error: {str(e)}')
+            raise e
+
+    async def _fetch_rows(self, cursor: Any) -> Tuple[List[Dict[str, Any]], int]:
+        """Fetch rows in batches until the result is exhausted.
+
+        An unbuffered result has to be read to the end before the connection can be reused, so
+        rows past the row or byte limit are still fetched to count them, but not converted.
+        """
+        make_row = row_builder(cursor.description)
+        rows = []
+        total = 0
+        size = 0
+        truncated = False
+        while True:
+            batch = await cursor.fetchmany(self.fetch_size)
+            if not batch:
+                return rows, total
+            total += len(batch)
+            if truncated:
+                continue
+
+            for values in batch:
+                if self.max_result_rows is not None and len(rows) >= self.max_result_rows:
+                    truncated = True
+                    break
+                row = make_row(values)
+                if self.max_result_bytes is not None:
+                    size += len(json.dumps(row, default=str))
+                    if size > self.max_result_bytes:
+                        truncated = True
+                        break
+                rows.append(row)
+
     async def close(self) -> None:
         """Close all connections in the pool."""
         if self.pool is not None:
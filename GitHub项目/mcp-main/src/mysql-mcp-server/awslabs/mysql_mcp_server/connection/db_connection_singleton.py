@@ -33,6 +33,8 @@ class DBConnectionSingleton:
         resource_arn: str | None = None,
         hostname: str | None = None,
         port: int | None = None,
+        max_result_rows: int | None = None,
+        max_result_bytes: int | None = None,
     ):
         """Initialize a new DB connection singleton using one of the two connection types.
 
@@ -47,6 +49,10 @@ class DBConnectionSingleton:
             resource_arn: The ARN of the RDS cluster (for using RDS Data API)
             hostname: Database hostname (for using direct MySQL connection)
             port: Database port (for using direct MySQL connection)
+            max_result_rows: Maximum number of rows returned per query (for using direct MySQL
+                connection)
+            max_result_bytes: Maximum JSON size of the rows returned per query (for using direct
+                MySQL connection)
             is_test: Whether this is a test connection (default: False)
         """
         if resource_arn:
@@ -81,6 +87,8 @@ class DBConnectionSingleton:
                 database=database,
                 region=region,
                 readonly=readonly,
+                max_result_rows=max_result_rows,
+                max_result_bytes=max_result_bytes,
             )
 
     @classmethod
@@ -94,6 +102,8 @@ class DBConnectionSingleton:
         resource_arn: str | None = None,
         hostname: str | None = None,
         port: int | None = None,
+        max_result_rows: int | None = None,
+        max_result_bytes: int | None = None,
     ):
         """Initialize the singleton instance if it doesn't exist.
 
@@ -101,6 +111,10 @@ class DBConnectionSingleton:
             resource_arn: The ARN of the RDS cluster (for using RDS Data API)
             hostname: Database hostname (for using direct MySQL/MariaDB connection)
             port: Database port (for using direct MySQL/MariaDB connection)
+            max_result_rows: Maximum number of rows returned per query (for using direct
+                MySQL/MariaDB connection)
+            max_result_bytes: Maximum JSON size of the rows returned per query (for using direct
+                MySQL/MariaDB connection)
             secret_arn: The ARN of the secret containing credentials
             database: The name of the database to connect to
             region: The AWS region where the RDS instance is located
@@ -117,6 +131,8 @@ class DBConnectionSingleton:
                 hostname=hostname,
                 port=port,
                 is_test=is_test,
+                max_result_rows=max_result_rows,
+                max_result_bytes=max_result_bytes,
             )
 
     @classmethod
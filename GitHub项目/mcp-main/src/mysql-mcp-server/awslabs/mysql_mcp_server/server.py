@@ -48,6 +48,14 @@ class DummyCtx:
         # Do nothing
         pass
 
+    async def warning(self, message):
+        """Ignore the given warning message.
+
+        Args:
+            message: The warning message
+        """
+        pass
+
 
 def extract_cell(cell: dict):
     """Extracts the scalar or array value from a single cell."""
@@ -138,11 +146,24 @@ async def run_query(
     try:
         logger.info(f'run_query: readonly:{db_connection.readonly_query}, SQL:{sql}')
 
-        # Execute the query using the abstract connection interface
-        response = await db_connection.execute_query(sql, query_parameters)
+        if isinstance(db_connection, AsyncmyPoolConnection):
+            # asyncmy streams the result and builds the final rows directly
+            rows, total = await db_connection.execute_query_rows(sql, query_parameters)
+            if total > len(rows):
+                message = (
+                    f'Query result truncated to {len(rows)} of {total} rows by the configured '
+                    f'max_result_rows:{db_connection.max_result_rows} or '
+                    f'max_result_bytes:{db_connection.max_result_bytes}'
+                )
+                logger.warning(message)
+                await ctx.warning(message)
+        else:
+            # Execute the query using the abstract connection interface
+            response = await db_connection.execute_query(sql, query_parameters)
+            rows = parse_execute_response(response)
 
         logger.success('run_query successfully executed query:{}', sql)
-        return parse_execute_response(response)
+        return rows
     except ClientError as e:
         logger.exception(client_error_code_key)
         await ctx.error(
@@ -235,6 +256,16 @@ def main():
     parser.add_argument(
         '--readonly', required=True, help='Enforce NL to SQL to only allow readonly sql statement'
     )
+    parser.add_argument(
+        '--max_result_rows',
+        type=int,
+        help='Maximum number of rows returned by run_query over asyncmy (default: no limit)',
+    )
+    parser.add_argument(
+        '--max_result_bytes',
+        type=int,
+        help='Maximum size in bytes of the rows returned by run_query over asyncmy (default: no limit)',
+    )
     args = parser.parse_args()
 
     # Validate connection parameters
@@ -294,6 +325,8 @@ def main():
                 readonly=args.readonly.lower(),
                 hostname=args.hostname,
                 port=args.port,
+                max_result_rows=args.max_result_rows,
+                max_result_bytes=args.max_result_bytes,
             )
     except Exception as e:
         logger.exception(f'Failed to create MySQL connection: {str(e)}')
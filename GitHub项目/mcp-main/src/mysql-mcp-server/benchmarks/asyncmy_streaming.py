@@ -0,0 +1,163 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of buffered and streamed asyncmy query results on a million-row table.
+
+The table is simulated by a cursor generating rows in memory, so the benchmark measures the
+client-side cost of fetching and converting rows without a database. Memory is traced with
+tracemalloc, which also slows every run down by a similar factor. With the package installed,
+run it with:
+
+    python benchmarks/asyncmy_streaming.py [--rows 1000000] [--max_result_rows 1000]
+"""
+
+import argparse
+import asyncio
+import datetime
+import decimal
+import time
+import tracemalloc
+from asyncmy.constants import FIELD_TYPE
+from awslabs.mysql_mcp_server.connection.asyncmy_pool_connection import AsyncmyPoolConnection
+from awslabs.mysql_mcp_server.server import parse_execute_response
+from unittest.mock import MagicMock, patch
+
+
+DESCRIPTION = [
+    ('id', FIELD_TYPE.LONGLONG),
+    ('name', FIELD_TYPE.VAR_STRING),
+    ('price', FIELD_TYPE.NEWDECIMAL),
+    ('score', FIELD_TYPE.DOUBLE),
+    ('created', FIELD_TYPE.DATETIME),
+]
+
+CREATED = datetime.datetime(2024, 1, 1)
+
+
+class SimulatedCursor:
+    """Cursor over a simulated table, generating each row when it is fetched."""
+
+    def __init__(self, row_count):
+        """Initialize the cursor for a table of row_count rows."""
+        self.row_count = row_count
+        self.description = None
+        self._position = 0
+
+    async def __aenter__(self):
+        """Enter the cursor context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Exit the cursor context."""
+        pass
+
+    async def execute(self, sql, params=None):
+        """Start a new result over the simulated table."""
+        self.description = DESCRIPTION
+        self._position = 0
+
+    def _rows(self, count):
+        start = self._position
+        end = min(self.row_count, start + count)
+        self._position = end
+        return [
+            (i, f'name-{i}', decimal.Decimal(i) / 100, i / 3, CREATED) for i in range(start, end)
+        ]
+
+    async def fetchall(self):
+        """Return all remaining rows."""
+        return self._rows(self.row_count)
+
+    async def fetchmany(self, size):
+        """Return the next batch of at most size rows."""
+        return self._rows(size)
+
+
+class _Acquire:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+def _connection(row_count, max_result_rows):
+    """Create an AsyncmyPoolConnection over a simulated table."""
+    fake_conn = MagicMock()
+    fake_conn.cursor = lambda *args: SimulatedCursor(row_count)
+    with patch(
+        'awslabs.mysql_mcp_server.connection.asyncmy_pool_connection._get_credentials_from_secret',
+        return_value=('user', 'pass'),
+    ):
+        conn = AsyncmyPoolConnection(
+            hostname='benchmark',
+            port=3306,
+            database='benchmark',
+            readonly=True,
+            secret_arn='benchmark',
+            region='us-east-1',
+            max_result_rows=max_result_rows,
+        )
+    conn.pool = MagicMock()
+    conn.pool.acquire = lambda: _Acquire(fake_conn)
+    return conn
+
+
+async def _buffered(conn):
+    response = await conn.execute_query('SELECT * FROM benchmark')
+    rows = parse_execute_response(response)
+    return len(rows), len(rows)
+
+
+async def _streamed(conn):
+    rows, total = await conn.execute_query_rows('SELECT * FROM benchmark')
+    return len(rows), total
+
+
+def _measure(name, run, conn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    returned, total = asyncio.run(run(conn))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f'{name:<40} {elapsed:8.2f} s {peak / 2**20:10.1f} MiB peak '
+        f'{returned:>9} of {total} rows returned'
+    )
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=(__doc__ or '').strip().split('\n')[0])
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Rows in the simulated table')
+    parser.add_argument(
+        '--max_result_rows', type=int, default=1000, help='Row limit of the limited run'
+    )
+    args = parser.parse_args()
+
+    _measure('fetchall + typed cells', _buffered, _connection(args.rows, None))
+    _measure('fetchmany + column converters', _streamed, _connection(args.rows, None))
+    _measure(
+        f'fetchmany, max_result_rows={args.max_result_rows}',
+        _streamed,
+        _connection(args.rows, args.max_result_rows),
+    )
+
+
+if __name__ == '__main__':
+    main()
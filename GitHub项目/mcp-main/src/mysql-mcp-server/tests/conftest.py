@@ -237,6 +237,14 @@ class DummyCtx:
         # Do nothing because MCP ctx.error doesn't throw exception
         pass
 
+    async def warning(self, message):
+        """Mock MCP ctx.warning with the given message.
+
+        Args:
+            message: The warning message
+        """
+        pass
+
 
 @pytest.fixture
 def mock_DBConnection():
@@ -14,8 +14,12 @@
 
 """Tests for the asyncmy connector functionality."""
 
+import datetime
+import decimal
 import json
 import pytest
+from asyncmy.constants import FIELD_TYPE
+from asyncmy.cursors import SSCursor
 from awslabs.mysql_mcp_server.connection.asyncmy_pool_connection import (
     AsyncmyPoolConnection,
     _get_credentials_from_secret,
@@ -105,21 +109,17 @@ async def test_execute_query_returns_results():
 
 
 @pytest.mark.asyncio
-async def test_readonly_mode_set():
-    """Test that _set_all_connections_readonly executes the correct SQL command."""
-    fake_cursor = AsyncMock()
-    fake_cursor.description = None
-    fake_cursor.execute = AsyncMock()
-
-    fake_conn = AsyncMock()
-    fake_conn.cursor = MagicMock(return_value=AsyncContextManagerMock(fake_cursor))
-
-    fake_pool = AsyncMock()
-    fake_pool.acquire = MagicMock(return_value=AsyncContextManagerMock(fake_conn))
-
-    with patch(
-        'awslabs.mysql_mcp_server.connection.asyncmy_pool_connection._get_credentials_from_secret',
-        return_value=('user', 'pass'),
+async def test_readonly_mode_set_once_per_connection():
+    """Test that read-only mode is set by the init command of every pooled connection."""
+    with (
+        patch(
+            'awslabs.mysql_mcp_server.connection.asyncmy_pool_connection.create_pool',
+            new_callable=AsyncMock,
+        ) as mock_create_pool,
+        patch(
+            'awslabs.mysql_mcp_server.connection.asyncmy_pool_connection._get_credentials_from_secret',
+            return_value=('user', 'pass'),
+        ),
     ):
         conn = AsyncmyPoolConnection(
             hostname='localhost',
@@ -129,10 +129,11 @@ async def test_readonly_mode_set():
             secret_arn='arn:test',
             region='us-east-1',
         )
-        conn.pool = fake_pool
-        await conn._set_all_connections_readonly()
+        await conn.initialize_pool()
 
-        fake_cursor.execute.assert_awaited_with('SET SESSION TRANSACTION READ ONLY;')
+        assert mock_create_pool.await_args is not None
+        init_command = mock_create_pool.await_args.kwargs['init_command']
+        assert init_command == 'SET SESSION TRANSACTION READ ONLY'
 
 
 @pytest.mark.asyncio
@@ -251,8 +252,8 @@ def test_get_credentials_from_secret():
 
 
 @pytest.mark.asyncio
-async def test_initialize_pool_calls_set_readonly_when_flag_true():
-    """initialize_pool triggers _set_all_connections_readonly when readonly=True."""
+async def test_initialize_pool_without_init_command_when_not_readonly():
+    """initialize_pool sets no init command when readonly=False."""
     with (
         patch(
             'awslabs.mysql_mcp_server.connection.asyncmy_pool_connection.create_pool',
@@ -263,65 +264,17 @@ async def test_initialize_pool_calls_set_readonly_when_flag_true():
             return_value=('user', 'pass'),
         ),
     ):
-        mock_pool = AsyncMock()
-        mock_create_pool.return_value = mock_pool
         conn = AsyncmyPoolConnection(
             hostname='localhost',
             port=3306,
             database='db',
-            readonly=True,
+            readonly=False,
             secret_arn='arn:test',
             region='us-east-1',
         )
-        conn._set_all_connections_readonly = AsyncMock()
         await conn.initialize_pool()
-        conn._set_all_connections_readonly.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_set_all_connections_readonly_no_pool_returns():
-    """_set_all_connections_readonly returns early when pool is None."""
-    with patch(
-        'awslabs.mysql_mcp_server.connection.asyncmy_pool_connection._get_credentials_from_secret',
-        return_value=('user', 'pass'),
-    ):
-        conn = AsyncmyPoolConnection(
-            hostname='h',
-            port=3306,
-            database='db',
-            readonly=True,
-            secret_arn='arn:test',
-            region='us-east-1',
-        )
-        conn.pool = None
-        await conn._set_all_connections_readonly()  # should not raise
-
-
-@pytest.mark.asyncio
-async def test_set_all_connections_readonly_handles_exception():
-    """_set_all_connections_readonly swallows exceptions and continues."""
-    fake_cursor = AsyncMock()
-    fake_cursor.execute = AsyncMock(side_effect=Exception('readonly fail'))
-    fake_conn = AsyncMock()
-    fake_conn.cursor = MagicMock(return_value=AsyncContextManagerMock(fake_cursor))
-    fake_pool = AsyncMock()
-    fake_pool.acquire = MagicMock(return_value=AsyncContextManagerMock(fake_conn))
-
-    with patch(
-        'awslabs.mysql_mcp_server.connection.asyncmy_pool_connection._get_credentials_from_secret',
-        return_value=('user', 'pass'),
-    ):
-        conn = AsyncmyPoolConnection(
-            hostname='h',
-            port=3306,
-            database='db',
-            readonly=True,
-            secret_arn='arn:test',
-            region='us-east-1',
-        )
-        conn.pool = fake_pool
-        await conn._set_all_connections_readonly()
-        fake_cursor.execute.assert_awaited()
+        assert mock_create_pool.await_args is not None
+        assert mock_create_pool.await_args.kwargs['init_command'] is None
 
 
 @pytest.mark.asyncio
@@ -398,7 +351,10 @@ async def test_execute_query_readonly_and_parameter_types_mapped_boolean_as_long
         ]
         result = await conn.execute_query('SELECT * FROM t WHERE a=%s', parameters=params)
 
-        fake_cursor.execute.assert_any_await('SET TRANSACTION READ ONLY')
+        # Read-only mode is set per connection, not per query
+        fake_cursor.execute.assert_awaited_once_with(
+            'SELECT * FROM t WHERE a=%s', ['a', 1, 2.5, False, b'x', None]
+        )
         assert result['columnMetadata'] == [
             {'label': 'n'},
             {'label': 's'},
@@ -516,3 +472,132 @@ def test_get_credentials_from_secret_boto_exception_wrapped():
         mock_session.return_value.client.side_effect = Exception('boto error')
         with pytest.raises(ValueError, match='Failed to retrieve credentials'):
             _get_credentials_from_secret('arn:test', 'us-east-1')
+
+
+class FakeSSCursor:
+    """Fake unbuffered cursor serving rows through fetchmany."""
+
+    def __init__(self, description, rows):
+        """Initialize the fake cursor.
+
+        Args:
+            description: The cursor.description of the result
+            rows: The result rows
+        """
+        self.description = description
+        self._rows = rows
+        self._position = 0
+        self.execute = AsyncMock()
+        self.fetch_sizes = []
+
+    async def fetchmany(self, size):
+        """Return the next batch of at most size rows."""
+        self.fetch_sizes.append(size)
+        batch = self._rows[self._position : self._position + size]
+        self._position += len(batch)
+        return batch
+
+
+def _streaming_connection(cursor, **kwargs):
+    """Create an AsyncmyPoolConnection whose pool hands out the given cursor."""
+    fake_conn = AsyncMock()
+    fake_conn.cursor = MagicMock(return_value=AsyncContextManagerMock(cursor))
+    fake_pool = AsyncMock()
+    fake_pool.acquire = MagicMock(return_value=AsyncContextManagerMock(fake_conn))
+
+    with patch(
+        'awslabs.mysql_mcp_server.connection.asyncmy_pool_connection._get_credentials_from_secret',
+        return_value=('user', 'pass'),
+    ):
+        conn = AsyncmyPoolConnection(
+            hostname='h',
+            port=3306,
+            database='db',
+            readonly=True,
+            secret_arn='arn:test',
+            region='us-east-1',
+            **kwargs,
+        )
+    conn.pool = fake_pool
+    return conn, fake_conn
+
+
+@pytest.mark.asyncio
+async def test_execute_query_rows_converts_columns_by_type():
+    """execute_query_rows streams batches and converts values by their column type."""
+    description = [
+        ('id', FIELD_TYPE.LONGLONG),
+        ('name', FIELD_TYPE.VAR_STRING),
+        ('price', FIELD_TYPE.NEWDECIMAL),
+        ('created', FIELD_TYPE.DATETIME),
+        ('flags', FIELD_TYPE.BIT),
+    ]
+    rows = [
+        (1, 'a', decimal.Decimal('1.50'), datetime.datetime(2024, 1, 2, 3, 4, 5), b'\x01'),
+        (2, None, None, None, None),
+        (3, 'c', decimal.Decimal('0'), datetime.datetime(2024, 1, 3), b'\x00'),
+    ]
+    cursor = FakeSSCursor(description, rows)
+    conn, fake_conn = _streaming_connection(cursor, fetch_size=2)
+
+    result, total = await conn.execute_query_rows(
+        'SELECT * FROM t WHERE id > %s',
+        [{'name': 'id', 'value': {'longValue': 0}}],
+    )
+
+    fake_conn.cursor.assert_called_once_with(SSCursor)
+    cursor.execute.assert_awaited_once_with('SELECT * FROM t WHERE id > %s', [0])
+    assert cursor.fetch_sizes == [2, 2, 2]
+    assert total == 3
+    assert result == [
+        {
+            'id': 1,
+            'name': 'a',
+            'price': '1.50',
+            'created': '2024-01-02 03:04:05',
+            'flags': b'\x01',
+        },
+        {'id': 2, 'name': None, 'price': None, 'created': None, 'flags': None},
+        {
+            'id': 3,
+            'name': 'c',
+            'price': '0',
+            'created': '2024-01-03 00:00:00',
+            'flags': b'\x00',
+        },
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_query_rows_row_limit_reports_total():
+    """execute_query_rows stops converting at max_result_rows but counts the whole result."""
+    cursor = FakeSSCursor([('id', FIELD_TYPE.LONG)], [(i,) for i in range(10)])
+    conn, _ = _streaming_connection(cursor, max_result_rows=3, fetch_size=4)
+
+    result, total = await conn.execute_query_rows('SELECT id FROM t')
+
+    assert result == [{'id': 0}, {'id': 1}, {'id': 2}]
+    assert total == 10
+
+
+@pytest.mark.asyncio
+async def test_execute_query_rows_byte_limit():
+    """execute_query_rows stops before the JSON size of the rows exceeds max_result_bytes."""
+    cursor = FakeSSCursor([('name', FIELD_TYPE.VARCHAR)], [('x' * 10,)] * 5)
+    row_size = len(json.dumps({'name': 'x' * 10}))
+    conn, _ = _streaming_connection(cursor, max_result_bytes=row_size * 2 + 1)
+
+    result, total = await conn.execute_query_rows('SELECT name FROM t')
+
+    assert len(result) == 2
+    assert total == 5
+
+
+@pytest.mark.asyncio
+async def test_execute_query_rows_without_result():
+    """execute_query_rows returns no rows for statements without a result set."""
+    cursor = FakeSSCursor(None, [])
+    conn, _ = _streaming_connection(cursor)
+
+    assert await conn.execute_query_rows('UPDATE t SET a=1') == ([], 0)
+    assert cursor.fetch_sizes == []
@@ -26,6 +26,7 @@ from awslabs.mysql_mcp_server.server import (
     client_error_code_key,
     get_table_schema,
     main,
+    parse_execute_response,
     run_query,
     unexpected_error_key,
     write_query_prohibited_key,
@@ -849,16 +850,15 @@ async def test_get_table_schema_asyncmy_connection():
 
     # Replace the real asyncmy connection with a mock to avoid actual DB connection
     mock_asyncmy_connection = Mock(spec=AsyncmyPoolConnection)
-    mock_asyncmy_connection.execute_query = AsyncMock(
-        return_value=get_mock_normal_query_response()
-    )
+    rows = parse_execute_response(get_mock_normal_query_response())
+    mock_asyncmy_connection.execute_query_rows = AsyncMock(return_value=(rows, len(rows)))
     DBConnectionSingleton._instance._db_connection = mock_asyncmy_connection  # type: ignore
 
     ctx = DummyCtx()
     tool_response = await get_table_schema(table_name='table_name', database_name='mysql', ctx=ctx)
 
     # Verify SQL was converted from :name to %s for asyncmy
-    call_args = mock_asyncmy_connection.execute_query.call_args
+    call_args = mock_asyncmy_connection.execute_query_rows.call_args
     sql_used = call_args[0][0]  # First positional argument is the SQL
 
     assert '%s' in sql_used
@@ -876,6 +876,25 @@ async def test_get_table_schema_asyncmy_connection():
     validate_normal_query_response(column_records)
 
 
+@pytest.mark.asyncio
+async def test_run_query_asyncmy_reports_truncation():
+    """Test that run_query returns asyncmy rows directly and warns when they were truncated."""
+    mock_asyncmy_connection = Mock(spec=AsyncmyPoolConnection)
+    mock_asyncmy_connection.readonly_query = True
+    mock_asyncmy_connection.max_result_rows = 2
+    mock_asyncmy_connection.max_result_bytes = None
+    rows = [{'id': 1}, {'id': 2}]
+    mock_asyncmy_connection.execute_query_rows = AsyncMock(return_value=(rows, 5))
+    ctx = AsyncMock()
+
+    tool_response = await run_query('SELECT id FROM t', ctx, mock_asyncmy_connection)
+
+    assert tool_response == rows
+    mock_asyncmy_connection.execute_query.assert_not_called()
+    ctx.warning.assert_awaited_once()
+    assert 'truncated to 2 of 5 rows' in ctx.warning.await_args[0][0]
+
+
 if __name__ == '__main__':
     DBConnectionSingleton.initialize(
         'mock', 'mock', 'mock', resource_arn='mock', readonly=True, is_test=True
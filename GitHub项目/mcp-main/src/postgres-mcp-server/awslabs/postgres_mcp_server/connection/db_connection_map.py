@@ -14,12 +14,15 @@
 
 """Database connection map for postgres MCP Server."""
 
+import asyncio
+import inspect
 import json
 import threading
 from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
+from collections import OrderedDict
 from enum import Enum
 from loguru import logger
-from typing import List
+from typing import Any, List, Optional, Set, Tuple
 
 
 class DatabaseType(str, Enum):
@@ -38,12 +41,23 @@ class ConnectionMethod(str, Enum):
 
 
 class DBConnectionMap:
-    """Manages Postgres DB connection map."""
+    """Manages Postgres DB connection map.
 
-    def __init__(self):
-        """Initialize the connection map."""
-        self.map = {}
+    Connections are kept in least recently used order. When max_connections is set, the least
+    recently used connections are evicted and closed once more connections are added, so idle
+    pools of clusters that are no longer queried do not hold database connections open.
+    """
+
+    def __init__(self, max_connections: Optional[int] = None):
+        """Initialize the connection map.
+
+        Args:
+            max_connections: Maximum number of cached connections, or None for no limit
+        """
+        self.map: 'OrderedDict[Tuple, AbstractDBConnection]' = OrderedDict()
+        self.max_connections = max_connections
         self._lock = threading.Lock()
+        self._closing: Set[asyncio.Task] = set()
 
     def get(
         self,
@@ -60,8 +74,12 @@ class DBConnectionMap:
         if not database:
             raise ValueError('database cannot be None or empty')
 
+        key = (method, cluster_identifier, db_endpoint, database, port)
         with self._lock:
-            return self.map.get((method, cluster_identifier, db_endpoint, database, port))
+            conn = self.map.get(key)
+            if conn is not None:
+                self.map.move_to_end(key)
+            return conn
 
     def set(
         self,
@@ -79,8 +97,17 @@ class DBConnectionMap:
         if not conn:
             raise ValueError('conn cannot be None')
 
+        key = (method, cluster_identifier, db_endpoint, database, port)
+        evicted = []
         with self._lock:
-            self.map[(method, cluster_identifier, db_endpoint, database, port)] = conn
+            self.map[key] = conn
+            self.map.move_to_end(key)
+            while self.max_connections is not None and len(self.map) > self.max_connections:
+                evicted.append(self.map.popitem(last=False))
+
+        for evicted_key, evicted_conn in evicted:
+            logger.info(f'Evict least recently used connection {evicted_key}')
+            self._close(evicted_key, evicted_conn)
 
     def remove(
         self,
@@ -102,27 +129,67 @@ class DBConnectionMap:
                     f'Try to remove a non-existing connection. {method} {cluster_identifier} {db_endpoint} {database} {port}'
                 )
 
+    def items(self) -> List[Tuple[dict, AbstractDBConnection]]:
+        """Get a snapshot of all connection keys and connections, least recently used first."""
+        with self._lock:
+            return [(self._key_entry(key), conn) for key, conn in self.map.items()]
+
     def get_keys_json(self) -> str:
         """Get all connection keys as JSON string."""
         entries: List[dict] = []
         with self._lock:
             for key in self.map.keys():
-                entry = {
-                    'connection_method': key[0],
-                    'cluster_identifier': key[1],
-                    'db_endpoint': key[2],
-                    'database': key[3],
-                    'port': key[4],
-                }
-                entries.append(entry)
+                entries.append(self._key_entry(key))
         return json.dumps(entries, indent=2)
 
     def close_all(self) -> None:
         """Close all connections and clear the map."""
         with self._lock:
             for key, conn in self.map.items():
-                try:
-                    conn.close()
-                except Exception as e:
-                    logger.warning(f'Failed to close connection {key}: {e}')
+                self._close(key, conn)
             self.map.clear()
+
+    @staticmethod
+    def _key_entry(key: Tuple) -> dict:
+        """Convert a connection key to its JSON entry."""
+        return {
+            'connection_method': key[0],
+            'cluster_identifier': key[1],
+            'db_endpoint': key[2],
+            'database': key[3],
+            'port': key[4],
+        }
+
+    def _close(self, key: Tuple, conn: Any) -> None:
+        """Close a connection without blocking the caller.
+
+        An async close is scheduled on the running event loop, or run to completion when no
+        event loop is running.
+        """
+        try:
+            result = conn.close()
+            if not inspect.isawaitable(result):
+                return
+
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(_await(result))
+                return
+
+            task = loop.create_task(_await(result))
+            self._closing.add(task)
+            task.add_done_callback(lambda t: self._closed(key, t))
+        except Exception as e:
+            logger.warning(f'Failed to close connection {key}: {e}')
+
+    def _closed(self, key: Tuple, task: asyncio.Task) -> None:
+        """Log the failure of a scheduled close."""
+        self._closing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f'Failed to close connection {key}: {task.exception()}')
+
+
+async def _await(awaitable: Any) -> Any:
+    """Await an awaitable, so that it can be run as a task."""
+    return await awaitable
@@ -21,14 +21,37 @@ parameters (host, port, database, user, password) or via AWS Secrets Manager.
 
 import boto3
 import json
+import re
+import uuid
 from aiorwlock import RWLock
 from awslabs.postgres_mcp_server import __user_agent__
 from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
+from awslabs.postgres_mcp_server.mutable_sql_detector import detect_mutating_keywords
 from botocore.config import Config
 from datetime import datetime, timedelta
 from loguru import logger
 from psycopg_pool import AsyncConnectionPool
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# Statements that can be declared as a server-side cursor
+CURSOR_QUERY_PATTERN = re.compile(r'^[\s(]*(SELECT|WITH|VALUES|TABLE)\b', re.IGNORECASE)
+
+# Values of these types are returned as they are, all others are converted to strings
+PLAIN_VALUE_TYPES = (str, bool, int, float, bytes)
+
+
+def plain_dict_row(cursor: Any) -> Callable[[Sequence[Any]], Dict[str, Any]]:
+    """Psycopg row factory building the final {column: value} rows returned by run_query."""
+    names = [column.name for column in cursor.description or []]
+
+    def make_row(values: Sequence[Any]) -> Dict[str, Any]:
+        return {
+            name: value if value is None or isinstance(value, PLAIN_VALUE_TYPES) else str(value)
+            for name, value in zip(names, values)
+        }
+
+    return make_row
 
 
 class PsycopgPoolConnection(AbstractDBConnection):
@@ -56,6 +79,9 @@ class PsycopgPoolConnection(AbstractDBConnection):
         min_size: int = 1,
         max_size: int = 10,
         is_test: bool = False,
+        max_result_rows: Optional[int] = None,
+        max_result_bytes: Optional[int] = None,
+        fetch_size: int = 1000,
     ):
         """Initialize a new DB connection pool.
 
@@ -68,10 +94,14 @@ class PsycopgPoolConnection(AbstractDBConnection):
             db_user: Database username
             region: AWS region for Secrets Manager
             is_iam_auth: Whether to use IAM authentication
-            pool_expiry_min: Pool expiry time in minutes
+            pool_expiry_min: Maximum lifetime of each pooled connection in minutes
             min_size: Minimum number of connections in the pool
             max_size: Maximum number of connections in the pool
             is_test: Whether this is a test connection
+            max_result_rows: Maximum number of rows returned by execute_query_rows, None for no limit
+            max_result_bytes: Maximum JSON size of the rows returned by execute_query_rows,
+                None for no limit
+            fetch_size: Number of rows fetched per round trip from server-side cursors
         """
         super().__init__(readonly)
         self.host = host
@@ -85,16 +115,21 @@ class PsycopgPoolConnection(AbstractDBConnection):
         self.pool_expiry_min = pool_expiry_min
         self.secret_arn = secret_arn
         self.is_test = is_test
+        self.max_result_rows = max_result_rows
+        self.max_result_bytes = max_result_bytes
+        self.fetch_size = fetch_size
         self.pool: Optional['AsyncConnectionPool[Any]'] = None
         self.rw_lock = RWLock()
         self.created_time = datetime.now()
+        self.password: Optional[str] = None
+        self.credentials_time = datetime.now()
 
         if is_iam_auth:
             # if db_user is set, then it is IAM auth scenario and iam_auth_token must be set
             if not db_user:
                 raise ValueError('db_user must be set when is_iam_auth is True')
 
-            # set pool expiry before IAM auth token expiry of 15 minutes
+            # rotate connections before IAM auth token expiry of 15 minutes
             self.pool_expiry_min = 14
             logger.info(f'Use IAM auth for user: {db_user}')
 
@@ -118,45 +153,62 @@ class PsycopgPoolConnection(AbstractDBConnection):
                 f'is_iam_auth:{self.is_iam_auth}\n'
             )
 
-            if self.is_iam_auth:
-                logger.info(f'Retrieving IAM auth token for {self.user}')
-                password = self.get_iam_auth_token()
-            else:
-                logger.info(f'Retrieving credentials from Secrets Manager: {self.secret_arn}')
-                self.user, password = self._get_credentials_from_secret(
-                    self.secret_arn, self.region, self.is_test
-                )
+            if not self.is_iam_auth:
+                self._refresh_credentials()
 
             self.created_time = datetime.now()
-            self.conninfo = f'host={self.host} port={self.port} dbname={self.database} user={self.user} password={password}'
+            self.conninfo = (
+                f'host={self.host} port={self.port} dbname={self.database} user={self.user}'
+            )
+            # Each connection is replaced in the background once it reaches max_lifetime, and
+            # its replacement is opened with the credentials from _connection_kwargs, so the
+            # pool never has to be recreated as a whole
             self.pool = AsyncConnectionPool(
-                self.conninfo, min_size=self.min_size, max_size=self.max_size, open=False
+                self.conninfo,
+                kwargs=self._connection_kwargs,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                max_lifetime=self.pool_expiry_min * 60,
+                check=AsyncConnectionPool.check_connection,
+                open=False,
             )
 
             # wait up to 30 seconds to fill the pool with connections
             await self.pool.open(True, 30)
             logger.info('Connection pool initialized successfully')
 
+    async def _connection_kwargs(self) -> Dict[str, Any]:
+        """Return the credentials for a new pooled connection.
+
+        With IAM authentication a fresh auth token is generated for every connection, so
+        connections opened to replace expired ones never use an expired token.
+        """
+        if self.is_iam_auth:
+            logger.info(f'Retrieving IAM auth token for {self.user}')
+            return {'password': self.get_iam_auth_token()}
+
+        # pick up rotated secrets once the cached credentials are as old as a connection can be
+        if datetime.now() - self.credentials_time >= timedelta(minutes=self.pool_expiry_min):
+            self._refresh_credentials()
+        return {'user': self.user, 'password': self.password}
+
+    def _refresh_credentials(self) -> None:
+        """Retrieve the database user and password from Secrets Manager."""
+        logger.info(f'Retrieving credentials from Secrets Manager: {self.secret_arn}')
+        self.user, self.password = self._get_credentials_from_secret(
+            self.secret_arn, self.region, self.is_test
+        )
+        self.credentials_time = datetime.now()
+
     async def _get_connection(self):
         """Get a database connection from the pool."""
-        await self.check_expiry()
+        await self.initialize_pool()
 
         async with self.rw_lock.reader_lock:
             if self.pool is None:
                 raise ValueError('Failed to initialize connection pool')
             return self.pool.connection(timeout=15.0)
 
-    async def check_expiry(self):
-        """Check and handle pool expiry."""
-        async with self.rw_lock.reader_lock:
-            if self.pool and datetime.now() - self.created_time < timedelta(
-                minutes=self.pool_expiry_min
-            ):
-                return
-
-        await self.close()
-        await self.initialize_pool()
-
     async def execute_query(
         self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
@@ -219,6 +271,79 @@ class PsycopgPoolConnection(AbstractDBConnection):
             logger.error(f'Database connection error: {str(e)}')
             raise e
 
+    async def execute_query_rows(
+        self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """Execute a SQL query and return its rows as {column: value} dictionaries.
+
+        Unlike execute_query, rows are built by a psycopg row factory in a single pass without
+        the intermediate typed cell dictionaries. Queries are read through a server-side cursor
+        in batches of fetch_size rows, so only the rows within max_result_rows and
+        max_result_bytes are transferred and kept in memory.
+
+        Args:
+            sql: The SQL query to execute
+            parameters: Optional parameters for the query
+
+        Returns:
+            Tuple of the rows and whether they were truncated by the row or byte limit
+        """
+        try:
+            async with await self._get_connection() as conn:
+                async with conn.transaction():
+                    if self.readonly_query:
+                        logger.info('SET TRANSACTION READ ONLY')
+                        await conn.execute('SET TRANSACTION READ ONLY')
+
+                    # Statements other than queries, e.g. INSERT ... RETURNING, cannot be
+                    # declared as a cursor and run on a client-side cursor instead
+                    if CURSOR_QUERY_PATTERN.match(sql) and not detect_mutating_keywords(sql):
+                        cursor = conn.cursor(
+                            name=f'mcp_{uuid.uuid4().hex}', row_factory=plain_dict_row
+                        )
+                    else:
+                        cursor = conn.cursor(row_factory=plain_dict_row)
+
+                    async with cursor:
+                        if parameters:
+                            params = self._convert_parameters(parameters)
+                            await cursor.execute(sql, params)
+                        else:
+                            await cursor.execute(sql)
+
+                        if not cursor.description:
+                            # No results (e.g., for INSERT, UPDATE, etc.)
+                            return [], False
+
+                        return await self._fetch_rows(cursor)
+
+        except Exception as e:
+            logger.error(f'Database connection error: {str(e)}')
+            raise e
+
+    async def _fetch_rows(self, cursor: Any) -> Tuple[List[Dict[str, Any]], bool]:
+        """Fetch rows in batches until the result or the row or byte limit is exhausted."""
+        rows = []
+        size = 0
+        while True:
+            batch_size = self.fetch_size
+            if self.max_result_rows is not None:
+                # Fetch one row past the limit to tell whether the result was truncated
+                batch_size = min(batch_size, self.max_result_rows + 1 - len(rows))
+
+            batch = await cursor.fetchmany(batch_size)
+            if not batch:
+                return rows, False
+
+            for row in batch:
+                if self.max_result_rows is not None and len(rows) >= self.max_result_rows:
+                    return rows, True
+                if self.max_result_bytes is not None:
+                    size += len(json.dumps(row, default=str))
+                    if size > self.max_result_bytes:
+                        return rows, True
+                rows.append(row)
+
     def _convert_parameters(self, parameters: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Transform structured parameter format to psycopg's native parameter format."""
         result = {}
@@ -310,19 +435,40 @@ class PsycopgPoolConnection(AbstractDBConnection):
             logger.error(f'Connection health check failed: {str(e)}')
             return False
 
-    async def get_pool_stats(self) -> Dict[str, int]:
-        """Get current connection pool statistics."""
+    async def get_pool_stats(self) -> Dict[str, Any]:
+        """Get current connection pool statistics.
+
+        Returns:
+            Pool sizes, the connections in use, the number of checkouts and checkouts per second
+            since the pool was opened, the average checkout wait time, the clients currently
+            waiting, and the connections opened (including rotations) and lost
+        """
         async with self.rw_lock.reader_lock:
             if not hasattr(self, 'pool') or self.pool is None:
                 return {'size': 0, 'min_size': self.min_size, 'max_size': self.max_size, 'idle': 0}
 
-            # Access pool attributes safely
-            size = getattr(self.pool, 'size', 0)
-            min_size = getattr(self.pool, 'min_size', self.min_size)
-            max_size = getattr(self.pool, 'max_size', self.max_size)
-            idle = getattr(self.pool, 'idle', 0)
-
-            return {'size': size, 'min_size': min_size, 'max_size': max_size, 'idle': idle}
+            stats = self.pool.get_stats()
+            size = stats.get('pool_size', 0)
+            idle = stats.get('pool_available', 0)
+            checkouts = stats.get('requests_num', 0)
+            elapsed = (datetime.now() - self.created_time).total_seconds()
+
+            return {
+                'size': size,
+                'min_size': stats.get('pool_min', self.min_size),
+                'max_size': stats.get('pool_max', self.max_size),
+                'idle': idle,
+                'in_use': size - idle,
+                'requests_waiting': stats.get('requests_waiting', 0),
+                'checkouts': checkouts,
+                'checkouts_per_sec': round(checkouts / elapsed, 3) if elapsed > 0 else 0.0,
+                'avg_wait_ms': round(stats.get('requests_wait_ms', 0) / checkouts, 3)
+                if checkouts
+                else 0.0,
+                'connections_opened': stats.get('connections_num', 0),
+                'connections_lost': stats.get('connections_lost', 0),
+                'max_lifetime_sec': self.pool_expiry_min * 60,
+            }
 
     def get_iam_auth_token(self) -> str:
         """Generate an IAM authentication token for RDS database access."""
@@ -0,0 +1,344 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bulk schema snapshots of Postgres catalogs and their cache."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+# Seconds during which a cached snapshot is served without checking the catalog version
+SCHEMA_SNAPSHOT_REVALIDATE_SECONDS = 30
+
+# Maximum number of schema snapshots kept across all connections
+SCHEMA_SNAPSHOT_CACHE_MAX_SCHEMAS = 64
+
+# Relation kinds included in a snapshot: tables, partitioned tables, views, materialized
+# views and foreign tables
+RELATION_KINDS = "('r', 'p', 'v', 'm', 'f')"
+
+RELATION_TYPES = {
+    'r': 'table',
+    'p': 'partitioned table',
+    'v': 'view',
+    'm': 'materialized view',
+    'f': 'foreign table',
+}
+
+CONSTRAINT_TYPES = {
+    'p': 'PRIMARY KEY',
+    'f': 'FOREIGN KEY',
+    'u': 'UNIQUE',
+    'c': 'CHECK',
+    'x': 'EXCLUSION',
+    't': 'TRIGGER',
+    'n': 'NOT NULL',
+}
+
+# Any DDL on the schema replaces pg_class rows (new xmin) or rewrites relations (new
+# relfilenode). Column, default, constraint and comment changes that leave pg_class untouched
+# replace rows of the other catalogs, so their xmin are part of the version as well.
+SCHEMA_VERSION_SQL = """
+    WITH ns AS (SELECT oid FROM pg_catalog.pg_namespace WHERE nspname = {schema}),
+    rels AS (SELECT c.oid FROM pg_catalog.pg_class c WHERE c.relnamespace IN (SELECT oid FROM ns))
+    SELECT md5(coalesce(string_agg(v, ',' ORDER BY v), '')) AS schema_version
+    FROM (
+        SELECT 'c' || c.oid || ':' || c.relfilenode || ':' || c.xmin::text AS v
+        FROM pg_catalog.pg_class c WHERE c.oid IN (SELECT oid FROM rels)
+        UNION ALL
+        SELECT 'a' || a.attrelid || ':' || a.attnum || ':' || a.xmin::text
+        FROM pg_catalog.pg_attribute a WHERE a.attrelid IN (SELECT oid FROM rels) AND a.attnum > 0
+        UNION ALL
+        SELECT 'd' || d.oid || ':' || d.xmin::text
+        FROM pg_catalog.pg_attrdef d WHERE d.adrelid IN (SELECT oid FROM rels)
+        UNION ALL
+        SELECT 'k' || k.oid || ':' || k.xmin::text
+        FROM pg_catalog.pg_constraint k WHERE k.connamespace IN (SELECT oid FROM ns)
+        UNION ALL
+        SELECT 'm' || m.objoid || ':' || m.objsubid || ':' || m.xmin::text
+        FROM pg_catalog.pg_description m
+        WHERE m.classoid = 'pg_catalog.pg_class'::regclass AND m.objoid IN (SELECT oid FROM rels)
+    ) versions
+"""
+
+TABLES_SQL = f"""
+    SELECT
+        c.relname AS table_name,
+        c.relkind AS relkind,
+        c.reltuples::bigint AS row_estimate,
+        obj_description(c.oid, 'pg_class') AS table_comment
+    FROM pg_catalog.pg_class c
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = {{schema}} AND c.relkind IN {RELATION_KINDS}
+    ORDER BY c.relname
+"""
+
+COLUMNS_SQL = f"""
+    SELECT
+        c.relname AS table_name,
+        a.attname AS column_name,
+        pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+        NOT a.attnotnull AS is_nullable,
+        pg_catalog.pg_get_expr(d.adbin, d.adrelid) AS column_default,
+        col_description(a.attrelid, a.attnum) AS column_comment
+    FROM pg_catalog.pg_attribute a
+    JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_catalog.pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+    WHERE n.nspname = {{schema}} AND c.relkind IN {RELATION_KINDS}
+        AND a.attnum > 0 AND NOT a.attisdropped
+    ORDER BY c.relname, a.attnum
+"""
+
+CONSTRAINTS_SQL = """
+    SELECT
+        c.relname AS table_name,
+        k.conname AS constraint_name,
+        k.contype AS contype,
+        pg_catalog.pg_get_constraintdef(k.oid) AS definition
+    FROM pg_catalog.pg_constraint k
+    JOIN pg_catalog.pg_class c ON c.oid = k.conrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = {schema}
+    ORDER BY c.relname, k.conname
+"""
+
+INDEXES_SQL = """
+    SELECT
+        c.relname AS table_name,
+        i.relname AS index_name,
+        x.indisunique AS is_unique,
+        x.indisprimary AS is_primary,
+        pg_catalog.pg_get_indexdef(x.indexrelid) AS definition
+    FROM pg_catalog.pg_index x
+    JOIN pg_catalog.pg_class c ON c.oid = x.indrelid
+    JOIN pg_catalog.pg_class i ON i.oid = x.indexrelid
+    JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = {schema}
+    ORDER BY c.relname, i.relname
+"""
+
+# Schema of the first relation with the given name in the search path, including the implicitly
+# searched pg_catalog and temporary schemas, which is the one an unqualified name refers to
+RESOLVE_TABLE_SCHEMA_SQL = f"""
+    SELECT s.nspname AS schema_name
+    FROM unnest(current_schemas(true)) WITH ORDINALITY AS s(nspname, position)
+    JOIN pg_catalog.pg_namespace n ON n.nspname = s.nspname
+    JOIN pg_catalog.pg_class c ON c.relnamespace = n.oid
+    WHERE c.relname = {{table}} AND c.relkind IN {RELATION_KINDS}
+    ORDER BY s.position
+    LIMIT 1
+"""
+
+# Runs a catalog query and returns its rows as {column: value} dictionaries
+QueryRunner = Callable[[str], Awaitable[List[Dict[str, Any]]]]
+
+
+def quote_literal(value: str) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def split_table_name(table_name: str) -> Tuple[Optional[str], str]:
+    """Split a possibly schema qualified table name into its schema and table.
+
+    Unquoted identifiers are folded to lower case like Postgres does. The schema of unqualified
+    names is None, to be resolved with resolve_table_schema.
+    """
+    parts = [part.strip() for part in table_name.split('.', 1)]
+    names = [
+        part[1:-1].replace('""', '"')
+        if len(part) > 1 and part.startswith('"') and part.endswith('"')
+        else part.lower()
+        for part in parts
+    ]
+    if len(names) == 1:
+        return None, names[0]
+    return names[0], names[1]
+
+
+async def resolve_table_schema(run: QueryRunner, table: str) -> Optional[str]:
+    """Return the schema an unqualified table name refers to in the search path of the session.
+
+    The schemas of current_schemas(true) are searched in order, like Postgres resolves the name.
+
+    Returns:
+        The schema name, or None if no table, view or foreign table of that name is visible
+    """
+    rows = await run(RESOLVE_TABLE_SCHEMA_SQL.format(table=quote_literal(table)))
+    return rows[0].get('schema_name') if rows else None
+
+
+async def get_schema_version(run: QueryRunner, schema: str) -> Optional[str]:
+    """Return the catalog version of a schema, which changes with any DDL on it."""
+    rows = await run(SCHEMA_VERSION_SQL.format(schema=quote_literal(schema)))
+    return rows[0].get('schema_version') if rows else None
+
+
+async def load_schema_snapshot(run: QueryRunner, schema: str) -> Dict[str, Dict[str, Any]]:
+    """Load the tables of a schema with their columns, constraints and indexes.
+
+    The four catalog queries cover the whole schema and run concurrently.
+
+    Args:
+        run: Runner of the catalog queries
+        schema: The schema name
+
+    Returns:
+        The tables of the schema by table name
+    """
+    literal = quote_literal(schema)
+    table_rows, column_rows, constraint_rows, index_rows = await asyncio.gather(
+        run(TABLES_SQL.format(schema=literal)),
+        run(COLUMNS_SQL.format(schema=literal)),
+        run(CONSTRAINTS_SQL.format(schema=literal)),
+        run(INDEXES_SQL.format(schema=literal)),
+    )
+
+    tables: Dict[str, Dict[str, Any]] = {}
+    for row in table_rows:
+        row_estimate = row.get('row_estimate')
+        tables[row['table_name']] = {
+            'table_name': row['table_name'],
+            'table_type': RELATION_TYPES.get(row['relkind'], row['relkind']),
+            # Tables that were never analyzed have no estimate
+            'row_estimate': row_estimate if row_estimate is None or row_estimate >= 0 else None,
+            'table_comment': row.get('table_comment'),
+            'columns': [],
+            'constraints': [],
+            'indexes': [],
+        }
+
+    for row in column_rows:
+        table = tables.get(row.pop('table_name'))
+        if table is not None:
+            table['columns'].append(row)
+
+    for row in constraint_rows:
+        table = tables.get(row.pop('table_name'))
+        if table is not None:
+            contype = row.pop('contype')
+            table['constraints'].append(
+                {
+                    'constraint_name': row['constraint_name'],
+                    'constraint_type': CONSTRAINT_TYPES.get(contype, contype),
+                    'definition': row['definition'],
+                }
+            )
+
+    for row in index_rows:
+        table = tables.get(row.pop('table_name'))
+        if table is not None:
+            table['indexes'].append(row)
+
+    return tables
+
+
+class SchemaSnapshotCache:
+    """Bounded in-memory cache of schema snapshots.
+
+    Entries are keyed by (connection key, schema) and hold the snapshot with the catalog version
+    it was loaded at. A cached snapshot is served from memory for revalidate_seconds after its
+    version was last checked; after that its version is checked again with one cheap catalog
+    query and the snapshot is only reloaded when the version changed. The least recently used
+    entries are evicted once max_schemas is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_schemas: int = SCHEMA_SNAPSHOT_CACHE_MAX_SCHEMAS,
+        revalidate_seconds: float = SCHEMA_SNAPSHOT_REVALIDATE_SECONDS,
+    ):
+        """Initialize the schema snapshot cache.
+
+        Args:
+            max_schemas: Maximum number of schema snapshots kept
+            revalidate_seconds: Seconds during which a snapshot is served without checking its
+                catalog version
+        """
+        self.max_schemas = max_schemas
+        self.revalidate_seconds = revalidate_seconds
+        self._entries: 'OrderedDict[Tuple[Hashable, str], Tuple[Optional[str], float, Dict[str, Any]]]' = OrderedDict()
+        self._loading: Dict[Tuple[Hashable, str], asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    async def get(
+        self,
+        connection_key: Hashable,
+        schema: str,
+        run: QueryRunner,
+        revalidate: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return the snapshot of a schema, loading or revalidating it as needed.
+
+        Concurrent requests for a snapshot that is being loaded share the same load.
+
+        Args:
+            connection_key: Key of the database connection the schema belongs to
+            schema: The schema name
+            run: Runner of the catalog queries on the connection
+            revalidate: Whether to check the catalog version even within revalidate_seconds
+
+        Returns:
+            The tables of the schema by table name
+        """
+        key = (connection_key, schema)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if not revalidate and time.monotonic() - entry[1] < self.revalidate_seconds:
+                    return entry[2]
+            task = self._loading.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._load(key, schema, run, entry))
+                self._loading[key] = task
+                task.add_done_callback(lambda _: self._loading.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _load(
+        self,
+        key: Tuple[Hashable, str],
+        schema: str,
+        run: QueryRunner,
+        entry: Optional[Tuple[Optional[str], float, Dict[str, Any]]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Check the catalog version of a schema and reload its snapshot if it changed."""
+        checked_at = time.monotonic()
+        version = await get_schema_version(run, schema)
+        if entry is not None and version is not None and entry[0] == version:
+            tables = entry[2]
+        else:
+            tables = await load_schema_snapshot(run, schema)
+
+        with self._lock:
+            self._entries[key] = (version, checked_at, tables)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_schemas:
+                self._entries.popitem(last=False)
+        return tables
+
+    def invalidate(self, connection_key: Hashable) -> None:
+        """Remove all cached snapshots of a connection."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == connection_key]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all cached snapshots."""
+        with self._lock:
+            self._entries.clear()
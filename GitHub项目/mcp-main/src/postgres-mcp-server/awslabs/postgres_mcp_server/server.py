@@ -38,6 +38,12 @@ from awslabs.postgres_mcp_server.mutable_sql_detector import (
     check_sql_injection_risk,
     detect_mutating_keywords,
 )
+from awslabs.postgres_mcp_server.schema_snapshot import (
+    QueryRunner,
+    SchemaSnapshotCache,
+    resolve_table_schema,
+    split_table_name,
+)
 from botocore.exceptions import ClientError
 from datetime import datetime
 from loguru import logger
@@ -47,6 +53,7 @@ from typing import Annotated, Any, Dict, List, Optional, Tuple
 
 
 db_connection_map = DBConnectionMap()
+schema_snapshot_cache = SchemaSnapshotCache()
 async_job_status: Dict[str, dict] = {}
 async_job_status_lock = threading.Lock()
 client_error_code_key = 'run_query ClientError code'
@@ -55,6 +62,8 @@ write_query_prohibited_key = 'Your MCP tool only allows readonly query. If you w
 query_comment_prohibited_key = 'The comment in query is prohibited because of injection risk'
 query_injection_risk_key = 'Your query contains risky injection patterns'
 readonly_query = True
+max_result_rows: Optional[int] = None
+max_result_bytes: Optional[int] = None
 
 
 class DummyCtx:
@@ -69,6 +78,14 @@ class DummyCtx:
         # Do nothing
         pass
 
+    async def warning(self, message):
+        """Ignore the given warning message.
+
+        Args:
+            message: The warning message
+        """
+        pass
+
 
 def extract_cell(cell: dict):
     """Extracts the scalar or array value from a single cell."""
@@ -192,10 +209,29 @@ async def run_query(
             )
         )
 
-        response = await db_connection.execute_query(sql, query_parameters)
+        if isinstance(db_connection, PsycopgPoolConnection):
+            # psycopg builds the final rows directly, without intermediate typed cells
+            rows, truncated = await db_connection.execute_query_rows(sql, query_parameters)
+            if truncated:
+                message = (
+                    f'Query result truncated to {len(rows)} rows by the configured '
+                    f'max_result_rows:{db_connection.max_result_rows} or '
+                    f'max_result_bytes:{db_connection.max_result_bytes}'
+                )
+                logger.warning(message)
+                await ctx.warning(message)
+        else:
+            response = await db_connection.execute_query(sql, query_parameters)
+            rows = parse_execute_response(response)
+
+        if detect_mutating_keywords(sql):
+            # the statement may have changed the schema, reload snapshots on their next use
+            schema_snapshot_cache.invalidate(
+                (connection_method, cluster_identifier, db_endpoint, database)
+            )
 
         logger.success(f'run_query successfully executed query:{sql}')
-        return parse_execute_response(response)
+        return rows
     except ClientError as e:
         logger.exception(client_error_code_key)
         await ctx.error(
@@ -238,6 +274,28 @@ async def get_table_schema(
         )
     )
 
+    schema, table = split_table_name(table_name)
+    try:
+        run = get_catalog_runner(connection_method, cluster_identifier, db_endpoint, database)
+        if run is not None and schema is None:
+            schema = await resolve_table_schema(run, table)
+        if schema is not None:
+            tables = await get_cached_schema(
+                connection_method, cluster_identifier, db_endpoint, database, schema
+            )
+            if tables is not None and table in tables:
+                return [
+                    {
+                        'column_name': column['column_name'],
+                        'data_type': column['data_type'],
+                        'column_comment': column['column_comment'],
+                    }
+                    for column in tables[table]['columns']
+                ]
+    except Exception:
+        logger.exception(f'Failed to load schema snapshot of {schema}, query {table_name} only')
+
+    # names the snapshot cannot answer, e.g. when the catalog queries failed, are queried on their own
     sql = f"""
         SELECT
             a.attname AS column_name,
@@ -265,6 +323,130 @@ async def get_table_schema(
     )
 
 
+@mcp.tool(
+    name='get_schema_snapshot',
+    description='Fetch all tables of a Postgres schema with their columns, comments, constraints, '
+    'indexes and row estimates in one call',
+)
+async def get_schema_snapshot(
+    connection_method: Annotated[ConnectionMethod, Field(description='connection method')],
+    cluster_identifier: Annotated[str, Field(description='Cluster identifier')],
+    db_endpoint: Annotated[str, Field(description='database endpoint')],
+    database: Annotated[str, Field(description='database name')],
+    ctx: Context,
+    schema_name: Annotated[str, Field(description='name of the schema')] = 'public',
+) -> dict:
+    """Get the tables of a schema with their columns, comments, constraints, indexes and row estimates.
+
+    The snapshot is loaded with a few catalog queries covering the whole schema and cached until
+    the catalog version of the schema changes, and later get_table_schema calls for its tables
+    are answered from the cache.
+
+    Args:
+        connection_method: connection method
+        cluster_identifier: Cluster identifier
+        db_endpoint: database endpoint
+        database: database name
+        ctx: MCP context for logging and state management
+        schema_name: name of the schema
+
+    Returns:
+        Dictionary with the schema name and its tables
+    """
+    logger.info(
+        (
+            f'Entered get_schema_snapshot: schema_name:{schema_name} connection_method:{connection_method}, '
+            f'cluster_identifier:{cluster_identifier}, db_endpoint:{db_endpoint}, database:{database}'
+        )
+    )
+
+    try:
+        tables = await get_cached_schema(
+            connection_method,
+            cluster_identifier,
+            db_endpoint,
+            database,
+            schema_name,
+            revalidate=True,
+        )
+    except ClientError as e:
+        logger.exception(client_error_code_key)
+        await ctx.error(
+            str({'code': e.response['Error']['Code'], 'message': e.response['Error']['Message']})
+        )
+        return {'error': client_error_code_key}
+    except Exception as e:
+        logger.exception(unexpected_error_key)
+        await ctx.error(str({'message': f'{type(e).__name__}: {str(e)}'}))
+        return {'error': unexpected_error_key}
+
+    if tables is None:
+        err = (
+            f'No database connection available for method:{connection_method}, '
+            f'cluster_identifier:{cluster_identifier}, db_endpoint:{db_endpoint}, database:{database}'
+        )
+        logger.error(err)
+        await ctx.error(err)
+        return {'error': err}
+
+    return {'schema_name': schema_name, 'tables': list(tables.values())}
+
+
+def get_catalog_runner(
+    connection_method: ConnectionMethod,
+    cluster_identifier: str,
+    db_endpoint: str,
+    database: str,
+) -> Optional[QueryRunner]:
+    """Get a runner of catalog queries on a connected database.
+
+    Catalog queries run through execute_query, which both the RDS Data API and the psycopg
+    connections implement, and skip the run_query checks meant for user supplied SQL.
+
+    Returns:
+        The catalog query runner, or None if the database is not connected
+    """
+    global db_connection_map
+    db_connection = db_connection_map.get(
+        method=connection_method,
+        cluster_identifier=cluster_identifier,
+        db_endpoint=db_endpoint,
+        database=database,
+    )
+    if not db_connection:
+        return None
+
+    async def run(sql: str) -> list[dict]:
+        return parse_execute_response(await db_connection.execute_query(sql))
+
+    return run
+
+
+async def get_cached_schema(
+    connection_method: ConnectionMethod,
+    cluster_identifier: str,
+    db_endpoint: str,
+    database: str,
+    schema: str,
+    revalidate: bool = False,
+) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Get the schema snapshot of a connected database from the cache, loading it as needed.
+
+    Returns:
+        The tables of the schema by table name, or None if the database is not connected
+    """
+    run = get_catalog_runner(connection_method, cluster_identifier, db_endpoint, database)
+    if run is None:
+        return None
+
+    return await schema_snapshot_cache.get(
+        (connection_method, cluster_identifier, db_endpoint, database),
+        schema,
+        run,
+        revalidate=revalidate,
+    )
+
+
 @mcp.tool(
     name='connect_to_database',
     description='Connect to a specific database and save the connection internally',
@@ -371,6 +553,24 @@ def get_database_connection_info() -> str:
     return db_connection_map.get_keys_json()
 
 
+@mcp.tool(
+    name='get_connection_pool_stats',
+    description='Get connection pool metrics of all cached pgwire database connections',
+)
+async def get_connection_pool_stats() -> str:
+    """Get connection pool metrics of all cached pgwire database connections.
+
+    Return:
+        A list of cached connection information, each with its pool metrics.
+    """
+    global db_connection_map
+    entries: List[dict] = []
+    for entry, conn in db_connection_map.items():
+        if isinstance(conn, PsycopgPoolConnection):
+            entries.append({**entry, 'pool_stats': await conn.get_pool_stats()})
+    return json.dumps(entries, indent=2, default=str)
+
+
 @mcp.tool(name='create_cluster', description='Create an Aurora Postgres cluster')
 def create_cluster(
     region: Annotated[str, Field(description='region')],
@@ -537,6 +737,8 @@ def internal_connect_to_database(
     """
     global db_connection_map
     global readonly_query
+    global max_result_rows
+    global max_result_bytes
 
     logger.info(
         f'Enter internal_connect_to_database\n'
@@ -628,6 +830,8 @@ def internal_connect_to_database(
             db_user=masteruser,
             region=region,
             is_iam_auth=True,
+            max_result_rows=max_result_rows,
+            max_result_bytes=max_result_bytes,
         )
 
     elif connection_method == ConnectionMethod.RDS_API:
@@ -649,6 +853,8 @@ def internal_connect_to_database(
             db_user='',
             region=region,
             is_iam_auth=False,
+            max_result_rows=max_result_rows,
+            max_result_bytes=max_result_bytes,
         )
 
     if db_connection:
@@ -678,6 +884,8 @@ def main():
     """
     global db_connection_map
     global readonly_query
+    global max_result_rows
+    global max_result_bytes
 
     parser = argparse.ArgumentParser(
         description='An AWS Labs Model Context Protocol (MCP) server for postgres'
@@ -696,6 +904,22 @@ def main():
     )
     parser.add_argument('--database', help='Database name')
     parser.add_argument('--port', type=int, default=5432, help='Database port (default: 5432)')
+    parser.add_argument(
+        '--max_result_rows',
+        type=int,
+        help='Maximum number of rows returned by run_query over pgwire (default: no limit)',
+    )
+    parser.add_argument(
+        '--max_result_bytes',
+        type=int,
+        help='Maximum size in bytes of the rows returned by run_query over pgwire (default: no limit)',
+    )
+    parser.add_argument(
+        '--max_cached_connections',
+        type=int,
+        help='Maximum number of cached database connections, the least recently used are closed '
+        'beyond it (default: no limit)',
+    )
     args = parser.parse_args()
 
     logger.info(
@@ -708,9 +932,15 @@ def main():
         f'allow_write_query:{args.allow_write_query}\n'
         f'database:{args.database}\n'
         f'port:{args.port}\n'
+        f'max_result_rows:{args.max_result_rows}\n'
+        f'max_result_bytes:{args.max_result_bytes}\n'
+        f'max_cached_connections:{args.max_cached_connections}\n'
     )
 
     readonly_query = not args.allow_write_query
+    max_result_rows = args.max_result_rows
+    max_result_bytes = args.max_result_bytes
+    db_connection_map.max_connections = args.max_cached_connections
 
     try:
         if args.db_type:
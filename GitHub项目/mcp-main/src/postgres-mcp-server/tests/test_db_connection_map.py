@@ -2,6 +2,7 @@
 
 """Unit tests for DBConnectionMap class."""
 
+import asyncio
 import json
 import pytest
 import threading
@@ -10,7 +11,7 @@ from awslabs.postgres_mcp_server.connection.db_connection_map import (
     ConnectionMethod,
     DBConnectionMap,
 )
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestDBConnectionMap:
@@ -806,6 +807,60 @@ class TestDBConnectionMapIntegration:
         keys = json.loads(keys_json)
         assert keys == []
 
+    # ==================== LRU Eviction Tests ====================
+
+    def test_set_evicts_least_recently_used(self):
+        """Test set() evicts and closes the least recently used connection over the limit."""
+        connection_map = DBConnectionMap(max_connections=2)
+        conn1, conn2, conn3 = MagicMock(), MagicMock(), MagicMock()
+
+        connection_map.set(ConnectionMethod.RDS_API, 'cluster1', 'endpoint1', 'db1', conn1)
+        connection_map.set(ConnectionMethod.RDS_API, 'cluster2', 'endpoint2', 'db2', conn2)
+        # Using conn1 makes conn2 the least recently used connection
+        connection_map.get(ConnectionMethod.RDS_API, 'cluster1', 'endpoint1', 'db1')
+        connection_map.set(ConnectionMethod.RDS_API, 'cluster3', 'endpoint3', 'db3', conn3)
+
+        assert connection_map.get(ConnectionMethod.RDS_API, 'cluster2', 'endpoint2', 'db2') is None
+        assert [entry['cluster_identifier'] for entry, _ in connection_map.items()] == [
+            'cluster1',
+            'cluster3',
+        ]
+        conn2.close.assert_called_once()
+        conn1.close.assert_not_called()
+        conn3.close.assert_not_called()
+
+    def test_set_without_limit_does_not_evict(self, connection_map):
+        """Test set() keeps all connections when no limit is set."""
+        for i in range(20):
+            connection_map.set(ConnectionMethod.RDS_API, f'cluster{i}', 'ep', 'db', MagicMock())
+
+        assert len(connection_map.map) == 20
+
+    @pytest.mark.asyncio
+    async def test_evicted_async_connection_closed_in_background(self):
+        """Test an evicted connection with an async close() is closed on the running loop."""
+        connection_map = DBConnectionMap(max_connections=1)
+        conn1, conn2 = MagicMock(), MagicMock()
+        conn1.close = AsyncMock()
+
+        connection_map.set(ConnectionMethod.PG_WIRE_PROTOCOL, 'cluster1', 'ep1', 'db1', conn1)
+        connection_map.set(ConnectionMethod.PG_WIRE_PROTOCOL, 'cluster2', 'ep2', 'db2', conn2)
+        await asyncio.gather(*connection_map._closing)
+
+        conn1.close.assert_awaited_once()
+        assert connection_map._closing == set()
+
+    def test_close_all_awaits_async_close_without_loop(self, connection_map):
+        """Test close_all() runs an async close() to completion outside an event loop."""
+        conn = MagicMock()
+        conn.close = AsyncMock()
+        connection_map.set(ConnectionMethod.PG_WIRE_PROTOCOL, 'cluster1', 'ep1', 'db1', conn)
+
+        connection_map.close_all()
+
+        conn.close.assert_awaited_once()
+        assert connection_map.map == {}
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
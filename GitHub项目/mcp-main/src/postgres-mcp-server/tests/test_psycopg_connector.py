@@ -19,6 +19,7 @@ import threading
 import time
 from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import PsycopgPoolConnection
 from datetime import datetime, timedelta
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
@@ -841,10 +842,18 @@ class TestPsycopgConnector:
         """Test get_pool_stats when pool exists."""
         with patch('psycopg_pool.AsyncConnectionPool') as mock_pool_class:
             mock_pool = AsyncMock()
-            mock_pool.size = 5
-            mock_pool.min_size = 2
-            mock_pool.max_size = 10
-            mock_pool.idle = 3
+            mock_pool.get_stats = MagicMock(
+                return_value={
+                    'pool_min': 2,
+                    'pool_max': 10,
+                    'pool_size': 5,
+                    'pool_available': 3,
+                    'requests_waiting': 1,
+                    'requests_num': 40,
+                    'requests_wait_ms': 200,
+                    'connections_num': 7,
+                }
+            )
             mock_pool_class.return_value = mock_pool
 
             conn = PsycopgPoolConnection(
@@ -862,6 +871,7 @@ class TestPsycopgConnector:
             )
 
             conn.pool = mock_pool
+            conn.created_time = datetime.now() - timedelta(seconds=20)
 
             stats = await conn.get_pool_stats()
 
@@ -869,6 +879,14 @@ class TestPsycopgConnector:
             assert stats['min_size'] == 2
             assert stats['max_size'] == 10
             assert stats['idle'] == 3
+            assert stats['in_use'] == 2
+            assert stats['requests_waiting'] == 1
+            assert stats['checkouts'] == 40
+            assert stats['checkouts_per_sec'] == pytest.approx(2.0, rel=0.01)
+            assert stats['avg_wait_ms'] == 5.0
+            assert stats['connections_opened'] == 7
+            assert stats['connections_lost'] == 0
+            assert stats['max_lifetime_sec'] == 30 * 60
 
     @pytest.mark.asyncio
     async def test_initialize_pool_with_secrets_manager(self):
@@ -928,9 +946,16 @@ class TestPsycopgConnector:
 
             await conn.initialize_pool()
 
-            mock_get_token.assert_called_once()
             mock_pool_class.assert_called_once()
-            assert 'password=iam_token_123' in conn.conninfo
+            pool_kwargs = mock_pool_class.call_args.kwargs
+            assert 'password' not in conn.conninfo
+            assert pool_kwargs['max_lifetime'] == 14 * 60
+            assert pool_kwargs['check'] is mock_pool_class.check_connection
+
+            # Every new connection is opened with a freshly generated token
+            mock_get_token.side_effect = ['iam_token_123', 'iam_token_456']
+            assert await pool_kwargs['kwargs']() == {'password': 'iam_token_123'}
+            assert await pool_kwargs['kwargs']() == {'password': 'iam_token_456'}
 
     @pytest.mark.asyncio
     async def test_initialize_pool_already_initialized(self):
@@ -959,41 +984,46 @@ class TestPsycopgConnector:
             mock_pool_class.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_check_expiry_not_expired(self):
-        """Test check_expiry when pool is not expired."""
-        with patch('psycopg_pool.AsyncConnectionPool') as mock_pool_class:
-            mock_pool = AsyncMock()
-            mock_pool_class.return_value = mock_pool
+    async def test_secret_credentials_refreshed_after_max_lifetime(self):
+        """Test that replacement connections pick up rotated secrets after max lifetime."""
+        with (
+            patch(
+                'awslabs.postgres_mcp_server.connection.psycopg_pool_connection.AsyncConnectionPool'
+            ) as mock_pool_class,
+            patch.object(PsycopgPoolConnection, '_get_credentials_from_secret') as mock_get_creds,
+        ):
+            mock_pool_class.return_value = AsyncMock()
+            mock_get_creds.side_effect = [('db_user', 'old_password'), ('db_user', 'new_password')]
 
             conn = PsycopgPoolConnection(
                 host='localhost',
                 port=5432,
                 database='test_db',
                 readonly=False,
-                secret_arn='test_secret',
-                db_user='test_user',
+                secret_arn='arn:secret',
+                db_user='',
                 is_iam_auth=False,
                 region='us-east-1',
                 pool_expiry_min=30,
                 is_test=True,
             )
+            await conn.initialize_pool()
+            connection_kwargs = mock_pool_class.call_args.kwargs['kwargs']
 
-            conn.pool = mock_pool
-
-            # Should not close pool
-            await conn.check_expiry()
+            assert await connection_kwargs() == {'user': 'db_user', 'password': 'old_password'}
 
-            mock_pool.close.assert_not_called()
+            conn.credentials_time = datetime.now() - timedelta(minutes=31)
+            assert await connection_kwargs() == {'user': 'db_user', 'password': 'new_password'}
+            assert mock_get_creds.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_check_expiry_expired(self):
-        """Test check_expiry when pool is expired."""
-        with (
-            patch('psycopg_pool.AsyncConnectionPool') as mock_pool_class,
-            patch.object(PsycopgPoolConnection, 'initialize_pool') as mock_init,
-        ):
+    async def test_old_pool_is_not_recreated(self):
+        """Test that connections are rotated individually instead of recreating the pool."""
+        with patch(
+            'awslabs.postgres_mcp_server.connection.psycopg_pool_connection.AsyncConnectionPool'
+        ) as mock_pool_class:
             mock_pool = AsyncMock()
-            mock_pool_class.return_value = mock_pool
+            mock_pool.connection = MagicMock(return_value='connection')
 
             conn = PsycopgPoolConnection(
                 host='localhost',
@@ -1009,11 +1039,138 @@ class TestPsycopgConnector:
             )
 
             conn.pool = mock_pool
-            # Set created_time to past
             conn.created_time = datetime.now() - timedelta(minutes=2)
 
-            await conn.check_expiry()
+            assert await conn._get_connection() == 'connection'
 
-            # Should close and reinitialize
-            mock_pool.close.assert_called_once()
-            mock_init.assert_called_once()
+            mock_pool.close.assert_not_called()
+            mock_pool_class.assert_not_called()
+
+
+class TestExecuteQueryRows:
+    """Tests for the direct row path of PsycopgPoolConnection."""
+
+    @staticmethod
+    def _connection(**kwargs):
+        """Create a test PsycopgPoolConnection."""
+        return PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=True,
+            secret_arn='test_secret',  # pragma: allowlist secret
+            db_user='test_user',
+            region='us-east-1',
+            is_test=True,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _mock_pg_connection(columns, values):
+        """Mock a psycopg connection whose cursors return the given rows through the factory."""
+        description = [MagicMock() for _ in columns]
+        for column, name in zip(description, columns):
+            column.name = name
+
+        cursor = MagicMock()
+        cursor.__aenter__.return_value = cursor
+        cursor.execute = AsyncMock()
+        cursor.description = description if columns else None
+        remaining = list(values)
+
+        async def fetchmany(size):
+            make_row = cursor.row_factory(cursor)
+            batch = [make_row(row) for row in remaining[:size]]
+            del remaining[:size]
+            return batch
+
+        cursor.fetchmany = AsyncMock(side_effect=fetchmany)
+
+        def make_cursor(name=None, row_factory=None):
+            cursor.name = name
+            cursor.row_factory = row_factory
+            return cursor
+
+        pg_conn = MagicMock()
+        pg_conn.execute = AsyncMock()
+        pg_conn.cursor = MagicMock(side_effect=make_cursor)
+        pg_conn.__aenter__.return_value = pg_conn
+        return pg_conn, cursor
+
+    @pytest.mark.asyncio
+    async def test_rows_are_built_directly(self):
+        """Test that rows are returned as dictionaries of plain values from a named cursor."""
+        conn = self._connection()
+        pg_conn, cursor = self._mock_pg_connection(
+            ['id', 'price', 'created', 'active', 'note'],
+            [(1, Decimal('9.50'), datetime(2024, 1, 2, 3, 4, 5), True, None)],
+        )
+
+        with patch.object(conn, '_get_connection', AsyncMock(return_value=pg_conn)):
+            rows, truncated = await conn.execute_query_rows('SELECT * FROM items')
+
+        assert rows == [
+            {
+                'id': 1,
+                'price': '9.50',
+                'created': '2024-01-02 03:04:05',
+                'active': True,
+                'note': None,
+            }
+        ]
+        assert truncated is False
+        assert cursor.name.startswith('mcp_')
+        pg_conn.execute.assert_called_once_with('SET TRANSACTION READ ONLY')
+        cursor.execute.assert_called_once_with('SELECT * FROM items')
+
+    @pytest.mark.asyncio
+    async def test_row_limit_stops_fetching(self):
+        """Test that fetching stops one row past max_result_rows and reports truncation."""
+        conn = self._connection(max_result_rows=3, fetch_size=2)
+        pg_conn, cursor = self._mock_pg_connection(['n'], [(i,) for i in range(100)])
+
+        with patch.object(conn, '_get_connection', AsyncMock(return_value=pg_conn)):
+            rows, truncated = await conn.execute_query_rows('SELECT n FROM numbers')
+
+        assert rows == [{'n': 0}, {'n': 1}, {'n': 2}]
+        assert truncated is True
+        assert [call.args[0] for call in cursor.fetchmany.call_args_list] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_byte_limit(self):
+        """Test that rows are returned until their JSON size exceeds max_result_bytes."""
+        conn = self._connection(max_result_bytes=30)
+        pg_conn, _ = self._mock_pg_connection(['name'], [('a' * 10,)] * 5)
+
+        with patch.object(conn, '_get_connection', AsyncMock(return_value=pg_conn)):
+            rows, truncated = await conn.execute_query_rows('SELECT name FROM users')
+
+        assert len(rows) == 1
+        assert truncated is True
+
+    @pytest.mark.asyncio
+    async def test_statements_use_client_side_cursor(self):
+        """Test that statements which cannot be declared as a cursor run on a regular cursor."""
+        conn = self._connection()
+        pg_conn, cursor = self._mock_pg_connection(['id'], [(7,)])
+
+        with patch.object(conn, '_get_connection', AsyncMock(return_value=pg_conn)):
+            rows, _ = await conn.execute_query_rows(
+                'INSERT INTO t VALUES (%(id)s) RETURNING id',
+                [{'name': 'id', 'value': {'longValue': 7}}],
+            )
+
+        assert rows == [{'id': 7}]
+        assert cursor.name is None
+        cursor.execute.assert_called_once_with(
+            'INSERT INTO t VALUES (%(id)s) RETURNING id', {'id': 7}
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_result(self):
+        """Test statements without a result set."""
+        conn = self._connection()
+        pg_conn, _ = self._mock_pg_connection([], [])
+
+        with patch.object(conn, '_get_connection', AsyncMock(return_value=pg_conn)):
+            assert await conn.execute_query_rows('SET search_path TO public') == ([], False)
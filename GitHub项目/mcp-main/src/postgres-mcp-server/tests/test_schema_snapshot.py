@@ -0,0 +1,195 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the schema_snapshot module."""
+
+import asyncio
+import pytest
+from awslabs.postgres_mcp_server.schema_snapshot import (
+    SchemaSnapshotCache,
+    load_schema_snapshot,
+    quote_literal,
+    resolve_table_schema,
+    split_table_name,
+)
+
+
+class FakeCatalog:
+    """Runner of catalog queries answering from in-memory rows."""
+
+    def __init__(self, version='v1'):
+        """Initialize the catalog with one table."""
+        self.version = version
+        self.queries = []
+        self.tables = [
+            {'table_name': 'orders', 'relkind': 'r', 'row_estimate': -1, 'table_comment': None}
+        ]
+        self.columns = [
+            {
+                'table_name': 'orders',
+                'column_name': 'id',
+                'data_type': 'integer',
+                'is_nullable': False,
+                'column_default': None,
+                'column_comment': None,
+            }
+        ]
+
+    async def run(self, sql):
+        """Return the rows of a catalog query."""
+        self.queries.append(sql)
+        await asyncio.sleep(0)
+        if 'schema_version' in sql:
+            return [{'schema_version': self.version}]
+        if 'pg_get_indexdef' in sql:
+            return [
+                {
+                    'table_name': 'orders',
+                    'index_name': 'orders_pkey',
+                    'is_unique': True,
+                    'is_primary': True,
+                    'definition': 'CREATE UNIQUE INDEX orders_pkey ON public.orders (id)',
+                }
+            ]
+        if 'pg_get_constraintdef' in sql:
+            return [
+                {
+                    'table_name': 'orders',
+                    'constraint_name': 'orders_pkey',
+                    'contype': 'p',
+                    'definition': 'PRIMARY KEY (id)',
+                }
+            ]
+        if 'format_type' in sql:
+            return [dict(row) for row in self.columns]
+        return [dict(row) for row in self.tables]
+
+
+class TestHelpers:
+    """Tests for the SQL helpers."""
+
+    def test_quote_literal(self):
+        """Test that quotes inside literals are escaped."""
+        assert quote_literal("o'brien") == "'o''brien'"
+
+    def test_split_table_name(self):
+        """Test that names are split and folded like Postgres identifiers."""
+        assert split_table_name('Orders') == (None, 'orders')
+        assert split_table_name('Sales.Orders') == ('sales', 'orders')
+        assert split_table_name('"Sales"."Order.Items"') == ('Sales', 'Order.Items')
+
+    @pytest.mark.asyncio
+    async def test_resolve_table_schema(self):
+        """Test that unqualified names are looked up in current_schemas(true) in order."""
+        queries = []
+
+        async def run(sql):
+            queries.append(sql)
+            return [{'schema_name': 'sales'}] if "'orders'" in sql else []
+
+        assert await resolve_table_schema(run, 'orders') == 'sales'
+        assert await resolve_table_schema(run, "o'brien") is None
+        assert 'current_schemas(true)' in queries[0]
+        assert 'ORDER BY s.position' in queries[0]
+        assert "'o''brien'" in queries[1]
+
+
+class TestLoadSchemaSnapshot:
+    """Tests for load_schema_snapshot function."""
+
+    @pytest.mark.asyncio
+    async def test_load_schema_snapshot(self):
+        """Test that catalog rows are grouped by table."""
+        catalog = FakeCatalog()
+
+        tables = await load_schema_snapshot(catalog.run, "o'brien")
+
+        orders = tables['orders']
+        assert orders['table_type'] == 'table'
+        assert orders['row_estimate'] is None
+        assert [column['column_name'] for column in orders['columns']] == ['id']
+        assert orders['constraints'][0]['constraint_type'] == 'PRIMARY KEY'
+        assert orders['indexes'][0]['is_primary'] is True
+        assert len(catalog.queries) == 4
+        assert all("'o''brien'" in sql for sql in catalog.queries)
+
+
+class TestSchemaSnapshotCache:
+    """Tests for SchemaSnapshotCache class."""
+
+    @pytest.mark.asyncio
+    async def test_served_from_memory_within_revalidate_seconds(self):
+        """Test that no query runs while a snapshot is within its revalidation window."""
+        cache = SchemaSnapshotCache(revalidate_seconds=60)
+        catalog = FakeCatalog()
+
+        first = await cache.get('conn', 'public', catalog.run)
+        second = await cache.get('conn', 'public', catalog.run)
+
+        assert first is second
+        assert len(catalog.queries) == 5
+
+    @pytest.mark.asyncio
+    async def test_unchanged_version_is_not_reloaded(self):
+        """Test that an expired snapshot is kept when the schema version is unchanged."""
+        cache = SchemaSnapshotCache(revalidate_seconds=0)
+        catalog = FakeCatalog()
+
+        first = await cache.get('conn', 'public', catalog.run)
+        second = await cache.get('conn', 'public', catalog.run)
+
+        assert first is second
+        assert len(catalog.queries) == 6
+
+    @pytest.mark.asyncio
+    async def test_changed_version_is_reloaded(self):
+        """Test that a snapshot is reloaded when the schema version changed."""
+        cache = SchemaSnapshotCache(revalidate_seconds=60)
+        catalog = FakeCatalog()
+        await cache.get('conn', 'public', catalog.run)
+
+        catalog.version = 'v2'
+        catalog.columns[0]['data_type'] = 'bigint'
+        tables = await cache.get('conn', 'public', catalog.run, revalidate=True)
+
+        assert tables['orders']['columns'][0]['data_type'] == 'bigint'
+        assert len(catalog.queries) == 10
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_load(self):
+        """Test that concurrent requests for an uncached schema load it once."""
+        cache = SchemaSnapshotCache()
+        catalog = FakeCatalog()
+
+        results = await asyncio.gather(
+            *[cache.get('conn', 'public', catalog.run) for _ in range(5)]
+        )
+
+        assert all(result is results[0] for result in results)
+        assert len(catalog.queries) == 5
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_eviction(self):
+        """Test invalidation per connection and eviction of the least recently used schema."""
+        cache = SchemaSnapshotCache(max_schemas=2)
+        catalog = FakeCatalog()
+
+        await cache.get('conn1', 'a', catalog.run)
+        await cache.get('conn1', 'b', catalog.run)
+        await cache.get('conn1', 'a', catalog.run)
+        await cache.get('conn2', 'c', catalog.run)
+        assert list(cache._entries) == [('conn1', 'a'), ('conn2', 'c')]
+
+        cache.invalidate('conn1')
+        assert list(cache._entries) == [('conn2', 'c')]
@@ -31,12 +31,15 @@ from awslabs.postgres_mcp_server.server import (
     client_error_code_key,
     create_cluster,
     db_connection_map,
+    get_connection_pool_stats,
     get_database_connection_info,
     get_job_status,
+    get_schema_snapshot,
     get_table_schema,
     is_database_connected,
     main,
     run_query,
+    schema_snapshot_cache,
     unexpected_error_key,
     write_query_prohibited_key,
 )
@@ -673,7 +676,10 @@ async def test_run_query_write_queries_on_write_allowed_setting():
 @pytest.mark.asyncio
 async def test_get_table_schema():
     """Test test_get_table_schema call in a positive case."""
+    schema_snapshot_cache.clear()
     mock_db_connection = Mock_DBConnection(readonly=False)
+    # The name is not found in the search path, so it is queried on its own
+    add_mock_resolved_schema_response(mock_db_connection, None)
     mock_db_connection.data_client.add_mock_response(get_mock_normal_query_response())
     setup_mock_connection(mock_db_connection)
 
@@ -693,6 +699,177 @@ async def test_get_table_schema():
     validate_normal_query_response(column_records)
 
 
+def add_mock_resolved_schema_response(mock_db_connection, schema):
+    """Queue the response of the search path lookup of an unqualified table name."""
+    mock_db_connection.data_client.add_mock_response(
+        mock_execute_statement_response(
+            columns=['schema_name'], rows=[[schema]] if schema is not None else []
+        )
+    )
+
+
+def add_mock_schema_snapshot_responses(mock_db_connection, version, columns, tables=None):
+    """Queue the responses of the catalog queries loading a schema snapshot."""
+    data_client = mock_db_connection.data_client
+    data_client.add_mock_response(
+        mock_execute_statement_response(columns=['schema_version'], rows=[[version]])
+    )
+    data_client.add_mock_response(
+        mock_execute_statement_response(
+            columns=['table_name', 'relkind', 'row_estimate', 'table_comment'],
+            rows=tables or [],
+        )
+    )
+    data_client.add_mock_response(
+        mock_execute_statement_response(
+            columns=[
+                'table_name',
+                'column_name',
+                'data_type',
+                'is_nullable',
+                'column_default',
+                'column_comment',
+            ],
+            rows=columns,
+        )
+    )
+    data_client.add_mock_response(
+        mock_execute_statement_response(
+            columns=['table_name', 'constraint_name', 'contype', 'definition'],
+            rows=[['orders', 'orders_pkey', 'p', 'PRIMARY KEY (id)']] if tables else [],
+        )
+    )
+    data_client.add_mock_response(
+        mock_execute_statement_response(
+            columns=['table_name', 'index_name', 'is_unique', 'is_primary', 'definition'],
+            rows=[],
+        )
+    )
+
+
+ORDERS_TABLE = [['orders', 'r', 1000, 'Customer orders']]
+ORDERS_COLUMNS = [
+    ['orders', 'id', 'integer', False, None, 'Order id'],
+    ['orders', 'note', 'text', True, None, None],
+]
+
+
+@pytest.mark.asyncio
+async def test_get_table_schema_from_schema_snapshot():
+    """Test that get_table_schema answers later calls from the cached schema snapshot."""
+    schema_snapshot_cache.clear()
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    add_mock_schema_snapshot_responses(
+        mock_db_connection, 'version-1', ORDERS_COLUMNS, ORDERS_TABLE
+    )
+    add_mock_resolved_schema_response(mock_db_connection, 'sales')
+    add_mock_resolved_schema_response(mock_db_connection, 'sales')
+    setup_mock_connection(mock_db_connection)
+
+    ctx = DummyCtx()
+    for table_name in ['sales.orders', 'orders', '"orders"']:
+        tool_response = await get_table_schema(
+            ConnectionMethod.RDS_API, 'test-cluster', 'test-endpoint', 'test-db', table_name, ctx
+        )
+        assert tool_response == [
+            {'column_name': 'id', 'data_type': 'integer', 'column_comment': 'Order id'},
+            {'column_name': 'note', 'data_type': 'text', 'column_comment': None},
+        ]
+
+    # The five catalog queries of the snapshot and the search path lookups were run
+    assert mock_db_connection.data_client._current_response_index == 7
+
+
+@pytest.mark.asyncio
+async def test_get_schema_snapshot():
+    """Test get_schema_snapshot reuses the snapshot while the schema version is unchanged."""
+    schema_snapshot_cache.clear()
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    add_mock_schema_snapshot_responses(
+        mock_db_connection, 'version-1', ORDERS_COLUMNS, ORDERS_TABLE
+    )
+    mock_db_connection.data_client.add_mock_response(
+        mock_execute_statement_response(columns=['schema_version'], rows=[['version-1']])
+    )
+    setup_mock_connection(mock_db_connection)
+
+    ctx = DummyCtx()
+    for _ in range(2):
+        tool_response = await get_schema_snapshot(
+            ConnectionMethod.RDS_API, 'test-cluster', 'test-endpoint', 'test-db', ctx
+        )
+        assert tool_response['schema_name'] == 'public'
+        [table] = tool_response['tables']
+        assert table['table_name'] == 'orders'
+        assert table['table_type'] == 'table'
+        assert table['row_estimate'] == 1000
+        assert table['columns'][0]['is_nullable'] is False
+        assert table['constraints'] == [
+            {
+                'constraint_name': 'orders_pkey',
+                'constraint_type': 'PRIMARY KEY',
+                'definition': 'PRIMARY KEY (id)',
+            }
+        ]
+
+    # The second call only checked the schema version
+    assert mock_db_connection.data_client._current_response_index == 6
+
+
+@pytest.mark.asyncio
+async def test_get_schema_snapshot_not_connected():
+    """Test get_schema_snapshot without a database connection."""
+    db_connection_map.close_all()
+
+    tool_response = await get_schema_snapshot(
+        ConnectionMethod.RDS_API, 'test-cluster', 'test-endpoint', 'test-db', DummyCtx()
+    )
+
+    assert 'No database connection available' in tool_response['error']
+
+
+@pytest.mark.asyncio
+async def test_get_schema_snapshot_error():
+    """Test get_schema_snapshot when the catalog queries fail."""
+    schema_snapshot_cache.clear()
+    setup_mock_connection(Mock_DBConnection(readonly=False, error=MockException.Client))
+
+    tool_response = await get_schema_snapshot(
+        ConnectionMethod.RDS_API, 'test-cluster', 'test-endpoint', 'test-db', DummyCtx()
+    )
+
+    assert tool_response == {'error': client_error_code_key}
+
+
+@pytest.mark.asyncio
+async def test_run_query_write_invalidates_schema_snapshot():
+    """Test that a mutating query drops the cached snapshots of its connection."""
+    schema_snapshot_cache.clear()
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    add_mock_schema_snapshot_responses(
+        mock_db_connection, 'version-1', ORDERS_COLUMNS, ORDERS_TABLE
+    )
+    mock_db_connection.data_client.add_mock_response(
+        mock_execute_statement_response(columns=[], rows=[])
+    )
+    setup_mock_connection(mock_db_connection)
+
+    ctx = DummyCtx()
+    await get_table_schema(
+        ConnectionMethod.RDS_API, 'test-cluster', 'test-endpoint', 'test-db', 'orders', ctx
+    )
+    await run_query(
+        'ALTER TABLE orders ADD COLUMN total numeric',
+        ctx,
+        ConnectionMethod.RDS_API,
+        'test-cluster',
+        'test-endpoint',
+        'test-db',
+    )
+
+    assert schema_snapshot_cache._entries == {}
+
+
 def test_main_with_valid_parameters(monkeypatch, capsys):
     """Test main function with valid command line parameters.
 
@@ -1006,6 +1183,42 @@ def test_get_database_connection_info_with_connections():
     db_connection_map.close_all()
 
 
+@pytest.mark.asyncio
+async def test_get_connection_pool_stats():
+    """Test get_connection_pool_stats reports pool metrics of pgwire connections only."""
+    db_connection_map.close_all()
+    db_connection_map.set(
+        ConnectionMethod.RDS_API,
+        'api-cluster',
+        'api-endpoint',
+        'api-db',
+        Mock_DBConnection(readonly=True),  # type: ignore
+    )
+    pool_connection = PsycopgPoolConnection(
+        host='pg-endpoint',
+        port=5432,
+        database='pg-db',
+        readonly=True,
+        secret_arn='test_secret',  # pragma: allowlist secret
+        db_user='test_user',
+        region='us-east-1',
+        min_size=2,
+        is_test=True,
+    )
+    db_connection_map.set(
+        ConnectionMethod.PG_WIRE_PROTOCOL, 'pg-cluster', 'pg-endpoint', 'pg-db', pool_connection
+    )
+
+    connections = json.loads(await get_connection_pool_stats())
+
+    assert len(connections) == 1
+    assert connections[0]['cluster_identifier'] == 'pg-cluster'
+    assert connections[0]['pool_stats']['size'] == 0
+    assert connections[0]['pool_stats']['min_size'] == 2
+
+    db_connection_map.close_all()
+
+
 def test_get_job_status_not_found():
     """Test get_job_status with non-existent job."""
     result = get_job_status('non-existent-job-id')
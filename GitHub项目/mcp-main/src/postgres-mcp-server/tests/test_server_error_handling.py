@@ -16,6 +16,7 @@
 import json
 import pytest
 from awslabs.postgres_mcp_server.connection.db_connection_map import ConnectionMethod, DatabaseType
+from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import PsycopgPoolConnection
 from awslabs.postgres_mcp_server.server import (
     DummyCtx,
     connect_to_database,
@@ -80,6 +81,34 @@ class TestRunQueryErrorHandling:
                 'SELECT * FROM users WHERE id = :id', parameters
             )
 
+    @pytest.mark.asyncio
+    async def test_run_query_psycopg_rows_truncated(self):
+        """Test that psycopg connections return rows directly and report truncation."""
+        ctx = MagicMock()
+        ctx.warning = AsyncMock()
+        mock_connection = MagicMock(spec=PsycopgPoolConnection)
+        mock_connection.readonly_query = True
+        mock_connection.max_result_rows = 1
+        mock_connection.max_result_bytes = None
+        mock_connection.execute_query_rows = AsyncMock(return_value=([{'id': 1}], True))
+
+        with patch('awslabs.postgres_mcp_server.server.db_connection_map') as mock_map:
+            mock_map.get.return_value = mock_connection
+
+            result = await run_query(
+                sql='SELECT id FROM users',
+                ctx=ctx,
+                connection_method=ConnectionMethod.PG_WIRE_PROTOCOL,
+                cluster_identifier='test-cluster',
+                db_endpoint='test.endpoint.com',
+                database='testdb',
+            )
+
+        assert result == [{'id': 1}]
+        mock_connection.execute_query_rows.assert_called_once_with('SELECT id FROM users', None)
+        mock_connection.execute_query.assert_not_called()
+        ctx.warning.assert_called_once()
+
 
 class TestConnectToDatabaseErrorHandling:
     """Tests for connect_to_database error handling."""
@@ -19,6 +19,15 @@ DEFAULT_AWS_REGION = 'us-east-1'
 DEFAULT_SERVICE_NAME = 'aps'
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1  # seconds
+DEFAULT_HTTP_POOL_MAXSIZE = 10  # keep-alive connections per workspace endpoint
+WORKSPACE_CACHE_TTL_SECONDS = 300  # how long a resolved workspace configuration is reused
+
+# Range query splitting and caching
+RANGE_QUERY_SPLIT_INTERVAL_SECONDS = 86400  # range queries are split into day-sized sub-queries
+RANGE_QUERY_MAX_SUB_QUERIES = 100  # longer ranges are split into proportionally longer intervals
+RANGE_QUERY_MAX_CONCURRENCY = 8  # sub-queries executed in parallel
+RANGE_QUERY_CACHE_FRESHNESS_SECONDS = 600  # sub-ranges newer than this are always queried live
+RANGE_QUERY_CACHE_MAX_SAMPLES = 2_000_000  # samples kept across all cached sub-query results
 
 # API endpoints and paths
 API_VERSION_PATH = '/api/v1'
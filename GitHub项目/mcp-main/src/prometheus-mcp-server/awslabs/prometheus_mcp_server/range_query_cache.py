@@ -0,0 +1,206 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Step-aligned splitting and caching of Prometheus range queries."""
+
+import json
+import re
+import threading
+from awslabs.prometheus_mcp_server.consts import (
+    RANGE_QUERY_CACHE_FRESHNESS_SECONDS,
+    RANGE_QUERY_CACHE_MAX_SAMPLES,
+    RANGE_QUERY_SPLIT_INTERVAL_SECONDS,
+)
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+DURATION_UNITS = {
+    'ms': 0.001,
+    's': 1,
+    'm': 60,
+    'h': 3600,
+    'd': 86400,
+    'w': 604800,
+    'y': 31536000,
+}
+
+DURATION_PATTERN = re.compile(r'(\d+)(ms|s|m|h|d|w|y)')
+
+
+def parse_duration(value: str) -> Optional[float]:
+    """Parse a Prometheus duration ('15s', '1h30m') or a number of seconds.
+
+    Args:
+        value: The duration to parse
+
+    Returns:
+        The duration in seconds, or None if the value is not a valid duration
+    """
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    position = 0
+    seconds = 0.0
+    for match in DURATION_PATTERN.finditer(value):
+        if match.start() != position:
+            return None
+        seconds += int(match.group(1)) * DURATION_UNITS[match.group(2)]
+        position = match.end()
+    if not value or position != len(value):
+        return None
+    return seconds
+
+
+def parse_timestamp(value: str) -> Optional[float]:
+    """Parse a Prometheus timestamp given as RFC3339 or Unix timestamp.
+
+    Args:
+        value: The timestamp to parse
+
+    Returns:
+        The timestamp in Unix seconds, or None if the value is not a valid timestamp
+    """
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def split_range(
+    start: float,
+    end: float,
+    step: int,
+    interval: int = RANGE_QUERY_SPLIT_INTERVAL_SECONDS,
+) -> List[Tuple[int, int]]:
+    """Align a range query to its step and split it at interval boundaries.
+
+    Evaluation timestamps are aligned to multiples of the step, so every sub-range starts and ends
+    on an evaluation timestamp and the same sub-range is produced for every request that covers it.
+
+    Args:
+        start: Start of the range in Unix seconds
+        end: End of the range in Unix seconds
+        step: The query resolution step in whole seconds
+        interval: The length of the intervals to split at, in seconds
+
+    Returns:
+        Inclusive (start, end) sub-ranges in Unix seconds, in ascending order
+    """
+    aligned_start = int(start // step * step)
+    aligned_end = int(end // step * step)
+
+    sub_ranges = []
+    interval_start = aligned_start // interval * interval
+    while interval_start <= aligned_end:
+        interval_end = interval_start + interval
+        sub_start = max(aligned_start, -(-interval_start // step) * step)
+        sub_end = min(aligned_end, -(-interval_end // step) * step - step)
+        if sub_start <= sub_end:
+            sub_ranges.append((sub_start, sub_end))
+        interval_start = interval_end
+    return sub_ranges
+
+
+def merge_matrix_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge the results of consecutive range sub-queries into one matrix result.
+
+    Args:
+        results: The data portions of the sub-query responses, in ascending time order
+
+    Returns:
+        A matrix result with the values of each series concatenated in time order
+    """
+    series: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        for item in result.get('result', []):
+            key = json.dumps(item.get('metric', {}), sort_keys=True)
+            merged = series.setdefault(key, {'metric': item.get('metric', {}), 'values': []})
+            merged['values'].extend(item.get('values', []))
+    return {'resultType': 'matrix', 'result': list(series.values())}
+
+
+class RangeQueryCache:
+    """Bounded in-memory cache of range sub-query results.
+
+    Entries are keyed by (endpoint, query, step, sub-range). Only sub-ranges that ended more than
+    freshness_seconds ago are cached, since recent samples may still be ingested late. The least
+    recently used entries are evicted once max_samples is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_samples: int = RANGE_QUERY_CACHE_MAX_SAMPLES,
+        freshness_seconds: int = RANGE_QUERY_CACHE_FRESHNESS_SECONDS,
+    ):
+        """Initialize the range query cache.
+
+        Args:
+            max_samples: Maximum number of samples kept across all entries
+            freshness_seconds: Age after which a sub-range is considered immutable and cacheable
+        """
+        self.max_samples = max_samples
+        self.freshness_seconds = freshness_seconds
+        self._entries: 'OrderedDict[Hashable, Tuple[Dict[str, Any], int]]' = OrderedDict()
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, sub_end: float, now: float) -> bool:
+        """Return whether a sub-range ending at sub_end is old enough to be cached."""
+        return sub_end <= now - self.freshness_seconds
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a key, or None if it is not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, result: Dict[str, Any]) -> None:
+        """Cache the result of a sub-query and evict entries over the sample budget."""
+        samples = sum(len(item.get('values', [])) for item in result.get('result', []))
+        if samples > self.max_samples:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._samples -= previous[1]
+            self._entries[key] = (result, samples)
+            self._samples += samples
+
+            while self._samples > self.max_samples:
+                _, (_, evicted_samples) = self._entries.popitem(last=False)
+                self._samples -= evicted_samples
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._samples = 0
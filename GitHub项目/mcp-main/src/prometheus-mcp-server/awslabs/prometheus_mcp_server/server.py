@@ -15,27 +15,41 @@
 """Prometheus MCP Server implementation."""
 
 import argparse
+import asyncio
 import boto3
 import json
 import os
 import requests
 import sys
+import threading
 import time
 from awslabs.prometheus_mcp_server.consts import (
     API_VERSION_PATH,
     DEFAULT_AWS_REGION,
+    DEFAULT_HTTP_POOL_MAXSIZE,
     DEFAULT_MAX_RETRIES,
     DEFAULT_RETRY_DELAY,
     DEFAULT_SERVICE_NAME,
     ENV_AWS_PROFILE,
     ENV_AWS_REGION,
     ENV_LOG_LEVEL,
+    RANGE_QUERY_MAX_CONCURRENCY,
+    RANGE_QUERY_MAX_SUB_QUERIES,
+    RANGE_QUERY_SPLIT_INTERVAL_SECONDS,
     SERVER_INSTRUCTIONS,
+    WORKSPACE_CACHE_TTL_SECONDS,
 )
 from awslabs.prometheus_mcp_server.models import (
     MetricsList,
     ServerInfo,
 )
+from awslabs.prometheus_mcp_server.range_query_cache import (
+    RangeQueryCache,
+    merge_matrix_results,
+    parse_duration,
+    parse_timestamp,
+    split_range,
+)
 from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
 from botocore.config import Config
@@ -44,7 +58,9 @@ from dotenv import load_dotenv
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
-from typing import Any, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 
 # Configure loguru
@@ -211,8 +227,61 @@ class SecurityValidator:
         return SecurityValidator.validate_string(query, 'query pattern')
 
 
+# Cache of range sub-query results shared by all workspaces
+range_query_cache = RangeQueryCache()
+
+
 class PrometheusClient:
-    """Client for interacting with Prometheus API."""
+    """Client for interacting with Prometheus API.
+
+    AWS sessions are reused per (profile, region) so that credentials are resolved once and
+    refreshed by botocore shortly before they expire. HTTP sessions are reused per workspace
+    endpoint so that consecutive queries share keep-alive connections.
+    """
+
+    _aws_sessions: Dict[Tuple[Optional[str], str], boto3.Session] = {}
+    _http_sessions: Dict[str, requests.Session] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_aws_session(region: str, profile: Optional[str] = None) -> boto3.Session:
+        """Get the shared AWS session for a profile and region, creating it if needed."""
+        key = (profile, region)
+        with PrometheusClient._lock:
+            session = PrometheusClient._aws_sessions.get(key)
+            if session is None:
+                session = boto3.Session(profile_name=profile, region_name=region)
+                PrometheusClient._aws_sessions[key] = session
+            return session
+
+    @staticmethod
+    def get_http_session(url: str) -> requests.Session:
+        """Get the pooled HTTP session for the endpoint of a URL, creating it if needed."""
+        parts = urlsplit(url)
+        key = f'{parts.scheme}://{parts.netloc}'
+        with PrometheusClient._lock:
+            session = PrometheusClient._http_sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=DEFAULT_HTTP_POOL_MAXSIZE)
+                session.mount(f'{key}/', adapter)
+                PrometheusClient._http_sessions[key] = session
+            return session
+
+    @staticmethod
+    def invalidate_aws_session(region: str, profile: Optional[str] = None) -> None:
+        """Drop the shared AWS session so the next request resolves credentials again."""
+        with PrometheusClient._lock:
+            PrometheusClient._aws_sessions.pop((profile, region), None)
+
+    @staticmethod
+    def clear_sessions() -> None:
+        """Close all pooled HTTP sessions and drop all shared AWS sessions."""
+        with PrometheusClient._lock:
+            for session in PrometheusClient._http_sessions.values():
+                session.close()
+            PrometheusClient._http_sessions.clear()
+            PrometheusClient._aws_sessions.clear()
 
     @staticmethod
     async def make_request(
@@ -274,15 +343,18 @@ class PrometheusClient:
 
         while retry_count < max_retries:
             try:
-                # Create a fresh session and client for each attempt
-                session = boto3.Session(profile_name=profile, region_name=region)
+                # Reuse the shared session; refreshable credentials renew before they expire
+                session = PrometheusClient.get_aws_session(region, profile)
                 credentials = session.get_credentials()
                 if not credentials:
+                    PrometheusClient.invalidate_aws_session(region, profile)
                     raise ValueError('AWS credentials not found')
 
-                # Create and sign the request
+                # Create and sign the request, every attempt needs a fresh signature
                 aws_request = AWSRequest(method='GET', url=url, params=params or {})
-                SigV4Auth(credentials, service_name, region).add_auth(aws_request)
+                SigV4Auth(credentials.get_frozen_credentials(), service_name, region).add_auth(
+                    aws_request
+                )
 
                 # Convert to requests format
                 prepared_request = requests.Request(
@@ -292,21 +364,22 @@ class PrometheusClient:
                     params=params or {},
                 ).prepare()
 
-                # Send the request
-                with requests.Session() as req_session:
-                    logger.debug(
-                        f'Making request to {url} (attempt {retry_count + 1}/{max_retries})'
-                    )
-                    response = req_session.send(prepared_request)
-                    response.raise_for_status()
-                    data = response.json()
-
-                    if data['status'] != 'success':
-                        error_msg = data.get('error', 'Unknown error')
-                        logger.error(f'Prometheus API request failed: {error_msg}')
-                        raise RuntimeError(f'Prometheus API request failed: {error_msg}')
-
-                    return data['data']
+                # Send the request over the pooled keep-alive connection of the endpoint
+                req_session = PrometheusClient.get_http_session(url)
+                logger.debug(f'Making request to {url} (attempt {retry_count + 1}/{max_retries})')
+                response = await asyncio.to_thread(req_session.send, prepared_request)
+                if response.status_code in (401, 403):
+                    # Credentials may have been rotated outside of botocore, reload on retry
+                    PrometheusClient.invalidate_aws_session(region, profile)
+                response.raise_for_status()
+                data = response.json()
+
+                if data['status'] != 'success':
+                    error_msg = data.get('error', 'Unknown error')
+                    logger.error(f'Prometheus API request failed: {error_msg}')
+                    raise RuntimeError(f'Prometheus API request failed: {error_msg}')
+
+                return data['data']
             except (requests.RequestException, json.JSONDecodeError) as e:
                 last_exception = e
                 retry_count += 1
@@ -324,6 +397,96 @@ class PrometheusClient:
             raise last_exception
         return None
 
+    @staticmethod
+    async def make_range_request(
+        prometheus_url: str,
+        query: str,
+        start: str,
+        end: str,
+        step: str,
+        region: str = DEFAULT_AWS_REGION,
+        profile: Optional[str] = None,
+    ) -> Any:
+        """Execute a range query as step-aligned, cached sub-queries.
+
+        The range is aligned to the step and split into day-sized sub-queries that run in parallel.
+        Sub-ranges older than the cache freshness window are cached per (endpoint, query, step), so
+        repeated queries only fetch the recent tail live. Queries whose start, end or step cannot be
+        parsed, or whose step is not a whole number of seconds, are forwarded unchanged.
+
+        Args:
+            prometheus_url: The base URL for the Prometheus API
+            query: The PromQL query to execute
+            start: Start timestamp (RFC3339 or Unix timestamp)
+            end: End timestamp (RFC3339 or Unix timestamp)
+            step: Query resolution step width (duration format or seconds)
+            region: AWS region to use
+            profile: AWS profile to use
+
+        Returns:
+            The merged matrix result of the range query
+        """
+        start_seconds = parse_timestamp(start)
+        end_seconds = parse_timestamp(end)
+        step_seconds = parse_duration(step)
+        if (
+            start_seconds is None
+            or end_seconds is None
+            or step_seconds is None
+            or step_seconds < 1
+            or step_seconds != int(step_seconds)
+            or end_seconds < start_seconds
+        ):
+            return await PrometheusClient.make_request(
+                prometheus_url=prometheus_url,
+                endpoint='query_range',
+                params={'query': query, 'start': start, 'end': end, 'step': step},
+                region=region,
+                profile=profile,
+                max_retries=DEFAULT_MAX_RETRIES,
+                retry_delay=DEFAULT_RETRY_DELAY,
+                service_name=DEFAULT_SERVICE_NAME,
+            )
+
+        step_seconds = int(step_seconds)
+        interval = RANGE_QUERY_SPLIT_INTERVAL_SECONDS
+        max_range = interval * RANGE_QUERY_MAX_SUB_QUERIES
+        interval *= -(-int(end_seconds - start_seconds + 1) // max_range)
+        sub_ranges = split_range(start_seconds, end_seconds, step_seconds, interval)
+
+        now = time.time()
+        semaphore = asyncio.Semaphore(RANGE_QUERY_MAX_CONCURRENCY)
+
+        async def fetch(sub_start: int, sub_end: int) -> Dict[str, Any]:
+            key = (prometheus_url, query, step_seconds, sub_start, sub_end)
+            cached = range_query_cache.get(key)
+            if cached is not None:
+                return cached
+
+            async with semaphore:
+                result = await PrometheusClient.make_request(
+                    prometheus_url=prometheus_url,
+                    endpoint='query_range',
+                    params={
+                        'query': query,
+                        'start': str(sub_start),
+                        'end': str(sub_end),
+                        'step': str(step_seconds),
+                    },
+                    region=region,
+                    profile=profile,
+                    max_retries=DEFAULT_MAX_RETRIES,
+                    retry_delay=DEFAULT_RETRY_DELAY,
+                    service_name=DEFAULT_SERVICE_NAME,
+                )
+            if range_query_cache.is_cacheable(sub_end, now):
+                range_query_cache.put(key, result)
+            return result
+
+        logger.debug(f'Executing range query as {len(sub_ranges)} sub-queries')
+        results = await asyncio.gather(*(fetch(s, e) for s, e in sub_ranges))
+        return merge_matrix_results(results)
+
 
 class PrometheusConnection:
     """Handles Prometheus connection testing."""
@@ -389,6 +552,42 @@ class PrometheusConnection:
             return False
 
 
+class WorkspaceConfigCache:
+    """TTL cache of resolved and connection-tested workspace configurations.
+
+    Avoids a DescribeWorkspace call and a connection test on every tool invocation for a
+    workspace that was already configured recently.
+    """
+
+    _entries: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get(key: Tuple) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached configuration for a key, or None if missing or expired."""
+        with WorkspaceConfigCache._lock:
+            entry = WorkspaceConfigCache._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, config = entry
+            if time.monotonic() >= expires_at:
+                del WorkspaceConfigCache._entries[key]
+                return None
+            return dict(config)
+
+    @staticmethod
+    def put(key: Tuple, config: Dict[str, Any], ttl: float = WORKSPACE_CACHE_TTL_SECONDS) -> None:
+        """Cache a workspace configuration for ttl seconds."""
+        with WorkspaceConfigCache._lock:
+            WorkspaceConfigCache._entries[key] = (time.monotonic() + ttl, dict(config))
+
+    @staticmethod
+    def clear() -> None:
+        """Remove all cached workspace configurations."""
+        with WorkspaceConfigCache._lock:
+            WorkspaceConfigCache._entries.clear()
+
+
 # Initialize MCP
 mcp = FastMCP(
     name='awslabs-prometheus-mcp-server',
@@ -581,6 +780,8 @@ async def execute_range_query(
     - Use this tool to execute a PromQL query over a time range
     - The query will return a series of values for the specified time range
     - Useful for generating time series data for graphs or trend analysis
+    - Start and end are aligned to the step, and long ranges are split into day-sized sub-queries
+    - Results older than 10 minutes are cached, so repeated queries only fetch the recent tail
     - If workspace_id is not known, use GetAvailableWorkspaces tool first to find available workspaces and ASK THE USER to choose one
     - Uses DescribeWorkspace API to get the exact workspace URL
     - No manual URL construction is performed
@@ -619,17 +820,14 @@ async def execute_range_query(
             await ctx.error(error_msg)
             raise ValueError(error_msg)
 
-        params = {'query': query, 'start': start, 'end': end, 'step': step}
-
-        return await PrometheusClient.make_request(
+        return await PrometheusClient.make_range_request(
             prometheus_url=workspace_config['prometheus_url'],
-            endpoint='query_range',
-            params=params,
+            query=query,
+            start=start,
+            end=end,
+            step=step,
             region=workspace_config['region'],
             profile=workspace_config['profile'],
-            max_retries=DEFAULT_MAX_RETRIES,
-            retry_delay=DEFAULT_RETRY_DELAY,
-            service_name=DEFAULT_SERVICE_NAME,
         )
     except Exception as e:
         error_msg = f'Error executing range query: {str(e)}'
@@ -937,6 +1135,7 @@ async def configure_workspace_for_request(
     If a URL is provided via environment variable, it will be used directly.
     If a workspace ID is provided, it will be used to fetch the URL from AWS API.
     If no workspace ID is provided but the URL contains one, it will be extracted and used.
+    Configurations that passed the connection test are cached for WORKSPACE_CACHE_TTL_SECONDS.
 
     Args:
         ctx: The MCP context
@@ -962,6 +1161,15 @@ async def configure_workspace_for_request(
                 workspace_id = extracted_workspace_id
                 logger.info(f'Using workspace ID extracted from URL: {workspace_id}')
 
+        # Reuse a recently resolved and tested configuration
+        cache_key = (prometheus_url, workspace_id, aws_region, aws_profile)
+        cached_config = WorkspaceConfigCache.get(cache_key)
+        if cached_config:
+            logger.debug(
+                f'Using cached workspace configuration: {cached_config["prometheus_url"]}'
+            )
+            return cached_config
+
         # If we have a URL but no workspace_id could be extracted, use the URL directly
         if prometheus_url:
             logger.info(f'Using Prometheus URL from environment: {prometheus_url}')
@@ -975,12 +1183,14 @@ async def configure_workspace_for_request(
                 await ctx.error(error_msg)
                 raise RuntimeError(error_msg)
 
-            return {
+            workspace_config = {
                 'prometheus_url': prometheus_url,
                 'region': aws_region,
                 'profile': aws_profile,
                 'workspace_id': workspace_id,
             }
+            WorkspaceConfigCache.put(cache_key, workspace_config)
+            return workspace_config
 
         # If no URL is configured, require workspace_id
         if not workspace_id:
@@ -1012,12 +1222,14 @@ async def configure_workspace_for_request(
         logger.info(f'Successfully configured workspace {workspace_id} for request')
 
         # Return workspace configuration
-        return {
+        workspace_config = {
             'prometheus_url': prometheus_url,
             'region': aws_region,
             'profile': aws_profile,
             'workspace_id': workspace_id,
         }
+        WorkspaceConfigCache.put(cache_key, workspace_config)
+        return workspace_config
     except Exception as e:
         error_msg = f'Error configuring workspace: {str(e)}'
         logger.error(error_msg)
@@ -1087,8 +1299,6 @@ def main():
         sys.exit(1)
 
     # Run async initialization in an event loop
-    import asyncio
-
     asyncio.run(async_main())
 
     logger.info('Starting server...')
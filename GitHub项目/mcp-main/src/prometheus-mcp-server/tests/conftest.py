@@ -15,9 +15,22 @@
 """Pytest configuration for the awslabs.prometheus-mcp-server package."""
 
 import pytest
+from awslabs.prometheus_mcp_server.server import (
+    PrometheusClient,
+    WorkspaceConfigCache,
+    range_query_cache,
+)
 from unittest.mock import AsyncMock, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_state():
+    """Drop pooled sessions and cached workspace configurations and results before each test."""
+    PrometheusClient.clear_sessions()
+    WorkspaceConfigCache.clear()
+    range_query_cache.clear()
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock Context object for testing."""
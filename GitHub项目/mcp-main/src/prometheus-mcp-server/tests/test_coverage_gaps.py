@@ -23,7 +23,7 @@ class TestPrometheusClientSuccess:
             # Mock successful response
             mock_response = MagicMock()
             mock_response.json.return_value = {'status': 'success', 'data': {'result': []}}
-            mock_req_session.return_value.__enter__.return_value.send.return_value = mock_response
+            mock_req_session.return_value.send.return_value = mock_response
 
             result = await PrometheusClient.make_request(
                 prometheus_url='https://test.com', endpoint='query', params={'query': 'up'}
@@ -46,7 +46,7 @@ class TestPrometheusClientSuccess:
             # Mock API error response
             mock_response = MagicMock()
             mock_response.json.return_value = {'status': 'error', 'error': 'test error'}
-            mock_req_session.return_value.__enter__.return_value.send.return_value = mock_response
+            mock_req_session.return_value.send.return_value = mock_response
 
             with pytest.raises(RuntimeError, match='Prometheus API request failed: test error'):
                 await PrometheusClient.make_request(
@@ -121,6 +121,7 @@ class TestMainExecution:
                 'awslabs.prometheus_mcp_server.server.AWSCredentials.validate', return_value=False
             ),
             patch('sys.exit') as mock_exit,
+            patch('awslabs.prometheus_mcp_server.server.mcp.run'),
         ):
             mock_args.return_value = MagicMock(url=None, region=None, profile=None, debug=False)
 
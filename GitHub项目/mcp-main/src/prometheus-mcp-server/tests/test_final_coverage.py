@@ -24,7 +24,7 @@ class TestFinalCoverage:
             # All requests fail
             mock_response = MagicMock()
             mock_response.raise_for_status.side_effect = Exception('Network error')
-            mock_req_session.return_value.__enter__.return_value.send.return_value = mock_response
+            mock_req_session.return_value.send.return_value = mock_response
 
             with pytest.raises(Exception, match='Network error'):
                 await PrometheusClient.make_request(
@@ -201,7 +201,8 @@ class TestMain:
             patch('sys.exit') as mock_exit,
             patch('awslabs.prometheus_mcp_server.server.logger'),
             patch('asyncio.run'),
-        ):  # Prevent asyncio.run from being called
+            patch('awslabs.prometheus_mcp_server.server.mcp.run'),
+        ):  # Prevent asyncio.run and the stdio server from being started
             main()
 
             # Check that sys.exit was called with 1
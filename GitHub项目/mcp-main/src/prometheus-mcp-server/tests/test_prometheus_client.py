@@ -15,6 +15,7 @@
 """Tests for the PrometheusClient class."""
 
 import pytest
+import requests
 from awslabs.prometheus_mcp_server.server import PrometheusClient
 from unittest.mock import MagicMock, patch
 
@@ -115,3 +116,57 @@ class TestPrometheusClient:
                 await PrometheusClient.make_request(
                     prometheus_url='https://example.com', endpoint='query', params={'query': 'up'}
                 )
+
+    @pytest.mark.asyncio
+    async def test_make_request_reuses_sessions(self):
+        """Test that consecutive requests share the AWS session and the pooled HTTP session."""
+        mock_session = MagicMock()
+        mock_response = MagicMock(status_code=200)
+        mock_response.json.return_value = {'status': 'success', 'data': ['up']}
+
+        with (
+            patch(
+                'awslabs.prometheus_mcp_server.server.boto3.Session', return_value=mock_session
+            ) as mock_session_cls,
+            patch('awslabs.prometheus_mcp_server.server.requests.Session') as mock_http_cls,
+            patch('awslabs.prometheus_mcp_server.server.SigV4Auth') as mock_sigv4,
+        ):
+            mock_http_cls.return_value.send.return_value = mock_response
+            for endpoint in ('query', 'label/__name__/values'):
+                result = await PrometheusClient.make_request(
+                    prometheus_url='https://example.com/workspaces/ws-1', endpoint=endpoint
+                )
+                assert result == ['up']
+
+        mock_session_cls.assert_called_once_with(profile_name=None, region_name='us-east-1')
+        mock_http_cls.assert_called_once()
+        assert mock_http_cls.return_value.send.call_count == 2
+        # Every request is signed with the current credentials of the shared session
+        assert mock_sigv4.call_count == 2
+        mock_sigv4.assert_called_with(
+            mock_session.get_credentials.return_value.get_frozen_credentials.return_value,
+            'aps',
+            'us-east-1',
+        )
+
+    @pytest.mark.asyncio
+    async def test_make_request_reloads_credentials_after_auth_failure(self):
+        """Test that an authorization failure drops the shared session before retrying."""
+        denied = MagicMock(status_code=403)
+        denied.raise_for_status.side_effect = requests.HTTPError('403 Forbidden')
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {'status': 'success', 'data': []}
+
+        with (
+            patch('awslabs.prometheus_mcp_server.server.boto3.Session') as mock_session_cls,
+            patch('awslabs.prometheus_mcp_server.server.requests.Session') as mock_http_cls,
+            patch('awslabs.prometheus_mcp_server.server.SigV4Auth'),
+            patch('awslabs.prometheus_mcp_server.server.time.sleep'),
+        ):
+            mock_http_cls.return_value.send.side_effect = [denied, ok]
+            result = await PrometheusClient.make_request(
+                prometheus_url='https://example.com', endpoint='query'
+            )
+
+        assert result == []
+        assert mock_session_cls.call_count == 2
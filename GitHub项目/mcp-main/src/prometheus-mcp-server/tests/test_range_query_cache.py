@@ -0,0 +1,213 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for step-aligned range query splitting and caching."""
+
+import pytest
+from awslabs.prometheus_mcp_server.range_query_cache import (
+    RangeQueryCache,
+    merge_matrix_results,
+    parse_duration,
+    parse_timestamp,
+    split_range,
+)
+from awslabs.prometheus_mcp_server.server import PrometheusClient
+from unittest.mock import AsyncMock, patch
+
+
+DAY = 86400
+NOW = 472223 * 3600 + 60
+
+
+def _matrix(params):
+    """Return one series with a sample at every step of the requested sub-range."""
+    start, end, step = int(params['start']), int(params['end']), int(params['step'])
+    return {
+        'resultType': 'matrix',
+        'result': [
+            {
+                'metric': {'job': 'node'},
+                'values': [[ts, '1'] for ts in range(start, end + 1, step)],
+            }
+        ],
+    }
+
+
+class TestParsing:
+    """Tests for duration and timestamp parsing."""
+
+    @pytest.mark.parametrize(
+        'value,expected',
+        [('15s', 15), ('1m', 60), ('1h30m', 5400), ('500ms', 0.5), ('30', 30), ('2.5', 2.5)],
+    )
+    def test_parse_duration(self, value, expected):
+        """Test that Prometheus durations and plain seconds are parsed."""
+        assert parse_duration(value) == expected
+
+    @pytest.mark.parametrize('value', ['', '5x', '1h 30m', 'm5'])
+    def test_parse_duration_invalid(self, value):
+        """Test that invalid durations are rejected."""
+        assert parse_duration(value) is None
+
+    def test_parse_timestamp(self):
+        """Test that RFC3339 and Unix timestamps are parsed."""
+        assert parse_timestamp('2023-01-01T00:00:00Z') == 1672531200
+        assert parse_timestamp('2023-01-01T01:00:00+01:00') == 1672531200
+        assert parse_timestamp('1672531200.5') == 1672531200.5
+        assert parse_timestamp('yesterday') is None
+
+
+class TestSplitRange:
+    """Tests for split_range."""
+
+    def test_aligns_to_step(self):
+        """Test that start and end are aligned down to multiples of the step."""
+        assert split_range(1000, 1950, 300) == [(900, 1800)]
+
+    def test_splits_at_day_boundaries(self):
+        """Test that sub-ranges end on the last evaluation timestamp before a day boundary."""
+        assert split_range(DAY - 3600, 2 * DAY + 3600, 3600) == [
+            (DAY - 3600, DAY - 3600),
+            (DAY, 2 * DAY - 3600),
+            (2 * DAY, 2 * DAY + 3600),
+        ]
+
+    def test_steps_not_dividing_the_interval(self):
+        """Test that no evaluation timestamp is lost or duplicated between sub-ranges."""
+        step = 7 * 3600
+        sub_ranges = split_range(0, 3 * DAY, step)
+        timestamps = [ts for s, e in sub_ranges for ts in range(s, e + 1, step)]
+
+        assert timestamps == list(range(0, 3 * DAY + 1, step))
+
+
+class TestMergeMatrixResults:
+    """Tests for merge_matrix_results."""
+
+    def test_concatenates_series_by_labels(self):
+        """Test that values of the same series are concatenated in order."""
+        merged = merge_matrix_results(
+            [
+                {'result': [{'metric': {'a': '1'}, 'values': [[1, '1']]}]},
+                {
+                    'result': [
+                        {'metric': {'a': '2'}, 'values': [[2, '2']]},
+                        {'metric': {'a': '1'}, 'values': [[2, '3']]},
+                    ]
+                },
+            ]
+        )
+
+        assert merged == {
+            'resultType': 'matrix',
+            'result': [
+                {'metric': {'a': '1'}, 'values': [[1, '1'], [2, '3']]},
+                {'metric': {'a': '2'}, 'values': [[2, '2']]},
+            ],
+        }
+
+
+class TestRangeQueryCache:
+    """Tests for RangeQueryCache."""
+
+    def test_freshness(self):
+        """Test that only sub-ranges older than the freshness window are cacheable."""
+        cache = RangeQueryCache(freshness_seconds=600)
+
+        assert cache.is_cacheable(NOW - 600, NOW)
+        assert not cache.is_cacheable(NOW - 599, NOW)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test that the sample budget evicts the least recently used entries."""
+        cache = RangeQueryCache(max_samples=3)
+        cache.put('a', {'result': [{'values': [[1, '1'], [2, '1']]}]})
+        cache.put('b', {'result': [{'values': [[1, '1']]}]})
+        cache.get('a')
+        cache.put('c', {'result': [{'values': [[1, '1']]}]})
+
+        assert cache.get('a') is not None
+        assert cache.get('b') is None
+        assert cache.get('c') is not None
+
+
+class TestMakeRangeRequest:
+    """Tests for PrometheusClient.make_range_request."""
+
+    @pytest.mark.asyncio
+    async def test_past_sub_ranges_are_cached(self):
+        """Test that repeated queries only fetch the recent tail live."""
+        mock_make_request = AsyncMock(side_effect=lambda **kwargs: _matrix(kwargs['params']))
+        start, end = NOW - 2 * DAY, NOW
+
+        with (
+            patch(
+                'awslabs.prometheus_mcp_server.server.PrometheusClient.make_request',
+                mock_make_request,
+            ),
+            patch('awslabs.prometheus_mcp_server.server.time.time', return_value=NOW),
+        ):
+            first = await PrometheusClient.make_range_request(
+                'https://example.com', 'up', str(start), str(end), '1h'
+            )
+            assert mock_make_request.call_count == 3
+
+            second = await PrometheusClient.make_range_request(
+                'https://example.com', 'up', str(start), str(end), '1h'
+            )
+
+        assert second == first
+        assert mock_make_request.call_count == 4
+        live_params = mock_make_request.call_args[1]['params']
+        assert live_params['end'] == str(NOW // 3600 * 3600)
+        values = first['result'][0]['values']
+        assert [ts for ts, _ in values] == list(range(start // 3600 * 3600, end + 1, 3600))
+
+    @pytest.mark.asyncio
+    async def test_long_ranges_are_limited_in_sub_queries(self):
+        """Test that very long ranges are split into longer intervals."""
+        mock_make_request = AsyncMock(side_effect=lambda **kwargs: _matrix(kwargs['params']))
+
+        with (
+            patch(
+                'awslabs.prometheus_mcp_server.server.PrometheusClient.make_request',
+                mock_make_request,
+            ),
+            patch('awslabs.prometheus_mcp_server.server.RANGE_QUERY_MAX_SUB_QUERIES', 10),
+        ):
+            await PrometheusClient.make_range_request(
+                'https://example.com', 'up', '0', str(100 * DAY), '1d'
+            )
+
+        assert mock_make_request.call_count <= 11
+
+    @pytest.mark.asyncio
+    async def test_unparsable_queries_are_forwarded(self):
+        """Test that queries with sub-second or invalid steps are forwarded unchanged."""
+        mock_make_request = AsyncMock(return_value={'resultType': 'matrix', 'result': []})
+
+        with patch(
+            'awslabs.prometheus_mcp_server.server.PrometheusClient.make_request',
+            mock_make_request,
+        ):
+            await PrometheusClient.make_range_request(
+                'https://example.com', 'up', 'now-1h', 'now', '1m'
+            )
+            await PrometheusClient.make_range_request(
+                'https://example.com', 'up', '0', '60', '0.5'
+            )
+
+        assert [c[1]['params'] for c in mock_make_request.call_args_list] == [
+            {'query': 'up', 'start': 'now-1h', 'end': 'now', 'step': '1m'},
+            {'query': 'up', 'start': '0', 'end': '60', 'step': '0.5'},
+        ]
@@ -16,6 +16,7 @@
 
 import os
 import pytest
+from awslabs.prometheus_mcp_server.consts import WORKSPACE_CACHE_TTL_SECONDS
 from awslabs.prometheus_mcp_server.server import (
     configure_workspace_for_request,
     get_prometheus_client,
@@ -397,3 +398,74 @@ class TestWorkspaceConfig:
         # Reset environment variables
         del os.environ['PROMETHEUS_URL']
         del os.environ['AWS_REGION']
+
+    @pytest.mark.asyncio
+    async def test_configure_workspace_for_request_uses_cache(self, mock_context):
+        """Test that a configured workspace is reused without another lookup or connection test."""
+        mock_get_workspace_details = AsyncMock(
+            return_value={'prometheus_url': 'https://example.com/workspaces/ws-12345'}
+        )
+        mock_test_connection = AsyncMock(return_value=True)
+
+        # Ensure environment has no URL
+        if 'PROMETHEUS_URL' in os.environ:
+            del os.environ['PROMETHEUS_URL']
+
+        with (
+            patch(
+                'awslabs.prometheus_mcp_server.server.get_workspace_details',
+                mock_get_workspace_details,
+            ),
+            patch(
+                'awslabs.prometheus_mcp_server.server.PrometheusConnection.test_connection',
+                mock_test_connection,
+            ),
+            patch('awslabs.prometheus_mcp_server.server.logger'),
+        ):
+            first = await configure_workspace_for_request(
+                ctx=mock_context, workspace_id='ws-12345', region='us-east-1', profile=None
+            )
+            second = await configure_workspace_for_request(
+                ctx=mock_context, workspace_id='ws-12345', region='us-east-1', profile=None
+            )
+            await configure_workspace_for_request(
+                ctx=mock_context, workspace_id='ws-12345', region='us-west-2', profile=None
+            )
+
+            assert second == first
+            assert mock_get_workspace_details.call_count == 2
+            assert mock_test_connection.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_configure_workspace_for_request_cache_expires(self, mock_context):
+        """Test that cached workspace configurations expire after their TTL."""
+        mock_get_workspace_details = AsyncMock(
+            return_value={'prometheus_url': 'https://example.com/workspaces/ws-12345'}
+        )
+
+        # Ensure environment has no URL
+        if 'PROMETHEUS_URL' in os.environ:
+            del os.environ['PROMETHEUS_URL']
+
+        with (
+            patch(
+                'awslabs.prometheus_mcp_server.server.get_workspace_details',
+                mock_get_workspace_details,
+            ),
+            patch(
+                'awslabs.prometheus_mcp_server.server.PrometheusConnection.test_connection',
+                AsyncMock(return_value=True),
+            ),
+            patch('awslabs.prometheus_mcp_server.server.time.monotonic') as mock_monotonic,
+            patch('awslabs.prometheus_mcp_server.server.logger'),
+        ):
+            mock_monotonic.return_value = 1000.0
+            await configure_workspace_for_request(
+                ctx=mock_context, workspace_id='ws-12345', region='us-east-1', profile=None
+            )
+            mock_monotonic.return_value = 1000.0 + WORKSPACE_CACHE_TTL_SECONDS
+            await configure_workspace_for_request(
+                ctx=mock_context, workspace_id='ws-12345', region='us-east-1', profile=None
+            )
+
+            assert mock_get_workspace_details.call_count == 2
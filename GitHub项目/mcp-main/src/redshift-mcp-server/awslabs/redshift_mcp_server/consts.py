@@ -22,7 +22,14 @@ CLIENT_USER_AGENT_NAME = 'awslabs/mcp/redshift-mcp-server'
 DEFAULT_LOG_LEVEL = 'WARNING'
 QUERY_TIMEOUT = 3600
 QUERY_POLL_INTERVAL = 1
+QUERY_POLL_INITIAL_INTERVAL = 0.05
+QUERY_POLL_BACKOFF = 1.5
 SESSION_KEEPALIVE = 600
+CLUSTER_CACHE_TTL = 300
+METADATA_CACHE_TTL = 300
+QUERY_RESULT_MAX_ROWS = 100000
+QUERY_RESULT_MAX_BYTES = 50 * 1024 * 1024
+QUERY_RESULT_FILE_MAX_BYTES = 1024 * 1024 * 1024
 
 # Best practices
 
@@ -64,62 +71,53 @@ REDSHIFT_BEST_PRACTICES = """
 
 # SQL queries
 
-SVV_REDSHIFT_DATABASES_QUERY = """
+# Loads the databases of the cluster and the schemas, tables and columns of one database as one
+# result, distinguished by the kind column and ordered by name and ordinal position.
+SVV_CATALOG_QUERY = """
 SELECT
+    'database' AS kind,
     database_name,
-    database_owner,
-    database_type,
-    database_acl,
-    database_options,
-    database_isolation_level
+    NULL::varchar AS schema_name,
+    NULL::varchar AS table_name,
+    NULL::varchar AS column_name,
+    database_owner AS owner,
+    database_type AS object_type,
+    database_acl AS acl,
+    database_options AS options,
+    database_isolation_level,
+    NULL::varchar AS source_database,
+    NULL::integer AS ordinal_position,
+    NULL::varchar AS column_default,
+    NULL::varchar AS is_nullable,
+    NULL::varchar AS data_type,
+    NULL::integer AS character_maximum_length,
+    NULL::integer AS numeric_precision,
+    NULL::integer AS numeric_scale,
+    NULL::varchar AS remarks
 FROM pg_catalog.svv_redshift_databases
-ORDER BY database_name;
-"""
-
-SVV_ALL_SCHEMAS_QUERY = """
+UNION ALL
 SELECT
-    database_name,
-    schema_name,
-    schema_owner,
-    schema_type,
-    schema_acl,
-    source_database,
-    schema_option
+    'schema', database_name, schema_name, NULL, NULL,
+    schema_owner, schema_type, schema_acl, schema_option, NULL,
+    source_database, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
 FROM pg_catalog.svv_all_schemas
 WHERE database_name = :database_name
-ORDER BY schema_name;
-"""
-
-SVV_ALL_TABLES_QUERY = """
+UNION ALL
 SELECT
-    database_name,
-    schema_name,
-    table_name,
-    table_acl,
-    table_type,
-    remarks
+    'table', database_name, schema_name, table_name, NULL,
+    NULL, table_type, table_acl, NULL, NULL,
+    NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, remarks
 FROM pg_catalog.svv_all_tables
-WHERE database_name = :database_name AND schema_name = :schema_name
-ORDER BY table_name;
-"""
-
-SVV_ALL_COLUMNS_QUERY = """
+WHERE database_name = :database_name
+UNION ALL
 SELECT
-    database_name,
-    schema_name,
-    table_name,
-    column_name,
-    ordinal_position,
-    column_default,
-    is_nullable,
-    data_type,
-    character_maximum_length,
-    numeric_precision,
-    numeric_scale,
-    remarks
+    'column', database_name, schema_name, table_name, column_name,
+    NULL, NULL, NULL, NULL, NULL,
+    NULL, ordinal_position, column_default, is_nullable, data_type,
+    character_maximum_length, numeric_precision, numeric_scale, remarks
 FROM pg_catalog.svv_all_columns
-WHERE database_name = :database_name AND schema_name = :schema_name AND table_name = :table_name
-ORDER BY ordinal_position;
+WHERE database_name = :database_name
+ORDER BY database_name, schema_name, table_name, ordinal_position;
 """
 
 # SQL guardrails
@@ -139,3 +139,9 @@ class QueryResult(BaseModel):
         None, description='Query execution time in milliseconds'
     )
     query_id: str = Field(..., description='Unique identifier for the query execution')
+    truncated: bool = Field(
+        False, description='Whether rows were left out because of the row or byte budget'
+    )
+    output_file: Optional[str] = Field(
+        None, description='Local file the rows were written to instead of being returned'
+    )
@@ -15,9 +15,11 @@
 """AWS client management for Redshift MCP Server."""
 
 import asyncio
+import bisect
 import boto3
 import os
 import regex
+import tempfile
 import time
 from awslabs.redshift_mcp_server import __version__
 from awslabs.redshift_mcp_server.consts import (
@@ -25,16 +27,22 @@ from awslabs.redshift_mcp_server.consts import (
     CLIENT_READ_TIMEOUT,
     CLIENT_RETRIES,
     CLIENT_USER_AGENT_NAME,
+    CLUSTER_CACHE_TTL,
+    METADATA_CACHE_TTL,
+    QUERY_POLL_BACKOFF,
+    QUERY_POLL_INITIAL_INTERVAL,
     QUERY_POLL_INTERVAL,
+    QUERY_RESULT_FILE_MAX_BYTES,
+    QUERY_RESULT_MAX_BYTES,
+    QUERY_RESULT_MAX_ROWS,
     QUERY_TIMEOUT,
     SESSION_KEEPALIVE,
     SUSPICIOUS_QUERY_REGEXP,
-    SVV_ALL_COLUMNS_QUERY,
-    SVV_ALL_SCHEMAS_QUERY,
-    SVV_ALL_TABLES_QUERY,
-    SVV_REDSHIFT_DATABASES_QUERY,
+    SVV_CATALOG_QUERY,
 )
+from awslabs.redshift_mcp_server.statement_results import StatementResultReader
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from loguru import logger
 
 
@@ -197,6 +205,253 @@ class RedshiftSessionManager:
         return (time.time() - session_info['created_at']) > self._session_keepalive
 
 
+class RedshiftClusterRegistry:
+    """Caches cluster information to resolve cluster identifiers without a full discovery."""
+
+    def __init__(self, cache_ttl: float):
+        """Initialize the cluster registry.
+
+        Args:
+            cache_ttl: Time in seconds for which cached cluster information is reused.
+        """
+        self._clusters = {}  # {identifier -> cluster_info_with_cached_at}
+        self._cache_ttl = cache_ttl
+
+    async def cluster(self, cluster_identifier: str) -> dict | None:
+        """Get cluster information for the given identifier.
+
+        Serves cached information while it is fresh, otherwise looks up only this cluster or
+        serverless workgroup.
+
+        Args:
+            cluster_identifier: The cluster identifier or serverless workgroup name.
+
+        Returns:
+            Cluster information dictionary, or None if no such cluster or workgroup exists.
+        """
+        cached = self._clusters.get(cluster_identifier)
+        if cached and time.monotonic() - cached['cached_at'] <= self._cache_ttl:
+            logger.debug(f'Using cached cluster information: {cluster_identifier}')
+            return cached['cluster_info']
+
+        cluster_info = await describe_cluster(cluster_identifier)
+        if cluster_info:
+            self.update([cluster_info])
+        else:
+            self._clusters.pop(cluster_identifier, None)
+        return cluster_info
+
+    def update(self, clusters: list[dict]) -> None:
+        """Cache cluster information, e.g. from discover_clusters.
+
+        Args:
+            clusters: List of cluster information dictionaries.
+        """
+        cached_at = time.monotonic()
+        for cluster_info in clusters:
+            self._clusters[cluster_info['identifier']] = {
+                'cluster_info': cluster_info,
+                'cached_at': cached_at,
+            }
+
+    def invalidate(self, cluster_identifier: str | None = None) -> None:
+        """Drop cached information of one cluster, or of all clusters if none is given.
+
+        Args:
+            cluster_identifier: The cluster identifier to drop.
+        """
+        if cluster_identifier is None:
+            self._clusters.clear()
+        else:
+            self._clusters.pop(cluster_identifier, None)
+
+
+class RedshiftCatalog:
+    """In-memory catalog of a Redshift cluster as seen from one database.
+
+    Holds the databases of the cluster and the schemas, tables and columns of the database,
+    indexed by name. Schema and table names are also kept sorted to filter them by prefix.
+    """
+
+    def __init__(self):
+        """Initialize an empty catalog."""
+        self.databases = {}  # {database_name -> database_info}
+        self.schemas = {}  # {schema_name -> schema_info}
+        self.tables = {}  # {schema_name -> {table_name -> table_info}}
+        self.columns = {}  # {(schema_name, table_name) -> [column_info]}
+        self._schema_names = []
+        self._table_names = {}  # {schema_name -> sorted table names}
+
+    def add_record(self, row: list) -> None:
+        """Add a row of SVV_CATALOG_QUERY to the catalog.
+
+        Args:
+            row: The converted values of the row.
+        """
+        (
+            kind,
+            database_name,
+            schema_name,
+            table_name,
+            column_name,
+            owner,
+            object_type,
+            acl,
+            options,
+            isolation_level,
+            source_database,
+            ordinal_position,
+            column_default,
+            is_nullable,
+            data_type,
+            character_maximum_length,
+            numeric_precision,
+            numeric_scale,
+            remarks,
+        ) = row
+
+        if kind == 'database':
+            self.databases[database_name] = {
+                'database_name': database_name,
+                'database_owner': owner,
+                'database_type': object_type,
+                'database_acl': acl,
+                'database_options': options,
+                'database_isolation_level': isolation_level,
+            }
+        elif kind == 'schema':
+            self.schemas[schema_name] = {
+                'database_name': database_name,
+                'schema_name': schema_name,
+                'schema_owner': owner,
+                'schema_type': object_type,
+                'schema_acl': acl,
+                'source_database': source_database,
+                'schema_option': options,
+            }
+        elif kind == 'table':
+            self.tables.setdefault(schema_name, {})[table_name] = {
+                'database_name': database_name,
+                'schema_name': schema_name,
+                'table_name': table_name,
+                'table_acl': acl,
+                'table_type': object_type,
+                'remarks': remarks,
+            }
+        elif kind == 'column':
+            self.columns.setdefault((schema_name, table_name), []).append(
+                {
+                    'database_name': database_name,
+                    'schema_name': schema_name,
+                    'table_name': table_name,
+                    'column_name': column_name,
+                    'ordinal_position': ordinal_position,
+                    'column_default': column_default,
+                    'is_nullable': is_nullable,
+                    'data_type': data_type,
+                    'character_maximum_length': character_maximum_length,
+                    'numeric_precision': numeric_precision,
+                    'numeric_scale': numeric_scale,
+                    'remarks': remarks,
+                }
+            )
+
+    def build_indexes(self) -> None:
+        """Sort the schema and table names once all records are added."""
+        self._schema_names = sorted(self.schemas)
+        self._table_names = {schema: sorted(tables) for schema, tables in self.tables.items()}
+
+    def schema_list(self, name_prefix: str | None = None) -> list[dict]:
+        """List the schemas of the database, optionally only those starting with a prefix."""
+        if not name_prefix:
+            return [dict(schema) for schema in self.schemas.values()]
+        return [
+            dict(self.schemas[name])
+            for name in _names_with_prefix(self._schema_names, name_prefix)
+        ]
+
+    def table_list(self, schema_name: str, name_prefix: str | None = None) -> list[dict]:
+        """List the tables of a schema, optionally only those starting with a prefix."""
+        tables = self.tables.get(schema_name, {})
+        if not name_prefix:
+            return [dict(table) for table in tables.values()]
+        return [
+            dict(tables[name])
+            for name in _names_with_prefix(self._table_names.get(schema_name, []), name_prefix)
+        ]
+
+    def column_list(self, schema_name: str, table_name: str) -> list[dict]:
+        """List the columns of a table in ordinal order."""
+        return [dict(column) for column in self.columns.get((schema_name, table_name), [])]
+
+
+def _names_with_prefix(sorted_names: list[str], prefix: str) -> list[str]:
+    """Return the names starting with prefix from a sorted list of names."""
+    start = bisect.bisect_left(sorted_names, prefix)
+    end = start
+    while end < len(sorted_names) and sorted_names[end].startswith(prefix):
+        end += 1
+    return sorted_names[start:end]
+
+
+class RedshiftMetadataCache:
+    """Caches catalogs to serve metadata discovery without running catalog queries per call."""
+
+    def __init__(self, cache_ttl: float):
+        """Initialize the metadata cache.
+
+        Args:
+            cache_ttl: Time in seconds for which a loaded catalog is reused.
+        """
+        self._catalogs = {}  # {(cluster_identifier, database_name) -> catalog_with_cached_at}
+        self._locks = {}  # {(cluster_identifier, database_name) -> asyncio.Lock}
+        self._cache_ttl = cache_ttl
+
+    async def catalog(
+        self, cluster_identifier: str, database_name: str, refresh: bool = False
+    ) -> RedshiftCatalog:
+        """Get the catalog of a cluster as seen from a database.
+
+        Serves the cached catalog while it is fresh, otherwise loads it with a single catalog
+        query. Concurrent callers share one load.
+
+        Args:
+            cluster_identifier: The cluster identifier to query.
+            database_name: The database to load schemas, tables and columns of. Also used to
+                connect to.
+            refresh: Reload the catalog even if the cached one is fresh.
+
+        Returns:
+            The catalog.
+        """
+        key = (cluster_identifier, database_name)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            cached = self._catalogs.get(key)
+            if (
+                cached
+                and not refresh
+                and time.monotonic() - cached['cached_at'] <= self._cache_ttl
+            ):
+                logger.debug(f'Using cached catalog: {cluster_identifier}/{database_name}')
+                return cached['catalog']
+
+            catalog = await load_catalog(cluster_identifier, database_name)
+            self._catalogs[key] = {'catalog': catalog, 'cached_at': time.monotonic()}
+            return catalog
+
+    def invalidate(self, cluster_identifier: str | None = None) -> None:
+        """Drop cached catalogs of one cluster, or of all clusters if none is given.
+
+        Args:
+            cluster_identifier: The cluster identifier to drop catalogs of.
+        """
+        if cluster_identifier is None:
+            self._catalogs.clear()
+        else:
+            for key in [key for key in self._catalogs if key[0] == cluster_identifier]:
+                del self._catalogs[key]
+
+
 async def _execute_protected_statement(
     cluster_identifier: str,
     database_name: str,
@@ -216,6 +471,11 @@ async def _execute_protected_statement(
     3. <user sql>
     4. END;
 
+    Each step is its own statement in the session, so that the BEGIN sets the access mode of
+    the transaction the user SQL runs in. BatchExecuteStatement must not be used here: it runs
+    its statements in an implicit transaction of its own, so a BEGIN READ ONLY inside the batch
+    would be ignored and the user SQL would run with write access.
+
     Args:
         cluster_identifier: The cluster identifier to query.
         database_name: The database to execute the query against.
@@ -225,19 +485,15 @@ async def _execute_protected_statement(
 
     Returns:
         Tuple containing:
-        - Dictionary with the raw results_response from get_statement_result.
+        - Dictionary with the first page of results from get_statement_result, further pages
+          are read with StatementResultReader.
         - String with the query_id.
 
     Raises:
         Exception: If cluster not found, query fails, or times out.
     """
     # Get cluster info
-    clusters = await discover_clusters()
-    cluster_info = None
-    for cluster in clusters:
-        if cluster['identifier'] == cluster_identifier:
-            cluster_info = cluster
-            break
+    cluster_info = await cluster_registry.cluster(cluster_identifier)
 
     if not cluster_info:
         raise Exception(
@@ -332,7 +588,7 @@ async def _execute_statement(
         parameters: Optional list of parameter dictionaries with 'name' and 'value' keys.
         session_id: Optional session ID to use.
         session_keepalive: Optional session keepalive seconds (only used when session_id is None).
-        query_poll_interval: Polling interval in seconds for checking query status.
+        query_poll_interval: Maximum polling interval in seconds for checking query status.
         query_timeout: Maximum time in seconds to wait for query completion.
 
     Returns:
@@ -341,28 +597,17 @@ async def _execute_statement(
     data_client = client_manager.redshift_data_client()
 
     # Build request parameters
-    request_params: dict[str, str | int | list[dict]] = {'Sql': sql}
-
-    # Add database and cluster/workgroup identifier only if not using session
-    if not session_id:
-        request_params['Database'] = database_name
-        if cluster_info['type'] == 'provisioned':
-            request_params['ClusterIdentifier'] = cluster_identifier
-        elif cluster_info['type'] == 'serverless':
-            request_params['WorkgroupName'] = cluster_identifier
-        else:
-            raise Exception(f'Unknown cluster type: {cluster_info["type"]}')
+    request_params: dict[str, str | int | list] = {
+        'Sql': sql,
+        **_statement_target(
+            cluster_info, cluster_identifier, database_name, session_id, session_keepalive
+        ),
+    }
 
     # Add parameters if provided
     if parameters:
         request_params['Parameters'] = parameters
 
-    # Add session ID if provided, otherwise add session keepalive
-    if session_id:
-        request_params['SessionId'] = session_id
-    elif session_keepalive is not None:
-        request_params['SessionKeepAliveSeconds'] = session_keepalive
-
     response = data_client.execute_statement(**request_params)
     statement_id = response['Id']
 
@@ -370,28 +615,161 @@ async def _execute_statement(
         f'Executed statement: {statement_id}' + (f' in session {session_id}' if session_id else '')
     )
 
-    # Wait for statement completion
-    wait_time = 0
-    while wait_time < query_timeout:
+    await _wait_for_statement(statement_id, query_poll_interval, query_timeout)
+    return statement_id
+
+
+def _statement_target(
+    cluster_info: dict,
+    cluster_identifier: str,
+    database_name: str,
+    session_id: str | None = None,
+    session_keepalive: int | None = None,
+) -> dict[str, str | int]:
+    """Build the request parameters that select where a statement runs.
+
+    Args:
+        cluster_info: Cluster information dictionary.
+        cluster_identifier: The cluster identifier.
+        database_name: The database name.
+        session_id: Optional session ID to use.
+        session_keepalive: Optional session keepalive seconds (only used when session_id is None).
+
+    Returns:
+        Dictionary with the session or database and cluster/workgroup request parameters.
+    """
+    # Add session ID if provided, otherwise database and cluster/workgroup identifier
+    if session_id:
+        return {'SessionId': session_id}
+
+    target: dict[str, str | int] = {'Database': database_name}
+    if cluster_info['type'] == 'provisioned':
+        target['ClusterIdentifier'] = cluster_identifier
+    elif cluster_info['type'] == 'serverless':
+        target['WorkgroupName'] = cluster_identifier
+    else:
+        raise Exception(f'Unknown cluster type: {cluster_info["type"]}')
+
+    if session_keepalive is not None:
+        target['SessionKeepAliveSeconds'] = session_keepalive
+    return target
+
+
+async def _wait_for_statement(
+    statement_id: str, query_poll_interval: float, query_timeout: float
+) -> dict:
+    """Wait for a statement to finish, polling quickly at first and backing off.
+
+    Args:
+        statement_id: The statement ID to wait for.
+        query_poll_interval: Maximum polling interval in seconds.
+        query_timeout: Maximum time in seconds to wait for completion.
+
+    Returns:
+        The final DescribeStatement response.
+    """
+    data_client = client_manager.redshift_data_client()
+    poll_interval = min(QUERY_POLL_INITIAL_INTERVAL, query_poll_interval)
+    started_at = time.monotonic()
+
+    while True:
         status_response = data_client.describe_statement(Id=statement_id)
         status = status_response['Status']
 
         if status == 'FINISHED':
             logger.debug(f'Statement completed: {statement_id}')
-            break
+            return status_response
         elif status in ['FAILED', 'ABORTED']:
             error_msg = status_response.get('Error', 'Unknown error')
             logger.error(f'Statement failed: {error_msg}')
             raise Exception(f'Statement failed: {error_msg}')
 
-        await asyncio.sleep(query_poll_interval)
-        wait_time += query_poll_interval
+        wait_time = time.monotonic() - started_at
+        if wait_time >= query_timeout:
+            logger.error(f'Statement timed out: {statement_id}')
+            raise Exception(f'Statement timed out after {wait_time:.1f} seconds')
+
+        await asyncio.sleep(min(poll_interval, query_timeout - wait_time))
+        poll_interval = min(poll_interval * QUERY_POLL_BACKOFF, query_poll_interval)
+
+
+def _provisioned_cluster_info(cluster: dict) -> dict:
+    """Build cluster information from a DescribeClusters cluster."""
+    return {
+        'identifier': cluster['ClusterIdentifier'],
+        'type': 'provisioned',
+        'status': cluster['ClusterStatus'],
+        'database_name': cluster['DBName'],
+        'endpoint': cluster.get('Endpoint', {}).get('Address'),
+        'port': cluster.get('Endpoint', {}).get('Port'),
+        'vpc_id': cluster.get('VpcId'),
+        'node_type': cluster.get('NodeType'),
+        'number_of_nodes': cluster.get('NumberOfNodes'),
+        'creation_time': cluster.get('ClusterCreateTime'),
+        'master_username': cluster.get('MasterUsername'),
+        'publicly_accessible': cluster.get('PubliclyAccessible'),
+        'encrypted': cluster.get('Encrypted'),
+        'tags': {tag['Key']: tag['Value'] for tag in cluster.get('Tags', [])},
+    }
+
+
+def _serverless_cluster_info(workgroup: dict, workgroup_detail: dict) -> dict:
+    """Build cluster information from a ListWorkgroups workgroup and its GetWorkgroup details."""
+    return {
+        'identifier': workgroup['workgroupName'],
+        'type': 'serverless',
+        'status': workgroup['status'],
+        'database_name': workgroup_detail.get('configParameters', [{}])[0].get(
+            'parameterValue', 'dev'
+        ),
+        'endpoint': workgroup_detail.get('endpoint', {}).get('address'),
+        'port': workgroup_detail.get('endpoint', {}).get('port'),
+        'vpc_id': workgroup_detail.get('subnetIds', [None])[0],  # Approximate VPC from subnet
+        'node_type': None,  # Not applicable for serverless
+        'number_of_nodes': None,  # Not applicable for serverless
+        'creation_time': workgroup.get('creationDate'),
+        'master_username': None,  # Serverless uses IAM
+        'publicly_accessible': workgroup_detail.get('publiclyAccessible'),
+        'encrypted': True,  # Serverless is always encrypted
+        'tags': {tag['key']: tag['value'] for tag in workgroup_detail.get('tags', [])},
+    }
+
+
+async def describe_cluster(cluster_identifier: str) -> dict | None:
+    """Look up a single Redshift cluster or serverless workgroup.
 
-    if wait_time >= query_timeout:
-        logger.error(f'Statement timed out: {statement_id}')
-        raise Exception(f'Statement timed out after {wait_time} seconds')
+    Args:
+        cluster_identifier: The cluster identifier or serverless workgroup name.
 
-    return statement_id
+    Returns:
+        Cluster information dictionary, or None if no such cluster or workgroup exists.
+    """
+    logger.debug(f'Looking up Redshift cluster {cluster_identifier}')
+
+    try:
+        redshift_client = client_manager.redshift_client()
+        clusters = redshift_client.describe_clusters(ClusterIdentifier=cluster_identifier)
+        for cluster in clusters.get('Clusters', []):
+            return _provisioned_cluster_info(cluster)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'ClusterNotFound':
+            logger.error(f'Error describing provisioned cluster {cluster_identifier}: {str(e)}')
+            raise
+
+    try:
+        serverless_client = client_manager.redshift_serverless_client()
+        workgroup = serverless_client.get_workgroup(workgroupName=cluster_identifier)['workgroup']
+        return _serverless_cluster_info(workgroup, workgroup)
+    except ClientError as e:
+        # Identifiers that are not valid workgroup names are rejected with a validation error
+        if e.response.get('Error', {}).get('Code') not in [
+            'ResourceNotFoundException',
+            'ValidationException',
+        ]:
+            logger.error(f'Error describing serverless workgroup {cluster_identifier}: {str(e)}')
+            raise
+
+    return None
 
 
 async def discover_clusters() -> list[dict]:
@@ -410,22 +788,7 @@ async def discover_clusters() -> list[dict]:
         paginator = redshift_client.get_paginator('describe_clusters')
         for page in paginator.paginate():
             for cluster in page.get('Clusters', []):
-                cluster_info = {
-                    'identifier': cluster['ClusterIdentifier'],
-                    'type': 'provisioned',
-                    'status': cluster['ClusterStatus'],
-                    'database_name': cluster['DBName'],
-                    'endpoint': cluster.get('Endpoint', {}).get('Address'),
-                    'port': cluster.get('Endpoint', {}).get('Port'),
-                    'vpc_id': cluster.get('VpcId'),
-                    'node_type': cluster.get('NodeType'),
-                    'number_of_nodes': cluster.get('NumberOfNodes'),
-                    'creation_time': cluster.get('ClusterCreateTime'),
-                    'master_username': cluster.get('MasterUsername'),
-                    'publicly_accessible': cluster.get('PubliclyAccessible'),
-                    'encrypted': cluster.get('Encrypted'),
-                    'tags': {tag['Key']: tag['Value'] for tag in cluster.get('Tags', [])},
-                }
+                cluster_info = _provisioned_cluster_info(cluster)
                 clusters.append(cluster_info)
 
         logger.info(f'Found {len(clusters)} provisioned clusters')
@@ -447,26 +810,7 @@ async def discover_clusters() -> list[dict]:
                     workgroupName=workgroup['workgroupName']
                 )['workgroup']
 
-                cluster_info = {
-                    'identifier': workgroup['workgroupName'],
-                    'type': 'serverless',
-                    'status': workgroup['status'],
-                    'database_name': workgroup_detail.get('configParameters', [{}])[0].get(
-                        'parameterValue', 'dev'
-                    ),
-                    'endpoint': workgroup_detail.get('endpoint', {}).get('address'),
-                    'port': workgroup_detail.get('endpoint', {}).get('port'),
-                    'vpc_id': workgroup_detail.get('subnetIds', [None])[
-                        0
-                    ],  # Approximate VPC from subnet
-                    'node_type': None,  # Not applicable for serverless
-                    'number_of_nodes': None,  # Not applicable for serverless
-                    'creation_time': workgroup.get('creationDate'),
-                    'master_username': None,  # Serverless uses IAM
-                    'publicly_accessible': workgroup_detail.get('publiclyAccessible'),
-                    'encrypted': True,  # Serverless is always encrypted
-                    'tags': {tag['key']: tag['value'] for tag in workgroup_detail.get('tags', [])},
-                }
+                cluster_info = _serverless_cluster_info(workgroup, workgroup_detail)
                 clusters.append(cluster_info)
 
         serverless_count = len([c for c in clusters if c['type'] == 'serverless'])
@@ -477,15 +821,60 @@ async def discover_clusters() -> list[dict]:
         raise
 
     logger.info(f'Total clusters discovered: {len(clusters)}')
+    cluster_registry.update(clusters)
     return clusters
 
 
-async def discover_databases(cluster_identifier: str, database_name: str = 'dev') -> list[dict]:
-    """Discover databases in a Redshift cluster using the Data API.
+async def load_catalog(cluster_identifier: str, database_name: str) -> RedshiftCatalog:
+    """Load the catalog of a cluster as seen from a database using the Data API.
+
+    The databases of the cluster and the schemas, tables and columns of the database are read
+    with a single catalog query.
+
+    Args:
+        cluster_identifier: The cluster identifier to query.
+        database_name: The database to load schemas, tables and columns of. Also used to
+            connect to.
+
+    Returns:
+        The loaded catalog.
+    """
+    logger.info(f'Loading catalog of database {database_name} in cluster {cluster_identifier}')
+
+    results_response, query_id = await _execute_protected_statement(
+        cluster_identifier=cluster_identifier,
+        database_name=database_name,
+        sql=SVV_CATALOG_QUERY,
+        parameters=[{'name': 'database_name', 'value': database_name}],
+    )
+
+    catalog = RedshiftCatalog()
+    reader = StatementResultReader(
+        data_client=client_manager.redshift_data_client,
+        statement_id=query_id,
+        first_page=results_response,
+    )
+    for row in reader.iter_rows():
+        catalog.add_record(row)
+    catalog.build_indexes()
+
+    logger.info(
+        f'Loaded catalog of database {database_name} in cluster {cluster_identifier}: '
+        f'{len(catalog.schemas)} schemas, {sum(len(t) for t in catalog.tables.values())} tables, '
+        f'{sum(len(c) for c in catalog.columns.values())} columns'
+    )
+    return catalog
+
+
+async def discover_databases(
+    cluster_identifier: str, database_name: str = 'dev', refresh: bool = False
+) -> list[dict]:
+    """Discover databases in a Redshift cluster from the cached catalog.
 
     Args:
         cluster_identifier: The cluster identifier to query.
         database_name: The database to connect to for querying system views.
+        refresh: Reload the catalog instead of using the cached one.
 
     Returns:
         List of database information dictionaries.
@@ -493,27 +882,8 @@ async def discover_databases(cluster_identifier: str, database_name: str = 'dev'
     try:
         logger.info(f'Discovering databases in cluster {cluster_identifier}')
 
-        # Execute the query using the common function
-        results_response, _ = await _execute_protected_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=database_name,
-            sql=SVV_REDSHIFT_DATABASES_QUERY,
-        )
-
-        databases = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            database_info = {
-                'database_name': record[0].get('stringValue'),
-                'database_owner': record[1].get('longValue'),
-                'database_type': record[2].get('stringValue'),
-                'database_acl': record[3].get('stringValue'),
-                'database_options': record[4].get('stringValue'),
-                'database_isolation_level': record[5].get('stringValue'),
-            }
-            databases.append(database_info)
+        catalog = await metadata_cache.catalog(cluster_identifier, database_name, refresh)
+        databases = [dict(database) for database in catalog.databases.values()]
 
         logger.info(f'Found {len(databases)} databases in cluster {cluster_identifier}')
         return databases
@@ -523,12 +893,19 @@ async def discover_databases(cluster_identifier: str, database_name: str = 'dev'
         raise
 
 
-async def discover_schemas(cluster_identifier: str, schema_database_name: str) -> list[dict]:
-    """Discover schemas in a Redshift database using the Data API.
+async def discover_schemas(
+    cluster_identifier: str,
+    schema_database_name: str,
+    schema_name_prefix: str | None = None,
+    refresh: bool = False,
+) -> list[dict]:
+    """Discover schemas in a Redshift database from the cached catalog.
 
     Args:
         cluster_identifier: The cluster identifier to query.
         schema_database_name: The database name to filter schemas for. Also used to connect to.
+        schema_name_prefix: Optional prefix the schema names have to start with.
+        refresh: Reload the catalog instead of using the cached one.
 
     Returns:
         List of schema information dictionaries.
@@ -538,29 +915,8 @@ async def discover_schemas(cluster_identifier: str, schema_database_name: str) -
             f'Discovering schemas in database {schema_database_name} in cluster {cluster_identifier}'
         )
 
-        # Execute the query using the common function
-        results_response, _ = await _execute_protected_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=schema_database_name,
-            sql=SVV_ALL_SCHEMAS_QUERY,
-            parameters=[{'name': 'database_name', 'value': schema_database_name}],
-        )
-
-        schemas = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            schema_info = {
-                'database_name': record[0].get('stringValue'),
-                'schema_name': record[1].get('stringValue'),
-                'schema_owner': record[2].get('longValue'),
-                'schema_type': record[3].get('stringValue'),
-                'schema_acl': record[4].get('stringValue'),
-                'source_database': record[5].get('stringValue'),
-                'schema_option': record[6].get('stringValue'),
-            }
-            schemas.append(schema_info)
+        catalog = await metadata_cache.catalog(cluster_identifier, schema_database_name, refresh)
+        schemas = catalog.schema_list(schema_name_prefix)
 
         logger.info(
             f'Found {len(schemas)} schemas in database {schema_database_name} in cluster {cluster_identifier}'
@@ -575,14 +931,20 @@ async def discover_schemas(cluster_identifier: str, schema_database_name: str) -
 
 
 async def discover_tables(
-    cluster_identifier: str, table_database_name: str, table_schema_name: str
+    cluster_identifier: str,
+    table_database_name: str,
+    table_schema_name: str,
+    table_name_prefix: str | None = None,
+    refresh: bool = False,
 ) -> list[dict]:
-    """Discover tables in a Redshift schema using the Data API.
+    """Discover tables in a Redshift schema from the cached catalog.
 
     Args:
         cluster_identifier: The cluster identifier to query.
         table_database_name: The database name to filter tables for. Also used to connect to.
         table_schema_name: The schema name to filter tables for.
+        table_name_prefix: Optional prefix the table names have to start with.
+        refresh: Reload the catalog instead of using the cached one.
 
     Returns:
         List of table information dictionaries.
@@ -592,31 +954,8 @@ async def discover_tables(
             f'Discovering tables in schema {table_schema_name} in database {table_database_name} in cluster {cluster_identifier}'
         )
 
-        # Execute the query using the common function
-        results_response, _ = await _execute_protected_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=table_database_name,
-            sql=SVV_ALL_TABLES_QUERY,
-            parameters=[
-                {'name': 'database_name', 'value': table_database_name},
-                {'name': 'schema_name', 'value': table_schema_name},
-            ],
-        )
-
-        tables = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            table_info = {
-                'database_name': record[0].get('stringValue'),
-                'schema_name': record[1].get('stringValue'),
-                'table_name': record[2].get('stringValue'),
-                'table_acl': record[3].get('stringValue'),
-                'table_type': record[4].get('stringValue'),
-                'remarks': record[5].get('stringValue'),
-            }
-            tables.append(table_info)
+        catalog = await metadata_cache.catalog(cluster_identifier, table_database_name, refresh)
+        tables = catalog.table_list(table_schema_name, table_name_prefix)
 
         logger.info(
             f'Found {len(tables)} tables in schema {table_schema_name} in database {table_database_name} in cluster {cluster_identifier}'
@@ -635,14 +974,16 @@ async def discover_columns(
     column_database_name: str,
     column_schema_name: str,
     column_table_name: str,
+    refresh: bool = False,
 ) -> list[dict]:
-    """Discover columns in a Redshift table using the Data API.
+    """Discover columns in a Redshift table from the cached catalog.
 
     Args:
         cluster_identifier: The cluster identifier to query.
         column_database_name: The database name to filter columns for. Also used to connect to.
         column_schema_name: The schema name to filter columns for.
         column_table_name: The table name to filter columns for.
+        refresh: Reload the catalog instead of using the cached one.
 
     Returns:
         List of column information dictionaries.
@@ -652,38 +993,8 @@ async def discover_columns(
             f'Discovering columns in table {column_table_name} in schema {column_schema_name} in database {column_database_name} in cluster {cluster_identifier}'
         )
 
-        # Execute the query using the common function
-        results_response, _ = await _execute_protected_statement(
-            cluster_identifier=cluster_identifier,
-            database_name=column_database_name,
-            sql=SVV_ALL_COLUMNS_QUERY,
-            parameters=[
-                {'name': 'database_name', 'value': column_database_name},
-                {'name': 'schema_name', 'value': column_schema_name},
-                {'name': 'table_name', 'value': column_table_name},
-            ],
-        )
-
-        columns = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            # Extract values from the record
-            column_info = {
-                'database_name': record[0].get('stringValue'),
-                'schema_name': record[1].get('stringValue'),
-                'table_name': record[2].get('stringValue'),
-                'column_name': record[3].get('stringValue'),
-                'ordinal_position': record[4].get('longValue'),
-                'column_default': record[5].get('stringValue'),
-                'is_nullable': record[6].get('stringValue'),
-                'data_type': record[7].get('stringValue'),
-                'character_maximum_length': record[8].get('longValue'),
-                'numeric_precision': record[9].get('longValue'),
-                'numeric_scale': record[10].get('longValue'),
-                'remarks': record[11].get('stringValue'),
-            }
-            columns.append(column_info)
+        catalog = await metadata_cache.catalog(cluster_identifier, column_database_name, refresh)
+        columns = catalog.column_list(column_schema_name, column_table_name)
 
         logger.info(
             f'Found {len(columns)} columns in table {column_table_name} in schema {column_schema_name} in database {column_database_name} in cluster {cluster_identifier}'
@@ -697,13 +1008,29 @@ async def discover_columns(
         raise
 
 
-async def execute_query(cluster_identifier: str, database_name: str, sql: str) -> dict:
+async def execute_query(
+    cluster_identifier: str,
+    database_name: str,
+    sql: str,
+    max_rows: int | None = None,
+    max_bytes: int | None = None,
+    output_format: str | None = None,
+) -> dict:
     """Execute a SQL query against a Redshift cluster using the Data API.
 
+    All result pages are read. Without output_format the rows are returned inline up to the
+    row and byte budget. With output_format 'csv' or 'parquet' the rows are streamed to a local
+    file instead and only its path is returned.
+
     Args:
         cluster_identifier: The cluster identifier to query.
         database_name: The database to execute the query against.
         sql: The SQL statement to execute.
+        max_rows: Maximum number of rows to return or write. Defaults to QUERY_RESULT_MAX_ROWS
+            for inline results and no limit for files.
+        max_bytes: Maximum size of the rows to return or write. Defaults to
+            QUERY_RESULT_MAX_BYTES for inline results and QUERY_RESULT_FILE_MAX_BYTES for files.
+        output_format: Optional file format to spill the result to, 'csv' or 'parquet'.
 
     Returns:
         Dictionary with query results including columns, rows, and metadata.
@@ -712,9 +1039,12 @@ async def execute_query(cluster_identifier: str, database_name: str, sql: str) -
         logger.info(f'Executing query on cluster {cluster_identifier} in database {database_name}')
         logger.debug(f'SQL: {sql}')
 
-        # Record start time for execution time calculation
-        import time
+        if output_format not in [None, 'csv', 'parquet']:
+            raise Exception(
+                f"Unsupported output format {output_format}, expected 'csv' or 'parquet'"
+            )
 
+        # Record start time for execution time calculation
         start_time = time.time()
 
         # Execute the query using the common function
@@ -726,45 +1056,50 @@ async def execute_query(cluster_identifier: str, database_name: str, sql: str) -
         end_time = time.time()
         execution_time_ms = int((end_time - start_time) * 1000)
 
-        # Extract column names
-        columns = []
-        column_metadata = results_response.get('ColumnMetadata', [])
-        for col_meta in column_metadata:
-            columns.append(col_meta.get('name'))
-
-        # Extract rows
-        rows = []
-        records = results_response.get('Records', [])
-
-        for record in records:
-            row = []
-            for field in record:
-                # Extract the actual value from the field based on its type
-                if 'stringValue' in field:
-                    row.append(field['stringValue'])
-                elif 'longValue' in field:
-                    row.append(field['longValue'])
-                elif 'doubleValue' in field:
-                    row.append(field['doubleValue'])
-                elif 'booleanValue' in field:
-                    row.append(field['booleanValue'])
-                elif 'isNull' in field and field['isNull']:
-                    row.append(None)
-                else:
-                    # Fallback for unknown field types
-                    row.append(str(field))
-            rows.append(row)
+        reader = StatementResultReader(
+            data_client=client_manager.redshift_data_client,
+            statement_id=query_id,
+            first_page=results_response,
+        )
+        columns = reader.columns
+
+        if output_format is None:
+            rows, truncated = await asyncio.to_thread(
+                reader.read,
+                max_rows=QUERY_RESULT_MAX_ROWS if max_rows is None else max_rows,
+                max_bytes=QUERY_RESULT_MAX_BYTES if max_bytes is None else max_bytes,
+            )
+            row_count = len(rows)
+            output_file = None
+        else:
+            fd, output_file = tempfile.mkstemp(
+                prefix='redshift-query-', suffix=f'.{output_format}'
+            )
+            os.close(fd)
+            write = reader.write_csv if output_format == 'csv' else reader.write_parquet
+            row_count, _, truncated = await asyncio.to_thread(
+                write,
+                output_file,
+                max_rows=max_rows,
+                max_bytes=QUERY_RESULT_FILE_MAX_BYTES if max_bytes is None else max_bytes,
+            )
+            rows = []
+
+        if truncated:
+            logger.warning(f'Query result {query_id} truncated at {row_count} rows')
 
         query_result = {
             'columns': columns,
             'rows': rows,
-            'row_count': len(rows),
+            'row_count': row_count,
             'execution_time_ms': execution_time_ms,
             'query_id': query_id,
+            'truncated': truncated,
+            'output_file': output_file,
         }
 
         logger.info(
-            f'Query executed successfully: {query_id}, returned {len(rows)} rows in {execution_time_ms}ms'
+            f'Query executed successfully: {query_id}, returned {row_count} rows in {execution_time_ms}ms'
         )
         return query_result
 
@@ -789,3 +1124,9 @@ client_manager = RedshiftClientManager(
 session_manager = RedshiftSessionManager(
     session_keepalive=SESSION_KEEPALIVE, app_name=f'{CLIENT_USER_AGENT_NAME}/{__version__}'
 )
+
+# Global cluster registry instance
+cluster_registry = RedshiftClusterRegistry(cache_ttl=CLUSTER_CACHE_TTL)
+
+# Global metadata cache instance
+metadata_cache = RedshiftMetadataCache(cache_ttl=METADATA_CACHE_TTL)
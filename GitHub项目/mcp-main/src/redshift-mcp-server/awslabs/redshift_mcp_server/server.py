@@ -40,6 +40,7 @@ from awslabs.redshift_mcp_server.redshift import (
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
+from typing import Literal, Optional
 
 
 # Remove default handler and add custom configuration
@@ -79,6 +80,10 @@ This tool queries the SVV_ALL_TABLES system view to discover available tables.
 Lists all columns in a specified table within a Redshift schema.
 This tool queries the SVV_ALL_COLUMNS system view to discover available columns.
 
+The list_databases, list_schemas, list_tables and list_columns tools share a catalog that is loaded
+per cluster and database with a single query and cached for 5 minutes. Pass refresh=true to reload
+it, e.g. after creating or dropping objects.
+
 ### execute_query
 Executes SQL queries against a Redshift cluster or serverless workgroup.
 This tool uses the Redshift Data API to run queries and return results.
@@ -172,6 +177,10 @@ async def list_databases_tool(
         'dev',
         description='The database to connect to for querying system views. Defaults to "dev".',
     ),
+    refresh: bool = Field(
+        False,
+        description='Reload the cached catalog metadata from the cluster, e.g. after objects were created or dropped.',
+    ),
 ) -> list[RedshiftDatabase]:
     """List all databases in a specified Amazon Redshift cluster.
 
@@ -191,6 +200,7 @@ async def list_databases_tool(
     - cluster_identifier: The unique identifier of the Redshift cluster to query.
                          IMPORTANT: Use a valid cluster identifier from the list_clusters tool.
     - database_name: The database to connect to for querying system views (defaults to 'dev').
+    - refresh: Reload the cached catalog metadata instead of serving it from the cache (defaults to false).
 
     ## Response Structure
 
@@ -220,7 +230,7 @@ async def list_databases_tool(
     try:
         logger.info(f'Discovering databases on cluster: {cluster_identifier}')
         databases_data = await discover_databases(
-            cluster_identifier=cluster_identifier, database_name=database_name
+            cluster_identifier=cluster_identifier, database_name=database_name, refresh=refresh
         )
 
         # Convert to RedshiftDatabase models
@@ -251,6 +261,14 @@ async def list_schemas_tool(
         ...,
         description='The database name to list schemas for. Also used to connect to. Must be a valid database name from the list_databases tool.',
     ),
+    schema_name_prefix: Optional[str] = Field(
+        None,
+        description='Only list schemas whose names start with this prefix.',
+    ),
+    refresh: bool = Field(
+        False,
+        description='Reload the cached catalog metadata from the cluster, e.g. after objects were created or dropped.',
+    ),
 ) -> list[RedshiftSchema]:
     """List all schemas in a specified database within a Redshift cluster.
 
@@ -271,6 +289,8 @@ async def list_schemas_tool(
                          IMPORTANT: Use a valid cluster identifier from the list_clusters tool.
     - schema_database_name: The database name to list schemas for. Also used to connect to.
                            IMPORTANT: Use a valid database name from the list_databases tool.
+    - schema_name_prefix: Only list schemas whose names start with this prefix (optional).
+    - refresh: Reload the cached catalog metadata instead of serving it from the cache (defaults to false).
 
     ## Response Structure
 
@@ -305,7 +325,10 @@ async def list_schemas_tool(
             f'Discovering schemas in database {schema_database_name} on cluster {cluster_identifier}'
         )
         schemas_data = await discover_schemas(
-            cluster_identifier=cluster_identifier, schema_database_name=schema_database_name
+            cluster_identifier=cluster_identifier,
+            schema_database_name=schema_database_name,
+            schema_name_prefix=schema_name_prefix,
+            refresh=refresh,
         )
 
         # Convert to RedshiftSchema models
@@ -342,6 +365,14 @@ async def list_tables_tool(
         ...,
         description='The schema name to list tables for. Also used to connect to. Must be a valid schema name from the list_schemas tool.',
     ),
+    table_name_prefix: Optional[str] = Field(
+        None,
+        description='Only list tables whose names start with this prefix.',
+    ),
+    refresh: bool = Field(
+        False,
+        description='Reload the cached catalog metadata from the cluster, e.g. after objects were created or dropped.',
+    ),
 ) -> list[RedshiftTable]:
     """List all tables in a specified schema within a Redshift database.
 
@@ -364,6 +395,8 @@ async def list_tables_tool(
                           IMPORTANT: Use a valid database name from the list_databases tool.
     - table_schema_name: The schema name to list tables for.
                         IMPORTANT: Use a valid schema name from the list_schemas tool.
+    - table_name_prefix: Only list tables whose names start with this prefix (optional).
+    - refresh: Reload the cached catalog metadata instead of serving it from the cache (defaults to false).
 
     ## Response Structure
 
@@ -401,6 +434,8 @@ async def list_tables_tool(
             cluster_identifier=cluster_identifier,
             table_database_name=table_database_name,
             table_schema_name=table_schema_name,
+            table_name_prefix=table_name_prefix,
+            refresh=refresh,
         )
 
         # Convert to RedshiftTable models
@@ -441,6 +476,10 @@ async def list_columns_tool(
         ...,
         description='The table name to list columns for. Must be a valid table name from the list_tables tool.',
     ),
+    refresh: bool = Field(
+        False,
+        description='Reload the cached catalog metadata from the cluster, e.g. after objects were created or dropped.',
+    ),
 ) -> list[RedshiftColumn]:
     """List all columns in a specified table within a Redshift schema.
 
@@ -465,6 +504,7 @@ async def list_columns_tool(
                          IMPORTANT: Use a valid schema name from the list_schemas tool.
     - column_table_name: The table name to list columns for.
                         IMPORTANT: Use a valid table name from the list_tables tool.
+    - refresh: Reload the cached catalog metadata instead of serving it from the cache (defaults to false).
 
     ## Response Structure
 
@@ -510,6 +550,7 @@ async def list_columns_tool(
             column_database_name=column_database_name,
             column_schema_name=column_schema_name,
             column_table_name=column_table_name,
+            refresh=refresh,
         )
 
         # Convert to RedshiftColumn models
@@ -545,6 +586,18 @@ async def execute_query_tool(
     sql: str = Field(
         ..., description='The SQL statement to execute. Should be a single SQL statement.'
     ),
+    max_rows: Optional[int] = Field(
+        None,
+        description='Maximum number of rows to return or write. Defaults to 100000 rows for inline results and no limit for output files.',
+    ),
+    max_bytes: Optional[int] = Field(
+        None,
+        description='Maximum size in bytes of the rows to return or write. Defaults to 50 MiB for inline results and 1 GiB for output files.',
+    ),
+    output_format: Optional[Literal['csv', 'parquet']] = Field(
+        None,
+        description="Write the rows to a local 'csv' or 'parquet' file instead of returning them. Parquet requires pyarrow.",
+    ),
 ) -> QueryResult:
     """Execute a SQL query against a Redshift cluster or serverless workgroup.
 
@@ -566,6 +619,9 @@ async def execute_query_tool(
     - database_name: The database name to execute the query against.
                     IMPORTANT: Use a valid database name from the list_databases tool.
     - sql: The SQL statement to execute. Should be a single SQL statement.
+    - max_rows: Optional maximum number of rows to return or write.
+    - max_bytes: Optional maximum size in bytes of the rows to return or write.
+    - output_format: Optional 'csv' or 'parquet' to write the rows to a local file instead.
 
     ## Response Structure
 
@@ -576,6 +632,8 @@ async def execute_query_tool(
     - row_count: Number of rows returned.
     - execution_time_ms: Query execution time in milliseconds.
     - query_id: Unique identifier for the query execution.
+    - truncated: Whether rows were left out because of the row or byte budget.
+    - output_file: Path of the local file the rows were written to, if output_format was given.
 
     ## Usage Tips
 
@@ -584,6 +642,7 @@ async def execute_query_tool(
     3. Ensure the cluster status is 'available' before executing queries.
     4. Use LIMIT clauses for exploratory queries to avoid large result sets.
     5. Consider using the metadata discovery tools to understand table structures before querying.
+    6. Use output_format for large analytical results and read the file instead of the inline rows.
 
     ## Data Type Handling
 
@@ -604,7 +663,12 @@ async def execute_query_tool(
     try:
         logger.info(f'Executing query on cluster {cluster_identifier} in database {database_name}')
         query_result_data = await execute_query(
-            cluster_identifier=cluster_identifier, database_name=database_name, sql=sql
+            cluster_identifier=cluster_identifier,
+            database_name=database_name,
+            sql=sql,
+            max_rows=max_rows,
+            max_bytes=max_bytes,
+            output_format=output_format,
         )
 
         # Convert to QueryResult model
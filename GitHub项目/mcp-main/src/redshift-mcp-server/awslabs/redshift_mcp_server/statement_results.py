@@ -0,0 +1,305 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Paginated, column-wise reading of Redshift Data API statement results."""
+
+import csv
+import json
+from typing import Any, Callable, Iterator
+
+
+# Field of the Data API typed value that holds each Redshift type
+LONG_TYPES = {'int2', 'int4', 'int8', 'smallint', 'integer', 'bigint', 'oid'}
+DOUBLE_TYPES = {'float4', 'float8', 'real', 'double precision'}
+BOOLEAN_TYPES = {'bool', 'boolean'}
+
+# Arrow types for spilled Parquet columns, everything else is written as strings
+ARROW_TYPES = {
+    'int2': 'int16',
+    'smallint': 'int16',
+    'int4': 'int32',
+    'integer': 'int32',
+    'int8': 'int64',
+    'bigint': 'int64',
+    'oid': 'int64',
+    'float4': 'float32',
+    'real': 'float32',
+    'float8': 'float64',
+    'double precision': 'float64',
+    'bool': 'bool_',
+    'boolean': 'bool_',
+}
+
+
+def field_value(field: dict) -> Any:
+    """Extract the Python value of a Data API field of any type."""
+    if 'stringValue' in field:
+        return field['stringValue']
+    elif 'longValue' in field:
+        return field['longValue']
+    elif 'doubleValue' in field:
+        return field['doubleValue']
+    elif 'booleanValue' in field:
+        return field['booleanValue']
+    elif 'isNull' in field and field['isNull']:
+        return None
+    else:
+        # Fallback for unknown field types
+        return str(field)
+
+
+def _typed_converter(key: str) -> Callable[[dict], Any]:
+    """Build a converter reading the given typed value key, falling back to field_value."""
+
+    def convert(field: dict) -> Any:
+        return field[key] if key in field else field_value(field)
+
+    return convert
+
+
+def column_converter(column_metadata: dict) -> Callable[[dict], Any]:
+    """Pick the converter for a column once from its ColumnMetadata type name."""
+    type_name = (column_metadata.get('typeName') or '').lower()
+    if type_name in LONG_TYPES:
+        return _typed_converter('longValue')
+    if type_name in DOUBLE_TYPES:
+        return _typed_converter('doubleValue')
+    if type_name in BOOLEAN_TYPES:
+        return _typed_converter('booleanValue')
+    if type_name:
+        return _typed_converter('stringValue')
+    return field_value
+
+
+class StatementResultReader:
+    """Lazy reader of all result pages of a Data API statement.
+
+    Pages are fetched with get_statement_result only when the previous page has been consumed,
+    following NextToken until the result is exhausted. Each page is converted column by column
+    with a converter decided once per column from ColumnMetadata, so no page is held in memory
+    after its rows have been handed out.
+    """
+
+    def __init__(
+        self, data_client: Callable[[], Any], statement_id: str, first_page: dict | None = None
+    ):
+        """Initialize the reader.
+
+        Args:
+            data_client: Callable returning the Redshift Data API client, only called when a page
+                has to be fetched.
+            statement_id: The id of the statement to read the result of.
+            first_page: The first get_statement_result response, if already fetched.
+        """
+        self.data_client = data_client
+        self.statement_id = statement_id
+        self._first_page = first_page
+        self._column_metadata: list[dict] | None = None
+        self._converters: list[Callable[[dict], Any]] = []
+
+    @property
+    def column_metadata(self) -> list[dict]:
+        """Return the ColumnMetadata of the result, fetching the first page if needed."""
+        if self._column_metadata is None:
+            self._load_first_page()
+        assert self._column_metadata is not None
+        return self._column_metadata
+
+    def _load_first_page(self) -> dict:
+        """Fetch the first page if needed and decide the column converters from it."""
+        if self._first_page is None:
+            self._first_page = self.data_client().get_statement_result(Id=self.statement_id)
+        if self._column_metadata is None:
+            column_metadata = self._first_page.get('ColumnMetadata') or []
+            self._column_metadata = column_metadata
+            self._converters = [column_converter(meta) for meta in column_metadata]
+        return self._first_page
+
+    @property
+    def columns(self) -> list[str]:
+        """Return the column names of the result."""
+        return [meta.get('name', '') for meta in self.column_metadata]
+
+    def pages(self) -> Iterator[dict]:
+        """Yield the raw result pages, following NextToken."""
+        page = self._load_first_page() if self._column_metadata is None else self._first_page
+        self._first_page = None
+        while page is not None:
+            yield page
+            next_token = page.get('NextToken')
+            if not next_token:
+                return
+            page = self.data_client().get_statement_result(
+                Id=self.statement_id, NextToken=next_token
+            )
+
+    def iter_column_batches(self) -> Iterator[list[list]]:
+        """Yield each page as a list of converted column value lists."""
+        for page in self.pages():
+            records = page.get('Records', [])
+            if not records:
+                continue
+            # Without column metadata every field is converted by its own type
+            converters = self._converters or [field_value] * len(records[0])
+            yield [
+                [convert(record[index]) for record in records]
+                for index, convert in enumerate(converters)
+            ]
+
+    def iter_rows(self) -> Iterator[list]:
+        """Yield the converted rows of all pages."""
+        for column_batch in self.iter_column_batches():
+            for row in zip(*column_batch):
+                yield list(row)
+
+    def read(self, max_rows: int | None = None, max_bytes: int | None = None) -> tuple[list, bool]:
+        """Read rows into memory up to a row and byte budget.
+
+        The byte budget is measured on the JSON encoding of the rows, which is how they are
+        returned to the client.
+
+        Args:
+            max_rows: Maximum number of rows to read, or None for no limit.
+            max_bytes: Maximum JSON encoded size of the rows read, or None for no limit.
+
+        Returns:
+            Tuple of the rows read and whether the result was truncated by the budget.
+        """
+        rows = []
+        size = 0
+        for row in self.iter_rows():
+            if max_rows is not None and len(rows) >= max_rows:
+                return rows, True
+            if max_bytes is not None:
+                size += len(json.dumps(row, default=str))
+                if size > max_bytes:
+                    return rows, True
+            rows.append(row)
+        return rows, False
+
+    def write_csv(
+        self, path: str, max_rows: int | None = None, max_bytes: int | None = None
+    ) -> tuple[int, int, bool]:
+        """Spill the result to a CSV file with a header row up to a row and byte budget.
+
+        Args:
+            path: The file to write.
+            max_rows: Maximum number of rows to write, or None for no limit.
+            max_bytes: Maximum size of the file in bytes, or None for no limit.
+
+        Returns:
+            Tuple of the number of rows written, the file size and whether the result was
+            truncated by the budget.
+        """
+        row_count = 0
+        truncated = False
+        with open(path, 'w', newline='', encoding='utf-8') as file:
+            output = _CountingWriter(file)
+            writer = csv.writer(output)
+            writer.writerow(self.columns)
+            for row in self.iter_rows():
+                if max_rows is not None and row_count >= max_rows:
+                    truncated = True
+                    break
+                if max_bytes is not None and output.bytes_written >= max_bytes:
+                    truncated = True
+                    break
+                writer.writerow(row)
+                row_count += 1
+        return row_count, output.bytes_written, truncated
+
+    def write_parquet(
+        self, path: str, max_rows: int | None = None, max_bytes: int | None = None
+    ) -> tuple[int, int, bool]:
+        """Spill the result to a Parquet file, one row group per page, up to a row and byte budget.
+
+        Column types are mapped once from ColumnMetadata. The byte budget is measured on the
+        in-memory Arrow size of the written row groups. Requires the optional pyarrow dependency.
+
+        Args:
+            path: The file to write.
+            max_rows: Maximum number of rows to write, or None for no limit.
+            max_bytes: Maximum Arrow size of the written data in bytes, or None for no limit.
+
+        Returns:
+            Tuple of the number of rows written, the Arrow size of the data written and whether
+            the result was truncated by the budget.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise Exception(
+                'Parquet output requires pyarrow, install it with the parquet extra: '
+                'awslabs.redshift-mcp-server[parquet]'
+            ) from e
+
+        schema = pa.schema(
+            [
+                (
+                    meta.get('name'),
+                    getattr(pa, ARROW_TYPES.get((meta.get('typeName') or '').lower(), 'string'))(),
+                )
+                for meta in self.column_metadata
+            ]
+        )
+
+        row_count = 0
+        bytes_written = 0
+        truncated = False
+        with pq.ParquetWriter(path, schema) as writer:
+            for column_batch in self.iter_column_batches():
+                if (max_rows is not None and row_count >= max_rows) or (
+                    max_bytes is not None and bytes_written >= max_bytes
+                ):
+                    truncated = True
+                    break
+                if max_rows is not None and row_count + len(column_batch[0]) > max_rows:
+                    column_batch = [values[: max_rows - row_count] for values in column_batch]
+                    truncated = True
+                table = pa.Table.from_arrays(
+                    [
+                        pa.array(
+                            [_string_value(value) for value in values]
+                            if pa.types.is_string(field.type)
+                            else values,
+                            type=field.type,
+                        )
+                        for values, field in zip(column_batch, schema)
+                    ],
+                    schema=schema,
+                )
+                writer.write_table(table)
+                row_count += table.num_rows
+                bytes_written += table.nbytes
+                if truncated:
+                    break
+        return row_count, bytes_written, truncated
+
+
+def _string_value(value: Any) -> str | None:
+    """Return a value as a string for a string typed Parquet column."""
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+class _CountingWriter:
+    """File wrapper counting the UTF-8 encoded bytes written through it."""
+
+    def __init__(self, file: Any):
+        self.file = file
+        self.bytes_written = 0
+
+    def write(self, text: str) -> int:
+        self.bytes_written += len(text.encode('utf-8'))
+        return self.file.write(text)
@@ -14,21 +14,27 @@
 
 """Tests for the redshift module."""
 
+import os
 import pytest
 import time
+from awslabs.redshift_mcp_server.consts import METADATA_CACHE_TTL, SVV_CATALOG_QUERY
 from awslabs.redshift_mcp_server.redshift import (
     RedshiftClientManager,
+    RedshiftClusterRegistry,
     RedshiftSessionManager,
     _execute_protected_statement,
     _execute_statement,
+    describe_cluster,
     discover_clusters,
     discover_columns,
     discover_databases,
     discover_schemas,
     discover_tables,
     execute_query,
+    metadata_cache,
 )
 from botocore.config import Config
+from botocore.exceptions import ClientError
 
 
 class TestRedshiftClientManagerRedshiftClient:
@@ -242,32 +248,37 @@ class TestRedshiftClientManagerDataClient:
 class TestExecuteProtectedStatement:
     """Tests for _execute_protected_statement function."""
 
-    @pytest.mark.asyncio
-    async def test_execute_protected_statement_read_only(self, mocker):
-        """Test executing protected statement in read-only mode."""
-        # Mock discover_clusters
-        mock_discover_clusters = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift.discover_clusters'
+    @pytest.fixture
+    def mock_cluster(self, mocker):
+        """Mock the cluster registry and session manager for a provisioned cluster."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.cluster_registry.cluster',
+            mocker.AsyncMock(
+                return_value={
+                    'identifier': 'test-cluster',
+                    'type': 'provisioned',
+                    'status': 'available',
+                }
+            ),
         )
-        mock_discover_clusters.return_value = [
-            {'identifier': 'test-cluster', 'type': 'provisioned', 'status': 'available'}
-        ]
-
-        # Mock session manager
         mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
         mock_session_manager.session = mocker.AsyncMock(return_value='test-session-123')
 
-        # Mock _execute_statement
-        mock_execute_statement = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift._execute_statement'
-        )
-        mock_execute_statement.side_effect = ['begin-stmt-id', 'user-stmt-id', 'end-stmt-id']
-
         # Mock data client
         mock_data_client = mocker.Mock()
         mock_data_client.get_statement_result.return_value = {'Records': [], 'ColumnMetadata': []}
         mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
         mock_client_manager.redshift_data_client.return_value = mock_data_client
+        return mock_session_manager, mock_data_client
+
+    @pytest.mark.asyncio
+    async def test_execute_protected_statement_read_only(self, mocker, mock_cluster):
+        """Test executing protected statement in read-only mode."""
+        mock_session_manager, mock_data_client = mock_cluster
+        mock_execute_statement = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_statement'
+        )
+        mock_execute_statement.side_effect = ['begin-stmt-id', 'user-stmt-id', 'end-stmt-id']
 
         result = await _execute_protected_statement(
             'test-cluster', 'test-db', 'SELECT 1', allow_read_write=False
@@ -276,66 +287,116 @@ class TestExecuteProtectedStatement:
         # Verify session was created
         mock_session_manager.session.assert_called_once()
 
-        # Verify three statements were executed: BEGIN READ ONLY, user SQL, END
-        assert mock_execute_statement.call_count == 3
+        # Verify BEGIN READ ONLY, user SQL and END each ran as a statement in the session
         calls = mock_execute_statement.call_args_list
-        assert calls[0][1]['sql'] == 'BEGIN READ ONLY;'
-        assert calls[1][1]['sql'] == 'SELECT 1'
-        assert calls[2][1]['sql'] == 'END;'
+        assert [call[1]['sql'] for call in calls] == ['BEGIN READ ONLY;', 'SELECT 1', 'END;']
+        assert all(call[1]['session_id'] == 'test-session-123' for call in calls)
+        mock_data_client.batch_execute_statement.assert_not_called()
 
+        mock_data_client.get_statement_result.assert_called_once_with(Id='user-stmt-id')
         assert result[1] == 'user-stmt-id'
 
     @pytest.mark.asyncio
-    async def test_execute_protected_statement_read_write(self, mocker):
-        """Test executing protected statement in read-write mode."""
-        # Mock discover_clusters
-        mock_discover_clusters = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift.discover_clusters'
-        )
-        mock_discover_clusters.return_value = [
-            {'identifier': 'test-cluster', 'type': 'provisioned', 'status': 'available'}
-        ]
+    async def test_execute_protected_statement_read_only_rejects_writes(
+        self, mocker, mock_cluster
+    ):
+        """Test that a write passing the pattern check fails in a read-only transaction.
+
+        The data client simulates the transaction handling of Redshift: a session keeps the
+        access mode set by BEGIN until END, and a batch runs in an implicit transaction of its
+        own in which an inner BEGIN has no effect.
+        """
+        _, mock_data_client = mock_cluster
+        mocker.patch('awslabs.redshift_mcp_server.redshift.asyncio.sleep')
+        session = {'read_only': False}
+        statements = {}
+        writes = []
+
+        def run(sql, read_only):
+            if sql.startswith('BEGIN'):
+                return 'FINISHED'
+            if sql.startswith(('DROP', 'INSERT', 'DELETE', 'UPDATE', 'CREATE')):
+                if read_only:
+                    return 'FAILED'
+                writes.append(sql)
+            return 'FINISHED'
+
+        def execute_statement(Sql, **kwargs):
+            if Sql == 'BEGIN READ ONLY;':
+                session['read_only'] = True
+            status = run(Sql, session['read_only'])
+            if Sql == 'END;':
+                session['read_only'] = False
+            statements[f'stmt-{len(statements)}'] = status
+            return {'Id': f'stmt-{len(statements) - 1}'}
+
+        def batch_execute_statement(Sqls, **kwargs):
+            statuses = [run(sql, read_only=False) for sql in Sqls]
+            status = 'FAILED' if 'FAILED' in statuses else 'FINISHED'
+            statements[f'stmt-{len(statements)}'] = status
+            return {'Id': f'stmt-{len(statements) - 1}'}
+
+        mock_data_client.execute_statement.side_effect = execute_statement
+        mock_data_client.batch_execute_statement.side_effect = batch_execute_statement
+        mock_data_client.describe_statement.side_effect = lambda Id: {
+            'Status': statements[Id],
+            'Error': 'cannot execute DROP TABLE in a read-only transaction',
+            'SubStatements': [],
+        }
 
-        # Mock session manager
-        mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
-        mock_session_manager.session = mocker.AsyncMock(return_value='test-session-123')
+        with pytest.raises(Exception, match='read-only transaction'):
+            await _execute_protected_statement(
+                'test-cluster', 'test-db', 'DROP TABLE test', allow_read_write=False
+            )
+
+        assert writes == []
+        assert session['read_only'] is False
 
-        # Mock _execute_statement
+    @pytest.mark.asyncio
+    async def test_execute_protected_statement_read_write(self, mocker, mock_cluster):
+        """Test executing protected statement in read-write mode."""
         mock_execute_statement = mocker.patch(
             'awslabs.redshift_mcp_server.redshift._execute_statement'
         )
         mock_execute_statement.side_effect = ['begin-stmt-id', 'user-stmt-id', 'end-stmt-id']
 
-        # Mock data client
-        mock_data_client = mocker.Mock()
-        mock_data_client.get_statement_result.return_value = {'Records': [], 'ColumnMetadata': []}
-        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
-        mock_client_manager.redshift_data_client.return_value = mock_data_client
-
         await _execute_protected_statement(
             'test-cluster', 'test-db', 'DROP TABLE test', allow_read_write=True
         )
 
         # Verify BEGIN READ WRITE was used
+        assert mock_execute_statement.call_args_list[0][1]['sql'] == 'BEGIN READ WRITE;'
+        assert mock_execute_statement.call_args_list[1][1]['sql'] == 'DROP TABLE test'
+
+    @pytest.mark.asyncio
+    async def test_execute_protected_statement_with_parameters(self, mocker, mock_cluster):
+        """Test that parameters are passed to the user SQL only."""
+        mock_execute_statement = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_statement'
+        )
+        mock_execute_statement.side_effect = ['begin-stmt-id', 'user-stmt-id', 'end-stmt-id']
+        parameters = [{'name': 'name', 'value': 'value'}]
+
+        result = await _execute_protected_statement(
+            'test-cluster', 'test-db', 'SELECT :name', parameters=parameters
+        )
+
+        assert mock_execute_statement.call_count == 3
         calls = mock_execute_statement.call_args_list
-        assert calls[0][1]['sql'] == 'BEGIN READ WRITE;'
-        assert calls[1][1]['sql'] == 'DROP TABLE test'
+        assert calls[0][1]['sql'] == 'BEGIN READ ONLY;'
+        assert calls[1][1]['sql'] == 'SELECT :name'
+        assert calls[1][1]['parameters'] == parameters
         assert calls[2][1]['sql'] == 'END;'
+        assert result[1] == 'user-stmt-id'
 
     @pytest.mark.asyncio
-    async def test_execute_protected_statement_transaction_breaker_error(self, mocker):
+    async def test_execute_protected_statement_transaction_breaker_error(
+        self, mocker, mock_cluster
+    ):
         """Test transaction breaker protection in read-only mode."""
-        # Mock discover_clusters
-        mock_discover_clusters = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift.discover_clusters'
+        mock_execute_statement = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_statement'
         )
-        mock_discover_clusters.return_value = [
-            {'identifier': 'test-cluster', 'type': 'provisioned', 'status': 'available'}
-        ]
-
-        # Mock session manager
-        mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
-        mock_session_manager.session = mocker.AsyncMock(return_value='test-session-123')
 
         # Test suspicious SQL patterns that should be rejected
         suspicious_sqls = [
@@ -360,14 +421,15 @@ class TestExecuteProtectedStatement:
                     'test-cluster', 'test-db', sql, allow_read_write=False
                 )
 
+        mock_execute_statement.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_protected_statement_cluster_not_found(self, mocker):
         """Test error when cluster is not found."""
-        # Mock discover_clusters to return empty list
-        mock_discover_clusters = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift.discover_clusters'
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.cluster_registry.cluster',
+            mocker.AsyncMock(return_value=None),
         )
-        mock_discover_clusters.return_value = []
 
         with pytest.raises(Exception, match='Cluster nonexistent-cluster not found'):
             await _execute_protected_statement(
@@ -375,38 +437,10 @@ class TestExecuteProtectedStatement:
             )
 
     @pytest.mark.asyncio
-    async def test_execute_protected_statement_cluster_not_in_list(self, mocker):
-        """Test error when cluster is not in the returned list."""
-        # Mock discover_clusters to return different clusters
-        mock_discover_clusters = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift.discover_clusters'
-        )
-        mock_discover_clusters.return_value = [
-            {'identifier': 'other-cluster', 'type': 'provisioned'},
-            {'identifier': 'another-cluster', 'type': 'serverless'},
-        ]
-
-        with pytest.raises(Exception, match='Cluster target-cluster not found'):
-            await _execute_protected_statement(
-                'target-cluster', 'test-db', 'SELECT 1', allow_read_write=False
-            )
-
-    @pytest.mark.asyncio
-    async def test_execute_protected_statement_user_sql_fails_end_succeeds(self, mocker):
+    async def test_execute_protected_statement_user_sql_fails_end_succeeds(
+        self, mocker, mock_cluster
+    ):
         """Test user SQL fails but END succeeds - should raise user SQL error."""
-        # Mock discover_clusters
-        mock_discover_clusters = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift.discover_clusters'
-        )
-        mock_discover_clusters.return_value = [
-            {'identifier': 'test-cluster', 'type': 'provisioned'}
-        ]
-
-        # Mock session manager
-        mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
-        mock_session_manager.session = mocker.AsyncMock(return_value='session-123')
-
-        # Mock _execute_statement to fail for user SQL, succeed for BEGIN and END
         mock_execute_statement = mocker.patch(
             'awslabs.redshift_mcp_server.redshift._execute_statement'
         )
@@ -424,7 +458,11 @@ class TestExecuteProtectedStatement:
 
         with pytest.raises(Exception, match='SQL syntax error'):
             await _execute_protected_statement(
-                'test-cluster', 'test-db', 'SELECT invalid_syntax', allow_read_write=False
+                'test-cluster',
+                'test-db',
+                'SELECT invalid_syntax',
+                parameters=[{'name': 'p', 'value': 'v'}],
+                allow_read_write=False,
             )
 
         # Verify END was still called
@@ -435,21 +473,10 @@ class TestExecuteProtectedStatement:
         assert calls[2][1]['sql'] == 'END;'
 
     @pytest.mark.asyncio
-    async def test_execute_protected_statement_user_sql_succeeds_end_fails(self, mocker):
+    async def test_execute_protected_statement_user_sql_succeeds_end_fails(
+        self, mocker, mock_cluster
+    ):
         """Test user SQL succeeds but END fails - should raise END error."""
-        # Mock discover_clusters
-        mock_discover_clusters = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift.discover_clusters'
-        )
-        mock_discover_clusters.return_value = [
-            {'identifier': 'test-cluster', 'type': 'provisioned'}
-        ]
-
-        # Mock session manager
-        mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
-        mock_session_manager.session = mocker.AsyncMock(return_value='session-123')
-
-        # Mock _execute_statement to succeed for user SQL, fail for END
         mock_execute_statement = mocker.patch(
             'awslabs.redshift_mcp_server.redshift._execute_statement'
         )
@@ -467,46 +494,11 @@ class TestExecuteProtectedStatement:
 
         with pytest.raises(Exception, match='END statement failed'):
             await _execute_protected_statement(
-                'test-cluster', 'test-db', 'SELECT 1', allow_read_write=False
-            )
-
-    @pytest.mark.asyncio
-    async def test_execute_protected_statement_both_user_sql_and_end_fail(self, mocker):
-        """Test both user SQL and END fail - should raise combined error."""
-        # Mock discover_clusters
-        mock_discover_clusters = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift.discover_clusters'
-        )
-        mock_discover_clusters.return_value = [
-            {'identifier': 'test-cluster', 'type': 'provisioned'}
-        ]
-
-        # Mock session manager
-        mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
-        mock_session_manager.session = mocker.AsyncMock(return_value='session-123')
-
-        # Mock _execute_statement to fail for both user SQL and END
-        mock_execute_statement = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift._execute_statement'
-        )
-
-        def execute_side_effect(cluster_info, cluster_identifier, database_name, sql, **kwargs):
-            if sql == 'BEGIN READ ONLY;':
-                return 'begin-stmt-id'
-            elif sql == 'SELECT invalid_syntax':
-                raise Exception('SQL syntax error')
-            elif sql == 'END;':
-                raise Exception('END statement failed')
-            return 'stmt-id'
-
-        mock_execute_statement.side_effect = execute_side_effect
-
-        with pytest.raises(
-            Exception,
-            match='User SQL failed: SQL syntax error; END statement failed: END statement failed',
-        ):
-            await _execute_protected_statement(
-                'test-cluster', 'test-db', 'SELECT invalid_syntax', allow_read_write=False
+                'test-cluster',
+                'test-db',
+                'SELECT 1',
+                parameters=[{'name': 'p', 'value': 'v'}],
+                allow_read_write=False,
             )
 
 
@@ -943,35 +935,130 @@ class TestDiscoverFunctions:
         with pytest.raises(Exception, match='Serverless API Error'):
             await discover_clusters()
 
+    @pytest.fixture(autouse=True)
+    def clear_metadata_cache(self):
+        """Start every test with an empty metadata cache."""
+        metadata_cache.invalidate()
+
+    @staticmethod
+    def _catalog_record(kind, database, schema=None, table=None, column=None, **values):
+        """Build a typed SVV_CATALOG_QUERY record."""
+        row = [kind, database, schema, table, column] + [
+            values.get(name)
+            for name in [
+                'owner',
+                'object_type',
+                'acl',
+                'options',
+                'database_isolation_level',
+                'source_database',
+                'ordinal_position',
+                'column_default',
+                'is_nullable',
+                'data_type',
+                'character_maximum_length',
+                'numeric_precision',
+                'numeric_scale',
+                'remarks',
+            ]
+        ]
+        return [
+            {'isNull': True}
+            if value is None
+            else {'longValue': value}
+            if isinstance(value, int)
+            else {'stringValue': value}
+            for value in row
+        ]
+
+    def _catalog_records(self):
+        """Build the records of a small catalog."""
+        return [
+            self._catalog_record(
+                'database',
+                'dev',
+                owner=100,
+                object_type='local',
+                acl='user=admin',
+                options='encoding=utf8',
+                database_isolation_level='Snapshot Isolation',
+            ),
+            self._catalog_record('database', 'prod', owner=101, object_type='shared'),
+            self._catalog_record('schema', 'dev', 'analytics', owner=100, object_type='local'),
+            self._catalog_record('schema', 'dev', 'public', owner=100, object_type='local'),
+            self._catalog_record('table', 'dev', 'public', 'orders', object_type='TABLE'),
+            self._catalog_record('table', 'dev', 'public', 'users', object_type='TABLE'),
+            self._catalog_record('table', 'dev', 'public', 'users_archive', object_type='VIEW'),
+            self._catalog_record(
+                'column',
+                'dev',
+                'public',
+                'users',
+                'id',
+                ordinal_position=1,
+                is_nullable='NO',
+                data_type='integer',
+                numeric_precision=32,
+                numeric_scale=0,
+            ),
+            self._catalog_record(
+                'column',
+                'dev',
+                'public',
+                'users',
+                'name',
+                ordinal_position=2,
+                is_nullable='YES',
+                data_type='character varying',
+                character_maximum_length=256,
+            ),
+        ]
+
     @pytest.mark.asyncio
     async def test_discover_databases(self, mocker):
         """Test discover_databases function."""
-        # Mock _execute_protected_statement
         mock_execute_protected = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=({'Records': self._catalog_records()}, 'query-123'),
         )
-        mock_execute_protected.return_value = (
-            {
-                'Records': [
-                    [
-                        {'stringValue': 'dev'},
-                        {'longValue': 100},
-                        {'stringValue': 'local'},
-                        {'stringValue': 'user=admin'},
-                        {'stringValue': 'encoding=utf8'},
-                        {'stringValue': 'Snapshot Isolation'},
-                    ]
-                ]
-            },
-            'query-123',
+
+        result = await discover_databases('test-cluster', 'dev')
+
+        assert [database['database_name'] for database in result] == ['dev', 'prod']
+        assert result[0] == {
+            'database_name': 'dev',
+            'database_owner': 100,
+            'database_type': 'local',
+            'database_acl': 'user=admin',
+            'database_options': 'encoding=utf8',
+            'database_isolation_level': 'Snapshot Isolation',
+        }
+        call_args = mock_execute_protected.call_args[1]
+        assert call_args['sql'] == SVV_CATALOG_QUERY
+        assert call_args['database_name'] == 'dev'
+        assert call_args['parameters'] == [{'name': 'database_name', 'value': 'dev'}]
+
+    @pytest.mark.asyncio
+    async def test_discover_databases_multiple_pages(self, mocker):
+        """Test that the catalog is loaded from all result pages."""
+        records = self._catalog_records()
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=({'Records': records[:1], 'NextToken': 'token-1'}, 'query-123'),
+        )
+        mock_data_client = mocker.Mock()
+        mock_data_client.get_statement_result.return_value = {'Records': records[1:]}
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_data_client',
+            return_value=mock_data_client,
         )
 
         result = await discover_databases('test-cluster', 'dev')
 
-        assert len(result) == 1
-        assert result[0]['database_name'] == 'dev'
-        assert result[0]['database_owner'] == 100
-        assert result[0]['database_type'] == 'local'
+        assert [database['database_name'] for database in result] == ['dev', 'prod']
+        mock_data_client.get_statement_result.assert_called_once_with(
+            Id='query-123', NextToken='token-1'
+        )
 
     @pytest.mark.asyncio
     async def test_discover_databases_error(self, mocker):
@@ -986,39 +1073,28 @@ class TestDiscoverFunctions:
 
     @pytest.mark.asyncio
     async def test_discover_schemas(self, mocker):
-        """Test discover_schemas function."""
-        # Mock _execute_protected_statement
-        mock_execute_protected = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
-        )
-        mock_execute_protected.return_value = (
-            {
-                'Records': [
-                    [
-                        {'stringValue': 'dev'},
-                        {'stringValue': 'public'},
-                        {'longValue': 100},
-                        {'stringValue': 'local'},
-                        {'stringValue': 'user=admin'},
-                        {'stringValue': None},
-                        {'stringValue': None},
-                    ]
-                ]
-            },
-            'query-456',
+        """Test discover_schemas function with and without a name prefix."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=({'Records': self._catalog_records()}, 'query-456'),
         )
 
         result = await discover_schemas('test-cluster', 'dev')
 
-        assert len(result) == 1
-        assert result[0]['database_name'] == 'dev'
-        assert result[0]['schema_name'] == 'public'
-        assert result[0]['schema_owner'] == 100
+        assert [schema['schema_name'] for schema in result] == ['analytics', 'public']
+        assert result[1] == {
+            'database_name': 'dev',
+            'schema_name': 'public',
+            'schema_owner': 100,
+            'schema_type': 'local',
+            'schema_acl': None,
+            'source_database': None,
+            'schema_option': None,
+        }
+
+        result = await discover_schemas('test-cluster', 'dev', schema_name_prefix='pub')
 
-        # Verify parameters were passed correctly
-        mock_execute_protected.assert_called_once()
-        call_args = mock_execute_protected.call_args
-        assert call_args[1]['parameters'] == [{'name': 'database_name', 'value': 'dev'}]
+        assert [schema['schema_name'] for schema in result] == ['public']
 
     @pytest.mark.asyncio
     async def test_discover_schemas_error(self, mocker):
@@ -1033,43 +1109,22 @@ class TestDiscoverFunctions:
 
     @pytest.mark.asyncio
     async def test_discover_tables(self, mocker):
-        """Test discover_tables function."""
-        # Mock _execute_protected_statement
-        mock_execute_protected = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
-        )
-        mock_execute_protected.return_value = (
-            {
-                'Records': [
-                    [
-                        {'stringValue': 'dev'},
-                        {'stringValue': 'public'},
-                        {'stringValue': 'users'},
-                        {'stringValue': 'user=admin'},
-                        {'stringValue': 'TABLE'},
-                        {'stringValue': 'User data table'},
-                    ]
-                ]
-            },
-            'query-789',
+        """Test discover_tables function with and without a name prefix."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=({'Records': self._catalog_records()}, 'query-789'),
         )
 
         result = await discover_tables('test-cluster', 'dev', 'public')
 
-        assert len(result) == 1
-        assert result[0]['database_name'] == 'dev'
-        assert result[0]['schema_name'] == 'public'
-        assert result[0]['table_name'] == 'users'
-        assert result[0]['table_type'] == 'TABLE'
-
-        # Verify parameters were passed correctly
-        mock_execute_protected.assert_called_once()
-        call_args = mock_execute_protected.call_args
-        expected_params = [
-            {'name': 'database_name', 'value': 'dev'},
-            {'name': 'schema_name', 'value': 'public'},
-        ]
-        assert call_args[1]['parameters'] == expected_params
+        assert [table['table_name'] for table in result] == ['orders', 'users', 'users_archive']
+        assert result[2]['table_type'] == 'VIEW'
+
+        result = await discover_tables('test-cluster', 'dev', 'public', table_name_prefix='users')
+
+        assert [table['table_name'] for table in result] == ['users', 'users_archive']
+        assert await discover_tables('test-cluster', 'dev', 'analytics') == []
+        assert await discover_tables('test-cluster', 'dev', 'missing', 'users') == []
 
     @pytest.mark.asyncio
     async def test_discover_tables_error(self, mocker):
@@ -1085,51 +1140,29 @@ class TestDiscoverFunctions:
     @pytest.mark.asyncio
     async def test_discover_columns(self, mocker):
         """Test discover_columns function."""
-        # Mock _execute_protected_statement
-        mock_execute_protected = mocker.patch(
-            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
-        )
-        mock_execute_protected.return_value = (
-            {
-                'Records': [
-                    [
-                        {'stringValue': 'dev'},
-                        {'stringValue': 'public'},
-                        {'stringValue': 'users'},
-                        {'stringValue': 'id'},
-                        {'longValue': 1},
-                        {'stringValue': None},
-                        {'stringValue': 'NO'},
-                        {'stringValue': 'integer'},
-                        {'longValue': None},
-                        {'longValue': 32},
-                        {'longValue': 0},
-                        {'stringValue': 'Primary key'},
-                    ]
-                ]
-            },
-            'query-101',
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=({'Records': self._catalog_records()}, 'query-101'),
         )
 
         result = await discover_columns('test-cluster', 'dev', 'public', 'users')
 
-        assert len(result) == 1
-        assert result[0]['database_name'] == 'dev'
-        assert result[0]['schema_name'] == 'public'
-        assert result[0]['table_name'] == 'users'
-        assert result[0]['column_name'] == 'id'
-        assert result[0]['ordinal_position'] == 1
-        assert result[0]['data_type'] == 'integer'
-
-        # Verify parameters were passed correctly
-        mock_execute_protected.assert_called_once()
-        call_args = mock_execute_protected.call_args
-        expected_params = [
-            {'name': 'database_name', 'value': 'dev'},
-            {'name': 'schema_name', 'value': 'public'},
-            {'name': 'table_name', 'value': 'users'},
-        ]
-        assert call_args[1]['parameters'] == expected_params
+        assert [column['column_name'] for column in result] == ['id', 'name']
+        assert result[1] == {
+            'database_name': 'dev',
+            'schema_name': 'public',
+            'table_name': 'users',
+            'column_name': 'name',
+            'ordinal_position': 2,
+            'column_default': None,
+            'is_nullable': 'YES',
+            'data_type': 'character varying',
+            'character_maximum_length': 256,
+            'numeric_precision': None,
+            'numeric_scale': None,
+            'remarks': None,
+        }
+        assert await discover_columns('test-cluster', 'dev', 'public', 'orders') == []
 
     @pytest.mark.asyncio
     async def test_discover_columns_error(self, mocker):
@@ -1142,6 +1175,59 @@ class TestDiscoverFunctions:
         with pytest.raises(Exception, match='Column discovery failed'):
             await discover_columns('test-cluster', 'dev', 'public', 'users')
 
+    @pytest.mark.asyncio
+    async def test_discovery_is_served_from_cache(self, mocker):
+        """Test that all discovery functions share one catalog query until refreshed."""
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=({'Records': self._catalog_records()}, 'query-123'),
+        )
+
+        await discover_databases('test-cluster', 'dev')
+        await discover_schemas('test-cluster', 'dev')
+        await discover_tables('test-cluster', 'dev', 'public')
+        await discover_columns('test-cluster', 'dev', 'public', 'users')
+        assert mock_execute_protected.call_count == 1
+
+        await discover_tables('test-cluster', 'prod', 'public')
+        assert mock_execute_protected.call_count == 2
+
+        await discover_columns('test-cluster', 'dev', 'public', 'users', refresh=True)
+        assert mock_execute_protected.call_count == 3
+
+        metadata_cache.invalidate('test-cluster')
+        await discover_schemas('test-cluster', 'dev')
+        assert mock_execute_protected.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_discovery_cache_expires(self, mocker):
+        """Test that the catalog is reloaded once the cache TTL has passed."""
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=({'Records': self._catalog_records()}, 'query-123'),
+        )
+        mock_monotonic = mocker.patch('time.monotonic', return_value=1000.0)
+
+        await discover_schemas('test-cluster', 'dev')
+        mock_monotonic.return_value = 1000.0 + METADATA_CACHE_TTL + 1
+        await discover_schemas('test-cluster', 'dev')
+
+        assert mock_execute_protected.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_discovery_results_are_copies(self, mocker):
+        """Test that modifying returned dictionaries does not modify the cache."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=({'Records': self._catalog_records()}, 'query-123'),
+        )
+
+        result = await discover_tables('test-cluster', 'dev', 'public')
+        result[0]['table_name'] = 'changed'
+
+        result = await discover_tables('test-cluster', 'dev', 'public')
+        assert result[0]['table_name'] == 'orders'
+
 
 class TestExecuteQuery:
     """Tests for execute_query function."""
@@ -1206,3 +1292,193 @@ class TestExecuteQuery:
 
         with pytest.raises(Exception, match='Query execution failed'):
             await execute_query('test-cluster', 'dev', 'SELECT * FROM nonexistent')
+
+    @pytest.mark.asyncio
+    async def test_execute_query_reads_all_pages(self, mocker):
+        """Test that rows of all result pages are returned up to the row budget."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=(
+                {
+                    'ColumnMetadata': [{'name': 'id', 'typeName': 'int4'}],
+                    'Records': [[{'longValue': 1}], [{'longValue': 2}]],
+                    'NextToken': 'token-1',
+                },
+                'query-123',
+            ),
+        )
+        mock_data_client = mocker.Mock()
+        mock_data_client.get_statement_result.return_value = {
+            'Records': [[{'longValue': 3}], [{'longValue': 4}]]
+        }
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_data_client',
+            return_value=mock_data_client,
+        )
+
+        result = await execute_query('test-cluster', 'dev', 'SELECT id FROM t', max_rows=3)
+
+        assert result['rows'] == [[1], [2], [3]]
+        assert result['row_count'] == 3
+        assert result['truncated'] is True
+        assert result['output_file'] is None
+        mock_data_client.get_statement_result.assert_called_once_with(
+            Id='query-123', NextToken='token-1'
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_query_csv_output(self, mocker):
+        """Test that the result is written to a CSV file instead of being returned."""
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement',
+            return_value=(
+                {
+                    'ColumnMetadata': [{'name': 'id', 'typeName': 'int4'}],
+                    'Records': [[{'longValue': 1}], [{'longValue': 2}]],
+                },
+                'query-123',
+            ),
+        )
+
+        result = await execute_query(
+            'test-cluster', 'dev', 'SELECT id FROM t', output_format='csv'
+        )
+
+        try:
+            with open(result['output_file']) as file:
+                assert file.read().splitlines() == ['id', '1', '2']
+        finally:
+            os.remove(result['output_file'])
+        assert result['rows'] == []
+        assert result['row_count'] == 2
+        assert result['truncated'] is False
+
+    @pytest.mark.asyncio
+    async def test_execute_query_unsupported_output_format(self, mocker):
+        """Test that unsupported output formats are rejected before executing the query."""
+        mock_execute_protected = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_protected_statement'
+        )
+
+        with pytest.raises(Exception, match='Unsupported output format'):
+            await execute_query('test-cluster', 'dev', 'SELECT 1', output_format='xlsx')
+
+        mock_execute_protected.assert_not_called()
+
+
+class TestRedshiftClusterRegistry:
+    """Tests for RedshiftClusterRegistry and describe_cluster."""
+
+    @pytest.mark.asyncio
+    async def test_cached_cluster_is_reused(self, mocker):
+        """Test that fresh cached cluster information is served without lookups."""
+        mock_describe = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.describe_cluster',
+            mocker.AsyncMock(return_value={'identifier': 'c1', 'type': 'provisioned'}),
+        )
+        registry = RedshiftClusterRegistry(cache_ttl=300)
+
+        for _ in range(2):
+            cluster = await registry.cluster('c1')
+            assert cluster is not None and cluster['identifier'] == 'c1'
+        mock_describe.assert_called_once_with('c1')
+
+    @pytest.mark.asyncio
+    async def test_expired_cluster_is_looked_up_again(self, mocker):
+        """Test that expired entries trigger a targeted lookup."""
+        mock_describe = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.describe_cluster',
+            mocker.AsyncMock(return_value=None),
+        )
+        mock_monotonic = mocker.patch('awslabs.redshift_mcp_server.redshift.time.monotonic')
+        registry = RedshiftClusterRegistry(cache_ttl=300)
+
+        mock_monotonic.return_value = 1000
+        registry.update([{'identifier': 'c1', 'type': 'provisioned'}])
+        mock_monotonic.return_value = 1301
+
+        assert await registry.cluster('c1') is None
+        mock_describe.assert_called_once_with('c1')
+
+    @pytest.mark.asyncio
+    async def test_discover_clusters_populates_registry(self, mocker):
+        """Test that discovered clusters are cached in the global registry."""
+        mock_redshift_client = mocker.Mock()
+        mock_redshift_client.get_paginator.return_value.paginate.return_value = [
+            {
+                'Clusters': [
+                    {'ClusterIdentifier': 'c1', 'ClusterStatus': 'available', 'DBName': 'dev'}
+                ]
+            }
+        ]
+        mock_serverless_client = mocker.Mock()
+        mock_serverless_client.get_paginator.return_value.paginate.return_value = [
+            {'workgroups': []}
+        ]
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_client',
+            return_value=mock_redshift_client,
+        )
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_serverless_client',
+            return_value=mock_serverless_client,
+        )
+        registry = RedshiftClusterRegistry(cache_ttl=300)
+        mocker.patch('awslabs.redshift_mcp_server.redshift.cluster_registry', registry)
+
+        await discover_clusters()
+
+        cluster = await registry.cluster('c1')
+        assert cluster is not None and cluster['database_name'] == 'dev'
+        mock_redshift_client.describe_clusters.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_describe_cluster_falls_back_to_serverless(self, mocker):
+        """Test that unknown provisioned clusters are looked up as serverless workgroups."""
+        mock_redshift_client = mocker.Mock()
+        mock_redshift_client.describe_clusters.side_effect = ClientError(
+            {'Error': {'Code': 'ClusterNotFound', 'Message': 'not found'}}, 'DescribeClusters'
+        )
+        mock_serverless_client = mocker.Mock()
+        mock_serverless_client.get_workgroup.return_value = {
+            'workgroup': {'workgroupName': 'wg1', 'status': 'AVAILABLE'}
+        }
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_client',
+            return_value=mock_redshift_client,
+        )
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_serverless_client',
+            return_value=mock_serverless_client,
+        )
+
+        result = await describe_cluster('wg1')
+
+        assert result is not None
+        assert result['type'] == 'serverless'
+        assert result['status'] == 'AVAILABLE'
+        mock_redshift_client.describe_clusters.assert_called_once_with(ClusterIdentifier='wg1')
+        mock_serverless_client.get_workgroup.assert_called_once_with(workgroupName='wg1')
+
+    @pytest.mark.asyncio
+    async def test_describe_cluster_not_found(self, mocker):
+        """Test that a missing cluster and workgroup yields None."""
+        mock_redshift_client = mocker.Mock()
+        mock_redshift_client.describe_clusters.side_effect = ClientError(
+            {'Error': {'Code': 'ClusterNotFound', 'Message': 'not found'}}, 'DescribeClusters'
+        )
+        mock_serverless_client = mocker.Mock()
+        mock_serverless_client.get_workgroup.side_effect = ClientError(
+            {'Error': {'Code': 'ResourceNotFoundException', 'Message': 'not found'}},
+            'GetWorkgroup',
+        )
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_client',
+            return_value=mock_redshift_client,
+        )
+        mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.client_manager.redshift_serverless_client',
+            return_value=mock_serverless_client,
+        )
+
+        assert await describe_cluster('missing') is None
@@ -0,0 +1,181 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the statement_results module."""
+
+import csv
+import pytest
+from awslabs.redshift_mcp_server.statement_results import (
+    StatementResultReader,
+    column_converter,
+)
+
+
+COLUMN_METADATA = [
+    {'name': 'id', 'typeName': 'int4'},
+    {'name': 'name', 'typeName': 'varchar'},
+    {'name': 'score', 'typeName': 'float8'},
+    {'name': 'active', 'typeName': 'bool'},
+]
+
+
+def _record(i):
+    """Build a typed Data API record for row i."""
+    return [
+        {'longValue': i},
+        {'stringValue': f'user-{i}'} if i % 2 else {'isNull': True},
+        {'doubleValue': i / 2},
+        {'booleanValue': i % 2 == 0},
+    ]
+
+
+def _mock_data_client(mocker, page_sizes):
+    """Mock a Data API client returning pages of the given sizes linked by NextToken."""
+    pages = []
+    offset = 0
+    for index, size in enumerate(page_sizes):
+        page: dict = {'Records': [_record(i) for i in range(offset, offset + size)]}
+        if index == 0:
+            page['ColumnMetadata'] = COLUMN_METADATA
+        if index < len(page_sizes) - 1:
+            page['NextToken'] = f'token-{index + 1}'
+        pages.append(page)
+        offset += size
+
+    data_client = mocker.Mock()
+    data_client.get_statement_result.side_effect = lambda Id, NextToken=None: pages[
+        int(NextToken.split('-')[1]) if NextToken else 0
+    ]
+    return data_client
+
+
+class TestColumnConverter:
+    """Tests for column_converter function."""
+
+    def test_typed_columns(self):
+        """Test that the typed value is read for known type names and nulls become None."""
+        assert column_converter({'typeName': 'int8'})({'longValue': 5}) == 5
+        assert column_converter({'typeName': 'float4'})({'doubleValue': 1.5}) == 1.5
+        assert column_converter({'typeName': 'bool'})({'booleanValue': False}) is False
+        assert column_converter({'typeName': 'timestamp'})({'stringValue': '2024-01-01'}) == (
+            '2024-01-01'
+        )
+        assert column_converter({'typeName': 'int4'})({'isNull': True}) is None
+
+    def test_untyped_columns(self):
+        """Test that columns without a type name fall back to generic extraction."""
+        convert = column_converter({'name': 'unknown'})
+
+        assert convert({'longValue': 1}) == 1
+        assert convert({'unknownType': 'fallback'}) == "{'unknownType': 'fallback'}"
+
+
+class TestStatementResultReader:
+    """Tests for StatementResultReader class."""
+
+    def test_iter_rows_follows_next_token(self, mocker):
+        """Test that all pages are read lazily and converted into rows."""
+        data_client = _mock_data_client(mocker, [2, 3, 1])
+        reader = StatementResultReader(lambda: data_client, 'query-123')
+
+        rows = reader.iter_rows()
+        assert next(rows) == [0, None, 0.0, True]
+        assert data_client.get_statement_result.call_count == 1
+
+        remaining = list(rows)
+        assert len(remaining) == 5
+        assert remaining[-1] == [5, 'user-5', 2.5, False]
+        assert reader.columns == ['id', 'name', 'score', 'active']
+        data_client.get_statement_result.assert_called_with(Id='query-123', NextToken='token-2')
+
+    def test_first_page_is_not_fetched_again(self, mocker):
+        """Test that a given first page is used and no client is needed for a single page."""
+        data_client_provider = mocker.Mock()
+        first_page = {'ColumnMetadata': COLUMN_METADATA, 'Records': [_record(1)]}
+        reader = StatementResultReader(data_client_provider, 'query-123', first_page)
+
+        assert list(reader.iter_rows()) == [[1, 'user-1', 0.5, False]]
+        data_client_provider.assert_not_called()
+
+    def test_read_row_budget(self, mocker):
+        """Test that reading stops at the row budget without fetching further pages."""
+        data_client = _mock_data_client(mocker, [2, 2, 2])
+        reader = StatementResultReader(lambda: data_client, 'query-123')
+
+        rows, truncated = reader.read(max_rows=3)
+
+        assert [row[0] for row in rows] == [0, 1, 2]
+        assert truncated is True
+        assert data_client.get_statement_result.call_count == 2
+
+    def test_read_byte_budget(self, mocker):
+        """Test that reading stops before the JSON size of the rows exceeds the byte budget."""
+        data_client = _mock_data_client(mocker, [4])
+        reader = StatementResultReader(lambda: data_client, 'query-123')
+
+        rows, truncated = reader.read(max_bytes=60)
+
+        assert len(rows) == 2
+        assert truncated is True
+
+    def test_read_everything(self, mocker):
+        """Test that a result within the budget is not truncated."""
+        data_client = _mock_data_client(mocker, [2, 2])
+        reader = StatementResultReader(lambda: data_client, 'query-123')
+
+        rows, truncated = reader.read(max_rows=4)
+
+        assert len(rows) == 4
+        assert truncated is False
+
+    def test_write_csv(self, mocker, tmp_path):
+        """Test that all pages are written to a CSV file with a header row."""
+        data_client = _mock_data_client(mocker, [2, 1])
+        reader = StatementResultReader(lambda: data_client, 'query-123')
+        path = tmp_path / 'result.csv'
+
+        row_count, bytes_written, truncated = reader.write_csv(str(path))
+
+        with open(path, newline='') as file:
+            lines = list(csv.reader(file))
+        assert lines[0] == ['id', 'name', 'score', 'active']
+        assert lines[2] == ['1', 'user-1', '0.5', 'False']
+        assert row_count == 3
+        assert bytes_written == path.stat().st_size
+        assert truncated is False
+
+    def test_write_csv_row_budget(self, mocker, tmp_path):
+        """Test that CSV spilling stops at the row budget."""
+        data_client = _mock_data_client(mocker, [2, 2])
+        reader = StatementResultReader(lambda: data_client, 'query-123')
+
+        row_count, _, truncated = reader.write_csv(str(tmp_path / 'result.csv'), max_rows=1)
+
+        assert row_count == 1
+        assert truncated is True
+
+    def test_write_parquet(self, mocker, tmp_path):
+        """Test that all pages are written to a Parquet file with typed columns."""
+        pq = pytest.importorskip('pyarrow.parquet')
+        data_client = _mock_data_client(mocker, [2, 2])
+        reader = StatementResultReader(lambda: data_client, 'query-123')
+        path = tmp_path / 'result.parquet'
+
+        row_count, _, truncated = reader.write_parquet(str(path), max_rows=3)
+
+        table = pq.read_table(path)
+        assert row_count == 3
+        assert truncated is True
+        assert table.column('id').to_pylist() == [0, 1, 2]
+        assert str(table.schema.field('score').type) == 'double'
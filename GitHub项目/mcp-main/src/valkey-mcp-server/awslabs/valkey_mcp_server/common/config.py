@@ -33,6 +33,7 @@ VALKEY_CFG = {
     'ssl_cert_reqs': os.getenv('VALKEY_SSL_CERT_REQS', 'required'),
     'ssl_ca_certs': os.getenv('VALKEY_SSL_CA_CERTS', None),
     'cluster_mode': os.getenv('VALKEY_CLUSTER_MODE', False) in ('true', '1', 't'),
+    'max_connections': int(os.getenv('VALKEY_MAX_CONNECTIONS', 10)),
 }
 
 
@@ -15,18 +15,24 @@
 import sys
 from awslabs.valkey_mcp_server.common.config import VALKEY_CFG
 from awslabs.valkey_mcp_server.version import __version__
-from typing import Optional, Type, Union
+from typing import Any, Dict, Optional, Type, TypeVar, Union
 from valkey import (
     Valkey,
     exceptions,
 )
+from valkey.asyncio import Valkey as AsyncValkey
+from valkey.asyncio.cluster import ValkeyCluster as AsyncValkeyCluster
 from valkey.cluster import ValkeyCluster
 
 
+ClientT = TypeVar('ClientT')
+
+
 class ValkeyConnectionManager:
     """Manages connection to Valkey."""
 
     _instance: Optional[Union[Valkey, ValkeyCluster]] = None
+    _async_instance: Optional[Union[AsyncValkey, AsyncValkeyCluster]] = None
 
     @classmethod
     def get_connection(cls, decode_responses: bool = True) -> Union[Valkey, ValkeyCluster]:
@@ -39,62 +45,104 @@ class ValkeyConnectionManager:
             Valkey: A Valkey connection instance.
         """
         if cls._instance is None:
-            try:
-                valkey_class: Type[Union[Valkey, ValkeyCluster]] = (
-                    ValkeyCluster if VALKEY_CFG['cluster_mode'] else Valkey
-                )
-
-                # Get SSL settings with defaults
-                ssl_enabled = VALKEY_CFG.get('ssl', False)
-                ssl_cert_reqs = VALKEY_CFG.get('ssl_cert_reqs')
-                if ssl_enabled and ssl_cert_reqs is None:
-                    ssl_cert_reqs = 'required'
-
-                # Build connection kwargs
-                connection_kwargs = {
-                    'host': VALKEY_CFG['host'],
-                    'port': VALKEY_CFG['port'],
-                    'username': VALKEY_CFG.get('username'),
-                    'password': VALKEY_CFG.get('password', ''),
-                    'ssl': ssl_enabled,
-                    'ssl_ca_path': VALKEY_CFG.get('ssl_ca_path'),
-                    'ssl_keyfile': VALKEY_CFG.get('ssl_keyfile'),
-                    'ssl_certfile': VALKEY_CFG.get('ssl_certfile'),
-                    'ssl_cert_reqs': ssl_cert_reqs,
-                    'ssl_ca_certs': VALKEY_CFG.get('ssl_ca_certs'),
-                    'decode_responses': decode_responses,
-                    'lib_name': f'valkey-py(mcp-server_v{__version__})',
-                }
-
-                # Add max_connections parameter based on mode
-                if VALKEY_CFG['cluster_mode']:
-                    connection_kwargs['max_connections_per_node'] = 10
-                else:
-                    connection_kwargs['max_connections'] = 10
-
-                # Create new instance
-                cls._instance = valkey_class(**connection_kwargs)
-
-            except exceptions.AuthenticationError:
-                print('Authentication failed', file=sys.stderr)
-                raise
-            except exceptions.ConnectionError:
-                print('Failed to connect to Valkey server', file=sys.stderr)
-                raise
-            except exceptions.TimeoutError:
-                print('Connection timed out', file=sys.stderr)
-                raise
-            except exceptions.ResponseError as e:
-                print(f'Response error: {e}', file=sys.stderr)
-                raise
-            except exceptions.ClusterError as e:
-                print(f'Valkey Cluster error: {e}', file=sys.stderr)
-                raise
-            except exceptions.ValkeyError as e:
-                print(f'Valkey error: {e}', file=sys.stderr)
-                raise
-            except Exception as e:
-                print(f'Unexpected error: {e}', file=sys.stderr)
-                raise
+            valkey_class: Type[Union[Valkey, ValkeyCluster]] = (
+                ValkeyCluster if VALKEY_CFG['cluster_mode'] else Valkey
+            )
+            connection_kwargs = _connection_kwargs(decode_responses)
+
+            # Add max_connections parameter based on mode
+            if VALKEY_CFG['cluster_mode']:
+                connection_kwargs['max_connections_per_node'] = _max_connections()
+            else:
+                connection_kwargs['max_connections'] = _max_connections()
+
+            cls._instance = _create_client(valkey_class, connection_kwargs)
 
         return cls._instance
+
+    @classmethod
+    def get_async_connection(
+        cls, decode_responses: bool = True
+    ) -> Union[AsyncValkey, AsyncValkeyCluster]:
+        """Create an asyncio connection to Valkey if none present or returns existing connection.
+
+        The asyncio client does not block the event loop while waiting for replies, and its
+        cluster client sends pipelined commands to all nodes concurrently.
+
+        Args:
+            decode_responses: Whether to decode response bytes to strings. Defaults to True.
+
+        Returns:
+            An asyncio Valkey or ValkeyCluster connection instance.
+        """
+        if cls._async_instance is None:
+            valkey_class: Type[Union[AsyncValkey, AsyncValkeyCluster]] = (
+                AsyncValkeyCluster if VALKEY_CFG['cluster_mode'] else AsyncValkey
+            )
+            connection_kwargs = _connection_kwargs(decode_responses)
+
+            # The asyncio clients only take a CA bundle file
+            connection_kwargs.pop('ssl_ca_path')
+
+            # max_connections is per node for the asyncio cluster client
+            connection_kwargs['max_connections'] = _max_connections()
+
+            cls._async_instance = _create_client(valkey_class, connection_kwargs)
+
+        return cls._async_instance
+
+
+def _max_connections() -> int:
+    """Return the configured maximum number of connections per node."""
+    return VALKEY_CFG.get('max_connections') or 10
+
+
+def _connection_kwargs(decode_responses: bool) -> Dict[str, Any]:
+    """Build the connection kwargs shared by the sync and asyncio clients."""
+    # Get SSL settings with defaults
+    ssl_enabled = VALKEY_CFG.get('ssl', False)
+    ssl_cert_reqs = VALKEY_CFG.get('ssl_cert_reqs')
+    if ssl_enabled and ssl_cert_reqs is None:
+        ssl_cert_reqs = 'required'
+
+    return {
+        'host': VALKEY_CFG['host'],
+        'port': VALKEY_CFG['port'],
+        'username': VALKEY_CFG.get('username'),
+        'password': VALKEY_CFG.get('password', ''),
+        'ssl': ssl_enabled,
+        'ssl_ca_path': VALKEY_CFG.get('ssl_ca_path'),
+        'ssl_keyfile': VALKEY_CFG.get('ssl_keyfile'),
+        'ssl_certfile': VALKEY_CFG.get('ssl_certfile'),
+        'ssl_cert_reqs': ssl_cert_reqs,
+        'ssl_ca_certs': VALKEY_CFG.get('ssl_ca_certs'),
+        'decode_responses': decode_responses,
+        'lib_name': f'valkey-py(mcp-server_v{__version__})',
+    }
+
+
+def _create_client(valkey_class: Type[ClientT], connection_kwargs: Dict[str, Any]) -> ClientT:
+    """Create a Valkey client, reporting connection errors on stderr."""
+    try:
+        return valkey_class(**connection_kwargs)
+    except exceptions.AuthenticationError:
+        print('Authentication failed', file=sys.stderr)
+        raise
+    except exceptions.ConnectionError:
+        print('Failed to connect to Valkey server', file=sys.stderr)
+        raise
+    except exceptions.TimeoutError:
+        print('Connection timed out', file=sys.stderr)
+        raise
+    except exceptions.ResponseError as e:
+        print(f'Response error: {e}', file=sys.stderr)
+        raise
+    except exceptions.ClusterError as e:
+        print(f'Valkey Cluster error: {e}', file=sys.stderr)
+        raise
+    except exceptions.ValkeyError as e:
+        print(f'Valkey error: {e}', file=sys.stderr)
+        raise
+    except Exception as e:
+        print(f'Unexpected error: {e}', file=sys.stderr)
+        raise
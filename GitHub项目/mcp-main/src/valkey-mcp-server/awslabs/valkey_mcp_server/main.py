@@ -19,9 +19,11 @@ from awslabs.valkey_mcp_server.common.server import mcp
 from awslabs.valkey_mcp_server.context import Context
 from awslabs.valkey_mcp_server.tools import (
     bitmap,  # noqa: F401
+    bulk,  # noqa: F401
     hash,  # noqa: F401
     hyperloglog,  # noqa: F401
     json,  # noqa: F401
+    keyspace,  # noqa: F401
     list,  # noqa: F401
     misc,  # noqa: F401
     server_management,  # noqa: F401
@@ -18,9 +18,11 @@ Tool imports for Valkey MCP Server.
 
 from . import (
     bitmap,
+    bulk,
     hash,
     hyperloglog,
     json,
+    keyspace,
     list,
     misc,
     server_management,
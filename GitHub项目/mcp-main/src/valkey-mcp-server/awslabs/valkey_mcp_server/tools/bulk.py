@@ -0,0 +1,284 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pipelined bulk operations for Valkey MCP Server."""
+
+from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.server import mcp
+from awslabs.valkey_mcp_server.context import Context
+from typing import Any, Dict, List, Optional, Sequence
+from valkey.exceptions import ValkeyError
+
+
+# Maximum number of operations accepted by a single bulk tool call
+BULK_MAX_OPERATIONS = 10000
+
+# Number of commands sent per pipeline round trip
+BULK_PIPELINE_BATCH_SIZE = 500
+
+# Single-key commands accepted by bulk_execute, with whether they modify data. The key is
+# always the first argument, so every command can be routed to the node owning its slot.
+BULK_COMMANDS = {
+    # Keys
+    'EXISTS': False,
+    'TYPE': False,
+    'TTL': False,
+    'PTTL': False,
+    'DEL': True,
+    'UNLINK': True,
+    'EXPIRE': True,
+    'PEXPIRE': True,
+    'PERSIST': True,
+    # Strings
+    'GET': False,
+    'STRLEN': False,
+    'GETRANGE': False,
+    'SET': True,
+    'APPEND': True,
+    'INCR': True,
+    'INCRBY': True,
+    'INCRBYFLOAT': True,
+    'DECR': True,
+    'DECRBY': True,
+    # Bitmaps and HyperLogLogs
+    'GETBIT': False,
+    'BITCOUNT': False,
+    'PFCOUNT': False,
+    'SETBIT': True,
+    'PFADD': True,
+    # Hashes
+    'HGET': False,
+    'HMGET': False,
+    'HGETALL': False,
+    'HEXISTS': False,
+    'HKEYS': False,
+    'HVALS': False,
+    'HLEN': False,
+    'HSET': True,
+    'HDEL': True,
+    'HINCRBY': True,
+    # Lists
+    'LINDEX': False,
+    'LLEN': False,
+    'LRANGE': False,
+    'LPUSH': True,
+    'RPUSH': True,
+    'LPOP': True,
+    'RPOP': True,
+    'LTRIM': True,
+    # Sets
+    'SCARD': False,
+    'SISMEMBER': False,
+    'SMEMBERS': False,
+    'SADD': True,
+    'SREM': True,
+    # Sorted sets
+    'ZCARD': False,
+    'ZRANGE': False,
+    'ZRANK': False,
+    'ZSCORE': False,
+    'ZADD': True,
+    'ZINCRBY': True,
+    'ZREM': True,
+    # Streams
+    'XLEN': False,
+    'XRANGE': False,
+    'XADD': True,
+    # JSON
+    'JSON.GET': False,
+    'JSON.TYPE': False,
+    'JSON.SET': True,
+    'JSON.DEL': True,
+}
+
+
+async def execute_pipelined(commands: Sequence[Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Execute single-key commands through pipelines on the asyncio client.
+
+    Commands are sent in batches of BULK_PIPELINE_BATCH_SIZE. In cluster mode the pipeline of
+    the asyncio cluster client groups each batch by the node owning the slot of every key and
+    sends the per-node pipelines concurrently, following MOVED and ASK redirections.
+
+    Args:
+        commands: The commands to execute, each a command name followed by its arguments
+
+    Returns:
+        The result of each command in order, as {'result': ...} or {'error': ...}
+
+    Raises:
+        ValkeyError: When a batch cannot be sent at all, e.g. on connection errors
+    """
+    r = ValkeyConnectionManager.get_async_connection()
+    results: List[Dict[str, Any]] = []
+    for start in range(0, len(commands), BULK_PIPELINE_BATCH_SIZE):
+        async with r.pipeline(transaction=False) as pipe:
+            for command in commands[start : start + BULK_PIPELINE_BATCH_SIZE]:
+                pipe.execute_command(*command)
+            replies = await pipe.execute(raise_on_error=False)
+        results.extend(
+            {'error': str(reply)} if isinstance(reply, Exception) else {'result': reply}
+            for reply in replies
+        )
+    return results
+
+
+def _check_size(count: int) -> Optional[str]:
+    """Return an error message if a bulk call has no or too many operations."""
+    if count == 0:
+        return 'No operations given'
+    if count > BULK_MAX_OPERATIONS:
+        return f'Too many operations: {count}, at most {BULK_MAX_OPERATIONS} per call'
+    return None
+
+
+@mcp.tool()
+async def bulk_execute(operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Execute many single-key commands in a few pipelined round trips.
+
+    Args:
+        operations: The commands to execute, each as {"command": "HSET", "args": ["key",
+            "field", "value"]} with the key as the first argument. Supported commands are the
+            single-key read and write commands of strings, hashes, lists, sets, sorted sets,
+            streams, bitmaps, HyperLogLogs and JSON, plus DEL, UNLINK, EXISTS, TYPE, TTL, PTTL,
+            EXPIRE, PEXPIRE and PERSIST.
+
+    Returns:
+        Dict[str, Any]: The result of each operation in order, as
+            {"results": [{"result": ...} or {"error": "..."}], "errors": <count>},
+            or {"error": "..."} if the operations were rejected or could not be sent.
+    """
+    error = _check_size(len(operations))
+    if error:
+        return {'error': error}
+
+    commands = []
+    for index, operation in enumerate(operations):
+        command = str(operation.get('command', '')).upper()
+        args = operation.get('args') or []
+        if command not in BULK_COMMANDS:
+            return {'error': f"Unsupported command '{command}' in operation {index}"}
+        if not args:
+            return {'error': f"Missing key for command '{command}' in operation {index}"}
+        if BULK_COMMANDS[command] and Context.readonly_mode():
+            return {'error': f"Cannot execute '{command}' in readonly mode"}
+        commands.append((command, *args))
+
+    try:
+        results = await execute_pipelined(commands)
+    except ValkeyError as e:
+        return {'error': str(e)}
+    return {'results': results, 'errors': sum('error' in result for result in results)}
+
+
+@mcp.tool()
+async def bulk_get(keys: List[str]) -> Dict[str, Any]:
+    """Get the string values of many keys in a few pipelined round trips.
+
+    Args:
+        keys: The keys to get
+
+    Returns:
+        Dict[str, Any]: The value of each key in order, as
+            {"results": [{"key": ..., "value": ...} or {"key": ..., "error": "..."}]},
+            with a null value for keys that do not exist.
+    """
+    error = _check_size(len(keys))
+    if error:
+        return {'error': error}
+
+    try:
+        results = await execute_pipelined([('GET', key) for key in keys])
+    except ValkeyError as e:
+        return {'error': str(e)}
+    return {
+        'results': [
+            {'key': key, 'error': result['error']}
+            if 'error' in result
+            else {'key': key, 'value': result['result']}
+            for key, result in zip(keys, results)
+        ]
+    }
+
+
+@mcp.tool()
+async def bulk_set(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Set the string values of many keys in a few pipelined round trips.
+
+    Args:
+        items: The keys to set, each as {"key": ..., "value": ...} with an optional "ex"
+            expire time in seconds
+
+    Returns:
+        Dict[str, Any]: Whether each key was set in order, as
+            {"results": [{"key": ..., "set": true} or {"key": ..., "error": "..."}]}
+    """
+    if Context.readonly_mode():
+        return {'error': 'Cannot set string values in readonly mode'}
+
+    error = _check_size(len(items))
+    if error:
+        return {'error': error}
+
+    commands = []
+    for index, item in enumerate(items):
+        if 'key' not in item or 'value' not in item:
+            return {'error': f'Missing key or value in item {index}'}
+        command = ['SET', item['key'], item['value']]
+        if item.get('ex') is not None:
+            command.extend(['EX', item['ex']])
+        commands.append(command)
+
+    try:
+        results = await execute_pipelined(commands)
+    except ValkeyError as e:
+        return {'error': str(e)}
+    return {
+        'results': [
+            {'key': item['key'], 'error': result['error']}
+            if 'error' in result
+            else {'key': item['key'], 'set': bool(result['result'])}
+            for item, result in zip(items, results)
+        ]
+    }
+
+
+@mcp.tool()
+async def bulk_delete(keys: List[str]) -> Dict[str, Any]:
+    """Delete many keys in a few pipelined round trips.
+
+    Args:
+        keys: The keys to delete
+
+    Returns:
+        Dict[str, Any]: The number of keys deleted, as {"deleted": <count>, "errors": [...]}
+    """
+    if Context.readonly_mode():
+        return {'error': 'Cannot delete keys in readonly mode'}
+
+    error = _check_size(len(keys))
+    if error:
+        return {'error': error}
+
+    try:
+        results = await execute_pipelined([('DEL', key) for key in keys])
+    except ValkeyError as e:
+        return {'error': str(e)}
+    return {
+        'deleted': sum(result.get('result') or 0 for result in results),
+        'errors': [
+            {'key': key, 'error': result['error']}
+            for key, result in zip(keys, results)
+            if 'error' in result
+        ],
+    }
@@ -0,0 +1,341 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keyspace scanning and profiling for Valkey MCP Server."""
+
+import asyncio
+import heapq
+import json
+import time
+from awslabs.valkey_mcp_server.common.connection import ValkeyConnectionManager
+from awslabs.valkey_mcp_server.common.server import mcp
+from awslabs.valkey_mcp_server.tools.bulk import execute_pipelined
+from typing import Any, Dict, List, Optional, Tuple
+from valkey.asyncio.cluster import ValkeyCluster
+from valkey.exceptions import ValkeyError
+
+
+# Name of the single node of a standalone deployment in scan cursors
+STANDALONE_NODE = 'standalone'
+
+# Upper bounds of the TTL histogram buckets in seconds
+TTL_BUCKETS = [
+    ('<1m', 60),
+    ('1m-1h', 3600),
+    ('1h-1d', 86400),
+    ('1d-7d', 604800),
+]
+
+
+class KeyspaceScanner:
+    """Incremental SCAN over all primaries of a deployment.
+
+    Every round sends one SCAN to each primary whose cursor is not exhausted yet, concurrently,
+    so a budget-limited scan samples all primaries evenly. The cursors of all primaries can be
+    saved with to_cursor and given back to resume the scan.
+    """
+
+    def __init__(
+        self,
+        r: Any,
+        pattern: Optional[str],
+        key_type: Optional[str],
+        count: int,
+        cursors: Optional[Dict[str, int]] = None,
+    ):
+        """Initialize the scanner.
+
+        Args:
+            r: The asyncio Valkey or ValkeyCluster client
+            pattern: Glob-style pattern the keys must match, or None for all keys
+            key_type: Type the keys must have, or None for all types
+            count: COUNT hint of every SCAN
+            cursors: Cursors by node name to resume from, or None to start a new scan
+        """
+        self.r = r
+        self.pattern = pattern
+        self.key_type = key_type
+        self.count = count
+        self.cursors: Dict[str, int] = dict(cursors) if cursors is not None else {}
+        self.resumed = cursors is not None
+        self.nodes: Dict[str, Any] = {}
+
+    async def start(self) -> None:
+        """Find the primaries to scan and their starting cursors."""
+        if isinstance(self.r, ValkeyCluster):
+            await self.r.initialize()
+            self.nodes = {node.name: node for node in self.r.get_primaries()}
+        else:
+            self.nodes = {STANDALONE_NODE: None}
+
+        if not self.resumed:
+            self.cursors = dict.fromkeys(self.nodes, 0)
+        else:
+            unknown = set(self.cursors) - set(self.nodes)
+            if unknown:
+                raise ValueError(f'Cursor refers to unknown nodes: {", ".join(sorted(unknown))}')
+
+    @property
+    def complete(self) -> bool:
+        """Whether all primaries have been scanned completely."""
+        return not self.cursors
+
+    async def _scan_node(self, name: str, count: int) -> List[str]:
+        """Run one SCAN on a primary and advance its cursor."""
+        if self.nodes[name] is None:
+            cursor, keys = await self.r.scan(
+                cursor=self.cursors[name], match=self.pattern, count=count, _type=self.key_type
+            )
+        else:
+            cursors, keys = await self.r.scan(
+                cursor=self.cursors[name],
+                match=self.pattern,
+                count=count,
+                _type=self.key_type,
+                target_nodes=self.nodes[name],
+            )
+            cursor = cursors[name]
+
+        if cursor == 0:
+            del self.cursors[name]
+        else:
+            self.cursors[name] = cursor
+        return keys
+
+    async def next_keys(self, limit: Optional[int] = None) -> List[str]:
+        """Scan one round over all unfinished primaries.
+
+        Args:
+            limit: Number of keys still wanted, used to lower the COUNT hint
+
+        Returns:
+            The keys found in this round
+        """
+        names = list(self.cursors)
+        if not names:
+            return []
+        count = self.count
+        if limit is not None:
+            count = max(1, min(count, -(-limit // len(names))))
+        pages = await asyncio.gather(*[self._scan_node(name, count) for name in names])
+        return [key for page in pages for key in page]
+
+    def to_cursor(self) -> Optional[str]:
+        """Return the cursor to resume the scan from, or None when it is complete."""
+        return None if self.complete else json.dumps(self.cursors)
+
+
+def _parse_cursor(cursor: str) -> Dict[str, int]:
+    """Parse a cursor returned by scan_keys."""
+    try:
+        cursors = json.loads(cursor)
+        return {str(name): int(value) for name, value in cursors.items()}
+    except (ValueError, TypeError, AttributeError):
+        raise ValueError(f'Invalid cursor: {cursor}')
+
+
+def _ttl_bucket(ttl: int) -> str:
+    """Return the TTL histogram bucket of a TTL in seconds."""
+    if ttl < 0:
+        return 'no_expiry'
+    for name, limit in TTL_BUCKETS:
+        if ttl < limit:
+            return name
+    return '>=7d'
+
+
+class KeyspaceProfile:
+    """Aggregates of the type, memory usage and TTL of sampled keys."""
+
+    def __init__(self, top: int, prefix_delimiter: str):
+        """Initialize an empty profile.
+
+        Args:
+            top: Number of largest keys and prefixes reported
+            prefix_delimiter: Delimiter ending the prefix of a key
+        """
+        self.top = top
+        self.prefix_delimiter = prefix_delimiter
+        self.keys = 0
+        self.memory_bytes = 0
+        self.vanished = 0
+        self.errors = 0
+        self.types: Dict[str, Dict[str, int]] = {}
+        self.prefixes: Dict[str, Dict[str, int]] = {}
+        self.ttl_histogram: Dict[str, int] = {}
+        self._largest: List[Tuple[int, str, str]] = []
+
+    def prefix(self, key: str) -> str:
+        """Return the prefix of a key, or '<none>' if it has no delimiter."""
+        if self.prefix_delimiter and self.prefix_delimiter in key:
+            return key.split(self.prefix_delimiter, 1)[0] + self.prefix_delimiter
+        return '<none>'
+
+    def add(self, key: str, key_type: Dict[str, Any], memory: Dict[str, Any], ttl: Dict[str, Any]):
+        """Add the TYPE, MEMORY USAGE and TTL results of one key."""
+        if 'error' in key_type or 'error' in ttl:
+            self.errors += 1
+            return
+        if key_type['result'] == 'none' or ttl['result'] == -2:
+            # The key expired or was deleted after it was scanned
+            self.vanished += 1
+            return
+
+        size = memory.get('result') or 0
+        self.keys += 1
+        self.memory_bytes += size
+
+        for stats, name in ((self.types, key_type['result']), (self.prefixes, self.prefix(key))):
+            entry = stats.setdefault(name, {'keys': 0, 'memory_bytes': 0})
+            entry['keys'] += 1
+            entry['memory_bytes'] += size
+
+        bucket = _ttl_bucket(ttl['result'])
+        self.ttl_histogram[bucket] = self.ttl_histogram.get(bucket, 0) + 1
+
+        item = (size, key, key_type['result'])
+        if len(self._largest) < self.top:
+            heapq.heappush(self._largest, item)
+        elif item > self._largest[0]:
+            heapq.heapreplace(self._largest, item)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the profile as a dictionary."""
+        prefixes = sorted(
+            self.prefixes.items(), key=lambda item: item[1]['memory_bytes'], reverse=True
+        )
+        return {
+            'sampled_keys': self.keys,
+            'sampled_memory_bytes': self.memory_bytes,
+            'vanished_keys': self.vanished,
+            'lookup_errors': self.errors,
+            'types': self.types,
+            'largest_keys': [
+                {'key': key, 'type': key_type, 'memory_bytes': size}
+                for size, key, key_type in sorted(self._largest, reverse=True)
+            ],
+            'top_prefixes': [
+                {'prefix': prefix, **stats} for prefix, stats in prefixes[: self.top]
+            ],
+            'distinct_prefixes': len(self.prefixes),
+            'ttl_histogram': self.ttl_histogram,
+        }
+
+
+@mcp.tool()
+async def scan_keys(
+    pattern: Optional[str] = None,
+    key_type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    max_keys: int = 1000,
+    max_seconds: float = 5.0,
+    count: int = 1000,
+) -> Dict[str, Any]:
+    """Incrementally list keys with SCAN across all primaries, without blocking the server.
+
+    Args:
+        pattern: Glob-style pattern the keys must match, e.g. "user:*"
+        key_type: Only return keys of this type (string, list, set, zset, hash, stream)
+        cursor: Cursor returned by a previous call to continue that scan
+        max_keys: Stop once this many keys were found; the last SCAN page is returned whole
+            so that no key is skipped when the scan is continued
+        max_seconds: Stop starting new SCAN rounds after this many seconds
+        count: COUNT hint of every SCAN call
+
+    Returns:
+        Dict[str, Any]: {"keys": [...], "cursor": "<cursor to continue>" or null when the
+            scan is complete, "complete": bool}, or {"error": "..."}
+    """
+    try:
+        cursors = _parse_cursor(cursor) if cursor else None
+        r = ValkeyConnectionManager.get_async_connection()
+        scanner = KeyspaceScanner(r, pattern, key_type, count, cursors)
+        await scanner.start()
+
+        deadline = time.monotonic() + max_seconds
+        keys: List[str] = []
+        while len(keys) < max_keys and time.monotonic() < deadline:
+            keys.extend(await scanner.next_keys(max_keys - len(keys)))
+            if scanner.complete:
+                break
+
+        return {'keys': keys, 'cursor': scanner.to_cursor(), 'complete': scanner.complete}
+    except (ValkeyError, ValueError) as e:
+        return {'error': str(e)}
+
+
+@mcp.tool()
+async def keyspace_profile(
+    pattern: Optional[str] = None,
+    key_type: Optional[str] = None,
+    max_keys: int = 10000,
+    max_seconds: float = 10.0,
+    top: int = 10,
+    prefix_delimiter: str = ':',
+) -> Dict[str, Any]:
+    """Profile memory usage of a sample of the keyspace to diagnose memory pressure.
+
+    Keys are sampled with SCAN across all primaries, and their TYPE, MEMORY USAGE and TTL are
+    looked up through pipelines after every SCAN round, until the whole keyspace was scanned or
+    the key or time budget is used up.
+
+    Args:
+        pattern: Glob-style pattern the keys must match, e.g. "session:*"
+        key_type: Only profile keys of this type (string, list, set, zset, hash, stream)
+        max_keys: Maximum number of keys sampled
+        max_seconds: Time budget; no new SCAN round or lookup starts after it
+        top: Number of largest keys and prefixes reported
+        prefix_delimiter: Delimiter ending the prefix of a key for the prefix distribution
+
+    Returns:
+        Dict[str, Any]: The profile with the sampled keys and memory, memory by type, the
+            largest keys, the prefixes using the most memory, a TTL histogram, and the total
+            number of keys with an extrapolated memory estimate when the whole keyspace was
+            sampled without filters, or {"error": "..."}
+    """
+    try:
+        r = ValkeyConnectionManager.get_async_connection()
+        scanner = KeyspaceScanner(r, pattern, key_type, min(1000, max_keys))
+        await scanner.start()
+        profile = KeyspaceProfile(top, prefix_delimiter)
+
+        start = time.monotonic()
+        deadline = start + max_seconds
+        sampled = 0
+        while sampled < max_keys and time.monotonic() < deadline:
+            keys = (await scanner.next_keys(max_keys - sampled))[: max_keys - sampled]
+            sampled += len(keys)
+            if keys:
+                commands = []
+                for key in keys:
+                    commands.extend([('TYPE', key), ('MEMORY USAGE', key), ('TTL', key)])
+                results = await execute_pipelined(commands)
+                for index, key in enumerate(keys):
+                    profile.add(key, *results[3 * index : 3 * index + 3])
+            if scanner.complete:
+                break
+
+        result = profile.to_dict()
+        result['complete'] = scanner.complete
+        result['elapsed_seconds'] = round(time.monotonic() - start, 3)
+        if pattern in (None, '*') and key_type is None:
+            total_keys = await r.dbsize()
+            result['total_keys'] = total_keys
+            if profile.keys:
+                result['estimated_total_memory_bytes'] = round(
+                    profile.memory_bytes / profile.keys * total_keys
+                )
+        return result
+    except ValkeyError as e:
+        return {'error': str(e)}
@@ -0,0 +1,183 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the bulk operations in the valkey MCP server."""
+
+import pytest
+from awslabs.valkey_mcp_server.tools import bulk
+from awslabs.valkey_mcp_server.tools.bulk import (
+    bulk_delete,
+    bulk_execute,
+    bulk_get,
+    bulk_set,
+)
+from unittest.mock import AsyncMock, Mock, patch
+from valkey.exceptions import ConnectionError, ResponseError
+
+
+class FakePipeline:
+    """Pipeline recording commands and replying from a function of each command."""
+
+    def __init__(self, reply):
+        """Initialize the pipeline."""
+        self.reply = reply
+        self.commands = []
+
+    async def __aenter__(self):
+        """Enter the pipeline context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Exit the pipeline context."""
+        pass
+
+    def execute_command(self, *args):
+        """Queue a command."""
+        self.commands.append(args)
+        return self
+
+    async def execute(self, raise_on_error=True):
+        """Reply to all queued commands."""
+        return [self.reply(command) for command in self.commands]
+
+
+class TestBulk:
+    """Tests for bulk operations."""
+
+    @pytest.fixture
+    def pipelines(self):
+        """Patch the asyncio connection with one that creates fake pipelines."""
+        created = []
+        reply = {'function': lambda command: 'OK'}
+
+        def pipeline(transaction=True):
+            assert transaction is False
+            created.append(FakePipeline(lambda command: reply['function'](command)))
+            return created[-1]
+
+        with patch('awslabs.valkey_mcp_server.tools.bulk.ValkeyConnectionManager') as mock_manager:
+            mock_conn = Mock()
+            mock_conn.pipeline = pipeline
+            mock_manager.get_async_connection.return_value = mock_conn
+            yield created, reply
+
+    @pytest.fixture
+    def mock_context(self):
+        """Create a mock Context."""
+        with patch('awslabs.valkey_mcp_server.tools.bulk.Context') as mock_ctx:
+            mock_ctx.readonly_mode.return_value = False
+            yield mock_ctx
+
+    async def test_bulk_execute(self, pipelines, mock_context):
+        """Test that operations run in order with per-item results and errors."""
+        created, reply = pipelines
+        reply['function'] = lambda command: (
+            ResponseError('WRONGTYPE') if command[1] == 'list_key' else len(command)
+        )
+
+        result = await bulk_execute(
+            [
+                {'command': 'hset', 'args': ['hash_key', 'field', 'value']},
+                {'command': 'GET', 'args': ['list_key']},
+            ]
+        )
+
+        assert created[0].commands == [('HSET', 'hash_key', 'field', 'value'), ('GET', 'list_key')]
+        assert result == {'results': [{'result': 4}, {'error': 'WRONGTYPE'}], 'errors': 1}
+
+    async def test_bulk_execute_batches(self, pipelines, mock_context):
+        """Test that operations are split into pipelines of the batch size."""
+        created, _ = pipelines
+
+        with patch.object(bulk, 'BULK_PIPELINE_BATCH_SIZE', 2):
+            result = await bulk_execute(
+                [{'command': 'GET', 'args': [f'key{i}']} for i in range(5)]
+            )
+
+        assert [len(pipeline.commands) for pipeline in created] == [2, 2, 1]
+        assert len(result['results']) == 5
+
+    async def test_bulk_execute_rejected(self, pipelines, mock_context):
+        """Test that unsupported, keyless, too many and readonly operations are rejected."""
+        created, _ = pipelines
+
+        assert (
+            'Unsupported command'
+            in (await bulk_execute([{'command': 'FLUSHALL', 'args': []}]))['error']
+        )
+        assert 'Missing key' in (await bulk_execute([{'command': 'GET'}]))['error']
+        assert (await bulk_execute([]))['error'] == 'No operations given'
+        with patch.object(bulk, 'BULK_MAX_OPERATIONS', 1):
+            assert (
+                'Too many operations'
+                in (await bulk_execute([{'command': 'GET', 'args': ['a']}] * 2))['error']
+            )
+
+        mock_context.readonly_mode.return_value = True
+        assert (
+            'readonly mode'
+            in (await bulk_execute([{'command': 'SET', 'args': ['a', 'b']}]))['error']
+        )
+        assert 'results' in await bulk_execute([{'command': 'GET', 'args': ['a']}])
+        assert len(created) == 1
+
+    async def test_bulk_get(self, pipelines, mock_context):
+        """Test getting many keys."""
+        _, reply = pipelines
+        reply['function'] = lambda command: None if command[1] == 'missing' else 'value'
+
+        result = await bulk_get(['key', 'missing'])
+
+        assert result == {
+            'results': [{'key': 'key', 'value': 'value'}, {'key': 'missing', 'value': None}]
+        }
+
+    async def test_bulk_set(self, pipelines, mock_context):
+        """Test setting many keys with optional expiry."""
+        created, _ = pipelines
+
+        result = await bulk_set([{'key': 'a', 'value': 1}, {'key': 'b', 'value': 2, 'ex': 60}])
+
+        assert created[0].commands == [('SET', 'a', 1), ('SET', 'b', 2, 'EX', 60)]
+        assert result == {'results': [{'key': 'a', 'set': True}, {'key': 'b', 'set': True}]}
+
+    async def test_bulk_set_readonly(self, pipelines, mock_context):
+        """Test that bulk_set is rejected in readonly mode."""
+        mock_context.readonly_mode.return_value = True
+
+        result = await bulk_set([{'key': 'a', 'value': 1}])
+
+        assert result == {'error': 'Cannot set string values in readonly mode'}
+
+    async def test_bulk_delete(self, pipelines, mock_context):
+        """Test deleting many keys."""
+        _, reply = pipelines
+        reply['function'] = lambda command: (
+            ResponseError('failed') if command[1] == 'bad' else int(command[1] != 'missing')
+        )
+
+        result = await bulk_delete(['a', 'b', 'missing', 'bad'])
+
+        assert result == {'deleted': 2, 'errors': [{'key': 'bad', 'error': 'failed'}]}
+
+    async def test_bulk_connection_error(self, mock_context):
+        """Test that a batch that cannot be sent is reported as an error."""
+        with patch('awslabs.valkey_mcp_server.tools.bulk.ValkeyConnectionManager') as mock_manager:
+            pipeline = FakePipeline(lambda command: 'OK')
+            pipeline.execute = AsyncMock(side_effect=ConnectionError('Connection refused'))
+            mock_manager.get_async_connection.return_value.pipeline.return_value = pipeline
+
+            result = await bulk_get(['a'])
+
+        assert result == {'error': 'Connection refused'}
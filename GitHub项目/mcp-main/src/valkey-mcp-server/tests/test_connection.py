@@ -11,6 +11,7 @@ class TestValkeyConnectionManager(unittest.TestCase):
     def setUp(self):
         """Reset the singleton instance before each test."""
         ValkeyConnectionManager._instance = None
+        ValkeyConnectionManager._async_instance = None
 
     def test_basic_connection(self):
         """Test basic connection creation without cluster mode or SSL."""
@@ -302,6 +303,89 @@ class TestValkeyConnectionManager(unittest.TestCase):
             with self.assertRaises(Exception):
                 ValkeyConnectionManager.get_connection()
 
+    def test_async_connection(self):
+        """Test asyncio connection creation and reuse without cluster mode."""
+        with (
+            patch('awslabs.valkey_mcp_server.common.connection.VALKEY_CFG') as mock_cfg,
+            patch('awslabs.valkey_mcp_server.common.connection.AsyncValkey') as mock_valkey,
+        ):
+            mock_cfg.__getitem__.side_effect = {
+                'cluster_mode': False,
+                'host': 'localhost',
+                'port': 6379,
+            }.__getitem__
+            mock_cfg.get.side_effect = lambda key, default=None: {
+                'username': None,
+                'password': '',
+                'ssl': True,
+                'ssl_ca_path': '/path/to/ca',
+                'ssl_ca_certs': '/path/to/certs',
+                'max_connections': 50,
+            }.get(key, default)
+
+            conn1 = ValkeyConnectionManager.get_async_connection()
+            conn2 = ValkeyConnectionManager.get_async_connection()
+
+            # The asyncio client takes no CA directory
+            mock_valkey.assert_called_once_with(
+                host='localhost',
+                port=6379,
+                username=None,
+                password='',
+                ssl=True,
+                ssl_keyfile=None,
+                ssl_certfile=None,
+                ssl_cert_reqs='required',
+                ssl_ca_certs='/path/to/certs',
+                decode_responses=True,
+                max_connections=50,
+                lib_name=f'valkey-py(mcp-server_v{__version__})',
+            )
+            self.assertIs(conn1, mock_valkey.return_value)
+            self.assertIs(conn1, conn2)
+
+    def test_async_cluster_mode_connection(self):
+        """Test asyncio connection creation in cluster mode."""
+        with (
+            patch('awslabs.valkey_mcp_server.common.connection.VALKEY_CFG') as mock_cfg,
+            patch(
+                'awslabs.valkey_mcp_server.common.connection.AsyncValkeyCluster'
+            ) as mock_cluster,
+        ):
+            mock_cfg.__getitem__.side_effect = {
+                'cluster_mode': True,
+                'host': 'localhost',
+                'port': 6379,
+            }.__getitem__
+            mock_cfg.get.side_effect = lambda key, default=None: {
+                'username': None,
+                'password': '',
+                'ssl': False,
+            }.get(key, default)
+
+            conn = ValkeyConnectionManager.get_async_connection()
+
+            self.assertIs(conn, mock_cluster.return_value)
+            self.assertEqual(mock_cluster.call_args.kwargs['max_connections'], 10)
+
+    def test_async_connection_error(self):
+        """Test handling of asyncio connection errors."""
+        with (
+            patch('awslabs.valkey_mcp_server.common.connection.VALKEY_CFG') as mock_cfg,
+            patch('awslabs.valkey_mcp_server.common.connection.AsyncValkey') as mock_valkey,
+        ):
+            mock_valkey.side_effect = exceptions.ConnectionError()
+            mock_cfg.__getitem__.side_effect = {
+                'cluster_mode': False,
+                'host': 'localhost',
+                'port': 6379,
+            }.__getitem__
+            mock_cfg.get.return_value = None
+
+            with self.assertRaises(exceptions.ConnectionError):
+                ValkeyConnectionManager.get_async_connection()
+            self.assertIsNone(ValkeyConnectionManager._async_instance)
+
 
 if __name__ == '__main__':
     unittest.main()
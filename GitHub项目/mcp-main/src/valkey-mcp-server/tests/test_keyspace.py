@@ -0,0 +1,230 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the keyspace scanning and profiling in the valkey MCP server."""
+
+import json
+import pytest
+from awslabs.valkey_mcp_server.tools.keyspace import (
+    KeyspaceProfile,
+    _ttl_bucket,
+    keyspace_profile,
+    scan_keys,
+)
+from unittest.mock import AsyncMock, Mock, patch
+from valkey.asyncio.cluster import ValkeyCluster
+from valkey.exceptions import ConnectionError, ResponseError
+
+
+class FakeScan:
+    """SCAN replying with fixed pages per node."""
+
+    def __init__(self, pages, cluster=False):
+        """Initialize with the pages of each node, as {node: {cursor: (next_cursor, keys)}}."""
+        self.pages = pages
+        self.cluster = cluster
+        self.calls = []
+
+    async def __call__(self, cursor=0, match=None, count=None, _type=None, target_nodes=None):
+        """Return the page of the node at the cursor."""
+        if self.cluster:
+            assert target_nodes is not None
+            name = target_nodes.name
+        else:
+            name = 'standalone'
+        self.calls.append((name, cursor, match, count, _type))
+        next_cursor, keys = self.pages[name][cursor]
+        return ({name: next_cursor}, keys) if self.cluster else (next_cursor, keys)
+
+
+def make_node(name):
+    """Create a mock cluster node."""
+    node = Mock()
+    node.name = name
+    return node
+
+
+class TestKeyspace:
+    """Tests for keyspace tools."""
+
+    @pytest.fixture
+    def mock_connection(self):
+        """Patch the asyncio connection of the keyspace tools."""
+        with patch(
+            'awslabs.valkey_mcp_server.tools.keyspace.ValkeyConnectionManager'
+        ) as mock_manager:
+            mock_conn = Mock()
+            mock_manager.get_async_connection.return_value = mock_conn
+            yield mock_conn
+
+    @pytest.fixture
+    def mock_cluster(self):
+        """Patch the asyncio connection of the keyspace tools with a two-primary cluster."""
+        with patch(
+            'awslabs.valkey_mcp_server.tools.keyspace.ValkeyConnectionManager'
+        ) as mock_manager:
+            mock_conn = Mock(spec=ValkeyCluster)
+            mock_conn.initialize = AsyncMock()
+            mock_conn.get_primaries.return_value = [make_node('a:6379'), make_node('b:6379')]
+            mock_manager.get_async_connection.return_value = mock_conn
+            yield mock_conn
+
+    async def test_scan_keys_standalone(self, mock_connection):
+        """Test that a standalone scan follows the cursor to the end."""
+        mock_connection.scan = FakeScan({'standalone': {0: (5, ['a', 'b']), 5: (0, ['c'])}})
+
+        result = await scan_keys(pattern='user:*', key_type='hash', count=100)
+
+        assert result == {'keys': ['a', 'b', 'c'], 'cursor': None, 'complete': True}
+        assert mock_connection.scan.calls[0] == ('standalone', 0, 'user:*', 100, 'hash')
+
+    async def test_scan_keys_cluster_resume(self, mock_cluster):
+        """Test that every primary is scanned and a stopped scan can be resumed."""
+        mock_cluster.scan = FakeScan(
+            {
+                'a:6379': {0: (7, ['a1', 'a2']), 7: (0, ['a3'])},
+                'b:6379': {0: (0, ['b1'])},
+            },
+            cluster=True,
+        )
+
+        first = await scan_keys(max_keys=2, count=10)
+
+        assert first['keys'] == ['a1', 'a2', 'b1']
+        assert first['complete'] is False
+        assert json.loads(first['cursor']) == {'a:6379': 7}
+        assert {call[3] for call in mock_cluster.scan.calls} == {1}
+
+        second = await scan_keys(cursor=first['cursor'])
+
+        assert second == {'keys': ['a3'], 'cursor': None, 'complete': True}
+
+    async def test_scan_keys_invalid_cursor(self, mock_cluster):
+        """Test that malformed cursors and unknown nodes are rejected."""
+        assert 'Invalid cursor' in (await scan_keys(cursor='[1]'))['error']
+        assert 'unknown nodes' in (await scan_keys(cursor='{"c:6379": 3}'))['error']
+
+    async def test_scan_keys_time_budget(self, mock_connection):
+        """Test that no SCAN round starts after the time budget."""
+        mock_connection.scan = FakeScan({'standalone': {0: (0, ['a'])}})
+
+        result = await scan_keys(max_seconds=0)
+
+        assert result == {'keys': [], 'cursor': '{"standalone": 0}', 'complete': False}
+
+    async def test_scan_keys_error(self, mock_connection):
+        """Test that connection errors are reported."""
+        mock_connection.scan = AsyncMock(side_effect=ConnectionError('Connection refused'))
+
+        result = await scan_keys()
+
+        assert result == {'error': 'Connection refused'}
+
+    async def test_keyspace_profile(self, mock_connection):
+        """Test that sampled keys are looked up in pipelines and aggregated."""
+        mock_connection.scan = FakeScan(
+            {'standalone': {0: (0, ['user:1', 'user:2', 'session:1', 'counter', 'gone'])}}
+        )
+        mock_connection.dbsize = AsyncMock(return_value=50)
+        replies = {
+            'user:1': ('hash', 300, -1),
+            'user:2': ('hash', 100, 30),
+            'session:1': ('string', 100, 7200),
+            'counter': ('string', 50, 500000),
+            'gone': ('none', None, -2),
+        }
+        commands = []
+
+        async def execute_pipelined(batch):
+            commands.extend(batch)
+            field = {'TYPE': 0, 'MEMORY USAGE': 1, 'TTL': 2}
+            return [{'result': replies[key][field[name]]} for name, key in batch]
+
+        with patch(
+            'awslabs.valkey_mcp_server.tools.keyspace.execute_pipelined', execute_pipelined
+        ):
+            result = await keyspace_profile(top=2)
+
+        assert commands[:3] == [('TYPE', 'user:1'), ('MEMORY USAGE', 'user:1'), ('TTL', 'user:1')]
+        assert result['sampled_keys'] == 4
+        assert result['sampled_memory_bytes'] == 550
+        assert result['vanished_keys'] == 1
+        assert result['types'] == {
+            'hash': {'keys': 2, 'memory_bytes': 400},
+            'string': {'keys': 2, 'memory_bytes': 150},
+        }
+        assert result['largest_keys'] == [
+            {'key': 'user:1', 'type': 'hash', 'memory_bytes': 300},
+            {'key': 'user:2', 'type': 'hash', 'memory_bytes': 100},
+        ]
+        assert result['top_prefixes'] == [
+            {'prefix': 'user:', 'keys': 2, 'memory_bytes': 400},
+            {'prefix': 'session:', 'keys': 1, 'memory_bytes': 100},
+        ]
+        assert result['distinct_prefixes'] == 3
+        assert result['ttl_histogram'] == {'no_expiry': 1, '<1m': 1, '1h-1d': 1, '1d-7d': 1}
+        assert result['complete'] is True
+        assert result['total_keys'] == 50
+        assert result['estimated_total_memory_bytes'] == 6875
+
+    async def test_keyspace_profile_key_budget(self, mock_connection):
+        """Test that no more keys than the budget are looked up."""
+        mock_connection.scan = FakeScan(
+            {'standalone': {0: (3, ['a:1', 'b:1', 'c:1']), 3: (0, [])}}
+        )
+        lookups = AsyncMock(side_effect=lambda batch: [{'result': 1}] * len(batch))
+
+        with patch('awslabs.valkey_mcp_server.tools.keyspace.execute_pipelined', lookups):
+            result = await keyspace_profile(pattern='*:*', max_keys=2)
+
+        assert len(lookups.call_args.args[0]) == 6
+        assert result['sampled_keys'] == 2
+        assert result['complete'] is False
+        assert 'total_keys' not in result
+
+    async def test_keyspace_profile_error(self, mock_connection):
+        """Test that errors of the scan are reported."""
+        mock_connection.scan = AsyncMock(side_effect=ResponseError('unknown command'))
+
+        result = await keyspace_profile()
+
+        assert result == {'error': 'unknown command'}
+
+
+class TestKeyspaceProfile:
+    """Tests for KeyspaceProfile class."""
+
+    def test_ttl_bucket(self):
+        """Test the TTL histogram buckets."""
+        assert [_ttl_bucket(ttl) for ttl in (-1, 0, 60, 3600, 86400, 604800)] == [
+            'no_expiry',
+            '<1m',
+            '1m-1h',
+            '1h-1d',
+            '1d-7d',
+            '>=7d',
+        ]
+
+    def test_largest_keys_and_errors(self):
+        """Test that only the largest keys are kept and failed lookups are counted."""
+        profile = KeyspaceProfile(top=2, prefix_delimiter='')
+        for key, size in (('a', 10), ('b', 30), ('c', 20)):
+            profile.add(key, {'result': 'string'}, {'result': size}, {'result': -1})
+        profile.add('d', {'error': 'timeout'}, {'error': 'timeout'}, {'error': 'timeout'})
+
+        result = profile.to_dict()
+
+        assert [item['key'] for item in result['largest_keys']] == ['b', 'c']
+        assert result['top_prefixes'] == [{'prefix': '<none>', 'keys': 3, 'memory_bytes': 60}]
+        assert result['lookup_errors'] == 1